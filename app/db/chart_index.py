@@ -0,0 +1,178 @@
+"""Maintain the sky-position and tag index tables for stored charts.
+
+:class:`~app.db.models.Chart` keeps positions as JSON blobs. The rows written
+here flatten them into :class:`~app.db.models.ChartPosition` and
+:class:`~app.db.models.ChartTag` so searches run as indexed range scans.
+ORM writes through any :class:`~sqlalchemy.orm.Session` are indexed by
+:func:`after_flush`; Core bulk writes call :func:`sync_chart_index` directly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import delete
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from astroengine.core.bodies import canonical_name
+
+from .models import Chart, ChartPosition, ChartTag, _normalize_tags
+
+__all__ = [
+    "SIGNS",
+    "after_flush",
+    "drop_chart_index",
+    "house_for",
+    "position_rows",
+    "sign_index",
+    "sync_chart_index",
+    "tag_rows",
+]
+
+SIGNS = (
+    "aries",
+    "taurus",
+    "gemini",
+    "cancer",
+    "leo",
+    "virgo",
+    "libra",
+    "scorpio",
+    "sagittarius",
+    "capricorn",
+    "aquarius",
+    "pisces",
+)
+
+_ANGLE_KEYS = {"ascendant": "asc", "midheaven": "mc"}
+_DELETE_CHUNK = 500
+
+
+def sign_index(value: int | str) -> int:
+    """Return the zero-based sign index for an index or sign name."""
+
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in SIGNS:
+            return SIGNS.index(lowered)
+        value = int(lowered)
+    index = int(value)
+    if not 0 <= index < 12:
+        raise ValueError(f"Sign index out of range: {value!r}")
+    return index
+
+
+def house_for(longitude: float, cusps: Sequence[float]) -> int | None:
+    """Return the 1-based house containing ``longitude`` or ``None`` without cusps."""
+
+    if len(cusps) < 12:
+        return None
+    lon = float(longitude) % 360.0
+    values = [float(cusp) % 360.0 for cusp in cusps[:12]]
+    for idx in range(12):
+        start = values[idx]
+        end = values[(idx + 1) % 12]
+        if start <= end:
+            if start <= lon < end:
+                return idx + 1
+        elif lon >= start or lon < end:
+            return idx + 1
+    return None
+
+
+def _longitude(value: Any) -> float | None:
+    if isinstance(value, Mapping):
+        value = value.get("longitude", value.get("lon"))
+    try:
+        return float(value) % 360.0
+    except (TypeError, ValueError):
+        return None
+
+
+def position_rows(
+    chart_id: int,
+    bodies: Mapping[str, Any] | None,
+    houses: Mapping[str, Any] | None,
+) -> list[dict[str, Any]]:
+    """Return :class:`ChartPosition` rows for one chart's JSON payloads."""
+
+    houses = houses or {}
+    cusps = houses.get("cusps") or ()
+    points: dict[str, float] = {}
+    for name, payload in (bodies or {}).items():
+        longitude = _longitude(payload)
+        body = canonical_name(str(name))
+        if longitude is not None and body:
+            points.setdefault(body, longitude)
+    for key, body in _ANGLE_KEYS.items():
+        longitude = _longitude(houses.get(key))
+        if longitude is not None:
+            points.setdefault(body, longitude)
+    return [
+        {
+            "chart_id": chart_id,
+            "body": body,
+            "longitude": longitude,
+            "sign": int(longitude // 30.0) % 12,
+            "house": house_for(longitude, cusps),
+        }
+        for body, longitude in points.items()
+    ]
+
+
+def tag_rows(chart_id: int, tags: Iterable[str] | str | None) -> list[dict[str, Any]]:
+    """Return :class:`ChartTag` rows for one chart's tags."""
+
+    return [{"chart_id": chart_id, "tag": tag} for tag in _normalize_tags(tags)]
+
+
+def sync_chart_index(
+    connection: Connection | Session,
+    charts: Iterable[tuple[int, Mapping[str, Any] | None, Mapping[str, Any] | None, Any]],
+) -> None:
+    """Replace index rows for ``(chart_id, bodies, houses, tags)`` records."""
+
+    ids: list[int] = []
+    positions: list[dict[str, Any]] = []
+    tags: list[dict[str, Any]] = []
+    for chart_id, bodies, houses, chart_tags in charts:
+        ids.append(int(chart_id))
+        positions.extend(position_rows(int(chart_id), bodies, houses))
+        tags.extend(tag_rows(int(chart_id), chart_tags))
+    drop_chart_index(connection, ids)
+    if positions:
+        connection.execute(ChartPosition.__table__.insert(), positions)
+    if tags:
+        connection.execute(ChartTag.__table__.insert(), tags)
+
+
+def drop_chart_index(connection: Connection | Session, chart_ids: Sequence[int]) -> None:
+    """Delete index rows belonging to ``chart_ids``."""
+
+    for start in range(0, len(chart_ids), _DELETE_CHUNK):
+        chunk = list(chart_ids[start : start + _DELETE_CHUNK])
+        for table in (ChartPosition.__table__, ChartTag.__table__):
+            connection.execute(delete(table).where(table.c.chart_id.in_(chunk)))
+
+
+def after_flush(session: Session, _context: Any) -> None:
+    """Session hook that re-indexes charts written or deleted in a flush."""
+
+    changed = [
+        obj
+        for obj in (*session.new, *session.dirty)
+        if isinstance(obj, Chart) and obj.id is not None
+    ]
+    removed = [obj.id for obj in session.deleted if isinstance(obj, Chart) and obj.id is not None]
+    if not changed and not removed:
+        return
+    connection = session.connection()
+    if removed:
+        drop_chart_index(connection, removed)
+    if changed:
+        sync_chart_index(
+            connection,
+            ((chart.id, chart.bodies, chart.houses, chart.tags) for chart in changed),
+        )
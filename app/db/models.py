@@ -59,6 +59,9 @@ def _ensure_utc(dt: datetime | None) -> datetime | None:
     return dt
 
 
+TAG_MAX_LENGTH = 64
+
+
 def _iter_tags(tags: Iterable[str] | str | None) -> Iterable[str]:
     if tags is None:
         return []
@@ -72,7 +75,8 @@ def _normalize_tags(tags: Iterable[str] | str | None) -> list[str]:
     if not tags:
         return normalized
     for tag in _iter_tags(tags):
-        value = str(tag).strip().lower()
+        # Tags are capped to the ``chart_tags.tag`` column width.
+        value = str(tag).strip().lower()[:TAG_MAX_LENGTH].rstrip()
         if value and value not in normalized:
             normalized.append(value)
     return normalized
@@ -450,6 +454,47 @@ class Chart(ModuleScopeMixin, TimestampMixin, Base):
         self._dt_utc = _ensure_utc(value) if value is not None else None
 
 
+class ChartPosition(Base):
+    """Per-body longitude, sign and house of a stored chart for range searches.
+
+    Rows mirror the ``bodies``/``houses`` JSON of :class:`Chart` and are kept
+    in sync by :mod:`app.db.chart_index`.
+    """
+
+    __tablename__ = "chart_positions"
+    __table_args__ = _table_args(
+        UniqueConstraint("chart_id", "body", name="uq_chart_positions_chart_body"),
+        Index("ix_chart_positions_body_longitude", "body", "longitude"),
+        Index("ix_chart_positions_body_sign", "body", "sign"),
+        Index("ix_chart_positions_body_house", "body", "house"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    chart_id: Mapped[int] = mapped_column(
+        ForeignKey("charts.id", ondelete="CASCADE"), nullable=False
+    )
+    body: Mapped[str] = mapped_column(String(64), nullable=False)
+    longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    sign: Mapped[int] = mapped_column(Integer, nullable=False)
+    house: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+class ChartTag(Base):
+    """Normalised chart tags so tag filters use an index instead of JSON scans."""
+
+    __tablename__ = "chart_tags"
+    __table_args__ = _table_args(
+        UniqueConstraint("chart_id", "tag", name="uq_chart_tags_chart_tag"),
+        Index("ix_chart_tags_tag_chart", "tag", "chart_id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    chart_id: Mapped[int] = mapped_column(
+        ForeignKey("charts.id", ondelete="CASCADE"), nullable=False
+    )
+    tag: Mapped[str] = mapped_column(String(TAG_MAX_LENGTH), nullable=False)
+
+
 class ChartNote(Base):
     """Free-form annotations linked to stored charts."""
 
@@ -810,6 +855,8 @@ __all__ = [
     "ExportType",
     "AsteroidMeta",
     "Chart",
+    "ChartPosition",
+    "ChartTag",
     "Event",
     "ExportJob",
     "ModuleScopeMixin",
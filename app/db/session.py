@@ -6,10 +6,12 @@ from typing import Any
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import URL, Engine, make_url
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from astroengine.infrastructure.storage.sqlite import apply_default_pragmas
 
+from . import chart_index
+
 DB_URL = os.getenv("DATABASE_URL", "sqlite:///./dev.db")
 engine = create_engine(DB_URL, echo=False, future=True)
 
@@ -19,6 +21,8 @@ if engine.url.get_backend_name() == "sqlite":
     def _sqlite_configure(dbapi_connection, connection_record):
         apply_default_pragmas(dbapi_connection)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True)
+# Registered on Session itself so sessions from other factories keep the chart index current.
+event.listen(Session, "after_flush", chart_index.after_flush)
 
 @contextmanager
 def session_scope():
@@ -156,6 +156,17 @@ def _register_startup(app: FastAPI) -> None:
             LOGGER.debug("Warmed %s JD/body entries during startup", warmed_entries)
 
 
+def _register_payload_pool(app: FastAPI) -> None:
+    @app.on_event("shutdown")
+    def _shutdown_payload_pool() -> None:
+        """Stop the chart computation pool started by bulk chart requests."""
+
+        pool = getattr(app.state, "payload_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            app.state.payload_pool = None
+
+
 def _install_dev_mode_router(app: FastAPI) -> None:
     if not settings.dev_mode:
         return
@@ -193,7 +204,7 @@ _CONFIG = AppFactoryConfig(
     middlewares=(configure_compression,),
     observability=(_setup_observability,),
     routers=_ROUTERS,
-    startup_hooks=(_register_startup,),
+    startup_hooks=(_register_startup, _register_payload_pool),
     on_create=(_install_security_headers, _install_dev_mode_router),
 )
 
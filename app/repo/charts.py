@@ -1,13 +1,66 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, bindparam, func, or_, select
 from sqlalchemy.orm import Session
 
-from app.db.models import Chart, Event, _normalize_tags
+from app.db.chart_index import sign_index, sync_chart_index
+from app.db.models import Chart, ChartPosition, ChartTag, Event, _ensure_utc, _normalize_tags
 from app.repo.base import BaseRepo
+from astroengine.core.bodies import canonical_name
+
+_BULK_SKIP_COLUMNS = frozenset({"id", "created_at", "updated_at"})
+_KEY_LOOKUP_CHUNK = 500
+_REINDEX_CHUNK = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class PositionFilter:
+    """Constraint on one body's stored position.
+
+    ``longitude``/``orb`` select an arc (wrapping through 0° Aries); ``sign``
+    (index or name) and ``house`` select exact buckets. Unset fields are
+    ignored; a filter with only ``body`` matches charts that contain it.
+    """
+
+    body: str
+    longitude: float | None = None
+    orb: float = 1.0
+    sign: int | str | None = None
+    house: int | None = None
+
+    def clause(self):
+        """Return the ``chart_id`` subquery selecting charts that satisfy this filter."""
+
+        conditions = [ChartPosition.body == canonical_name(self.body)]
+        if self.longitude is not None:
+            orb = abs(float(self.orb))
+            if orb < 180.0:
+                low = (float(self.longitude) - orb) % 360.0
+                high = (float(self.longitude) + orb) % 360.0
+                if low <= high:
+                    conditions.append(ChartPosition.longitude.between(low, high))
+                else:
+                    conditions.append(
+                        or_(ChartPosition.longitude >= low, ChartPosition.longitude <= high)
+                    )
+        if self.sign is not None:
+            conditions.append(ChartPosition.sign == sign_index(self.sign))
+        if self.house is not None:
+            conditions.append(ChartPosition.house == int(self.house))
+        return select(ChartPosition.chart_id).where(*conditions)
+
+
+def _tag_clauses(tags: Sequence[str] | str | None) -> list[Any]:
+    return [
+        Chart.id.in_(select(ChartTag.chart_id).where(ChartTag.tag == tag))
+        for tag in _normalize_tags(tags)
+    ]
 
 
 class ChartRepo(BaseRepo[Chart]):
@@ -81,6 +134,137 @@ class ChartRepo(BaseRepo[Chart]):
         chart = self.get(db, chart_id)
         return chart.events if chart else []
 
+    # ------------------------------------------------------------------
+    # Bulk helpers
+    # ------------------------------------------------------------------
+    def _bulk_values(self, row: Mapping[str, Any]) -> dict[str, Any]:
+        """Return a full column mapping for ``row`` with model defaults applied.
+
+        ``executemany`` needs every parameter set to carry the same keys, so
+        absent or ``None`` values on non-nullable columns fall back to the
+        column's Python default.
+        """
+
+        values: dict[str, Any] = {}
+        for column in self.model.__table__.columns:
+            if column.key in _BULK_SKIP_COLUMNS:
+                continue
+            value = row.get(column.key)
+            if value is None and not column.nullable and column.default is not None:
+                default = column.default
+                value = default.arg(None) if default.is_callable else default.arg
+            values[column.key] = value
+        kind = values.get("kind")
+        values["kind"] = str(getattr(kind, "value", kind))
+        values["chart_key"] = str(values.get("chart_key") or uuid4().hex)
+        values["dt_utc"] = _ensure_utc(values.get("dt_utc"))
+        values["deleted_at"] = _ensure_utc(values.get("deleted_at"))
+        values["tags"] = _normalize_tags(values.get("tags"))
+        return values
+
+    def _ids_for_keys(self, db: Session, keys: Iterable[str]) -> dict[str, int]:
+        table = self.model.__table__
+        unique = list(dict.fromkeys(keys))
+        found: dict[str, int] = {}
+        for start in range(0, len(unique), _KEY_LOOKUP_CHUNK):
+            chunk = unique[start : start + _KEY_LOOKUP_CHUNK]
+            stmt = select(table.c.chart_key, table.c.id).where(table.c.chart_key.in_(chunk))
+            found.update((str(key), int(ident)) for key, ident in db.execute(stmt))
+        return found
+
+    def bulk_insert(self, db: Session, rows: Sequence[Mapping[str, Any]]) -> list[int]:
+        """Insert ``rows`` with a single ``executemany`` and return their ids in order.
+
+        Rows use column names (``dt_utc``, ``memo``, ``location_name`` …) and
+        bypass ORM construction, so no :class:`Chart` objects are created.
+        """
+
+        if not rows:
+            return []
+        values = [self._bulk_values(row) for row in rows]
+        db.execute(self.model.__table__.insert(), values)
+        ids = self._ids_for_keys(db, (row["chart_key"] for row in values))
+        ordered = [ids[row["chart_key"]] for row in values]
+        sync_chart_index(
+            db,
+            (
+                (ident, row["bodies"], row["houses"], row["tags"])
+                for ident, row in zip(ordered, values, strict=True)
+            ),
+        )
+        return ordered
+
+    def bulk_upsert(
+        self, db: Session, rows: Sequence[Mapping[str, Any]]
+    ) -> tuple[list[int], int]:
+        """Insert or update ``rows`` keyed by ``chart_key``.
+
+        Existing charts are updated in one ``executemany`` covering the
+        columns named in the rows; new charts go through :meth:`bulk_insert`.
+        When a key repeats, the last row wins. Returns the chart ids aligned
+        with ``rows`` and the number of charts created.
+        """
+
+        if not rows:
+            return [], 0
+        values = [self._bulk_values(row) for row in rows]
+        latest = {row["chart_key"]: row for row in values}
+        existing = self._ids_for_keys(db, latest)
+        created = [row for key, row in latest.items() if key not in existing]
+        updated = [row for key, row in latest.items() if key in existing]
+        if created:
+            db.execute(self.model.__table__.insert(), created)
+        if updated:
+            table = self.model.__table__
+            named = {key for row in rows for key in row} & set(table.columns.keys())
+            columns = sorted(named - _BULK_SKIP_COLUMNS - {"chart_key"})
+            stmt = table.update().where(table.c.chart_key == bindparam("_match_key"))
+            db.execute(
+                stmt,
+                [
+                    {"_match_key": row["chart_key"], **{name: row[name] for name in columns}}
+                    for row in updated
+                ],
+            )
+        ids = {**existing, **self._ids_for_keys(db, (row["chart_key"] for row in created))}
+        sync_chart_index(
+            db,
+            ((ids[row["chart_key"]], row["bodies"], row["houses"], row["tags"]) for row in created),
+        )
+        if updated:
+            # Updates may name only some columns, so index what was stored.
+            self.reindex(db, [existing[row["chart_key"]] for row in updated])
+        return [ids[row["chart_key"]] for row in values], len(created)
+
+    def reindex(self, db: Session, chart_ids: Sequence[int] | None = None) -> int:
+        """Rebuild position and tag index rows from stored JSON; returns charts indexed."""
+
+        table = self.model.__table__
+        columns = (table.c.id, table.c.bodies, table.c.houses, table.c.tags)
+        count = 0
+        if chart_ids is not None:
+            ids = list(chart_ids)
+            for start in range(0, len(ids), _REINDEX_CHUNK):
+                chunk = ids[start : start + _REINDEX_CHUNK]
+                rows = db.execute(select(*columns).where(table.c.id.in_(chunk))).all()
+                sync_chart_index(db, rows)
+                count += len(rows)
+            return count
+        last_id = 0
+        while True:
+            stmt = (
+                select(*columns)
+                .where(table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(_REINDEX_CHUNK)
+            )
+            rows = db.execute(stmt).all()
+            if not rows:
+                return count
+            sync_chart_index(db, rows)
+            count += len(rows)
+            last_id = int(rows[-1][0])
+
     # ------------------------------------------------------------------
     # Search helpers
     # ------------------------------------------------------------------
@@ -107,6 +291,7 @@ class ChartRepo(BaseRepo[Chart]):
             conditions.append(self.model.created_at >= created_from)
         if created_to:
             conditions.append(self.model.created_at <= created_to)
+        conditions.extend(_tag_clauses(tags))
         if conditions:
             stmt = stmt.where(and_(*conditions))
         stmt = (
@@ -114,17 +299,44 @@ class ChartRepo(BaseRepo[Chart]):
             .offset(offset)
             .limit(limit)
         )
-        results = list(db.execute(stmt).scalars())
-        if tags:
-            normalized = _normalize_tags(tags)
-            if normalized:
-                results = [
-                    chart
-                    for chart in results
-                    if all(tag in chart.tags for tag in normalized)
-                ]
-        return results
-
-
-__all__ = ["ChartRepo"]
+        return list(db.execute(stmt).scalars())
+
+    def search_positions(
+        self,
+        db: Session,
+        filters: Sequence[PositionFilter],
+        *,
+        tags: Sequence[str] | str | None = None,
+        kind: str | None = None,
+        include_deleted: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Chart]:
+        """Return charts matching every position filter and tag.
+
+        Each filter is an indexed range scan on ``chart_positions`` and each
+        tag a lookup on ``chart_tags``; chart JSON is only loaded for the
+        matching page. Index rows are kept current by an ``after_flush``
+        listener on every ORM :class:`~sqlalchemy.orm.Session` and by this
+        repository's bulk helpers; charts written with raw Core statements
+        elsewhere must be passed to :meth:`reindex`.
+        """
+
+        conditions = [self.model.id.in_(item.clause()) for item in filters]
+        conditions.extend(_tag_clauses(tags))
+        if kind:
+            conditions.append(self.model.kind == kind)
+        if not include_deleted:
+            conditions.append(self.model.deleted_at.is_(None))
+        stmt = (
+            select(self.model)
+            .where(*conditions)
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        return list(db.execute(stmt).scalars())
+
+
+__all__ = ["ChartRepo", "PositionFilter"]
 
@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+import json
+import queue
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 from zoneinfo import ZoneInfoNotFoundError
 
-from fastapi import APIRouter, HTTPException, Query, Response
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from sqlalchemy import or_, select
+from sqlalchemy.exc import SQLAlchemyError
 
-from app.db.models import Chart, _normalize_tags
+from app.db.chart_index import sign_index
+from app.db.models import Chart, ChartTag, _normalize_tags
 from app.db.session import session_scope
-from app.repo.charts import ChartRepo
+from app.repo.charts import ChartRepo, PositionFilter
 from app.schemas.charts import ChartSummary, ChartTagsUpdate
-from astroengine.atlas.tz import LocalTimeResolution, to_utc_with_timezone
+from astroengine.atlas.tz import LocalTimeResolution, to_utc_with_timezone, tzids_for
 from astroengine.chart.natal import ChartLocation, compute_natal_chart
-from astroengine.compute import build_payload
+from astroengine.compute import PayloadFailure, build_payload, build_payloads, payload_pool
 from astroengine.config import (
     Settings,
     apply_profile_overlay,
@@ -29,6 +38,12 @@ from astroengine.report.builders import build_chart_report_context
 
 router = APIRouter(prefix="/v1/charts", tags=["charts"])
 
+BULK_MAX_CHARTS = 50_000
+BULK_INSERT_BATCH = 2_000
+
+ProgressCallback = Callable[[str, int, int], None]
+"""Receives ``(stage, done, total)`` for the ``timezone``, ``compute`` and ``insert`` stages."""
+
 
 def _ensure_utc(moment: datetime | None) -> datetime | None:
     if moment is None:
@@ -123,6 +138,99 @@ class ChartImport(BaseModel):
     chart: Mapping[str, Any]
 
 
+class ChartBulkEntry(ChartCreate):
+    """Birth record accepted by the bulk create endpoint.
+
+    ``dt_utc`` may be omitted when ``dt_local`` is given, and ``tz`` may be
+    omitted to resolve it from the coordinates.
+    """
+
+    dt_utc: datetime | None = Field(default=None, description="Reference datetime in UTC.")
+    tz: str | None = Field(
+        default=None,
+        description="Timezone identifier (IANA); resolved from lat/lon when omitted.",
+    )
+
+
+class ChartBulkCreate(BaseModel):
+    """Payload for creating many charts in one request."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    charts: list[ChartBulkEntry] = Field(..., min_length=1, max_length=BULK_MAX_CHARTS)
+    workers: int | None = Field(
+        default=None,
+        ge=1,
+        le=8,
+        description=(
+            "Chart computation chunks run at once on the shared worker pool "
+            "(defaults to settings.perf.workers)."
+        ),
+    )
+
+
+class ChartBulkImport(BaseModel):
+    """Payload used when importing many charts from an export bundle."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    charts: list[Mapping[str, Any]] = Field(..., min_length=1, max_length=BULK_MAX_CHARTS)
+
+
+class ChartBulkFailure(BaseModel):
+    """A record rejected during a bulk operation."""
+
+    index: int
+    detail: str
+
+
+class ChartBulkResult(BaseModel):
+    """Outcome of a bulk create or import."""
+
+    processed: int
+    created: int
+    updated: int
+    ids: list[int | None] = Field(
+        default_factory=list,
+        description="Chart id per input record, null where the record failed.",
+    )
+    failures: list[ChartBulkFailure] = Field(default_factory=list)
+
+
+class ChartPositionFilter(BaseModel):
+    """One body constraint in a position search."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    body: str = Field(..., description="Body or angle name, e.g. Mars or Ascendant.")
+    longitude: float | None = Field(
+        default=None,
+        ge=0.0,
+        lt=360.0,
+        description="Ecliptic longitude in degrees (15° Leo is 135).",
+    )
+    orb: float = Field(default=1.0, ge=0.0, le=180.0, description="Allowed distance from longitude.")
+    sign: int | str | None = Field(default=None, description="Sign index (0 = Aries) or name.")
+    house: int | None = Field(default=None, ge=1, le=12)
+
+    @field_validator("sign")
+    @classmethod
+    def _normalise_sign(cls, value: int | str | None) -> int | None:
+        return None if value is None else sign_index(value)
+
+
+class ChartPositionSearch(BaseModel):
+    """Query for charts matching body positions and tags."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    positions: list[ChartPositionFilter] = Field(default_factory=list, max_length=12)
+    tags: list[str] = Field(default_factory=list, description="Every tag must be present.")
+    kind: str | None = Field(default=None)
+    limit: int = Field(default=200, ge=1, le=500)
+    offset: int = Field(default=0, ge=0)
+
+
 class ChartResponse(BaseModel):
     """API representation of a persisted chart."""
 
@@ -219,10 +327,9 @@ def _ensure_list(value: Any) -> list[Any]:
     return []
 
 
-@router.post("", response_model=ChartResponse, status_code=201)
-def create_chart(payload: ChartCreate) -> ChartResponse:
-    base_settings = runtime_settings.persisted()
-    settings, profile_key = _apply_profile(base_settings, payload.profile)
+def _resolve_moment(payload: ChartCreate) -> tuple[datetime, dict[str, Any]]:
+    """Return the UTC instant for ``payload`` and its timezone metadata."""
+
     resolution: LocalTimeResolution | None = None
     if payload.dt_local is not None:
         local_value = payload.dt_local
@@ -244,9 +351,6 @@ def create_chart(payload: ChartCreate) -> ChartResponse:
         moment = _ensure_utc(payload.dt_utc)
     if moment is None:
         raise HTTPException(status_code=400, detail="dt_utc is required")
-    result = build_payload(moment, float(payload.lat), float(payload.lon), settings)
-    metadata = dict(result.get("metadata") or {})
-    normalized_tags = _normalize_tags(payload.tags)
     if resolution is not None:
         timezone_meta = resolution.to_metadata()
         timezone_meta["source"] = "local"
@@ -266,28 +370,60 @@ def create_chart(payload: ChartCreate) -> ChartResponse:
             "source": "utc",
         }
     timezone_meta.setdefault("gap_seconds", None)
+    return moment, timezone_meta
+
+
+def _chart_fields(
+    payload: ChartCreate,
+    moment: datetime,
+    timezone_meta: dict[str, Any],
+    result: Mapping[str, Any],
+    *,
+    profile_key: str,
+    settings_snapshot: dict[str, Any],
+) -> dict[str, Any]:
+    """Return chart column values shared by :class:`Chart` and bulk inserts."""
+
+    metadata = dict(result.get("metadata") or {})
     metadata["timezone_resolution"] = timezone_meta
+    return {
+        "name": payload.name,
+        "kind": payload.kind,
+        "dt_utc": moment,
+        "lat": float(payload.lat),
+        "lon": float(payload.lon),
+        "timezone": payload.tz,
+        "location_name": payload.location,
+        "gender": payload.gender,
+        "tags": _normalize_tags(payload.tags),
+        "memo": payload.notes,
+        "profile_key": profile_key,
+        "narrative_profile": payload.narrative_profile,
+        "settings_snapshot": settings_snapshot,
+        "bodies": result["bodies"],
+        "houses": result["houses"],
+        "aspects": result["aspects"],
+        "patterns": result["patterns"],
+        "data": {"metadata": metadata},
+    }
+
+
+@router.post("", response_model=ChartResponse, status_code=201)
+def create_chart(payload: ChartCreate) -> ChartResponse:
+    base_settings = runtime_settings.persisted()
+    settings, profile_key = _apply_profile(base_settings, payload.profile)
+    moment, timezone_meta = _resolve_moment(payload)
+    result = build_payload(moment, float(payload.lat), float(payload.lon), settings)
+    fields = _chart_fields(
+        payload,
+        moment,
+        timezone_meta,
+        result,
+        profile_key=profile_key,
+        settings_snapshot=settings.model_dump(),
+    )
     with session_scope() as db:
-        chart = Chart(
-            name=payload.name,
-            kind=payload.kind,
-            dt_utc=moment,
-            lat=float(payload.lat),
-            lon=float(payload.lon),
-            timezone=payload.tz,
-            location_name=payload.location,
-            gender=payload.gender,
-            tags=normalized_tags,
-            memo=payload.notes,
-            profile_key=profile_key,
-            narrative_profile=payload.narrative_profile,
-            settings_snapshot=settings.model_dump(),
-            bodies=result["bodies"],
-            houses=result["houses"],
-            aspects=result["aspects"],
-            patterns=result["patterns"],
-            data={"metadata": metadata},
-        )
+        chart = Chart(**fields)
         db.add(chart)
         db.flush()
         db.refresh(chart)
@@ -312,20 +448,31 @@ def list_charts(
     if q:
         pattern = f"%{q}%"
         stmt = stmt.where(or_(Chart.name.ilike(pattern), Chart.chart_key.ilike(pattern)))
+    for tag in _normalize_tags(tags):
+        stmt = stmt.where(Chart.id.in_(select(ChartTag.chart_id).where(ChartTag.tag == tag)))
     stmt = stmt.order_by(Chart.created_at.desc()).limit(limit)
     with session_scope() as db:
         records = db.execute(stmt).scalars().all()
-    if tags:
-        normalized = _normalize_tags(tags)
-        if normalized:
-            records = [
-                chart
-                for chart in records
-                if all(tag in (chart.tags or []) for tag in normalized)
-            ]
     return [_chart_to_response(chart) for chart in records]
 
 
+@router.post("/search", response_model=list[ChartResponse])
+def search_charts(payload: ChartPositionSearch) -> list[ChartResponse]:
+    """Find charts by body positions and tags using the position index."""
+
+    filters = [PositionFilter(**item.model_dump()) for item in payload.positions]
+    with session_scope() as db:
+        records = ChartRepo().search_positions(
+            db,
+            filters,
+            tags=payload.tags,
+            kind=payload.kind,
+            limit=payload.limit,
+            offset=payload.offset,
+        )
+        return [_chart_to_response(chart) for chart in records]
+
+
 @router.get("/deleted", response_model=list[ChartSummary])
 def list_deleted_charts(
     limit: int = Query(default=200, ge=1, le=500),
@@ -466,75 +613,353 @@ def update_chart_tags(chart_id: int, payload: ChartTagsUpdate) -> ChartResponse:
         return _chart_to_response(chart)
 
 
+def _import_fields(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return chart column values for an exported chart record."""
+
+    chart_key = data.get("chart_key")
+    return {
+        "chart_key": str(chart_key) if chart_key is not None else None,
+        "name": data.get("name"),
+        "kind": data.get("kind"),
+        "dt_utc": _parse_import_datetime(data.get("dt_utc")),
+        "lat": _coerce_float(data.get("lat")),
+        "lon": _coerce_float(data.get("lon")),
+        "timezone": data.get("tz") or data.get("timezone"),
+        "location_name": data.get("location"),
+        "gender": data.get("gender"),
+        "tags": _normalize_tags(data.get("tags")),
+        "memo": data.get("notes"),
+        "profile_key": data.get("profile_applied") or data.get("profile_key") or "default",
+        "narrative_profile": data.get("narrative_profile"),
+        "settings_snapshot": _ensure_mapping(data.get("settings_snapshot")),
+        "bodies": _ensure_mapping(data.get("bodies")),
+        "houses": _ensure_mapping(data.get("houses")),
+        "aspects": _ensure_list(data.get("aspects")),
+        "patterns": _ensure_list(data.get("patterns")),
+        "data": {"metadata": _ensure_mapping(data.get("metadata"))},
+    }
+
+
 @router.post("/import", response_model=ChartResponse)
 def import_chart(payload: ChartImport) -> ChartResponse:
-    data = dict(payload.chart)
-    dt_utc = _parse_import_datetime(data.get("dt_utc"))
-    chart_key = data.get("chart_key")
-    lat = _coerce_float(data.get("lat"))
-    lon = _coerce_float(data.get("lon"))
-    profile_key = data.get("profile_applied") or data.get("profile_key") or "default"
-    bodies = _ensure_mapping(data.get("bodies"))
-    houses = _ensure_mapping(data.get("houses"))
-    aspects = _ensure_list(data.get("aspects"))
-    patterns = _ensure_list(data.get("patterns"))
-    settings_snapshot = _ensure_mapping(data.get("settings_snapshot"))
-    metadata = _ensure_mapping(data.get("metadata"))
-    tags_data = _normalize_tags(data.get("tags"))
+    fields = _import_fields(payload.chart)
+    chart_key = fields["chart_key"]
     with session_scope() as db:
         existing = None
         if chart_key:
-            existing = db.execute(select(Chart).where(Chart.chart_key == str(chart_key))).scalar_one_or_none()
+            existing = db.execute(select(Chart).where(Chart.chart_key == chart_key)).scalar_one_or_none()
         if existing is None:
-            chart = Chart(
-                chart_key=str(chart_key) if chart_key is not None else None,
-                name=data.get("name"),
-                kind=data.get("kind"),
-                dt_utc=dt_utc,
-                lat=lat,
-                lon=lon,
-                timezone=data.get("tz") or data.get("timezone"),
-                location_name=data.get("location"),
-                gender=data.get("gender"),
-                tags=tags_data,
-                memo=data.get("notes"),
-                profile_key=profile_key,
-                narrative_profile=data.get("narrative_profile"),
-                settings_snapshot=settings_snapshot,
-                bodies=bodies,
-                houses=houses,
-                aspects=aspects,
-                patterns=patterns,
-                data={"metadata": metadata},
-            )
+            chart = Chart(**fields)
             db.add(chart)
             db.flush()
             db.refresh(chart)
         else:
-            existing.name = data.get("name")
-            existing.kind = data.get("kind")
-            existing.dt_utc = dt_utc
-            existing.lat = lat
-            existing.lon = lon
-            existing.timezone = data.get("tz") or data.get("timezone")
-            existing.location_name = data.get("location")
-            existing.gender = data.get("gender")
-            existing.tags = tags_data
-            existing.memo = data.get("notes")
-            existing.profile_key = profile_key
-            existing.narrative_profile = data.get("narrative_profile")
-            existing.settings_snapshot = settings_snapshot
-            existing.bodies = bodies
-            existing.houses = houses
-            existing.aspects = aspects
-            existing.patterns = patterns
-            existing.data = {"metadata": metadata}
+            for name, value in fields.items():
+                if name != "chart_key":
+                    setattr(existing, name, value)
             db.flush()
             db.refresh(existing)
             chart = existing
         return _chart_to_response(chart)
 
 
+def _report(progress: ProgressCallback | None, stage: str, done: int, total: int) -> None:
+    if progress is not None:
+        progress(stage, done, total)
+
+
+def _bulk_result(
+    total: int,
+    ids: Mapping[int, int],
+    created: int,
+    failures: Mapping[int, str],
+) -> ChartBulkResult:
+    return ChartBulkResult(
+        processed=total,
+        created=created,
+        updated=len(ids) - created,
+        ids=[ids.get(index) for index in range(total)],
+        failures=[
+            ChartBulkFailure(index=index, detail=detail)
+            for index, detail in sorted(failures.items())
+        ],
+    )
+
+
+def _persist_batches(
+    rows: Sequence[dict[str, Any]],
+    indices: Sequence[int],
+    write: Callable[[Any, Sequence[dict[str, Any]]], tuple[list[int], int]],
+    *,
+    batch_size: int,
+    failures: dict[int, str],
+    progress: ProgressCallback | None,
+) -> tuple[dict[int, int], int]:
+    """Write ``rows`` in transactions of ``batch_size``; a failed batch rolls back alone."""
+
+    ids: dict[int, int] = {}
+    created = 0
+    size = max(1, int(batch_size))
+    for start in range(0, len(rows), size):
+        batch = rows[start : start + size]
+        batch_indices = indices[start : start + size]
+        try:
+            with session_scope() as db:
+                batch_ids, batch_created = write(db, batch)
+        except SQLAlchemyError as exc:
+            detail = f"Database error: {exc.__class__.__name__}"
+            failures.update((index, detail) for index in batch_indices)
+        else:
+            ids.update(zip(batch_indices, batch_ids, strict=True))
+            created += batch_created
+        _report(progress, "insert", start + len(batch), len(rows))
+    return ids, created
+
+
+def _insert_new(db: Any, rows: Sequence[dict[str, Any]]) -> tuple[list[int], int]:
+    ids = ChartRepo().bulk_insert(db, rows)
+    return ids, len(ids)
+
+
+def _upsert(db: Any, rows: Sequence[dict[str, Any]]) -> tuple[list[int], int]:
+    return ChartRepo().bulk_upsert(db, rows)
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedBirth:
+    index: int
+    entry: ChartBulkEntry
+    moment: datetime
+    timezone_meta: dict[str, Any]
+    settings: Settings
+    profile_key: str
+    snapshot: dict[str, Any]
+
+
+def bulk_create_charts(
+    entries: Sequence[ChartBulkEntry | Mapping[str, Any]],
+    *,
+    workers: int | None = None,
+    batch_size: int = BULK_INSERT_BATCH,
+    progress: ProgressCallback | None = None,
+    executor: Executor | None = None,
+) -> ChartBulkResult:
+    """Compute and persist many charts.
+
+    Missing timezones are resolved in one :func:`tzids_for` pass, payloads are
+    computed with :func:`build_payloads` across ``workers`` processes (on
+    ``executor`` when given) and rows are inserted ``batch_size`` at a time
+    with ``executemany``. Invalid records are reported in ``failures``
+    without stopping the batch.
+    """
+
+    total = len(entries)
+    failures: dict[int, str] = {}
+    validated: dict[int, ChartBulkEntry] = {}
+    for index, raw in enumerate(entries):
+        try:
+            validated[index] = (
+                raw if isinstance(raw, ChartBulkEntry) else ChartBulkEntry.model_validate(raw)
+            )
+        except ValidationError as exc:
+            failures[index] = str(exc)
+
+    missing = [index for index, entry in validated.items() if not entry.tz]
+    resolved_tz: dict[int, str | None] = {}
+    if missing:
+        try:
+            points = [(validated[index].lat, validated[index].lon) for index in missing]
+            resolved_tz = dict(zip(missing, tzids_for(points), strict=True))
+        except ModuleNotFoundError as exc:
+            failures.update(
+                (index, str(exc)) for index in missing if validated[index].dt_local is not None
+            )
+
+    base_settings = runtime_settings.persisted()
+    profiles: dict[str | None, tuple[Settings, str, dict[str, Any]] | str] = {}
+    prepared: list[_PreparedBirth] = []
+    for index, entry in validated.items():
+        if index in failures:
+            continue
+        try:
+            if not entry.tz:
+                tzid = resolved_tz.get(index)
+                if tzid is None and entry.dt_local is not None:
+                    raise HTTPException(status_code=400, detail="Unable to resolve timezone for coordinates")
+                entry = entry.model_copy(update={"tz": tzid})
+            if entry.profile not in profiles:
+                try:
+                    settings, profile_key = _apply_profile(base_settings, entry.profile)
+                    profiles[entry.profile] = (settings, profile_key, settings.model_dump())
+                except HTTPException as exc:
+                    profiles[entry.profile] = str(exc.detail)
+            profile = profiles[entry.profile]
+            if isinstance(profile, str):
+                raise HTTPException(status_code=404, detail=profile)
+            moment, timezone_meta = _resolve_moment(entry)
+        except HTTPException as exc:
+            failures[index] = str(exc.detail)
+            continue
+        settings, profile_key, snapshot = profile
+        prepared.append(
+            _PreparedBirth(index, entry, moment, timezone_meta, settings, profile_key, snapshot)
+        )
+    _report(progress, "timezone", total, total)
+
+    payloads = build_payloads(
+        [(item.moment, float(item.entry.lat), float(item.entry.lon)) for item in prepared],
+        [item.settings for item in prepared],
+        workers=workers,
+        progress=lambda done, count: _report(progress, "compute", done, count),
+        executor=executor,
+    )
+
+    rows: list[dict[str, Any]] = []
+    indices: list[int] = []
+    for item, result in zip(prepared, payloads, strict=True):
+        if isinstance(result, PayloadFailure):
+            failures[item.index] = result.error
+            continue
+        rows.append(
+            _chart_fields(
+                item.entry,
+                item.moment,
+                item.timezone_meta,
+                result,
+                profile_key=item.profile_key,
+                settings_snapshot=item.snapshot,
+            )
+        )
+        indices.append(item.index)
+
+    ids, created = _persist_batches(
+        rows, indices, _insert_new, batch_size=batch_size, failures=failures, progress=progress
+    )
+    return _bulk_result(total, ids, created, failures)
+
+
+def bulk_import_charts(
+    records: Sequence[Mapping[str, Any]],
+    *,
+    batch_size: int = BULK_INSERT_BATCH,
+    progress: ProgressCallback | None = None,
+) -> ChartBulkResult:
+    """Insert or update many exported chart records keyed by ``chart_key``."""
+
+    total = len(records)
+    failures: dict[int, str] = {}
+    rows: list[dict[str, Any]] = []
+    indices: list[int] = []
+    for index, record in enumerate(records):
+        if not isinstance(record, Mapping):
+            failures[index] = "Chart record must be an object"
+            continue
+        try:
+            rows.append(_import_fields(record))
+        except HTTPException as exc:
+            failures[index] = str(exc.detail)
+            continue
+        indices.append(index)
+    ids, created = _persist_batches(
+        rows, indices, _upsert, batch_size=batch_size, failures=failures, progress=progress
+    )
+    return _bulk_result(total, ids, created, failures)
+
+
+_PAYLOAD_POOL_LOCK = threading.Lock()
+
+
+def _payload_pool(request: Request) -> Executor:
+    """Return the app's shared chart computation pool, starting it on first use."""
+
+    state = request.app.state
+    with _PAYLOAD_POOL_LOCK:
+        pool = getattr(state, "payload_pool", None)
+        if pool is None:
+            pool = payload_pool(runtime_settings.persisted().perf.workers)
+            state.payload_pool = pool
+    return pool
+
+
+class _StreamClosed(Exception):
+    """Raised from a progress callback once its client has gone away."""
+
+
+def _stream_progress(run: Callable[[ProgressCallback], ChartBulkResult]) -> StreamingResponse:
+    """Run ``run`` on a worker thread and stream its progress as NDJSON lines.
+
+    When the client disconnects the run stops at its next progress report;
+    batches already written stay stored.
+    """
+
+    events: queue.Queue[dict[str, Any] | None] = queue.Queue()
+    closed = threading.Event()
+
+    def _progress(stage: str, done: int, total: int) -> None:
+        if closed.is_set():
+            raise _StreamClosed
+        events.put({"stage": stage, "done": done, "total": total})
+
+    def _worker() -> None:
+        try:
+            result = run(_progress)
+            events.put({"result": result.model_dump()})
+        except _StreamClosed:
+            pass
+        except Exception as exc:  # pragma: no cover - surfaced to the client stream
+            events.put({"error": str(exc)})
+        finally:
+            events.put(None)
+
+    threading.Thread(target=_worker, name="charts-bulk", daemon=True).start()
+
+    async def _lines():
+        try:
+            while (event := await asyncio.to_thread(events.get)) is not None:
+                yield json.dumps(event) + "\n"
+        finally:
+            closed.set()
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
+@router.post("/bulk", response_model=ChartBulkResult)
+def bulk_create(
+    payload: ChartBulkCreate,
+    request: Request,
+    stream: bool = Query(
+        default=False,
+        description="Stream NDJSON progress lines, ending with the result.",
+    ),
+) -> ChartBulkResult | StreamingResponse:
+    pool = _payload_pool(request)
+
+    def _run(progress: ProgressCallback | None) -> ChartBulkResult:
+        return bulk_create_charts(
+            payload.charts, workers=payload.workers, progress=progress, executor=pool
+        )
+
+    if stream:
+        return _stream_progress(_run)
+    return _run(None)
+
+
+@router.post("/import/bulk", response_model=ChartBulkResult)
+def bulk_import(
+    payload: ChartBulkImport,
+    stream: bool = Query(
+        default=False,
+        description="Stream NDJSON progress lines, ending with the result.",
+    ),
+) -> ChartBulkResult | StreamingResponse:
+    def _run(progress: ProgressCallback | None) -> ChartBulkResult:
+        return bulk_import_charts(payload.charts, progress=progress)
+
+    if stream:
+        return _stream_progress(_run)
+    return _run(None)
+
+
 @router.get("/{chart_id}/pdf")
 def chart_pdf(chart_id: int) -> Response:
     settings = runtime_settings.persisted()
@@ -575,5 +1000,11 @@ def chart_pdf(chart_id: int) -> Response:
     return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
-__all__ = ["router"]
+__all__ = [
+    "ChartBulkEntry",
+    "ChartBulkResult",
+    "bulk_create_charts",
+    "bulk_import_charts",
+    "router",
+]
 
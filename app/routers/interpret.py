@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import threading
 from dataclasses import asdict
 from typing import Any
 
@@ -14,7 +15,7 @@ from app.schemas.interpret import (
     RulepacksResponse,
 )
 from astroengine.web.responses import conditional_json_response
-from core.interpret_plus.engine import interpret, load_rules
+from core.interpret_plus.engine import CompiledPack, compile_pack, interpret, load_rules
 
 router = APIRouter(prefix="/interpret", tags=["Interpretations"])
 
@@ -30,14 +31,61 @@ else:
     ]
 
 
-def _load_pack_info(path: str) -> RulepackInfo | None:
+class _LoadedPack:
+    """Rulepack file parsed once per ``(path, st_mtime_ns, st_size)``."""
+
+    __slots__ = ("signature", "info", "pack", "compiled")
+
+    def __init__(self, signature: tuple[str, int, int], pack: dict[str, Any] | None) -> None:
+        self.signature = signature
+        self.pack = pack
+        self.compiled: CompiledPack | None = None
+        self.info: RulepackInfo | None = None
+        if pack is not None:
+            path = signature[0]
+            rid = pack.get("rulepack") or os.path.splitext(os.path.basename(path))[0]
+            self.info = RulepackInfo(id=str(rid), path=path, description=pack.get("description"))
+
+
+_PACKS: dict[str, _LoadedPack] = {}
+_PACKS_LOCK = threading.Lock()
+
+
+def _loaded_pack(path: str) -> _LoadedPack | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = (path, stat.st_mtime_ns, stat.st_size)
+    with _PACKS_LOCK:
+        cached = _PACKS.get(path)
+    if cached is not None and cached.signature == signature:
+        return cached
     try:
-        pack = load_rules(path)
+        pack: dict[str, Any] | None = load_rules(path)
     except Exception:
+        pack = None
+    loaded = _LoadedPack(signature, pack)
+    with _PACKS_LOCK:
+        _PACKS[path] = loaded
+    return loaded
+
+
+def _load_pack_info(path: str) -> RulepackInfo | None:
+    loaded = _loaded_pack(path)
+    return loaded.info if loaded is not None else None
+
+
+def _compiled_pack(path: str) -> CompiledPack | None:
+    """Return the compiled rulepack at ``path``, rebuilt only when the file changes."""
+
+    loaded = _loaded_pack(path)
+    if loaded is None or loaded.pack is None:
         return None
-    rid = pack.get("rulepack") or os.path.splitext(os.path.basename(path))[0]
-    desc = pack.get("description")
-    return RulepackInfo(id=str(rid), path=path, description=desc)
+    if loaded.compiled is None:
+        path_key, mtime_ns, size = loaded.signature
+        loaded.compiled = compile_pack(loaded.pack, etag=f"file:{path_key}:{mtime_ns}:{size}")
+    return loaded.compiled
 
 
 def _discover_rulepacks() -> list[RulepackInfo]:
@@ -92,9 +140,10 @@ def relationship_findings(req: FindingsRequest):
     else:
         rp = req.rulepack_id or "relationship_basic"  # default built-in
         match = next((r for r in _discover_rulepacks() if r.id == rp), None)
-        if not match:
+        compiled = _compiled_pack(match.path) if match else None
+        if compiled is None:
             raise HTTPException(status_code=404, detail=f"rulepack not found: {rp}")
-        rules = load_rules(match.path)
+        rules = compiled
 
     # Build request for engine
     ireq: dict[str, Any] = {"scope": req.scope}
@@ -117,7 +166,10 @@ def relationship_findings(req: FindingsRequest):
     if req.top_k is not None and req.top_k > 0:
         findings = findings[: req.top_k]
 
-    pack_id = rules.get("rulepack") if isinstance(rules, dict) else None
+    if isinstance(rules, CompiledPack):
+        pack_id = rules.pack.get("rulepack")
+    else:
+        pack_id = rules.get("rulepack") if isinstance(rules, dict) else None
 
     return FindingsResponse(
         findings=[FindingOut(**asdict(f)) for f in findings],
@@ -5,6 +5,7 @@ from __future__ import annotations
 from .astrocartography import (
     AstrocartographyResult,
     MapLine,
+    compute_astrocartography_batch,
     compute_astrocartography_lines,
 )
 from .declinations import DeclinationAspect, declination_aspects, get_declinations
@@ -48,6 +49,7 @@ __all__ = [
     # Astrocartography
     "AstrocartographyResult",
     "MapLine",
+    "compute_astrocartography_batch",
     "compute_astrocartography_lines",
     # Fixed stars
     "Star",
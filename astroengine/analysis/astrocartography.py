@@ -7,12 +7,15 @@ from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
+import numpy as np
+
 from astroengine.ephemeris import SwissEphemerisAdapter
 from astroengine.ephemeris.swe import has_swe, swe
 
 __all__ = [
     "AstrocartographyResult",
     "MapLine",
+    "compute_astrocartography_batch",
     "compute_astrocartography_lines",
 ]
 
@@ -107,61 +110,38 @@ def _resolve_body_code(name: str) -> int:
     return int(code)
 
 
-def _normalize_longitude(value: float) -> float:
-    wrapped = (value + 180.0) % 360.0 - 180.0
-    if wrapped == -180.0:
-        return 180.0
-    return wrapped
+def _normalize_longitudes(values: np.ndarray) -> np.ndarray:
+    """Wrap ``values`` into ``(-180, 180]`` degrees."""
 
+    wrapped = (values + 180.0) % 360.0 - 180.0
+    return np.where(wrapped == -180.0, 180.0, wrapped)
 
-def _normalize_relative(value: float, reference: float) -> float:
-    """Shift ``value`` onto the longitude branch near ``reference``."""
 
-    adjusted = value
-    while adjusted - reference > 180.0:
-        adjusted -= 360.0
-    while adjusted - reference < -180.0:
-        adjusted += 360.0
-    return adjusted
+def _latitude_grid(start: float, stop: float, step_deg: float) -> np.ndarray:
+    count = int(math.floor((stop - start + 1e-6) / step_deg)) + 1
+    return np.clip(start + step_deg * np.arange(count, dtype=float), -90.0, 90.0)
 
 
-def _meridian_track(longitude: float, *, step_deg: float = 2.0) -> tuple[tuple[float, float], ...]:
-    coordinates: list[tuple[float, float]] = []
-    lat = -90.0
-    while lat <= 90.0 + 1e-6:
-        coordinates.append((_normalize_longitude(longitude), max(min(lat, 90.0), -90.0)))
-        lat += step_deg
-    return tuple(coordinates)
+def _horizon_longitudes(
+    ra_deg: np.ndarray,
+    decl_deg: np.ndarray,
+    gst_deg: np.ndarray,
+    latitudes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return rising/setting longitudes shaped ``(moments, bodies, latitudes)``.
 
+    Latitudes where the body is circumpolar (or sits on a celestial pole)
+    are ``NaN``.
+    """
 
-def _horizon_tracks(
-    ra_deg: float,
-    decl_deg: float,
-    gst_deg: float,
-    *,
-    step_deg: float = 1.5,
-) -> tuple[tuple[tuple[float, float], ...], tuple[tuple[float, float], ...]]:
-    asc: list[tuple[float, float]] = []
-    dsc: list[tuple[float, float]] = []
-    delta_rad = math.radians(decl_deg)
-    if abs(math.cos(delta_rad)) < 1e-6:
-        return tuple(asc), tuple(dsc)
-    lat = -88.5
-    while lat <= 88.5 + 1e-6:
-        phi = math.radians(lat)
-        tan_phi = math.tan(phi)
-        tan_delta = math.tan(delta_rad)
-        cos_h = -tan_phi * tan_delta
-        if abs(cos_h) <= 1.0:
-            hour_angle = math.degrees(math.acos(max(-1.0, min(1.0, cos_h))))
-            lon_rise = _normalize_longitude(ra_deg - hour_angle - gst_deg)
-            lon_set = _normalize_longitude(ra_deg + hour_angle - gst_deg)
-            asc.append((lon_rise, lat))
-            dsc.append((lon_set, lat))
-        lat += step_deg
-    asc.sort(key=lambda item: item[1])
-    dsc.sort(key=lambda item: item[1])
-    return tuple(asc), tuple(dsc)
+    delta = np.radians(decl_deg)[..., None]
+    cos_h = -np.tan(np.radians(latitudes)) * np.tan(delta)
+    valid = (np.abs(cos_h) <= 1.0) & (np.abs(np.cos(delta)) >= 1e-6)
+    hour_angle = np.degrees(np.arccos(np.clip(cos_h, -1.0, 1.0)))
+    base = (ra_deg - gst_deg[:, None])[..., None]
+    rise = np.where(valid, _normalize_longitudes(base - hour_angle), np.nan)
+    setting = np.where(valid, _normalize_longitudes(base + hour_angle), np.nan)
+    return rise, setting
 
 
 def _moment_to_utc(moment: datetime) -> datetime:
@@ -170,40 +150,50 @@ def _moment_to_utc(moment: datetime) -> datetime:
     return moment.astimezone(UTC)
 
 
-def _perpendicular_distance(
-    point: tuple[float, float], start: tuple[float, float], end: tuple[float, float]
-) -> float:
-    (x0, y0), (x1, y1), (x2, y2) = point, start, end
-    if (x1, y1) == (x2, y2):
-        return math.hypot(x0 - x1, y0 - y1)
-    numerator = abs((y2 - y1) * x0 - (x2 - x1) * y0 + x2 * y1 - y2 * x1)
-    denominator = math.hypot(x2 - x1, y2 - y1)
-    if denominator == 0.0:
-        return 0.0
-    return numerator / denominator
-
-
-def _angular_separation(
-    ra1_deg: float | None,
-    dec1_deg: float | None,
-    ra2_deg: float | None,
-    dec2_deg: float | None,
-) -> float | None:
-    """Return the angular separation between two equatorial coordinates."""
-
-    if None in (ra1_deg, dec1_deg, ra2_deg, dec2_deg):
-        return None
-
-    ra1 = math.radians(ra1_deg)
-    dec1 = math.radians(dec1_deg)
-    ra2 = math.radians(ra2_deg)
-    dec2 = math.radians(dec2_deg)
-    cos_angle = (
-        math.sin(dec1) * math.sin(dec2)
-        + math.cos(dec1) * math.cos(dec2) * math.cos(ra1 - ra2)
-    )
-    cos_angle = max(-1.0, min(1.0, cos_angle))
-    return math.degrees(math.acos(cos_angle))
+def _rdp_keep(
+    points: np.ndarray, first: np.ndarray, last: np.ndarray, tolerance: float
+) -> np.ndarray:
+    """Return Ramer–Douglas–Peucker keep-masks for many polylines at once.
+
+    ``points`` is shaped ``(lines, n, 2)`` and line ``i`` spans indices
+    ``first[i]..last[i]``.  Every pending split of every line is evaluated
+    in one array pass per recursion level; the retained points match the
+    recursive single-line form, including its first-maximum tie-break.
+    """
+
+    lines, count, _ = points.shape
+    index = np.arange(count)
+    inside = (index >= first[:, None]) & (index <= last[:, None])
+    if tolerance <= 0.0:
+        return inside
+    keep = inside & ((index == first[:, None]) | (index == last[:, None]))
+
+    line = np.flatnonzero(last - first >= 2)
+    lo, hi = first[line], last[line]
+    while line.size:
+        track = points[line]
+        x1, y1 = points[line, lo, 0][:, None], points[line, lo, 1][:, None]
+        x2, y2 = points[line, hi, 0][:, None], points[line, hi, 1][:, None]
+        x0, y0 = track[..., 0], track[..., 1]
+        dx, dy = x2 - x1, y2 - y1
+        span = np.hypot(dx, dy)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distance = np.where(
+                span == 0.0,
+                np.hypot(x0 - x1, y0 - y1),
+                np.abs(dy * x0 - dx * y0 + x2 * y1 - y2 * x1) / span,
+            )
+        distance[(index <= lo[:, None]) | (index >= hi[:, None])] = -np.inf
+        split = np.argmax(distance, axis=1)
+        split_ok = distance[np.arange(line.size), split] > tolerance
+
+        line, lo, hi, split = line[split_ok], lo[split_ok], hi[split_ok], split[split_ok]
+        keep[line, split] = True
+        line = np.concatenate((line, line))
+        lo, hi = np.concatenate((lo, split)), np.concatenate((split, hi))
+        wide = hi - lo >= 2
+        line, lo, hi = line[wide], lo[wide], hi[wide]
+    return keep
 
 
 def _rdp_simplify(
@@ -211,25 +201,167 @@ def _rdp_simplify(
 ) -> tuple[tuple[float, float], ...]:
     if tolerance <= 0.0 or len(coordinates) < 3:
         return coordinates
+    points = np.asarray(coordinates, dtype=float)[None]
+    keep = _rdp_keep(points, np.array([0]), np.array([len(coordinates) - 1]), tolerance)[0]
+    return tuple(point for point, kept in zip(coordinates, keep.tolist()) if kept)
+
+
+def _simplified_tracks(
+    longitudes: np.ndarray, latitudes: np.ndarray, tolerance: float
+) -> list[tuple[tuple[float, float], ...]]:
+    """Return simplified ``(lon, lat)`` tracks for each row of ``longitudes``.
+
+    ``NaN`` longitudes mark latitudes where a row has no track; valid
+    samples of a row are contiguous.
+    """
+
+    flat = longitudes.reshape(-1, latitudes.size)
+    valid = ~np.isnan(flat)
+    first = np.argmax(valid, axis=1)
+    last = latitudes.size - 1 - np.argmax(valid[:, ::-1], axis=1)
+    last[~valid.any(axis=1)] = -1
+    points = np.stack((flat, np.broadcast_to(latitudes, flat.shape)), axis=-1)
+    keep = _rdp_keep(points, first, last, tolerance)
+    return [
+        tuple(map(tuple, row[mask].tolist())) for row, mask in zip(points, keep)
+    ]
+
+
+def _equatorial_arrays(
+    adapter: SwissEphemerisAdapter, jds: Sequence[float], bodies: Sequence[str]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return right ascension and declination shaped ``(moments, bodies)``."""
+
+    codes = {body: _resolve_body_code(body) for body in bodies}
+    batched = getattr(adapter, "compute_bodies_array", None)
+    if batched is not None:
+        arrays = batched(jds, codes)
+        return arrays.right_ascension, arrays.declination
+    ra = np.empty((len(jds), len(bodies)))
+    decl = np.empty_like(ra)
+    for row, jd_ut in enumerate(jds):
+        for col, body in enumerate(bodies):
+            equatorial = adapter.body_equatorial(jd_ut, codes[body])
+            ra[row, col] = equatorial.right_ascension
+            decl[row, col] = equatorial.declination
+    return ra, decl
+
+
+def _pair_separations(
+    meridians: Sequence[MapLine], horizons: Sequence[MapLine]
+) -> list[list[float | None]]:
+    """Return angular separations between every meridian and horizon body."""
+
+    def _coords(lines: Sequence[MapLine]) -> tuple[np.ndarray, np.ndarray]:
+        ra = np.full(len(lines), np.nan)
+        decl = np.full(len(lines), np.nan)
+        for idx, line in enumerate(lines):
+            meta = line.metadata or {}
+            if meta.get("ra_deg") is not None and meta.get("decl_deg") is not None:
+                ra[idx] = meta["ra_deg"]
+                decl[idx] = meta["decl_deg"]
+        return np.radians(ra), np.radians(decl)
+
+    ra1, dec1 = _coords(meridians)
+    ra2, dec2 = _coords(horizons)
+    cos_angle = np.sin(dec1)[:, None] * np.sin(dec2) + np.cos(dec1)[:, None] * np.cos(
+        dec2
+    ) * np.cos(ra1[:, None] - ra2)
+    angle = np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
+    return [[None if value != value else value for value in row] for row in angle.tolist()]
+
+
+_PARAN_COMBINATIONS = (("MC", "ASC"), ("MC", "DSC"), ("IC", "ASC"), ("IC", "DSC"))
+
+
+def _paran_markers(lines: Sequence[MapLine]) -> tuple[dict[str, object], ...]:
+    """Intersect every meridian line with every horizon segment in array form."""
+
+    lines_by_kind: dict[str, list[MapLine]] = {kind: [] for kind in _AngleKinds}
+    for line in lines:
+        lines_by_kind.setdefault(line.kind, []).append(line)
+
+    markers: list[dict[str, object]] = []
+    seen: set[tuple[object, ...]] = set()
+    for meridian_kind, horizon_kind in _PARAN_COMBINATIONS:
+        meridians = [line for line in lines_by_kind.get(meridian_kind, []) if line.coordinates]
+        horizons = [line for line in lines_by_kind.get(horizon_kind, []) if len(line.coordinates) >= 2]
+        if not meridians or not horizons:
+            continue
+
+        owner = np.concatenate(
+            [np.full(len(line.coordinates) - 1, idx) for idx, line in enumerate(horizons)]
+        )
+        starts = np.concatenate([np.asarray(line.coordinates[:-1]) for line in horizons])
+        ends = np.concatenate([np.asarray(line.coordinates[1:]) for line in horizons])
+        longitude = _normalize_longitudes(
+            np.array([line.coordinates[0][0] for line in meridians], dtype=float)
+        )[:, None]
+
+        lon1 = longitude + (starts[:, 0] - longitude + 180.0) % 360.0 - 180.0
+        lon2 = longitude + (ends[:, 0] - longitude + 180.0) % 360.0 - 180.0
+        dx = lon2 - lon1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (longitude - lon1) / dx
+        lat = starts[:, 1] + t * (ends[:, 1] - starts[:, 1])
+        hit = (
+            (np.abs(dx) > 1e-9)
+            & (np.minimum(lon1, lon2) - 1e-9 <= longitude)
+            & (longitude <= np.maximum(lon1, lon2) + 1e-9)
+            & (t >= -1e-6)
+            & (t <= 1.0 + 1e-6)
+            & (np.abs(lat) <= 90.0 + 1e-6)
+        )
 
-    start, end = coordinates[0], coordinates[-1]
-    max_distance = 0.0
-    index = 0
-    for i in range(1, len(coordinates) - 1):
-        dist = _perpendicular_distance(coordinates[i], start, end)
-        if dist > max_distance:
-            index = i
-            max_distance = dist
-
-    if max_distance > tolerance:
-        left = _rdp_simplify(coordinates[: index + 1], tolerance)
-        right = _rdp_simplify(coordinates[index:], tolerance)
-        return left[:-1] + right
-    return (start, end)
+        separation = _pair_separations(meridians, horizons)
+        rows, cols = np.nonzero(hit)
+        dy = (ends[:, 1] - starts[:, 1])[cols]
+        magnitude = np.hypot(dx[rows, cols], dy)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bearing = np.degrees(np.arccos(np.clip(dy / magnitude, -1.0, 1.0)))
+        for row, col, hit_lat, hit_bearing, hit_magnitude in zip(
+            rows.tolist(),
+            cols.tolist(),
+            lat[rows, cols].tolist(),
+            bearing.tolist(),
+            magnitude.tolist(),
+        ):
+            meridian = meridians[row]
+            horizon = horizons[int(owner[col])]
+            hit_lon = float(longitude[row, 0])
+            key = (
+                meridian.body,
+                meridian.kind,
+                horizon.body,
+                horizon.kind,
+                round(hit_lon, 4),
+                round(hit_lat, 4),
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+
+            metadata: dict[str, float | None] = {
+                "angular_separation_deg": separation[row][int(owner[col])],
+            }
+            if hit_magnitude > 0.0:
+                metadata["bearing_difference_deg"] = hit_bearing
+
+            markers.append(
+                {
+                    "coordinates": ((hit_lon, hit_lat),),
+                    "longitude": hit_lon,
+                    "latitude": hit_lat,
+                    "primary": {"body": meridian.body, "kind": meridian.kind},
+                    "secondary": {"body": horizon.body, "kind": horizon.kind},
+                    "metadata": metadata,
+                }
+            )
+    return tuple(markers)
 
 
-def compute_astrocartography_lines(
-    moment: datetime,
+def compute_astrocartography_batch(
+    moments: Sequence[datetime],
     *,
     bodies: Sequence[str] | None = None,
     adapter: SwissEphemerisAdapter | None = None,
@@ -237,8 +369,13 @@ def compute_astrocartography_lines(
     line_types: Iterable[str] | None = None,
     simplify_tolerance: float = 0.5,
     show_parans: bool = False,
-) -> AstrocartographyResult:
-    """Return astrocartography lines for ``moment`` with optional parans."""
+) -> tuple[AstrocartographyResult, ...]:
+    """Return astrocartography lines for every moment in ``moments``.
+
+    Equatorial positions for all moments and bodies come from one batched
+    ephemeris call, and ASC/DSC/MC/IC longitudes are evaluated over the
+    whole latitude grid as ``(moments, bodies, latitudes)`` arrays.
+    """
 
     _require_swisseph()
 
@@ -247,134 +384,78 @@ def compute_astrocartography_lines(
     requested_kinds = {kind.upper() for kind in (line_types or _AngleKinds)} & _AngleKinds
     if not requested_kinds:
         raise ValueError("At least one line type must be requested")
+    if not moments:
+        return ()
 
-    jd_ut = adapter.julian_day(_moment_to_utc(moment))
+    jds = [adapter.julian_day(_moment_to_utc(moment)) for moment in moments]
     swe_module = swe()
-    gst_hours = swe_module.sidtime(jd_ut)
-    gst_deg = (gst_hours * 15.0) % 360.0
-
-    lines: list[MapLine] = []
-    for body in bodies:
-        code = _resolve_body_code(body)
-        equatorial = adapter.body_equatorial(jd_ut, code)
-        ra_deg = equatorial.right_ascension
-        decl_deg = equatorial.declination
-        metadata = {"ra_deg": ra_deg, "decl_deg": decl_deg}
-
-        mc_long = _normalize_longitude(ra_deg - gst_deg)
-        if "MC" in requested_kinds:
-            track = _meridian_track(mc_long, step_deg=lat_step)
-            track = _rdp_simplify(track, simplify_tolerance)
-            lines.append(MapLine(body=body, kind="MC", coordinates=track, metadata=metadata))
-        if "IC" in requested_kinds:
-            ic_long = _normalize_longitude(mc_long + 180.0)
-            track = _meridian_track(ic_long, step_deg=lat_step)
-            track = _rdp_simplify(track, simplify_tolerance)
-            lines.append(MapLine(body=body, kind="IC", coordinates=track, metadata=metadata))
-
-        asc_track, dsc_track = _horizon_tracks(ra_deg, decl_deg, gst_deg, step_deg=lat_step)
-        if asc_track and "ASC" in requested_kinds:
-            lines.append(
-                MapLine(
-                    body=body,
-                    kind="ASC",
-                    coordinates=_rdp_simplify(asc_track, simplify_tolerance),
-                    metadata=metadata,
-                )
-            )
-        if dsc_track and "DSC" in requested_kinds:
-            lines.append(
-                MapLine(
-                    body=body,
-                    kind="DSC",
-                    coordinates=_rdp_simplify(dsc_track, simplify_tolerance),
-                    metadata=metadata,
-                )
-            )
+    gst_deg = np.array([swe_module.sidtime(jd_ut) * 15.0 % 360.0 for jd_ut in jds])
+    if bodies:
+        ra_deg, decl_deg = _equatorial_arrays(adapter, jds, bodies)
+    else:
+        ra_deg = decl_deg = np.empty((len(jds), 0))
+
+    meridian_lats = _latitude_grid(-90.0, 90.0, lat_step)
+    horizon_lats = _latitude_grid(-88.5, 88.5, lat_step)
+    mc_long = _normalize_longitudes(ra_deg - gst_deg[:, None])
+    ic_long = _normalize_longitudes(mc_long + 180.0)
+    rise, setting = _horizon_longitudes(ra_deg, decl_deg, gst_deg, horizon_lats)
+
+    shape = mc_long.shape
+    tracks = {
+        "MC": _simplified_tracks(
+            np.repeat(mc_long[..., None], meridian_lats.size, axis=-1),
+            meridian_lats,
+            simplify_tolerance,
+        ),
+        "IC": _simplified_tracks(
+            np.repeat(ic_long[..., None], meridian_lats.size, axis=-1),
+            meridian_lats,
+            simplify_tolerance,
+        ),
+        "ASC": _simplified_tracks(rise, horizon_lats, simplify_tolerance),
+        "DSC": _simplified_tracks(setting, horizon_lats, simplify_tolerance),
+    }
+    kinds = [kind for kind in ("MC", "IC", "ASC", "DSC") if kind in requested_kinds]
+
+    results: list[AstrocartographyResult] = []
+    for row in range(shape[0]):
+        lines: list[MapLine] = []
+        for col, body in enumerate(bodies):
+            metadata = {
+                "ra_deg": float(ra_deg[row, col]),
+                "decl_deg": float(decl_deg[row, col]),
+            }
+            flat = row * shape[1] + col
+            for kind in kinds:
+                track = tracks[kind][flat]
+                if track or kind in {"MC", "IC"}:
+                    lines.append(
+                        MapLine(body=body, kind=kind, coordinates=track, metadata=metadata)
+                    )
+        parans = _paran_markers(lines) if show_parans else ()
+        results.append(AstrocartographyResult(lines=tuple(lines), parans=parans))
+    return tuple(results)
+
+
+def compute_astrocartography_lines(
+    moment: datetime,
+    *,
+    bodies: Sequence[str] | None = None,
+    adapter: SwissEphemerisAdapter | None = None,
+    lat_step: float = 1.5,
+    line_types: Iterable[str] | None = None,
+    simplify_tolerance: float = 0.5,
+    show_parans: bool = False,
+) -> AstrocartographyResult:
+    """Return astrocartography lines for ``moment`` with optional parans."""
 
-    parans: tuple[dict[str, object], ...] = tuple()
-    if show_parans:
-        lines_by_kind: dict[str, list[MapLine]] = {kind: [] for kind in _AngleKinds}
-        for line in lines:
-            lines_by_kind.setdefault(line.kind, []).append(line)
-
-        paran_markers: list[dict[str, object]] = []
-        seen: set[tuple[object, ...]] = set()
-        combinations = (("MC", "ASC"), ("MC", "DSC"), ("IC", "ASC"), ("IC", "DSC"))
-
-        for meridian_kind, horizon_kind in combinations:
-            for meridian in lines_by_kind.get(meridian_kind, []):
-                if not meridian.coordinates:
-                    continue
-                longitude = _normalize_longitude(meridian.coordinates[0][0])
-                meridian_meta = meridian.metadata
-                for horizon in lines_by_kind.get(horizon_kind, []):
-                    coords = horizon.coordinates
-                    if len(coords) < 2:
-                        continue
-                    horizon_meta = horizon.metadata
-                    for idx in range(len(coords) - 1):
-                        lon1, lat1 = coords[idx]
-                        lon2, lat2 = coords[idx + 1]
-                        lon1_adj = _normalize_relative(lon1, longitude)
-                        lon2_adj = _normalize_relative(lon2, longitude)
-                        if math.isclose(lon1_adj, lon2_adj, abs_tol=1e-9):
-                            continue
-                        min_lon = min(lon1_adj, lon2_adj)
-                        max_lon = max(lon1_adj, lon2_adj)
-                        if not (min_lon - 1e-9 <= longitude <= max_lon + 1e-9):
-                            continue
-                        t = (longitude - lon1_adj) / (lon2_adj - lon1_adj)
-                        if t < -1e-6 or t > 1.0 + 1e-6:
-                            continue
-                        lat = lat1 + t * (lat2 - lat1)
-                        if lat < -90.0 - 1e-6 or lat > 90.0 + 1e-6:
-                            continue
-
-                        key = (
-                            meridian.body,
-                            meridian.kind,
-                            horizon.body,
-                            horizon.kind,
-                            round(longitude, 4),
-                            round(lat, 4),
-                        )
-                        if key in seen:
-                            continue
-                        seen.add(key)
-
-                        dx = lon2_adj - lon1_adj
-                        dy = lat2 - lat1
-                        magnitude = math.hypot(dx, dy)
-                        bearing_angle = None
-                        if magnitude > 0.0:
-                            cos_theta = max(-1.0, min(1.0, dy / magnitude))
-                            bearing_angle = math.degrees(math.acos(cos_theta))
-
-                        angular_sep = _angular_separation(
-                            meridian_meta.get("ra_deg") if meridian_meta else None,
-                            meridian_meta.get("decl_deg") if meridian_meta else None,
-                            horizon_meta.get("ra_deg") if horizon_meta else None,
-                            horizon_meta.get("decl_deg") if horizon_meta else None,
-                        )
-
-                        metadata: dict[str, float | None] = {
-                            "angular_separation_deg": angular_sep,
-                        }
-                        if bearing_angle is not None:
-                            metadata["bearing_difference_deg"] = bearing_angle
-
-                        paran_markers.append(
-                            {
-                                "coordinates": ((longitude, lat),),
-                                "longitude": longitude,
-                                "latitude": lat,
-                                "primary": {"body": meridian.body, "kind": meridian.kind},
-                                "secondary": {"body": horizon.body, "kind": horizon.kind},
-                                "metadata": metadata,
-                            }
-                        )
-
-        parans = tuple(paran_markers)
-
-    return AstrocartographyResult(lines=tuple(lines), parans=parans)
+    return compute_astrocartography_batch(
+        (moment,),
+        bodies=bodies,
+        adapter=adapter,
+        lat_step=lat_step,
+        line_types=line_types,
+        simplify_tolerance=simplify_tolerance,
+        show_parans=show_parans,
+    )[0]
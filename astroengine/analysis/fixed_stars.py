@@ -7,11 +7,11 @@ import math
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from functools import cache
+from functools import cache, lru_cache
 from importlib import resources
 
 from ..astro.declination import OBLIQUITY_DEG
-from ..core.stars_plus import Location, ParanPair, detect_parans
+from ..core.stars_plus import Location, StarEventTable, scan_parans
 from ..core.stars_plus.catalog import Star as ParanStar
 
 __all__ = [
@@ -212,6 +212,25 @@ def star_declination_aspects(
     return aspects
 
 
+@lru_cache(maxsize=64)
+def _star_event_table(
+    catalog: str, magnitude_limit: float | None, lat_deg: float, lon_deg: float
+) -> StarEventTable:
+    """Return the cached star rise/set/culmination table for one location."""
+
+    stars = {
+        star.name: ParanStar(
+            name=star.name,
+            ra_deg=star.ra_deg,
+            dec_deg=star.dec_deg,
+            vmag=star.mag,
+        )
+        for star in _catalog_rows(catalog)
+        if magnitude_limit is None or star.mag <= magnitude_limit
+    }
+    return StarEventTable.build(stars, Location(lat_deg=lat_deg, lon_east_deg=lon_deg))
+
+
 def star_parans(
     date_start: datetime,
     date_end: datetime,
@@ -264,43 +283,22 @@ def star_parans(
         )
 
     allowed_events = {"rise", "set", "culminate"}
+    event_pairs = tuple(event_pairs)
     for star_event, planet_event in event_pairs:
         if star_event not in allowed_events or planet_event not in allowed_events:
             raise ValueError("Unsupported event in event_pairs")
 
-    star_catalog: dict[str, ParanStar] = {}
-    for star in _catalog_rows(catalog):
-        if magnitude_limit is not None and star.mag > magnitude_limit:
-            continue
-        star_catalog[star.name] = ParanStar(
-            name=star.name,
-            ra_deg=star.ra_deg,
-            dec_deg=star.dec_deg,
-            vmag=star.mag,
-        )
-
-    if not star_catalog:
+    table = _star_event_table(catalog, magnitude_limit, lat_deg, lon_deg)
+    if not table.names:
         return []
 
-    pairs = [
-        ParanPair(
-            star_name=star_name,
-            planet_name=body,
-            star_event=star_event,
-            planet_event=planet_event,
-        )
-        for star_name in star_catalog
-        for body in bodies
-        for star_event, planet_event in event_pairs
-    ]
-
-    events = detect_parans(
-        date_start=date_start,
-        date_end=date_end,
-        location=Location(lat_deg=lat_deg, lon_east_deg=lon_deg),
-        stars=star_catalog,
-        provider_radec=provider_radec,
-        pairs=pairs,
+    events = scan_parans(
+        date_start,
+        date_end,
+        table,
+        bodies,
+        provider_radec,
+        event_pairs,
         tol_minutes=float(tolerance_minutes),
         step_days=int(step_days),
     )
@@ -3,14 +3,31 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import math
+import os
+import sqlite3
+import threading
 import time
 from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
 
 from fastapi import HTTPException, Request, Response, status
 
+from ..observability.metrics import RATE_LIMIT_REJECTIONS, RATE_LIMIT_STORE_ERRORS
+
+try:  # pragma: no cover - optional redis runtime
+    from redis.asyncio import Redis
+except ModuleNotFoundError:  # pragma: no cover - optional dependency guard
+    Redis = None  # type: ignore
+
+LOGGER = logging.getLogger(__name__)
+
+RATE_LIMIT_STORE_ENV = "ASTROENGINE_RATE_LIMIT_STORE"
+
 
 @dataclass
 class RateLimitStatus:
@@ -59,6 +76,294 @@ class SimpleRateLimiter:
             return RateLimitStatus(True, remaining, max(reset, 0.0))
 
 
+class BucketStore(Protocol):
+    """Shared token-bucket state keyed by ``scope:identity``."""
+
+    name: str
+
+    async def take(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> tuple[bool, float]:
+        """Refill ``key`` to ``now``, take one token if available.
+
+        Returns ``(allowed, tokens_left)``.
+        """
+
+
+def _refill(
+    tokens: float, last: float, capacity: float, refill_per_second: float, now: float
+) -> tuple[bool, float]:
+    level = min(capacity, tokens + max(0.0, now - last) * refill_per_second)
+    if level >= 1.0:
+        return True, level - 1.0
+    return False, level
+
+
+class MemoryBucketStore:
+    """Per-process buckets split across independently locked stripes.
+
+    Each identity costs one ``(tokens, updated, full_at)`` tuple.  Buckets that
+    have refilled completely are indistinguishable from absent ones, so each
+    stripe periodically drops them.
+    """
+
+    name = "memory"
+
+    def __init__(self, stripes: int = 64, *, sweep_every: int = 4096) -> None:
+        if stripes <= 0:
+            raise ValueError("stripes must be positive")
+        self._stripes: tuple[tuple[dict[str, tuple[float, float, float]], threading.Lock], ...]
+        self._stripes = tuple(({}, threading.Lock()) for _ in range(stripes))
+        self._sweep_every = sweep_every
+        self._ops = [0] * stripes
+
+    def __len__(self) -> int:
+        return sum(len(buckets) for buckets, _ in self._stripes)
+
+    def take_now(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> tuple[bool, float]:
+        """Synchronous form of :meth:`take`."""
+
+        index = hash(key) % len(self._stripes)
+        buckets, lock = self._stripes[index]
+        with lock:
+            tokens, last, _ = buckets.get(key, (capacity, now, now))
+            allowed, tokens = _refill(tokens, last, capacity, refill_per_second, now)
+            full_at = now + (capacity - tokens) / refill_per_second
+            buckets[key] = (tokens, max(last, now), full_at)
+            self._ops[index] += 1
+            if self._ops[index] >= self._sweep_every:
+                self._ops[index] = 0
+                for stale in [k for k, v in buckets.items() if v[2] <= now]:
+                    del buckets[stale]
+        return allowed, tokens
+
+    async def take(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> tuple[bool, float]:
+        return self.take_now(key, capacity, refill_per_second, now)
+
+
+class SQLiteBucketStore:
+    """Buckets shared by every worker process on a host through one SQLite file.
+
+    Each decision is a single atomic ``UPSERT ... RETURNING`` statement, so
+    concurrent workers serialise on SQLite's write lock rather than on a
+    Python lock.  Place the file on a tmpfs (e.g. ``/dev/shm``) to keep it in
+    shared memory.  Statements run on a worker thread so the event loop never
+    blocks on the file; a write lock held longer than ``busy_timeout`` seconds
+    raises ``sqlite3.OperationalError``, which :class:`TokenBucketRateLimiter`
+    answers from its per-process fallback buckets (fail open to local limits).
+    """
+
+    name = "sqlite"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rate_buckets (
+            key TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated REAL NOT NULL,
+            full_at REAL NOT NULL,
+            allowed INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """
+    # SET expressions read the pre-update row, so ``level`` is recomputed inline.
+    _TAKE = """
+        INSERT INTO rate_buckets (key, tokens, updated, full_at, allowed)
+        VALUES (:key, :capacity - 1, :now, :now + 1 / :refill, 1)
+        ON CONFLICT(key) DO UPDATE SET
+            allowed = (min(:capacity, tokens + max(0, :now - updated) * :refill) >= 1),
+            tokens = min(:capacity, tokens + max(0, :now - updated) * :refill)
+                - (min(:capacity, tokens + max(0, :now - updated) * :refill) >= 1),
+            full_at = :now + (:capacity - min(:capacity, tokens + max(0, :now - updated) * :refill)
+                + (min(:capacity, tokens + max(0, :now - updated) * :refill) >= 1)) / :refill,
+            updated = max(updated, :now)
+        RETURNING allowed, tokens
+    """
+    _PRUNE = "DELETE FROM rate_buckets WHERE full_at <= ?"
+
+    def __init__(
+        self, path: str | Path, *, prune_every: int = 4096, busy_timeout: float = 0.05
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = float(busy_timeout)
+        self._local = threading.local()
+        self._prune_every = prune_every
+        self._ops = 0
+        self._connection().execute(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path, isolation_level=None, timeout=self.busy_timeout)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=OFF")
+            self._local.con = con
+        return con
+
+    def take_now(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> tuple[bool, float]:
+        """Synchronous form of :meth:`take`."""
+
+        con = self._connection()
+        allowed, tokens = con.execute(
+            self._TAKE,
+            {"key": key, "capacity": capacity, "refill": refill_per_second, "now": now},
+        ).fetchone()
+        self._ops += 1
+        if self._ops >= self._prune_every:
+            self._ops = 0
+            con.execute(self._PRUNE, (now,))
+        return bool(allowed), float(tokens)
+
+    async def take(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> tuple[bool, float]:
+        return await asyncio.to_thread(self.take_now, key, capacity, refill_per_second, now)
+
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local last = tonumber(bucket[2]) or now
+local level = math.min(capacity, tokens + math.max(0, now - last) * refill)
+local allowed = 0
+if level >= 1 then
+    allowed = 1
+    level = level - 1
+end
+redis.call('HSET', KEYS[1], 'tokens', level, 'updated', math.max(last, now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - level) / refill * 1000) + 1000)
+return {allowed, tostring(level)}
+"""
+
+
+class RedisBucketStore:
+    """Buckets shared across hosts through any server speaking the Redis protocol.
+
+    ``client`` needs an awaitable ``eval(script, numkeys, *keys_and_args)``;
+    ``redis.asyncio.Redis`` and :class:`LocalRedisStandIn` both qualify.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: Any, *, prefix: str = "rl:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, *, prefix: str = "rl:") -> RedisBucketStore:
+        if Redis is None:
+            raise RuntimeError("redis is required for Redis rate limiting. Install 'redis'.")
+        return cls(Redis.from_url(url, decode_responses=True), prefix=prefix)
+
+    async def take(
+        self, key: str, capacity: float, refill_per_second: float, now: float
+    ) -> tuple[bool, float]:
+        allowed, tokens = await self._client.eval(
+            TOKEN_BUCKET_SCRIPT,
+            1,
+            self._prefix + key,
+            float(capacity),
+            float(refill_per_second),
+            float(now),
+        )
+        return bool(int(allowed)), float(tokens)
+
+
+class LocalRedisStandIn:
+    """In-process stand-in serving :data:`TOKEN_BUCKET_SCRIPT` for development and tests."""
+
+    def __init__(self, stripes: int = 64) -> None:
+        self._buckets = MemoryBucketStore(stripes)
+        self.calls = 0
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
+        if script != TOKEN_BUCKET_SCRIPT or numkeys != 1:
+            raise ValueError("LocalRedisStandIn only serves the token-bucket script")
+        key, capacity, refill, now = keys_and_args
+        self.calls += 1
+        allowed, tokens = self._buckets.take_now(
+            str(key), float(capacity), float(refill), float(now)
+        )
+        return [int(allowed), repr(tokens)]
+
+
+def create_bucket_store(url: str | None = None) -> BucketStore:
+    """Return a bucket store for ``url``.
+
+    ``None``/``"memory"`` keeps buckets in-process, ``"sqlite:///path"`` shares
+    them between workers on one host and ``"redis://..."`` across hosts.
+    """
+
+    if not url or url == "memory":
+        return MemoryBucketStore()
+    if url.startswith("sqlite:"):
+        # SQLAlchemy-style: sqlite:///relative.db or sqlite:////absolute.db
+        path = url.removeprefix("sqlite:///") if url.startswith("sqlite:///") else url[7:]
+        if not path:
+            raise ValueError("sqlite rate-limit store requires a path")
+        return SQLiteBucketStore(path)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBucketStore.from_url(url)
+    raise ValueError(f"Unsupported rate-limit store: {url!r}")
+
+
+class TokenBucketRateLimiter:
+    """Token bucket allowing ``limit`` requests per ``window_seconds`` per identity.
+
+    Bursts up to ``limit`` are admitted and tokens refill continuously at
+    ``limit / window_seconds`` per second.  State lives in ``store``; if the
+    store fails, the decision falls back to in-process buckets.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float,
+        *,
+        scope: str = "default",
+        store: BucketStore | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if limit <= 0 or window_seconds <= 0:
+            raise ValueError("limit and window_seconds must be positive")
+        self.limit = int(limit)
+        self.window = float(window_seconds)
+        self.scope = scope
+        self.store: BucketStore = store or MemoryBucketStore()
+        self._refill = self.limit / self.window
+        self._clock = clock
+        self._fallback: MemoryBucketStore | None = None
+
+    async def check(self, identity: str) -> RateLimitStatus:
+        """Take a token for ``identity`` and return the quota status."""
+
+        key = f"{self.scope}:{identity}"
+        now = self._clock()
+        try:
+            allowed, tokens = await self.store.take(key, self.limit, self._refill, now)
+        except Exception as exc:
+            RATE_LIMIT_STORE_ERRORS.labels(store=self.store.name).inc()
+            LOGGER.warning("rate limit store %s failed: %s", self.store.name, exc)
+            if self._fallback is None:
+                self._fallback = MemoryBucketStore()
+            allowed, tokens = self._fallback.take_now(key, self.limit, self._refill, now)
+
+        if allowed:
+            reset = (self.limit - tokens) / self._refill
+        else:
+            RATE_LIMIT_REJECTIONS.labels(scope=self.scope).inc()
+            reset = (1.0 - tokens) / self._refill
+        return RateLimitStatus(allowed, max(0, int(math.floor(tokens))), max(reset, 0.0))
+
+
 def _resolve_identity(request: Request) -> str:
     user_headers = [
         "x-api-user",
@@ -85,7 +390,7 @@ def _resolve_identity(request: Request) -> str:
     return "anonymous"
 
 
-def _limiter_registry(request: Request) -> dict[str, SimpleRateLimiter]:
+def _limiter_registry(request: Request) -> dict[str, TokenBucketRateLimiter]:
     registry = getattr(request.app.state, "_simple_rate_limiters", None)
     if registry is None:
         registry = {}
@@ -93,13 +398,29 @@ def _limiter_registry(request: Request) -> dict[str, SimpleRateLimiter]:
     return registry
 
 
+def _bucket_store(request: Request) -> BucketStore:
+    store = getattr(request.app.state, "rate_limit_store", None)
+    if store is None:
+        store = create_bucket_store(os.getenv(RATE_LIMIT_STORE_ENV))
+        request.app.state.rate_limit_store = store
+    return store
+
+
 def _get_limiter(
     request: Request, scope: str, limit: int, window_seconds: int | float
-) -> SimpleRateLimiter:
+) -> TokenBucketRateLimiter:
     registry = _limiter_registry(request)
+    store = _bucket_store(request)
     limiter = registry.get(scope)
-    if limiter is None or limiter.limit != limit or limiter.window != float(window_seconds):
-        limiter = SimpleRateLimiter(limit=limit, window_seconds=float(window_seconds))
+    if (
+        limiter is None
+        or limiter.limit != limit
+        or limiter.window != float(window_seconds)
+        or limiter.store is not store
+    ):
+        limiter = TokenBucketRateLimiter(
+            limit, float(window_seconds), scope=scope, store=store
+        )
         registry[scope] = limiter
     return limiter
 
@@ -111,7 +432,13 @@ def heavy_endpoint_rate_limiter(
     window_seconds: int = 60,
     message: str | None = None,
 ) -> Callable[[Request, Response], Awaitable[None]]:
-    """Return a dependency enforcing a simple rate limit for ``scope``."""
+    """Return a dependency enforcing a token-bucket rate limit for ``scope``.
+
+    Buckets live in ``app.state.rate_limit_store``, created on first use from
+    the ``ASTROENGINE_RATE_LIMIT_STORE`` environment variable (see
+    :func:`create_bucket_store`); use a shared store so the limit holds across
+    worker processes.
+    """
 
     friendly = message or "This endpoint is receiving a high volume of requests."
 
@@ -144,8 +471,17 @@ def heavy_endpoint_rate_limiter(
 
 
 __all__ = [
+    "BucketStore",
+    "LocalRedisStandIn",
+    "MemoryBucketStore",
+    "RATE_LIMIT_STORE_ENV",
     "RateLimitStatus",
+    "RedisBucketStore",
+    "SQLiteBucketStore",
     "SimpleRateLimiter",
+    "TOKEN_BUCKET_SCRIPT",
+    "TokenBucketRateLimiter",
+    "create_bucket_store",
     "heavy_endpoint_rate_limiter",
 ]
 
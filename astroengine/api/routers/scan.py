@@ -12,7 +12,7 @@ from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
 
 from .._time import UtcDateTime, ensure_utc_datetime
 
-from ...core.transit_engine import scan_transits
+from ...core.transit_engine import iter_scan_transits, scan_transits
 from ...detectors.directed_aspects import solar_arc_natal_aspects
 from ...detectors.progressed_aspects import progressed_natal_aspects
 from ...detectors.returns import solar_lunar_returns
@@ -337,11 +337,15 @@ def _iter_direction_hits(request: TransitScanRequest) -> Iterator[Hit]:
     )
 
 
-def _iter_transit_hits(request: TransitScanRequest) -> Iterator[Hit]:
+def _iter_transit_hits(
+    request: TransitScanRequest, *, streaming: bool = False
+) -> Iterator[Hit]:
     natal, start, end = request.iso_tuple()
+    # Streaming consumes the heap-merged generator so hits leave as found.
+    scan = iter_scan_transits if streaming else scan_transits
     yield from (
         _hit_from_aspect(hit)
-        for hit in scan_transits(
+        for hit in scan(
             natal_ts=natal,
             start_ts=start,
             end_ts=end,
@@ -569,7 +573,7 @@ def api_scan_transits(
             )
         return _stream_scan_hits(
             "transits",
-            _iter_transit_hits(request),
+            _iter_transit_hits(request, streaming=True),
             offset=offset,
             limit=limit,
         )
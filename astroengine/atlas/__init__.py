@@ -12,6 +12,7 @@ from .tz import (
     to_utc,
     to_utc_with_timezone,
     tzid_for,
+    tzids_for,
 )
 
 __all__ = [
@@ -25,5 +26,6 @@ __all__ = [
     "to_utc",
     "to_utc_with_timezone",
     "tzid_for",
+    "tzids_for",
 ]
 
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import importlib
 import importlib.util
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Literal, NoReturn
@@ -122,6 +123,7 @@ __all__ = [
     "to_utc",
     "to_utc_with_timezone",
     "tzid_for",
+    "tzids_for",
 
 ]
 
@@ -141,6 +143,27 @@ def tzid_for(lat: float, lon: float) -> str:
     raise ValueError("Unable to resolve timezone for coordinates")
 
 
+def tzids_for(points: Iterable[tuple[float, float]]) -> list[str | None]:
+    """Return timezone identifiers for many ``(lat, lon)`` points at once.
+
+    Each distinct coordinate is looked up once, so batches of births from the
+    same towns cost one finder query per town. Points that cannot be resolved
+    map to ``None`` instead of raising.
+    """
+
+    resolved: dict[tuple[float, float], str | None] = {}
+    result: list[str | None] = []
+    for lat, lon in points:
+        key = (float(lat), float(lon))
+        if key not in resolved:
+            try:
+                resolved[key] = tzid_for(*key)
+            except ValueError:
+                resolved[key] = None
+        result.append(resolved[key])
+    return result
+
+
 def _attach(local_naive: datetime, zone: ZoneInfo, fold: int) -> datetime:
     if local_naive.tzinfo is not None:
         raise ValueError("local_naive must be timezone-naive")
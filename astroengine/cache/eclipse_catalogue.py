@@ -0,0 +1,148 @@
+"""Memory-mapped catalogue of global solar and lunar eclipse maxima.
+
+The file is a 64-byte header followed by fixed-size little-endian records
+sorted by Julian day.  The header records the Julian-day span that was
+searched when the catalogue was built, so an empty range inside that span
+is a definitive "no eclipses" answer rather than a cache miss.  Writers
+build a sibling file and swap it in atomically.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from ..infrastructure.home import ae_home
+
+__all__ = [
+    "CATALOGUE",
+    "KIND_LUNAR",
+    "KIND_SOLAR",
+    "RECORD_DTYPE",
+    "EclipseCatalogue",
+    "write_eclipse_catalogue",
+]
+
+CATALOGUE = ae_home() / "cache" / "eclipses.bin"
+
+MAGIC = b"AEECLIP1"
+VERSION = 1
+_HEADER = struct.Struct("<8sIddq")  # magic, version, start_jd, end_jd, records
+_HEADER_SIZE = 64
+
+KIND_SOLAR = 0
+KIND_LUNAR = 1
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("jd", "<f8"),
+        ("sun_longitude", "<f8"),
+        ("moon_longitude", "<f8"),
+        ("moon_latitude", "<f8"),
+        ("kind", "<i4"),
+        ("swe_flags", "<i4"),
+    ]
+)
+
+
+class EclipseCatalogue:
+    """Read-only view over an eclipse catalogue file."""
+
+    __slots__ = ("path", "start_jd", "end_jd", "_records", "_jd", "_stat")
+
+    def __init__(
+        self,
+        path: Path,
+        start_jd: float,
+        end_jd: float,
+        records: np.ndarray,
+        stat: os.stat_result | None = None,
+    ) -> None:
+        self.path = path
+        self.start_jd = float(start_jd)
+        self.end_jd = float(end_jd)
+        self._records = records
+        self._jd = records["jd"]
+        self._stat = stat
+
+    @classmethod
+    def open(cls, path: str | Path) -> EclipseCatalogue:
+        """Map ``path`` read-only, validating its header."""
+
+        target = Path(path)
+        with target.open("rb") as handle:
+            header = handle.read(_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE:
+            raise ValueError(f"{target} is not an eclipse catalogue")
+        magic, version, start_jd, end_jd, count = _HEADER.unpack_from(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{target} has an unsupported eclipse catalogue header")
+        if count:
+            records = np.memmap(
+                target, dtype=RECORD_DTYPE, mode="r", offset=_HEADER_SIZE, shape=(count,)
+            )
+        else:
+            records = np.empty(0, dtype=RECORD_DTYPE)
+        return cls(target, start_jd, end_jd, records, os.stat(target))
+
+    def __len__(self) -> int:
+        return int(self._records.shape[0])
+
+    @property
+    def records(self) -> np.ndarray:
+        """Underlying structured record array sorted by ``jd``."""
+
+        return self._records
+
+    def is_stale(self) -> bool:
+        """Return ``True`` when the file on disk was replaced since opening."""
+
+        if self._stat is None:
+            return False
+        try:
+            current = os.stat(self.path)
+        except OSError:
+            return True
+        return (current.st_ino, current.st_mtime_ns) != (
+            self._stat.st_ino,
+            self._stat.st_mtime_ns,
+        )
+
+    def covers(self, start_jd: float, end_jd: float) -> bool:
+        """Return ``True`` when ``start_jd``..``end_jd`` lies within the searched span."""
+
+        return self.start_jd <= start_jd and end_jd <= self.end_jd
+
+    def between(self, start_jd: float, end_jd: float) -> np.ndarray:
+        """Return records with ``start_jd <= jd <= end_jd``."""
+
+        lo = int(np.searchsorted(self._jd, start_jd, side="left"))
+        hi = int(np.searchsorted(self._jd, end_jd, side="right"))
+        return self._records[lo:hi]
+
+
+def write_eclipse_catalogue(
+    path: str | Path,
+    start_jd: float,
+    end_jd: float,
+    records: np.ndarray,
+) -> Path:
+    """Atomically write ``records`` (``RECORD_DTYPE``) covering ``start_jd``..``end_jd``."""
+
+    if end_jd < start_jd:
+        raise ValueError("end_jd must not precede start_jd")
+    target = Path(path)
+    array = np.asarray(records, dtype=RECORD_DTYPE)
+    array = array[np.argsort(array["jd"], kind="stable")]
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    header = _HEADER.pack(MAGIC, VERSION, float(start_jd), float(end_jd), array.shape[0])
+    with staging.open("wb") as handle:
+        handle.write(header.ljust(_HEADER_SIZE, b"\0"))
+        handle.write(array.tobytes())
+    os.replace(staging, target)
+    return target
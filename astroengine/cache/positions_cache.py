@@ -3,10 +3,14 @@ from __future__ import annotations
 
 import atexit
 import logging
+import os
 import sqlite3
 from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
-from time import perf_counter
+from pathlib import Path
+from time import monotonic, perf_counter
+
+import numpy as np
 
 from ..canonical import canonical_round, normalize_longitude, normalize_speed_per_day
 from ..core.time import julian_day
@@ -14,15 +18,20 @@ from ..ephemeris import SwissEphemerisAdapter
 from ..ephemeris.swe import swe
 from ..infrastructure.home import ae_home
 from ..infrastructure.storage.sqlite import apply_default_pragmas
+from .positions_store import FIELDS, PositionsStore, write_positions_store
 
 CACHE_DIR = ae_home() / "cache"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 DB = CACHE_DIR / "positions.sqlite"
+STORE = CACHE_DIR / "positions_daily.f64"
 
 _LOGGER = logging.getLogger(__name__)
 
 _CONNECTION: sqlite3.Connection | None = None
 _INITIALIZED = False
+_STORE: PositionsStore | None = None
+_STORE_CHECKED_AT: float | None = None
+_STORE_RECHECK_SEC = 5.0
 
 _BODY_CODES = {
     "sun": "SUN",
@@ -54,6 +63,10 @@ CREATE INDEX IF NOT EXISTS ix_positions_daily_day_body
 """,
     "get": "SELECT lon FROM positions_daily WHERE day_jd=? AND body=?",
     "get_full": "SELECT lon, lat, speed FROM positions_daily WHERE day_jd=? AND body=?",
+    "range": (
+        "SELECT day_jd, body, lon, lat, speed FROM positions_daily"
+        " WHERE day_jd BETWEEN ? AND ? AND lat IS NOT NULL AND speed IS NOT NULL"
+    ),
     "upsert": (
         "INSERT OR REPLACE INTO positions_daily(day_jd, body, lon, lat, speed)"
         " VALUES (?,?,?,?,?)"
@@ -105,10 +118,65 @@ def supported_body(body: str) -> bool:
     return body.lower() in _SUPPORTED_BODIES
 
 
+def _open_store() -> PositionsStore | None:
+    """Return the mapped positions store, reopening it if it was replaced."""
+
+    global _STORE, _STORE_CHECKED_AT
+
+    _STORE_CHECKED_AT = monotonic()
+    if _STORE is not None and not _STORE.is_stale():
+        return _STORE
+    try:
+        _STORE = PositionsStore.open(STORE)
+    except FileNotFoundError:
+        _STORE = None
+    except (OSError, ValueError) as exc:
+        _LOGGER.warning("Ignoring unreadable positions store %s: %s", STORE, exc)
+        _STORE = None
+    return _STORE
+
+
+def _store_entry(day: int, body: str) -> tuple[float, float, float] | None:
+    store = _STORE
+    if store is not None:
+        hit = store.entry(day, body)
+        if hit is not None:
+            return hit
+    # Miss: a backfill may have replaced or created the file since we mapped
+    # it.  Look at most once per _STORE_RECHECK_SEC so a missing or partial
+    # store does not add an open/stat to every lookup.
+    checked = _STORE_CHECKED_AT
+    if checked is not None and monotonic() - checked < _STORE_RECHECK_SEC:
+        return None
+    refreshed = _open_store()
+    if refreshed is None or refreshed is store:
+        return None
+    return refreshed.entry(day, body)
+
+
+def _compute_daily(day: int, body: str) -> tuple[float, float, float]:
+    if not _ensure_swiss_available():
+        raise RuntimeError("Swiss ephemeris unavailable for cache compute")
+    try:
+        code = int(getattr(swe, _BODY_CODES[body]))
+    except (KeyError, AttributeError) as exc:
+        raise ValueError(f"Unsupported body '{body}' for daily cache") from exc
+    adapter = SwissEphemerisAdapter.get_default_adapter()
+    sample = adapter.body_position(float(day), code, body_name=body.title())
+    lon = normalize_longitude(float(sample.longitude))
+    lat = canonical_round(float(sample.latitude))
+    speed = normalize_speed_per_day(float(sample.speed_longitude))
+    return lon, lat, speed
+
+
 def get_daily_entry(
     jd_ut: float, body: str
 ) -> tuple[float, float | None, float | None]:
     normalized = body.lower()
+    stored = _store_entry(_day_jd(jd_ut), normalized)
+    if stored is not None:
+        return stored
+
     con = _get_connection()
     cur = con.cursor()
     try:
@@ -125,17 +193,10 @@ def get_daily_entry(
         )
         return lon_f, lat_f, speed_f
 
-    if not _ensure_swiss_available():
-        raise RuntimeError("Swiss ephemeris unavailable for cache compute")
     try:
-        code = int(getattr(swe, _BODY_CODES[normalized]))
-    except (KeyError, AttributeError) as exc:
+        lon, lat, speed = _compute_daily(_day_jd(jd_ut), normalized)
+    except ValueError as exc:
         raise ValueError(f"Unsupported body '{body}' for daily cache") from exc
-    adapter = SwissEphemerisAdapter.get_default_adapter()
-    sample = adapter.body_position(float(_day_jd(jd_ut)), code, body_name=body.title())
-    lon = normalize_longitude(float(sample.longitude))
-    lat = canonical_round(float(sample.latitude))
-    speed = normalize_speed_per_day(float(sample.speed_longitude))
     con = _get_connection()
     cur = con.cursor()
     try:
@@ -176,6 +237,84 @@ def warm_daily(bodies: Iterable[str], start_jd: float, end_jd: float) -> int:
     return count
 
 
+def backfill_store(
+    bodies: Iterable[str],
+    start_jd: float,
+    end_jd: float,
+    *,
+    path: str | os.PathLike[str] | None = None,
+) -> int:
+    """Bulk-fill the memory-mapped positions store for ``bodies``.
+
+    Existing store cells and ``positions_daily`` SQLite rows are reused;
+    only missing (day, body) cells are computed.  The file is rewritten
+    atomically so running workers keep serving from their current mapping
+    until a miss re-checks the file, at most every ``_STORE_RECHECK_SEC``
+    seconds.  Returns the number of newly computed cells.
+    """
+
+    global _STORE_CHECKED_AT
+
+    start = _day_jd(start_jd)
+    end = _day_jd(end_jd)
+    if end < start:
+        return 0
+    selected = tuple(dict.fromkeys(body.lower() for body in bodies))
+    for body in selected:
+        if not supported_body(body):
+            raise ValueError(f"Unsupported body '{body}' for daily cache")
+
+    target = Path(path) if path is not None else STORE
+    try:
+        existing: PositionsStore | None = PositionsStore.open(target)
+    except FileNotFoundError:
+        existing = None
+
+    names = list(existing.bodies) if existing is not None else []
+    names.extend(body for body in selected if body not in names)
+    first = min(start, existing.start_day) if existing is not None else start
+    last = max(end, existing.end_day) if existing is not None else end
+    data = np.full((last - first + 1, len(names), len(FIELDS)), np.nan)
+    if existing is not None:
+        offset = existing.start_day - first
+        width = len(existing.bodies)
+        data[offset : offset + existing.day_count, :width] = existing.data
+
+    columns = {name: idx for idx, name in enumerate(names)}
+    con = _get_connection()
+    cur = con.cursor()
+    try:
+        cur.execute(_SQL["range"], (start, end))
+        rows = cur.fetchall()
+    finally:
+        cur.close()
+    for day, body, lon, lat, speed in rows:
+        col = columns.get(str(body))
+        if col is None or str(body) not in selected:
+            continue
+        cell = data[int(day) - first, col]
+        if np.isnan(cell[0]):
+            cell[:] = (
+                normalize_longitude(float(lon)),
+                canonical_round(float(lat)),
+                normalize_speed_per_day(float(speed)),
+            )
+
+    computed = 0
+    for day in range(start, end + 1):
+        row = data[day - first]
+        for body in selected:
+            cell = row[columns[body]]
+            if np.isnan(cell[0]):
+                cell[:] = _compute_daily(day, body)
+                computed += 1
+
+    write_positions_store(target, first, names, data)
+    if target == STORE:
+        _STORE_CHECKED_AT = None
+    return computed
+
+
 _BOOTSTRAP_BODIES: tuple[str, ...] = ("sun", "moon", "mercury")
 _BOOTSTRAP_DAY_OFFSETS: tuple[int, ...] = (0, 1)
 
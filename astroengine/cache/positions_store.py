@@ -0,0 +1,153 @@
+"""Memory-mapped fixed-stride store of daily body positions.
+
+The file is a 64-byte header, a body-name table and a dense little-endian
+``float64`` array laid out as ``day × body × (lon, lat, speed)``.  Readers
+map it read-only so every worker process shares the same OS page cache;
+missing cells are ``NaN``.  Writers always build a sibling file and swap it
+in atomically, leaving existing mappings valid until they are reopened.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+__all__ = ["FIELDS", "PositionsStore", "write_positions_store"]
+
+MAGIC = b"AEPOSMM1"
+VERSION = 1
+FIELDS: tuple[str, ...] = ("lon", "lat", "speed")
+_HEADER = struct.Struct("<8sIIqqI")  # magic, version, fields, start_day, days, bodies
+_HEADER_SIZE = 64
+_NAME_SIZE = 16
+_ALIGN = 64
+
+
+def _data_offset(body_count: int) -> int:
+    raw = _HEADER_SIZE + body_count * _NAME_SIZE
+    return (raw + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class PositionsStore:
+    """Read-only view over a positions store file."""
+
+    __slots__ = ("path", "start_day", "day_count", "bodies", "_index", "_data", "_stat")
+
+    def __init__(
+        self,
+        path: Path,
+        start_day: int,
+        bodies: tuple[str, ...],
+        data: np.ndarray,
+        stat: os.stat_result | None = None,
+    ) -> None:
+        self.path = path
+        self.start_day = int(start_day)
+        self.day_count = int(data.shape[0])
+        self.bodies = bodies
+        self._index = {name: idx for idx, name in enumerate(bodies)}
+        self._data = data
+        self._stat = stat
+
+    @classmethod
+    def open(cls, path: str | Path) -> PositionsStore:
+        """Map ``path`` read-only, validating its header."""
+
+        target = Path(path)
+        with target.open("rb") as handle:
+            header = handle.read(_HEADER_SIZE)
+            if len(header) < _HEADER_SIZE:
+                raise ValueError(f"{target} is not a positions store")
+            magic, version, fields, start_day, days, body_count = _HEADER.unpack_from(header)
+            if magic != MAGIC or version != VERSION or fields != len(FIELDS):
+                raise ValueError(f"{target} has an unsupported positions store header")
+            names = handle.read(body_count * _NAME_SIZE)
+        bodies = tuple(
+            names[i * _NAME_SIZE : (i + 1) * _NAME_SIZE].rstrip(b"\0").decode("ascii")
+            for i in range(body_count)
+        )
+        data = np.memmap(
+            target,
+            dtype="<f8",
+            mode="r",
+            offset=_data_offset(body_count),
+            shape=(days, body_count, len(FIELDS)),
+        )
+        return cls(target, start_day, bodies, data, os.stat(target))
+
+    @property
+    def end_day(self) -> int:
+        """Last day (inclusive) covered by the store."""
+
+        return self.start_day + self.day_count - 1
+
+    @property
+    def data(self) -> np.ndarray:
+        """Underlying ``(days, bodies, fields)`` array."""
+
+        return self._data
+
+    def is_stale(self) -> bool:
+        """Return ``True`` when the file on disk was replaced since opening."""
+
+        if self._stat is None:
+            return False
+        try:
+            current = os.stat(self.path)
+        except OSError:
+            return True
+        return (current.st_ino, current.st_mtime_ns) != (
+            self._stat.st_ino,
+            self._stat.st_mtime_ns,
+        )
+
+    def entry(self, day: int, body: str) -> tuple[float, float, float] | None:
+        """Return ``(lon, lat, speed)`` for ``day``/``body`` or ``None`` if absent."""
+
+        col = self._index.get(body)
+        row = int(day) - self.start_day
+        if col is None or row < 0 or row >= self.day_count:
+            return None
+        lon, lat, speed = self._data[row, col].tolist()
+        if lon != lon:  # NaN marks an unfilled cell
+            return None
+        return lon, lat, speed
+
+
+def write_positions_store(
+    path: str | Path,
+    start_day: int,
+    bodies: Sequence[str],
+    data: np.ndarray,
+) -> Path:
+    """Atomically write ``data`` shaped ``(days, len(bodies), 3)`` to ``path``."""
+
+    target = Path(path)
+    names = tuple(str(body) for body in bodies)
+    array = np.ascontiguousarray(data, dtype="<f8")
+    if array.ndim != 3 or array.shape[1:] != (len(names), len(FIELDS)):
+        raise ValueError("data must be shaped (days, bodies, fields)")
+    encoded = []
+    for name in names:
+        raw = name.encode("ascii")
+        if len(raw) > _NAME_SIZE:
+            raise ValueError(f"body name '{name}' exceeds {_NAME_SIZE} bytes")
+        encoded.append(raw.ljust(_NAME_SIZE, b"\0"))
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    header = _HEADER.pack(
+        MAGIC, VERSION, len(FIELDS), int(start_day), array.shape[0], len(names)
+    )
+    offset = _data_offset(len(names))
+    with staging.open("wb") as handle:
+        handle.write(header.ljust(_HEADER_SIZE, b"\0"))
+        handle.write(b"".join(encoded))
+        handle.write(b"\0" * (offset - handle.tell()))
+        handle.write(array.tobytes())
+    os.replace(staging, target)
+    return target
@@ -249,8 +249,35 @@ def _event_year(ts: str) -> int:
     return dt.year
 
 
-def _event_row(event: TransitEvent) -> dict[str, Any]:
-    meta_source = event.meta or {}
+CANONICAL_COLUMNS: tuple[str, ...] = (
+    "ts",
+    "moving",
+    "target",
+    "aspect",
+    "orb",
+    "orb_abs",
+    "applying",
+    "score",
+    "profile_id",
+    "natal_id",
+    "event_year",
+    "meta_json",
+)
+
+
+def _row_values(
+    ts: str,
+    moving: str,
+    target: str,
+    aspect: str,
+    orb: float,
+    applying: bool,
+    score: float | None,
+    meta_source: Any,
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """Return the :data:`CANONICAL_COLUMNS` values and enriched metadata."""
+
+    meta_source = meta_source or {}
     if not isinstance(meta_source, Mapping):
         raise TypeError("TransitEvent.meta must be a mapping for canonical exports")
     meta: dict[str, Any] = dict(meta_source)
@@ -260,32 +287,42 @@ def _event_row(event: TransitEvent) -> dict[str, Any]:
         meta["profile_id"] = profile_id
     if natal_id and "natal_id" not in meta:
         meta["natal_id"] = natal_id
-    meta_json = json.dumps(meta, sort_keys=True)
-    return {
-        "ts": event.ts,
-        "moving": event.moving,
-        "target": event.target,
-        "aspect": event.aspect,
-        "orb": float(event.orb),
-        "orb_abs": float(abs(event.orb)),
-        "applying": bool(event.applying),
-        "score": None if event.score is None else float(event.score),
-        "profile_id": profile_id,
-        "natal_id": natal_id,
-        "event_year": _event_year(event.ts),
-        "meta": meta,
-        "meta_json": meta_json,
-    }
+    values = (
+        ts,
+        moving,
+        target,
+        aspect,
+        float(orb),
+        float(abs(orb)),
+        bool(applying),
+        None if score is None else float(score),
+        profile_id,
+        natal_id,
+        _event_year(ts),
+        json.dumps(meta, sort_keys=True),
+    )
+    return values, meta
 
 
-def event_from_legacy(
-    obj: Mapping[str, Any] | _HasAttrs | TransitEvent,
-) -> TransitEvent:
-    """Convert dicts/legacy classes into the canonical :class:`TransitEvent`."""
+def _event_row(event: TransitEvent) -> dict[str, Any]:
+    values, meta = _row_values(
+        event.ts,
+        event.moving,
+        event.target,
+        event.aspect,
+        event.orb,
+        event.applying,
+        event.score,
+        event.meta,
+    )
+    row = dict(zip(CANONICAL_COLUMNS, values))
+    row["meta"] = meta
+    return row
 
-    if isinstance(obj, TransitEvent):
-        return obj
 
+def _legacy_fields(
+    obj: Mapping[str, Any] | _HasAttrs,
+) -> tuple[str, str, str, AspectName, float, bool, float | None, dict[str, Any]]:
     if hasattr(obj, "__dict__") and not isinstance(obj, dict):
         d = {
             "ts": getattr(obj, "ts", None),
@@ -319,18 +356,63 @@ def event_from_legacy(
     ):
         raise ValueError(f"Cannot canonicalize event; missing required keys: {d}")
 
+    return (
+        str(ts),
+        str(moving),
+        str(target),
+        _coerce_aspect(aspect_raw),
+        float(orb),
+        bool(applying),
+        None if score is None else float(score),
+        dict(meta),
+    )
+
+
+def event_from_legacy(
+    obj: Mapping[str, Any] | _HasAttrs | TransitEvent,
+) -> TransitEvent:
+    """Convert dicts/legacy classes into the canonical :class:`TransitEvent`."""
+
+    if isinstance(obj, TransitEvent):
+        return obj
+    ts, moving, target, aspect, orb, applying, score, meta = _legacy_fields(obj)
     return TransitEvent(
-        ts=str(ts),
-        moving=str(moving),
-        target=str(target),
-        aspect=_coerce_aspect(aspect_raw),
-        orb=float(orb),
-        applying=bool(applying),
-        score=None if score is None else float(score),
-        meta=dict(meta),
+        ts=ts,
+        moving=moving,
+        target=target,
+        aspect=aspect,
+        orb=orb,
+        applying=applying,
+        score=score,
+        meta=meta,
     )
 
 
+def canonical_row_values(
+    obj: Mapping[str, Any] | _HasAttrs | TransitEvent,
+) -> tuple[Any, ...]:
+    """Return the :data:`CANONICAL_COLUMNS` values for ``obj``.
+
+    Equivalent to converting through :func:`event_from_legacy` and the export
+    row mapping, without building the intermediate dataclass or dictionaries.
+    """
+
+    if isinstance(obj, TransitEvent):
+        fields = (
+            obj.ts,
+            obj.moving,
+            obj.target,
+            obj.aspect,
+            obj.orb,
+            obj.applying,
+            obj.score,
+            obj.meta,
+        )
+    else:
+        fields = _legacy_fields(obj)
+    return _row_values(*fields)[0]
+
+
 def iter_events_from_any(
     seq: Iterable[Mapping[str, Any] | _HasAttrs | TransitEvent]
 ) -> Iterator[TransitEvent]:
@@ -609,7 +691,9 @@ __all__ = [
     "AspectName",
     "BodyPosition",
     "TransitEvent",
+    "CANONICAL_COLUMNS",
     "event_from_legacy",
+    "canonical_row_values",
     "iter_events_from_any",
     "events_from_any",
     "sqlite_write_canonical",
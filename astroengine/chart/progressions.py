@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
+
 from ..ephemeris import SwissEphemerisAdapter
 from ..scoring import DEFAULT_ASPECTS, OrbCalculator
 from .config import ChartConfig
@@ -16,9 +19,16 @@ from .natal import (
     compute_natal_chart,
 )
 
-__all__ = ["ProgressedChart", "compute_secondary_progressed_chart"]
+__all__ = [
+    "ProgressedChart",
+    "ProgressedEphemeris",
+    "compute_secondary_progressed_chart",
+]
 
 SIDEREAL_YEAR_DAYS = 365.2422
+# Ephemeris-day spacing of progressed samples; 6h keeps the Moon's Hermite
+# interpolation error far below a millidegree.
+_SAMPLE_DAYS = 0.25
 
 
 @dataclass(frozen=True)
@@ -80,3 +90,95 @@ def compute_secondary_progressed_chart(
         progressed_moment=progressed_moment,
         chart=progressed_chart,
     )
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressedEphemeris:
+    """Secondary-progressed longitudes sampled once for a whole scan.
+
+    A year of real time maps onto about one ephemeris day, so a lifetime
+    scan only spans a few months of ephemeris.  That span is sampled at
+    sub-day resolution and real-time moments are mapped onto it by cubic
+    Hermite interpolation of longitude and speed, avoiding a chart rebuild
+    per tick.
+    """
+
+    natal_moment: datetime
+    natal_jd: float
+    bodies: tuple[str, ...]
+    sample_jd: np.ndarray
+    longitude: np.ndarray
+    speed: np.ndarray
+
+    @classmethod
+    def sample(
+        cls,
+        natal_moment: datetime,
+        start: datetime,
+        end: datetime,
+        bodies: Mapping[str, int],
+        *,
+        adapter: SwissEphemerisAdapter,
+        resolution_days: float = _SAMPLE_DAYS,
+    ) -> ProgressedEphemeris:
+        """Sample progressed positions covering real moments ``start``..``end``."""
+
+        if resolution_days <= 0:
+            raise ValueError("resolution_days must be positive")
+        natal_moment = _ensure_utc(natal_moment)
+        natal_jd = float(adapter.julian_day(natal_moment))
+        first, last = sorted(
+            natal_jd + _elapsed_days(natal_moment, _ensure_utc(moment)) / SIDEREAL_YEAR_DAYS
+            for moment in (start, end)
+        )
+        span = max(last - first, resolution_days)
+        grid = np.linspace(first, first + span, math.ceil(span / resolution_days) + 1)
+        arrays = adapter.compute_bodies_array(grid, bodies)
+        return cls(
+            natal_moment=natal_moment,
+            natal_jd=natal_jd,
+            bodies=tuple(arrays.bodies),
+            sample_jd=grid,
+            longitude=np.unwrap(arrays.longitude, period=360.0, axis=0),
+            speed=np.asarray(arrays.speed_longitude, dtype=float),
+        )
+
+    def progressed_jd(self, elapsed_days: np.ndarray) -> np.ndarray:
+        """Map real days elapsed since birth onto progressed Julian days."""
+
+        return self.natal_jd + np.asarray(elapsed_days, dtype=float) / SIDEREAL_YEAR_DAYS
+
+    def positions(self, elapsed_days: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(longitude, speed)`` shaped ``(len(elapsed_days), bodies)``.
+
+        Longitudes are normalised to ``[0, 360)``; speeds are in degrees per
+        ephemeris day, matching :attr:`BodyPosition.speed_longitude`.
+        """
+
+        jd = np.atleast_1d(self.progressed_jd(elapsed_days))
+        knots = self.sample_jd
+        idx = np.clip(np.searchsorted(knots, jd, side="right") - 1, 0, knots.size - 2)
+        width = (knots[idx + 1] - knots[idx])[:, None]
+        t = (jd[:, None] - knots[idx][:, None]) / width
+        t2 = t * t
+        t3 = t2 * t
+        p0 = self.longitude[idx]
+        p1 = self.longitude[idx + 1]
+        m0 = self.speed[idx] * width
+        m1 = self.speed[idx + 1] * width
+        value = (
+            (2 * t3 - 3 * t2 + 1) * p0
+            + (t3 - 2 * t2 + t) * m0
+            + (-2 * t3 + 3 * t2) * p1
+            + (t3 - t2) * m1
+        )
+        slope = (
+            (6 * t2 - 6 * t) * (p0 - p1)
+            + (3 * t2 - 4 * t + 1) * m0
+            + (3 * t2 - 2 * t) * m1
+        ) / width
+        return value % 360.0, slope
+
+
+def _elapsed_days(natal_moment: datetime, moment: datetime) -> float:
+    return (moment - natal_moment).total_seconds() / 86400.0
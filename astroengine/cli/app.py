@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from argparse import Namespace
 from pathlib import Path
 import json
@@ -1064,6 +1065,108 @@ def database_stamp(
 app.add_typer(database_app, name="database")
 
 
+charts_app = typer.Typer(help="Chart database utilities.")
+
+
+def _load_chart_records(path: Path) -> list[Mapping[str, object]]:
+    text = sys.stdin.read() if str(path) == "-" else path.read_text(encoding="utf-8")
+    stripped = text.lstrip()
+    if stripped.startswith("[") or stripped.startswith("{"):
+        try:
+            document = json.loads(text)
+        except json.JSONDecodeError:
+            document = None
+        if isinstance(document, list):
+            return document
+        if isinstance(document, dict) and isinstance(document.get("charts"), list):
+            return document["charts"]
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+@charts_app.command("import")
+def charts_import(
+    source: Path = typer.Argument(
+        ..., metavar="FILE", help="JSON list, {'charts': [...]} document or JSONL file ('-' for stdin)."
+    ),
+    computed: bool = typer.Option(
+        False,
+        "--computed",
+        help="Records are exported charts with stored positions; upsert them without recomputing.",
+    ),
+    workers: int | None = typer.Option(
+        None, "--workers", min=1, max=8, help="Worker processes for chart computation."
+    ),
+    batch_size: int = typer.Option(
+        2000, "--batch-size", min=1, help="Rows written per database transaction."
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Emit the import result as JSON."),
+    database_url: str | None = typer.Option(
+        None,
+        "--database-url",
+        envvar="DATABASE_URL",
+        help="SQLAlchemy database URL (defaults to DATABASE_URL environment variable).",
+    ),
+) -> None:
+    """Create or import many charts with batched computation and inserts."""
+
+    try:
+        records = _load_chart_records(source)
+    except (OSError, ValueError) as exc:
+        typer.secho(f"Unable to read chart records: {exc}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1) from exc
+    if database_url:
+        os.environ["DATABASE_URL"] = database_url
+
+    from app.routers.charts import bulk_create_charts, bulk_import_charts
+
+    def _progress(stage: str, done: int, total: int) -> None:
+        typer.echo(f"{stage}: {done}/{total}", err=True)
+
+    if computed:
+        result = bulk_import_charts(records, batch_size=batch_size, progress=_progress)
+    else:
+        result = bulk_create_charts(
+            records, workers=workers, batch_size=batch_size, progress=_progress
+        )
+
+    if json_output:
+        typer.echo(json.dumps(result.model_dump(), indent=2))
+    else:
+        typer.echo(
+            f"Processed {result.processed}: {result.created} created, "
+            f"{result.updated} updated, {len(result.failures)} failed."
+        )
+        for failure in result.failures:
+            typer.secho(f"  #{failure.index}: {failure.detail}", fg=typer.colors.YELLOW, err=True)
+    if result.failures:
+        raise typer.Exit(1)
+
+
+@charts_app.command("reindex")
+def charts_reindex(
+    database_url: str | None = typer.Option(
+        None,
+        "--database-url",
+        envvar="DATABASE_URL",
+        help="SQLAlchemy database URL (defaults to DATABASE_URL environment variable).",
+    ),
+) -> None:
+    """Rebuild the chart position and tag index from stored chart payloads."""
+
+    if database_url:
+        os.environ["DATABASE_URL"] = database_url
+
+    from app.db.session import session_scope
+    from app.repo.charts import ChartRepo
+
+    with session_scope() as db:
+        count = ChartRepo().reindex(db)
+    typer.echo(f"Indexed {count} charts.")
+
+
+app.add_typer(charts_app, name="charts")
+
+
 @app.command("legacy")
 def legacy(args: Optional[List[str]] = typer.Argument(None, metavar="ARGS...")) -> None:
     """Invoke the historical monolithic CLI for backward compatibility."""
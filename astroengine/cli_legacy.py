@@ -8,7 +8,7 @@ import argparse
 import json
 import logging
 import sys
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import asdict, is_dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -309,26 +309,54 @@ def cmd_cache_info(_: argparse.Namespace) -> int:
         print(f"cache database: {POSITIONS_DB} ({size} bytes, {row_count} rows)")
     else:
         print(f"cache database: {POSITIONS_DB} (missing)")
+
+    from .cache.positions_cache import STORE as POSITIONS_STORE
+    from .cache.positions_store import PositionsStore
+
+    try:
+        store = PositionsStore.open(POSITIONS_STORE)
+    except (OSError, ValueError):
+        print(f"positions store: {POSITIONS_STORE} (missing)")
+    else:
+        print(
+            f"positions store: {POSITIONS_STORE} (JD {store.start_day}–{store.end_day}, "
+            f"{len(store.bodies)} bodies)"
+        )
+
+    from .cache.eclipse_catalogue import CATALOGUE, EclipseCatalogue
+
+    try:
+        catalogue = EclipseCatalogue.open(CATALOGUE)
+    except (OSError, ValueError):
+        print(f"eclipse catalogue: {CATALOGUE} (missing)")
+    else:
+        print(
+            f"eclipse catalogue: {CATALOGUE} (JD {catalogue.start_jd}–{catalogue.end_jd}, "
+            f"{len(catalogue)} eclipses)"
+        )
     return 0
 
 
+_DEFAULT_CACHE_BODIES: tuple[str, ...] = (
+    "sun",
+    "moon",
+    "mercury",
+    "venus",
+    "mars",
+    "jupiter",
+    "saturn",
+    "uranus",
+    "neptune",
+    "pluto",
+)
+
+
 def cmd_cache_warm(args: argparse.Namespace) -> int:
 
     bodies = (
         [b.strip().lower() for b in args.bodies.split(",") if b.strip()]
         if args.bodies
-        else [
-            "sun",
-            "moon",
-            "mercury",
-            "venus",
-            "mars",
-            "jupiter",
-            "saturn",
-            "uranus",
-            "neptune",
-            "pluto",
-        ]
+        else list(_DEFAULT_CACHE_BODIES)
     )
     if not bodies:
         print("no bodies specified for cache warm", file=sys.stderr)
@@ -349,6 +377,59 @@ def cmd_cache_warm(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_cache_backfill(args: argparse.Namespace) -> int:
+    from .cache.positions_cache import backfill_store
+
+    bodies = (
+        [b.strip().lower() for b in args.bodies.split(",") if b.strip()]
+        if args.bodies
+        else list(_DEFAULT_CACHE_BODIES)
+    )
+    if not bodies:
+        print("no bodies specified for cache backfill", file=sys.stderr)
+        return 1
+
+    enable_cache(True)
+    start_jd = iso_to_jd(args.start)
+    end_jd = iso_to_jd(args.end)
+    if end_jd < start_jd:
+        print("end must be after start", file=sys.stderr)
+        return 1
+
+    try:
+        computed = backfill_store(bodies, start_jd, end_jd, path=args.path)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    print(
+        f"backfilled positions store ({computed} computed cells) for bodies "
+        f"{', '.join(bodies)} [{args.start} → {args.end}]"
+    )
+    return 0
+
+
+def cmd_cache_eclipses(args: argparse.Namespace) -> int:
+    from .detectors.eclipses import (
+        CATALOGUE_END_JD,
+        CATALOGUE_START_JD,
+        build_eclipse_catalogue,
+    )
+
+    start_jd = iso_to_jd(args.start) if args.start else CATALOGUE_START_JD
+    end_jd = iso_to_jd(args.end) if args.end else CATALOGUE_END_JD
+    if end_jd <= start_jd:
+        print("end must be after start", file=sys.stderr)
+        return 1
+
+    try:
+        path = build_eclipse_catalogue(start_jd, end_jd, path=args.path)
+    except (RuntimeError, ValueError) as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    print(f"wrote eclipse catalogue {path} [JD {start_jd} → {end_jd}]")
+    return 0
+
+
 def cmd_ops_migrate(args: argparse.Namespace) -> int:
     from .infrastructure.storage.sqlite.engine import SQLiteMigrator
 
@@ -386,31 +467,72 @@ def _augment_parser_with_cache(parser: argparse.ArgumentParser) -> None:
     )
     cache_warm.set_defaults(func=cmd_cache_warm)
 
+    cache_backfill = cache_sub.add_parser(
+        "backfill", help="Bulk-fill the memory-mapped daily positions store"
+    )
+    cache_backfill.add_argument("--start", required=True, help="Start date (ISO-8601)")
+    cache_backfill.add_argument("--end", required=True, help="End date (ISO-8601)")
+    cache_backfill.add_argument(
+        "--bodies",
+        help="Comma-separated list of bodies (default: Sun, Moon, Mercury … Pluto)",
+    )
+    cache_backfill.add_argument(
+        "--path", help="Store file to write (default: positions_daily.f64 in the cache dir)"
+    )
+    cache_backfill.set_defaults(func=cmd_cache_backfill)
+
+    cache_eclipses = cache_sub.add_parser(
+        "eclipses", help="Build the precomputed global eclipse catalogue"
+    )
+    cache_eclipses.add_argument("--start", help="Start date (ISO-8601, default 1000 CE)")
+    cache_eclipses.add_argument("--end", help="End date (ISO-8601, default 3000 CE)")
+    cache_eclipses.add_argument(
+        "--path", help="Catalogue file to write (default: eclipses.bin in the cache dir)"
+    )
+    cache_eclipses.set_defaults(func=cmd_cache_eclipses)
+
     parser._ae_cache_added = True
 
 
+def _iter_jsonl_events(handle: Iterable[str]) -> Iterator[dict[str, Any]]:
+    for line in handle:
+        if line.strip():
+            yield json.loads(line)
+
+
 def cmd_dataset_parquet(args: argparse.Namespace) -> int:
+    if args.format == "jsonl":
+        # Stream line by line so large research exports stay in bounded memory.
+        try:
+            if args.input == "-":
+                written = export_parquet_dataset(args.output, _iter_jsonl_events(sys.stdin))
+            else:
+                with Path(args.input).open("r", encoding="utf-8") as handle:
+                    written = export_parquet_dataset(
+                        args.output, _iter_jsonl_events(handle)
+                    )
+        except json.JSONDecodeError as exc:
+            print(f"failed to load input events: {exc}", file=sys.stderr)
+            return 1
+        print(f"wrote {written} events to {args.output}")
+        return 0
+
     if args.input == "-":
         payload_text = sys.stdin.read()
     else:
         payload_text = Path(args.input).read_text(encoding="utf-8")
 
     try:
-        if args.format == "jsonl":
-            events = [
-                json.loads(line) for line in payload_text.splitlines() if line.strip()
-            ]
+        document = json.loads(payload_text)
+        if isinstance(document, dict):
+            key = args.key or "events"
+            if key not in document:
+                raise KeyError(key)
+            events = document[key]
+        elif isinstance(document, list):
+            events = document
         else:
-            document = json.loads(payload_text)
-            if isinstance(document, dict):
-                key = args.key or "events"
-                if key not in document:
-                    raise KeyError(key)
-                events = document[key]
-            elif isinstance(document, list):
-                events = document
-            else:
-                raise TypeError("unsupported JSON payload")
+            raise TypeError("unsupported JSON payload")
         if not isinstance(events, list):
             raise TypeError("event payload must be a list")
     except Exception as exc:  # pragma: no cover - defensive parsing
@@ -501,8 +623,17 @@ def cmd_scheduler_enqueue(args: argparse.Namespace) -> int:
 
 
 def cmd_scheduler_worker(args: argparse.Namespace) -> int:
-    from .scheduler.worker import run_worker
-
+    from .scheduler.worker import run_worker, run_worker_pool
+
+    if args.concurrency is not None and args.concurrency > 1:
+        run_worker_pool(
+            args.concurrency,
+            batch_size=args.batch_size,
+            sleep_sec=args.sleep_sec,
+            heartbeat_sec=args.heartbeat_sec,
+            grace_sec=args.grace_sec,
+        )
+        return 0
     run_worker(sleep_sec=args.sleep_sec, heartbeat_sec=args.heartbeat_sec)
     return 0
 
@@ -556,7 +687,23 @@ def _augment_parser_with_scheduler(parser: argparse.ArgumentParser) -> None:
         "--heartbeat-sec",
         type=float,
         default=10.0,
-        help="Send a heartbeat when a job exceeds this duration",
+        help="Interval between lease heartbeats for running jobs",
+    )
+    worker.add_argument(
+        "--concurrency",
+        type=int,
+        help="Run jobs on a process pool of this size (default: single job at a time)",
+    )
+    worker.add_argument(
+        "--batch-size",
+        type=int,
+        help="Maximum jobs claimed per queue transaction (default: concurrency)",
+    )
+    worker.add_argument(
+        "--grace-sec",
+        type=float,
+        default=30.0,
+        help="Seconds in-flight jobs may finish after SIGTERM before being requeued",
     )
     worker.set_defaults(func=cmd_scheduler_worker)
 
@@ -1,5 +1,6 @@
 """Computation helpers for persisting chart results."""
 
+from .bulk import PayloadFailure, build_payloads, payload_pool
 from .save import build_payload
 
-__all__ = ["build_payload"]
+__all__ = ["PayloadFailure", "build_payload", "build_payloads", "payload_pool"]
@@ -0,0 +1,160 @@
+"""Batch computation of chart payloads across a process pool."""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from astroengine.config.settings import Settings
+
+from .save import build_payload
+
+__all__ = ["PayloadFailure", "build_payloads", "payload_pool"]
+
+
+@dataclass(frozen=True, slots=True)
+class PayloadFailure:
+    """Marker returned in place of a payload when one birth fails to compute."""
+
+    index: int
+    error: str
+
+
+@dataclass(frozen=True, slots=True)
+class _PayloadTask:
+    settings: Settings
+    births: tuple[tuple[int, datetime, float, float], ...]
+
+
+def _build_chunk(task: _PayloadTask) -> list[tuple[int, dict[str, Any] | str]]:
+    results: list[tuple[int, dict[str, Any] | str]] = []
+    for index, moment, lat, lon in task.births:
+        try:
+            results.append((index, build_payload(moment, lat, lon, task.settings)))
+        except Exception as exc:  # pragma: no cover - engine failures surface per birth
+            results.append((index, f"{type(exc).__name__}: {exc}"))
+    return results
+
+
+def _chunk_tasks(
+    births: Sequence[tuple[datetime, float, float]],
+    settings: Sequence[Settings],
+    chunk_size: int,
+) -> list[_PayloadTask]:
+    # Births sharing a settings object share a task, so each chunk pickles
+    # its settings once rather than once per birth.
+    groups: dict[int, tuple[Settings, list[tuple[int, datetime, float, float]]]] = {}
+    for index, (moment, lat, lon) in enumerate(births):
+        config = settings[index]
+        entry = groups.setdefault(id(config), (config, []))
+        entry[1].append((index, moment, float(lat), float(lon)))
+    tasks: list[_PayloadTask] = []
+    for config, members in groups.values():
+        for start in range(0, len(members), chunk_size):
+            tasks.append(_PayloadTask(config, tuple(members[start : start + chunk_size])))
+    return tasks
+
+
+def payload_pool(workers: int) -> ProcessPoolExecutor:
+    """Return a process pool for :func:`build_payloads`.
+
+    Workers start from a ``forkserver`` (``spawn`` where unavailable) so a
+    threaded caller such as the API server is never forked mid-request.
+    """
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=max(1, int(workers)), mp_context=context)
+
+
+def _map_chunks(
+    executor: Executor,
+    tasks: Iterable[_PayloadTask],
+    window: int,
+    collect: Callable[[list[tuple[int, dict[str, Any] | str]]], None],
+) -> None:
+    # At most ``window`` chunks are queued on a shared executor at once, and
+    # anything still queued is cancelled if ``collect`` raises.
+    queued = iter(tasks)
+    pending: deque[Future[list[tuple[int, dict[str, Any] | str]]]] = deque()
+    try:
+        for task in queued:
+            pending.append(executor.submit(_build_chunk, task))
+            if len(pending) >= window:
+                break
+        while pending:
+            chunk = pending.popleft().result()
+            task = next(queued, None)
+            if task is not None:
+                pending.append(executor.submit(_build_chunk, task))
+            collect(chunk)
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def build_payloads(
+    births: Sequence[tuple[datetime, float, float]],
+    settings: Settings | Sequence[Settings],
+    *,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    executor: Executor | None = None,
+) -> list[dict[str, Any] | PayloadFailure]:
+    """Return :func:`build_payload` results for many ``(dt_utc, lat, lon)`` births.
+
+    ``settings`` is either shared by every birth or given per birth. Births
+    are grouped into chunks of ``chunk_size`` (default
+    ``settings.perf.batch_size``) and fanned out to ``workers`` processes
+    (default ``settings.perf.workers``); one worker computes inline.
+    ``executor`` supplies a long-lived pool (see :func:`payload_pool`) on
+    which at most ``workers`` chunks are queued at once; without it a pool
+    is started for this call. ``progress`` receives ``(done, total)`` after
+    each chunk. A birth that fails yields a :class:`PayloadFailure` at its
+    index instead of aborting the batch.
+    """
+
+    total = len(births)
+    if isinstance(settings, Settings):
+        per_birth: Sequence[Settings] = [settings] * total
+    elif len(settings) != total:
+        raise ValueError("settings must be a single Settings or one per birth")
+    else:
+        per_birth = settings
+    if not total:
+        return []
+    reference = per_birth[0]
+
+    worker_count = max(1, int(workers if workers is not None else reference.perf.workers))
+    size = max(1, int(chunk_size if chunk_size is not None else reference.perf.batch_size))
+    tasks = _chunk_tasks(births, per_birth, size)
+
+    results: list[dict[str, Any] | PayloadFailure | None] = [None] * total
+    done = 0
+
+    def _collect(chunk: list[tuple[int, dict[str, Any] | str]]) -> None:
+        nonlocal done
+        for index, outcome in chunk:
+            if isinstance(outcome, str):
+                results[index] = PayloadFailure(index, outcome)
+            else:
+                results[index] = outcome
+        done += len(chunk)
+        if progress is not None:
+            progress(done, total)
+
+    if worker_count > 1 and len(tasks) > 1 and executor is not None:
+        _map_chunks(executor, tasks, worker_count, _collect)
+    elif worker_count > 1 and len(tasks) > 1:
+        with payload_pool(min(worker_count, len(tasks))) as pool:
+            _map_chunks(pool, tasks, worker_count, _collect)
+    else:
+        for task in tasks:
+            _collect(_build_chunk(task))
+    return results  # type: ignore[return-value]
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
+import math
+import multiprocessing
+import pickle
 from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from itertools import combinations
@@ -11,6 +15,8 @@ from typing import (
     Any,
 )
 
+import numpy as np
+
 LOG = logging.getLogger(__name__)
 
 from astroengine.analysis.antiscia import (
@@ -278,6 +284,29 @@ def _bisect_mirror(
     return best_time, abs(best_delta)
 
 
+def _grid_times(window: TimeWindow, step_minutes: int) -> list[datetime]:
+    """Return the coarse sampling instants, ending exactly at ``window.end``."""
+
+    step = timedelta(minutes=max(1, int(step_minutes)))
+    times = [window.start]
+    current = window.start
+    while current < window.end:
+        current = min(current + step, window.end)
+        times.append(current)
+    return times
+
+
+def _as_deltas(values: Iterable[float | None]) -> np.ndarray:
+    return np.array([math.nan if value is None else value for value in values], dtype=float)
+
+
+def _bracket_indices(deltas: np.ndarray) -> list[int]:
+    """Indices ``i`` where ``deltas[i]``..``deltas[i + 1]`` touches or crosses zero."""
+
+    with np.errstate(invalid="ignore"):
+        return np.flatnonzero(deltas[:-1] * deltas[1:] <= 0.0).tolist()
+
+
 def _scan_single_spec(
     body_a: str,
     body_b: str,
@@ -287,44 +316,48 @@ def _scan_single_spec(
     limit: float,
     step_minutes: int,
 ) -> list[Hit]:
-    step = timedelta(minutes=max(1, int(step_minutes)))
-    hits: list[Hit] = []
+    times = _grid_times(window, step_minutes)
+    deltas = _as_deltas(_angle_delta(provider, ts, body_a, body_b, spec.angle) for ts in times)
+    return _collect_spec_hits(body_a, body_b, window, provider, spec, limit, times, deltas)
+
+
+def _collect_spec_hits(
+    body_a: str,
+    body_b: str,
+    window: TimeWindow,
+    provider: PositionProvider,
+    spec: AspectSpec,
+    limit: float,
+    times: Sequence[datetime],
+    deltas: np.ndarray,
+) -> list[Hit]:
+    """Refine the zero crossings of sampled ``deltas`` into :class:`Hit` rows."""
 
-    prev_time = window.start
-    prev_delta_opt = _angle_delta(provider, prev_time, body_a, body_b, spec.angle)
-    if prev_delta_opt is None:
+    hits: list[Hit] = []
+    if not len(deltas) or math.isnan(deltas[0]):
         return hits
     last_recorded: datetime | None = None
 
-    while prev_time < window.end:
-        next_time = prev_time + step
-        if next_time > window.end:
-            next_time = window.end
-        next_delta_opt = _angle_delta(provider, next_time, body_a, body_b, spec.angle)
-        if next_delta_opt is None:
-            prev_time = next_time
-            prev_delta_opt = None
-            continue
-
+    for index in _bracket_indices(deltas):
+        prev_time, next_time = times[index], times[index + 1]
+        prev_delta, next_delta = float(deltas[index]), float(deltas[index + 1])
         candidate: tuple[datetime, float] | None = None
 
-        if prev_delta_opt == 0.0:
+        if prev_delta == 0.0:
             candidate = (prev_time, 0.0)
-        elif next_delta_opt == 0.0:
+        elif next_delta == 0.0:
             candidate = (next_time, 0.0)
-        elif prev_delta_opt * next_delta_opt <= 0:
-            refined = _bisect_refine(
+        else:
+            candidate = _bisect_refine(
                 provider,
                 body_a,
                 body_b,
                 spec.angle,
                 prev_time,
-                prev_delta_opt,
+                prev_delta,
                 next_time,
-                next_delta_opt,
+                next_delta,
             )
-            if refined:
-                candidate = refined
 
         if candidate:
             hit_time, orb = candidate
@@ -344,9 +377,6 @@ def _scan_single_spec(
                     )
                     last_recorded = hit_time
 
-        prev_time = next_time
-        prev_delta_opt = next_delta_opt
-
     return hits
 
 
@@ -361,38 +391,55 @@ def _scan_mirror_target(
     *,
     expected_label: str,
 ) -> list[Hit]:
-    step = timedelta(minutes=max(1, int(step_minutes)))
-    hits: list[Hit] = []
+    times = _grid_times(window, step_minutes)
+    deltas = _as_deltas(_sum_delta(provider, ts, body_a, body_b, target_angle) for ts in times)
+    return _collect_mirror_hits(
+        body_a,
+        body_b,
+        window,
+        provider,
+        target_angle,
+        limit,
+        times,
+        deltas,
+        expected_label=expected_label,
+    )
+
 
-    prev_time = window.start
-    prev_delta_opt = _sum_delta(provider, prev_time, body_a, body_b, target_angle)
-    if prev_delta_opt is None:
+def _collect_mirror_hits(
+    body_a: str,
+    body_b: str,
+    window: TimeWindow,
+    provider: PositionProvider,
+    target_angle: float,
+    limit: float,
+    times: Sequence[datetime],
+    deltas: np.ndarray,
+    *,
+    expected_label: str,
+) -> list[Hit]:
+    """Refine sampled mirror ``deltas`` into antiscia :class:`Hit` rows."""
+
+    hits: list[Hit] = []
+    missing = np.flatnonzero(np.isnan(deltas))
+    if missing.size:
+        # Mirror scans stop at the first instant the provider cannot serve.
+        deltas = deltas[: int(missing[0])]
+    if not len(deltas):
         return hits
-    prev_delta = prev_delta_opt
     last_recorded: datetime | None = None
 
-    while prev_time < window.end:
-        next_time = prev_time + step
-        if next_time > window.end:
-            next_time = window.end
-        next_delta_opt = _sum_delta(provider, next_time, body_a, body_b, target_angle)
-        if next_delta_opt is None:
-            prev_time = next_time
-            prev_delta_opt = _sum_delta(provider, prev_time, body_a, body_b, target_angle)
-            if prev_delta_opt is None:
-                break
-            prev_delta = prev_delta_opt
-            continue
-
-        next_delta = next_delta_opt
+    for index in _bracket_indices(deltas):
+        prev_time, next_time = times[index], times[index + 1]
+        prev_delta, next_delta = float(deltas[index]), float(deltas[index + 1])
         candidate: tuple[datetime, float] | None = None
 
         if prev_delta == 0.0:
             candidate = (prev_time, 0.0)
         elif next_delta == 0.0:
             candidate = (next_time, 0.0)
-        elif prev_delta * next_delta <= 0:
-            refined = _bisect_mirror(
+        else:
+            candidate = _bisect_mirror(
                 provider,
                 body_a,
                 body_b,
@@ -402,8 +449,6 @@ def _scan_mirror_target(
                 next_time,
                 next_delta,
             )
-            if refined:
-                candidate = refined
 
         if candidate:
             hit_time, approx_orb = candidate
@@ -453,12 +498,24 @@ def _scan_mirror_target(
                             )
                             last_recorded = hit_time
 
-        prev_time = next_time
-        prev_delta = next_delta
-
     return hits
 
 
+def _mirror_limit(orb_deg: float | None) -> float | None:
+    if orb_deg is None:
+        return None
+    try:
+        limit = abs(float(orb_deg))
+    except (TypeError, ValueError):
+        return None
+    if limit <= 0.0:
+        return None
+    return limit
+
+
+_MIRROR_TARGETS = ((180.0, "antiscia"), (0.0, "contra"))
+
+
 def _scan_pair_mirrors(
     body_a: str,
     body_b: str,
@@ -467,40 +524,24 @@ def _scan_pair_mirrors(
     orb_deg: float | None,
     step_minutes: int,
 ) -> list[Hit]:
-    if orb_deg is None:
-        return []
-    try:
-        limit = abs(float(orb_deg))
-    except (TypeError, ValueError):
-        return []
-    if limit <= 0.0:
+    limit = _mirror_limit(orb_deg)
+    if limit is None:
         return []
 
     hits: list[Hit] = []
-    hits.extend(
-        _scan_mirror_target(
-            body_a,
-            body_b,
-            window,
-            provider,
-            180.0,
-            limit,
-            step_minutes,
-            expected_label="antiscia",
-        )
-    )
-    hits.extend(
-        _scan_mirror_target(
-            body_a,
-            body_b,
-            window,
-            provider,
-            0.0,
-            limit,
-            step_minutes,
-            expected_label="contra",
+    for target_angle, label in _MIRROR_TARGETS:
+        hits.extend(
+            _scan_mirror_target(
+                body_a,
+                body_b,
+                window,
+                provider,
+                target_angle,
+                limit,
+                step_minutes,
+                expected_label=label,
+            )
         )
-    )
     hits.sort(key=lambda h: (h.exact_time, h.orb))
     return hits
 
@@ -574,6 +615,171 @@ def _build_specs(aspects: Sequence[str], harmonics: Sequence[int]) -> list[Aspec
     return specs
 
 
+# ---------------------------------------------------------------------------
+# Shared-grid execution
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class _GridTask:
+    """One pair/spec (or pair/mirror target) root-finding job."""
+
+    a: str
+    b: str
+    col_a: int
+    col_b: int
+    limit: float
+    spec: AspectSpec | None = None
+    mirror_angle: float = 0.0
+    mirror_label: str = ""
+
+
+@dataclass(slots=True)
+class _GridState:
+    """Coarse longitudes for every object, sampled once per step."""
+
+    provider: PositionProvider
+    window: TimeWindow
+    times: list[datetime]
+    longitudes: np.ndarray  # (len(times), objects); NaN where unavailable
+
+
+def _sample_grid(
+    provider: PositionProvider, objects: Sequence[str], times: Sequence[datetime]
+) -> np.ndarray:
+    grid = np.full((len(times), len(objects)), np.nan)
+    for row, ts in enumerate(times):
+        try:
+            positions = provider(ts)
+        except Exception:
+            continue
+        for col, name in enumerate(objects):
+            try:
+                grid[row, col] = float(positions[name])
+            except Exception:
+                continue
+    return grid
+
+
+def _run_grid_task(state: _GridState, task: _GridTask) -> list[Hit]:
+    lon_a = state.longitudes[:, task.col_a]
+    lon_b = state.longitudes[:, task.col_b]
+    if task.spec is not None:
+        deltas = np.abs((lon_a - lon_b + 180.0) % 360.0 - 180.0) - float(task.spec.angle)
+        return _collect_spec_hits(
+            task.a,
+            task.b,
+            state.window,
+            state.provider,
+            task.spec,
+            task.limit,
+            state.times,
+            deltas,
+        )
+    total = (lon_a + lon_b) % 360.0
+    deltas = (total - float(task.mirror_angle) + 180.0) % 360.0 - 180.0
+    return _collect_mirror_hits(
+        task.a,
+        task.b,
+        state.window,
+        state.provider,
+        task.mirror_angle,
+        task.limit,
+        state.times,
+        deltas,
+        expected_label=task.mirror_label,
+    )
+
+
+_WORKER_STATE: _GridState | None = None
+
+
+def _init_grid_worker(state: _GridState) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = state
+
+
+def _grid_worker_task(task: _GridTask) -> list[Hit]:
+    assert _WORKER_STATE is not None, "grid worker used before initialisation"
+    return _run_grid_task(_WORKER_STATE, task)
+
+
+def _pool_can_share(provider: PositionProvider) -> bool:
+    if multiprocessing.get_start_method(allow_none=False) == "fork":
+        return True
+    try:
+        pickle.dumps(provider)
+    except Exception:
+        return False
+    return True
+
+
+def _scan_shared_grid(
+    pairs: Sequence[tuple[str, str]],
+    specs: Sequence[AspectSpec],
+    window: TimeWindow,
+    provider: PositionProvider,
+    orb_policy: Mapping[str, Any] | None,
+    step_minutes: int,
+    mirror_limit: float | None,
+    workers: int,
+) -> list[Hit]:
+    objects = list(dict.fromkeys(name for pair in pairs for name in pair))
+    columns = {name: idx for idx, name in enumerate(objects)}
+    times = _grid_times(window, step_minutes)
+    state = _GridState(provider, window, times, _sample_grid(provider, objects, times))
+
+    tasks: list[_GridTask] = []
+    for a, b in pairs:
+        col_a, col_b = columns[a], columns[b]
+        for spec in specs:
+            limit = _resolve_orb_limit(orb_policy, spec, a, b)
+            tasks.append(_GridTask(a, b, col_a, col_b, limit, spec=spec))
+        if mirror_limit is not None:
+            for target_angle, label in _MIRROR_TARGETS:
+                tasks.append(
+                    _GridTask(
+                        a,
+                        b,
+                        col_a,
+                        col_b,
+                        mirror_limit,
+                        mirror_angle=target_angle,
+                        mirror_label=label,
+                    )
+                )
+
+    if workers > 1 and len(tasks) > 1 and _pool_can_share(provider):
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_init_grid_worker,
+            initargs=(state,),
+        ) as pool:
+            results = list(pool.map(_grid_worker_task, tasks, chunksize=chunksize))
+    else:
+        results = [_run_grid_task(state, task) for task in tasks]
+
+    # Merge in the serial order: per pair, sorted aspect hits then sorted mirrors.
+    hits: list[Hit] = []
+    cursor = 0
+    for _pair in pairs:
+        aspect_hits = [hit for chunk in results[cursor : cursor + len(specs)] for hit in chunk]
+        cursor += len(specs)
+        aspect_hits.sort(key=lambda h: (h.exact_time, h.orb))
+        hits.extend(aspect_hits)
+        if mirror_limit is not None:
+            mirror_hits = [
+                hit
+                for chunk in results[cursor : cursor + len(_MIRROR_TARGETS)]
+                for hit in chunk
+            ]
+            cursor += len(_MIRROR_TARGETS)
+            mirror_hits.sort(key=lambda h: (h.exact_time, h.orb))
+            hits.extend(mirror_hits)
+    return hits
+
+
 def scan_time_range(
     *,
     objects: Sequence[str],
@@ -586,13 +792,37 @@ def scan_time_range(
     step_minutes: int = 60,
     include_antiscia: bool = False,
     antiscia_orb: float | None = None,
+    workers: int | None = None,
 ) -> list[Hit]:
-    """Scan a set of objects for matching aspect hits."""
+    """Scan a set of objects for matching aspect hits.
+
+    ``workers`` selects the shared-grid mode: every object is sampled once
+    per step into a single longitude array, and the per-pair/per-spec root
+    finding runs on up to ``workers`` processes (in-process for ``1``).  The
+    provider must be picklable unless the platform forks.  Hits are merged
+    in the same order as the default serial scan.
+    """
 
     specs = _build_specs(aspects, harmonics)
     if not specs:
         return []
 
+    if workers is not None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        hits = _scan_shared_grid(
+            list(_pair_iter(objects, pairs)),
+            specs,
+            window,
+            position_provider,
+            orb_policy,
+            step_minutes,
+            _mirror_limit(antiscia_orb) if include_antiscia else None,
+            int(workers),
+        )
+        hits.sort(key=lambda h: (h.exact_time, h.orb))
+        return hits
+
     hits: list[Hit] = []
     for a, b in _pair_iter(objects, pairs):
         hits.extend(
@@ -50,8 +50,12 @@ def search_time_range(
     position_provider: PositionProvider,
     timerange: TimeRange,
     config: AspectSearch,
+    workers: int | None = None,
 ) -> list[Hit]:
-    """Execute a time-ranged aspect search using ``scan_time_range`` primitives."""
+    """Execute a time-ranged aspect search using ``scan_time_range`` primitives.
+
+    ``workers`` enables the shared-grid process-pool mode of ``scan_time_range``.
+    """
 
     if not config.objects:
         raise ValueError("config.objects must contain at least one body")
@@ -68,6 +72,7 @@ def search_time_range(
         step_minutes=timerange.step_minutes,
         include_antiscia=config.include_antiscia,
         antiscia_orb=config.antiscia_orb,
+        workers=workers,
     )
     return hits
 
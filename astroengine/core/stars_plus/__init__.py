@@ -13,7 +13,14 @@ from .geometry import (
     radec_to_ecliptic_lon_deg,
     rise_set_hour_angle_deg,
 )
-from .parans import Location, ParanEvent, ParanPair, detect_parans
+from .parans import (
+    Location,
+    ParanEvent,
+    ParanPair,
+    StarEventTable,
+    detect_parans,
+    scan_parans,
+)
 
 __all__ = [
     "Star",
@@ -23,7 +30,9 @@ __all__ = [
     "Location",
     "ParanPair",
     "ParanEvent",
+    "StarEventTable",
     "detect_parans",
+    "scan_parans",
     "approximate_transit_times",
     "gmst_deg",
     "lst_deg",
@@ -3,6 +3,12 @@ from __future__ import annotations
 import math
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
+
+SIDEREAL_RATE_DEG_PER_DAY = 360.98564736629
+EVENTS = ("rise", "set", "culminate")
+_EVENT_GUESS_DAYS = np.array([0.25, 0.75, 0.5])  # rough UTC hour of each event
+
 # --------------------------- Angles & time ---------------------------------
 
 def norm360(x: float) -> float:
@@ -36,24 +42,33 @@ def radec_to_ecliptic_lon_deg(ra_deg: float, dec_deg: float, epsilon_deg: float)
 
 # --------------------------- Sidereal time ---------------------------------
 
+def julian_day(dt: datetime) -> float:
+    y = dt.year; m = dt.month; d = dt.day
+    hr = dt.hour + dt.minute/60 + dt.second/3600 + dt.microsecond/3.6e9
+    if m <= 2:
+        y -= 1; m += 12
+    A = int(y/100); B = 2 - A + int(A/4)
+    JD = int(365.25*(y+4716)) + int(30.6001*(m+1)) + d + B - 1524.5 + hr/24.0
+    return JD
+
+
 def gmst_deg(ts: datetime) -> float:
     # Vallado-ish approximation for GMST in degrees
-    # Convert to Julian Date
-    def jd(dt: datetime) -> float:
-        y = dt.year; m = dt.month; d = dt.day
-        hr = dt.hour + dt.minute/60 + dt.second/3600 + dt.microsecond/3.6e9
-        if m <= 2:
-            y -= 1; m += 12
-        A = int(y/100); B = 2 - A + int(A/4)
-        JD = int(365.25*(y+4716)) + int(30.6001*(m+1)) + d + B - 1524.5 + hr/24.0
-        return JD
-    JD = jd(ts)
+    JD = julian_day(ts)
     D = JD - 2451545.0
     T = D / 36525.0
-    GMST = 280.46061837 + 360.98564736629*D + 0.000387933*T*T - (T*T*T)/38710000.0
+    GMST = 280.46061837 + SIDEREAL_RATE_DEG_PER_DAY*D + 0.000387933*T*T - (T*T*T)/38710000.0
     return norm360(GMST)
 
 
+def gmst_deg_array(jd: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`gmst_deg` over Julian days."""
+
+    D = np.asarray(jd, dtype=float) - 2451545.0
+    T = D / 36525.0
+    return (280.46061837 + SIDEREAL_RATE_DEG_PER_DAY*D + 0.000387933*T*T - (T*T*T)/38710000.0) % 360.0
+
+
 def lst_deg(ts: datetime, lon_deg_east: float) -> float:
     return norm360(gmst_deg(ts) + lon_deg_east)
 
@@ -83,7 +98,7 @@ def refine_event_time(ts_guess: datetime, lon_east: float, target_lst_deg: float
         cur = lst_deg(ts, lon_east)
         # convert difference (deg) to seconds using dLST/dt ≈ 360.9856°/sidereal day
         delta_deg = (target_lst_deg - cur + 540) % 360 - 180
-        sec = delta_deg / 360.98564736629 * 86164.0905
+        sec = delta_deg / SIDEREAL_RATE_DEG_PER_DAY * 86164.0905
         ts = ts + timedelta(seconds=sec)
     return ts
 
@@ -104,3 +119,35 @@ def approximate_transit_times(date_utc: datetime, lon_east: float, ra_deg: float
         out["rise"] = refine_event_time(base + timedelta(hours=6), lon_east, L_rise)
         out["set"] = refine_event_time(base + timedelta(hours=18), lon_east, L_set)
     return out
+
+
+def event_lsts_deg(ra_deg: np.ndarray, dec_deg: np.ndarray, phi_deg: float) -> np.ndarray:
+    """Return LST targets ``(..., 3)`` for each of :data:`EVENTS`.
+
+    Rise and set are ``NaN`` where the object never crosses the horizon.
+    """
+
+    ra = np.asarray(ra_deg, dtype=float)
+    dec = np.radians(np.asarray(dec_deg, dtype=float))
+    cos_h0 = -math.tan(math.radians(phi_deg)) * np.tan(dec)
+    with np.errstate(invalid="ignore"):
+        h0 = np.where(np.abs(cos_h0) > 1.0, np.nan, np.degrees(np.arccos(cos_h0)))
+    return np.stack([ra - h0, ra + h0, ra], axis=-1) % 360.0
+
+
+def event_times_jd(base_jd: np.ndarray, lon_east: float, lst_targets: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`approximate_transit_times` in Julian days.
+
+    ``base_jd`` holds 0h UTC of each date and must broadcast against
+    ``lst_targets[..., 0]``.  Each event resolves to the instant nearest its
+    rough guess where the local sidereal time reaches the target, matching
+    :func:`refine_event_time`.
+    """
+
+    targets = np.asarray(lst_targets, dtype=float)
+    jd = np.asarray(base_jd, dtype=float)[..., None] + _EVENT_GUESS_DAYS
+    jd = np.broadcast_to(jd, np.broadcast_shapes(jd.shape, targets.shape)).copy()
+    for _ in range(2):
+        delta = (targets - gmst_deg_array(jd) - lon_east + 540.0) % 360.0 - 180.0
+        jd += delta / SIDEREAL_RATE_DEG_PER_DAY
+    return jd
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
+
 from .catalog import Star
-from .geometry import approximate_transit_times
+from .geometry import EVENTS, event_lsts_deg, event_times_jd, julian_day
 
 PositionProvider = Callable[[datetime], dict[str, float]]  # returns ecliptic longitudes for planets
 
@@ -28,6 +30,166 @@ class ParanEvent:
     meta: dict[str, object]
 
 
+_EVENT_INDEX = {name: index for index, name in enumerate(EVENTS)}
+
+
+@dataclass(frozen=True)
+class StarEventTable:
+    """Rise/set/culmination sidereal times for a star set at one location.
+
+    Star RA/Dec are fixed, so the LST of each event depends only on latitude;
+    :meth:`times` turns them into UTC instants for any batch of dates.
+    """
+
+    names: tuple[str, ...]
+    lst_deg: np.ndarray  # (stars, 3) in geometry.EVENTS order; NaN if circumpolar
+    location: Location
+
+    @classmethod
+    def build(cls, stars: Mapping[str, Star], location: Location) -> StarEventTable:
+        names = tuple(stars)
+        ra = np.array([stars[name].ra_deg for name in names], dtype=float)
+        dec = np.array([stars[name].dec_deg for name in names], dtype=float)
+        lst = event_lsts_deg(ra, dec, location.lat_deg).reshape(len(names), 3)
+        lst.setflags(write=False)
+        return cls(names, lst, location)
+
+    def times(self, base_jd: np.ndarray) -> np.ndarray:
+        """Return event Julian days ``(dates, stars, 3)`` for 0h UTC ``base_jd``."""
+
+        base = np.asarray(base_jd, dtype=float)[:, None]
+        return event_times_jd(base, self.location.lon_east_deg, self.lst_deg)
+
+
+def _scan_days(date_start: datetime, date_end: datetime, step_days: int) -> list[datetime]:
+    days: list[datetime] = []
+    cur = date_start.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    end = date_end.astimezone(UTC)
+    while cur <= end:
+        days.append(cur)
+        cur += timedelta(days=step_days)
+    return days
+
+
+def _sweep_matches(
+    star_rel: np.ndarray, planet_rel: np.ndarray, tol_days: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(day, star)`` index pairs with same-day events within ``tol_days``.
+
+    ``star_rel`` is ``(days, stars)`` and ``planet_rel`` is ``(days,)``, both
+    in days after each date's 0h.  Offsetting every date by a stride wider
+    than one date's events plus the tolerance flattens the scan into a single
+    sorted sweep that never pairs events from different dates.
+    """
+
+    n_days, n_stars = star_rel.shape
+    stride = 4.0 + 2.0 * tol_days
+    offsets = stride * np.arange(n_days, dtype=float)
+    keys = star_rel + offsets[:, None]
+    valid = ~np.isnan(keys)
+    flat = keys[valid]
+    columns = np.broadcast_to(np.arange(n_stars), keys.shape)[valid]
+    order = np.argsort(flat, kind="stable")
+    flat = flat[order]
+    columns = columns[order]
+
+    probe = planet_rel + offsets
+    lo = np.searchsorted(flat, probe - tol_days, side="left")
+    hi = np.searchsorted(flat, probe + tol_days, side="right")
+    counts = np.where(np.isnan(probe), 0, hi - lo)
+    total = int(counts.sum())
+    if not total:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    day = np.repeat(np.arange(n_days), counts)
+    run_start = np.repeat(np.cumsum(counts) - counts, counts)
+    position = np.repeat(lo, counts) + (np.arange(total) - run_start)
+    return day, columns[position]
+
+
+def _scan(
+    days: Sequence[datetime],
+    table: StarEventTable,
+    groups: Mapping[tuple[str, str, str], np.ndarray],
+    provider_radec: Callable[[datetime, str], tuple[float, float]],
+    tol_minutes: float,
+) -> list[ParanEvent]:
+    """Match star events against planet events for each ``(planet, star_event, planet_event)`` group."""
+
+    if not days or not groups:
+        return []
+    location = table.location
+    base = np.array([julian_day(day) for day in days], dtype=float)
+    star_rel = table.times(base) - base[:, None, None]
+
+    planets = list(dict.fromkeys(planet for planet, _, _ in groups))
+    radec = np.array(
+        [[provider_radec(day + timedelta(hours=12), planet) for planet in planets] for day in days],
+        dtype=float,
+    ).reshape(len(days), len(planets), 2)
+    planet_lst = event_lsts_deg(radec[..., 0], radec[..., 1], location.lat_deg)
+    planet_rel = event_times_jd(base[:, None], location.lon_east_deg, planet_lst) - base[:, None, None]
+    planet_column = {planet: index for index, planet in enumerate(planets)}
+
+    tol_days = tol_minutes / 1440.0
+    out: list[ParanEvent] = []
+    for (planet, star_event, planet_event), columns in groups.items():
+        if not len(columns):
+            continue
+        stars = star_rel[:, columns, _EVENT_INDEX[star_event]]
+        planet_times = planet_rel[:, planet_column[planet], _EVENT_INDEX[planet_event]]
+        day_index, star_index = _sweep_matches(stars, planet_times, tol_days)
+        for d, s in zip(day_index.tolist(), star_index.tolist()):
+            ts_star = stars[d, s]
+            ts_plan = planet_times[d]
+            dt_min = abs(ts_star - ts_plan) * 1440.0
+            if dt_min > tol_minutes:
+                continue
+            out.append(ParanEvent(
+                kind="paran",
+                time=days[d] + timedelta(days=float(min(ts_star, ts_plan))),
+                meta={
+                    "star": table.names[columns[s]],
+                    "planet": planet,
+                    "star_event": star_event,
+                    "planet_event": planet_event,
+                    "dt_diff_min": float(dt_min),
+                }
+            ))
+
+    out.sort(key=lambda e: e.time)
+    return out
+
+
+def _check_event(name: str) -> None:
+    if name not in _EVENT_INDEX:
+        raise ValueError(f"Unsupported paran event: {name}")
+
+
+def scan_parans(
+    date_start: datetime,
+    date_end: datetime,
+    table: StarEventTable,
+    bodies: Sequence[str],
+    provider_radec: Callable[[datetime, str], tuple[float, float]],
+    event_pairs: Iterable[tuple[str, str]],
+    tol_minutes: float = 8.0,
+    step_days: int = 1,
+) -> list[ParanEvent]:
+    """Scan every star in ``table`` against every body for each event pair.
+
+    ``provider_radec`` is called once per body per date.
+    """
+    all_stars = np.arange(len(table.names))
+    groups: dict[tuple[str, str, str], np.ndarray] = {}
+    for body in bodies:
+        for star_event, planet_event in event_pairs:
+            _check_event(star_event)
+            _check_event(planet_event)
+            groups[(body, star_event, planet_event)] = all_stars
+    return _scan(_scan_days(date_start, date_end, step_days), table, groups, provider_radec, tol_minutes)
+
+
 def detect_parans(
     date_start: datetime,
     date_end: datetime,
@@ -40,43 +202,19 @@ def detect_parans(
 ) -> list[ParanEvent]:
     """Scan dates [start,end] (UTC) for parans matching the `pairs` at `location`.
 
-    MVP: For each UTC date, compute star and planet event times (rise/set/culm) using their RA/Dec
-    and report matches when the absolute time difference ≤ tol_minutes.
+    For each UTC date, star and planet event times (rise/set/culm) are derived from
+    their RA/Dec, and matches are reported when the absolute time difference is
+    ≤ tol_minutes.  Planet RA/Dec is sampled once per planet per date at midday.
     """
-    out: list[ParanEvent] = []
-    cur = date_start.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-    end = date_end.astimezone(UTC)
-
-    while cur <= end:
-        for pair in pairs:
-            star = stars.get(pair.star_name)
-            if not star:
-                continue
-            # Star events for this date
-            st_events = approximate_transit_times(cur, location.lon_east_deg, star.ra_deg, star.dec_deg, location.lat_deg)
-
-            # Planet RA/Dec at midday (approx across day)
-            mid = cur + timedelta(hours=12)
-            pra, pdec = provider_radec(mid, pair.planet_name)
-            pl_events = approximate_transit_times(cur, location.lon_east_deg, pra, pdec, location.lat_deg)
-
-            ts_star = st_events.get(pair.star_event)
-            ts_plan = pl_events.get(pair.planet_event)
-            if ts_star and ts_plan:
-                dt_min = abs((ts_star - ts_plan).total_seconds()) / 60.0
-                if dt_min <= tol_minutes:
-                    out.append(ParanEvent(
-                        kind="paran",
-                        time=ts_star if ts_star < ts_plan else ts_plan,
-                        meta={
-                            "star": pair.star_name,
-                            "planet": pair.planet_name,
-                            "star_event": pair.star_event,
-                            "planet_event": pair.planet_event,
-                            "dt_diff_min": dt_min,
-                        }
-                    ))
-        cur += timedelta(days=step_days)
-
-    out.sort(key=lambda e: e.time)
-    return out
+    table = StarEventTable.build(stars, location)
+    column = {name: index for index, name in enumerate(table.names)}
+    grouped: dict[tuple[str, str, str], list[int]] = {}
+    for pair in pairs:
+        if pair.star_name not in column:
+            continue
+        if pair.star_event not in _EVENT_INDEX or pair.planet_event not in _EVENT_INDEX:
+            continue
+        key = (pair.planet_name, pair.star_event, pair.planet_event)
+        grouped.setdefault(key, []).append(column[pair.star_name])
+    groups = {key: np.array(columns, dtype=np.intp) for key, columns in grouped.items()}
+    return _scan(_scan_days(date_start, date_end, step_days), table, groups, provider_radec, tol_minutes)
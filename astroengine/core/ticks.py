@@ -0,0 +1,140 @@
+"""Julian-day tick helpers shared by scanners, detectors and providers.
+
+Dense scans represent sample instants as ``float`` Julian days (UTC) so
+that ticks can be generated, compared and cached without building or
+parsing ISO-8601 strings.  Strings are only rendered for emitted events
+via :func:`utc_iso_from_jd`.  Providers may implement the optional
+``positions_ecliptic_jd(jd_utc, bodies)`` method; :func:`positions_at`
+falls back to ``positions_ecliptic`` for providers that only accept ISO
+timestamps.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Final
+
+__all__ = [
+    "IsoTickView",
+    "Tick",
+    "UNIX_EPOCH_JD",
+    "iso_from_tick",
+    "jd_from_tick",
+    "jd_from_utc_datetime",
+    "jd_ticks",
+    "positions_at",
+    "utc_datetime_from_jd",
+    "utc_iso_from_jd",
+]
+
+
+UNIX_EPOCH_JD: Final[float] = 2440587.5
+SECONDS_PER_DAY: Final[float] = 86_400.0
+_UNIX_EPOCH: Final[_dt.datetime] = _dt.datetime(1970, 1, 1, tzinfo=_dt.UTC)
+
+Tick = str | float
+
+
+def jd_from_utc_datetime(moment: _dt.datetime) -> float:
+    """Return the UTC Julian day for ``moment`` (naive values are treated as UTC)."""
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=_dt.UTC)
+    return moment.timestamp() / SECONDS_PER_DAY + UNIX_EPOCH_JD
+
+
+def utc_datetime_from_jd(jd_utc: float) -> _dt.datetime:
+    """Return an aware UTC datetime for ``jd_utc`` rounded to the millisecond.
+
+    A float64 Julian day only resolves ~40 µs near the present epoch, so
+    rounding to whole milliseconds recovers the exact instant for ticks
+    laid out on second-aligned grids.
+    """
+
+    millis = round((float(jd_utc) - UNIX_EPOCH_JD) * SECONDS_PER_DAY * 1000.0)
+    return _UNIX_EPOCH + _dt.timedelta(milliseconds=millis)
+
+
+def utc_iso_from_jd(jd_utc: float) -> str:
+    """Render ``jd_utc`` as an ISO-8601 ``Z`` timestamp rounded to the second."""
+
+    seconds = round((float(jd_utc) - UNIX_EPOCH_JD) * SECONDS_PER_DAY)
+    moment = _UNIX_EPOCH + _dt.timedelta(seconds=seconds)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def iso_from_tick(tick: Tick) -> str:
+    """Return the ISO representation of a string or Julian-day tick."""
+
+    if isinstance(tick, str):
+        return tick
+    return utc_iso_from_jd(tick)
+
+
+def jd_from_tick(tick: Tick) -> float:
+    """Return the UTC Julian day of a string or Julian-day tick."""
+
+    if isinstance(tick, str):
+        return jd_from_utc_datetime(_dt.datetime.fromisoformat(tick.replace("Z", "+00:00")))
+    return float(tick)
+
+
+def jd_ticks(start: _dt.datetime, end: _dt.datetime, step: _dt.timedelta) -> Iterator[float]:
+    """Yield UTC Julian days from ``start`` to ``end`` inclusive every ``step``.
+
+    Each tick is derived from ``start`` by multiplication rather than
+    accumulation so rounding error does not drift over long scans.
+    """
+
+    start_jd = jd_from_utc_datetime(start)
+    step_days = step.total_seconds() / SECONDS_PER_DAY
+    if step_days <= 0.0:
+        raise ValueError("step must be positive")
+    count = int((end - start).total_seconds() // step.total_seconds())
+    for index in range(count + 1):
+        yield start_jd + index * step_days
+
+
+class IsoTickView(Sequence[str]):
+    """Read-only ISO-8601 view over Julian-day ticks, formatted on access.
+
+    Plugin detectors receive ``DetectorContext.ticks`` as strings; the view
+    keeps that contract without rendering every tick up front.
+    """
+
+    __slots__ = ("_ticks",)
+
+    def __init__(self, ticks: Sequence[float]) -> None:
+        self._ticks = ticks
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [utc_iso_from_jd(tick) for tick in self._ticks[index]]
+        return utc_iso_from_jd(self._ticks[index])
+
+    def __iter__(self) -> Iterator[str]:
+        for tick in self._ticks:
+            yield utc_iso_from_jd(tick)
+
+    @property
+    def jd(self) -> Sequence[float]:
+        """Underlying Julian-day ticks for JD-aware consumers."""
+
+        return self._ticks
+
+
+def positions_at(
+    provider: object, tick: Tick, bodies: Iterable[str]
+) -> Mapping[str, Mapping[str, float]]:
+    """Query ``provider`` at ``tick`` using the JD-native API when available."""
+
+    if isinstance(tick, str):
+        return provider.positions_ecliptic(tick, bodies)  # type: ignore[attr-defined]
+    native = getattr(provider, "positions_ecliptic_jd", None)
+    if native is not None:
+        return native(float(tick), bodies)
+    return provider.positions_ecliptic(utc_iso_from_jd(tick), bodies)  # type: ignore[attr-defined]
@@ -16,13 +16,20 @@ from ..transits.engine import (
     TransitScanEvent,
     TransitScanService,
     _aspect_definitions,
+    iter_scan_transits,
     scan_transits as _scan_transits_impl,
     to_canonical_events,
 )
 
 from .api import TransitEvent as LegacyTransitEvent
 
-__all__ = ["TransitEngine", "TransitEngineConfig", "scan_transits", "_aspect_definitions"]
+__all__ = [
+    "TransitEngine",
+    "TransitEngineConfig",
+    "iter_scan_transits",
+    "scan_transits",
+    "_aspect_definitions",
+]
 
 
 @dataclass
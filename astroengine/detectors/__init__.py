@@ -13,6 +13,7 @@ from ..astro.declination import (
     is_contraparallel,
     is_parallel,
 )
+from ..core.ticks import Tick, iso_from_tick, positions_at
 from ..refine import adaptive_corridor_width
 from ..utils.angles import classify_applying_separating, delta_angle, is_within_orb
 from .directed_aspects import solar_arc_natal_aspects
@@ -24,6 +25,8 @@ __all__ = [
     "detect_antiscia_contacts",
     "find_lunations",
     "find_eclipses",
+    "find_ephemeris_events",
+    "EphemerisEvents",
     "find_stations",
     "find_shadow_periods",
     "find_sign_ingresses",
@@ -67,97 +70,177 @@ def _extract_declination(data: Mapping[str, float], fallback_lon: float) -> floa
     return ecl_to_dec(fallback_lon)
 
 
+def _decl_hits_for_tick(
+    when: Tick,
+    moving: str,
+    target: str,
+    pos_moving: Mapping[str, float],
+    pos_target: Mapping[str, float],
+    orb_deg_parallel: float,
+    orb_deg_contra: float,
+) -> list[CoarseHit]:
+    """Evaluate declination contacts for a single sampled tick."""
+
+    allow_parallel = float(orb_deg_parallel if orb_deg_parallel is not None else 0.5)
+    allow_contra = float(orb_deg_contra if orb_deg_contra is not None else 0.5)
+    corridor_profile = "gaussian"
+
+    lon_moving = float(pos_moving.get("lon", 0.0))
+    lon_target = float(pos_target.get("lon", 0.0))
+    dec_moving = _extract_declination(pos_moving, lon_moving)
+    dec_target = _extract_declination(pos_target, lon_target)
+    speed_moving = float(pos_moving.get("speed_lon", 0.0))
+    speed_target = float(pos_target.get("speed_lon", 0.0))
+    retrograde = speed_moving < 0 or speed_target < 0
+
+    if is_parallel(dec_moving, dec_target, orb_deg_parallel):
+        kind = "decl_parallel"
+        delta = dec_moving - dec_target
+        allow = allow_parallel
+    elif is_contraparallel(dec_moving, dec_target, orb_deg_contra):
+        kind = "decl_contra"
+        delta = dec_moving + dec_target
+        allow = allow_contra
+    else:
+        return []
+
+    iso = iso_from_tick(when)
+    motion = classify_applying_separating(lon_moving, speed_moving, lon_target)
+    corridor_width = adaptive_corridor_width(
+        allow,
+        speed_moving,
+        speed_target,
+        retrograde=retrograde,
+        aspect_strength=1.0,
+        minimum_orb_deg=0.1,
+    )
+    return [
+        CoarseHit(
+            kind=kind,
+            when_iso=iso,
+            moving=moving,
+            target=target,
+            lon_moving=lon_moving,
+            lon_target=lon_target,
+            dec_moving=dec_moving,
+            dec_target=dec_target,
+            delta=delta,
+            applying_or_separating=motion,
+            orb_allow=allow,
+            corridor_width_deg=corridor_width,
+            corridor_profile=corridor_profile,
+        )
+    ]
+
+
 def detect_decl_contacts(
     provider,
-    iso_ticks: Iterable[str],
+    iso_ticks: Iterable[Tick],
     moving: str,
     target: str,
     orb_deg_parallel: float = 0.5,
     orb_deg_contra: float = 0.5,
 ) -> list[CoarseHit]:
-    """Detect declination parallels/contraparallels across ``iso_ticks``."""
+    """Detect declination parallels/contraparallels across ``iso_ticks``.
+
+    Ticks may be ISO-8601 strings or UTC Julian days; timestamps are only
+    rendered for emitted hits.
+    """
 
     out: list[CoarseHit] = []
-    allow_parallel = float(orb_deg_parallel if orb_deg_parallel is not None else 0.5)
-    allow_contra = float(orb_deg_contra if orb_deg_contra is not None else 0.5)
-    corridor_profile = "gaussian"
-    for iso in iso_ticks:
-        positions = provider.positions_ecliptic(iso, [moving, target])
+    for tick in iso_ticks:
+        positions = positions_at(provider, tick, [moving, target])
         pos_moving = positions.get(moving)
         pos_target = positions.get(target)
         if not pos_moving or not pos_target:
             continue
-
-        lon_moving = float(pos_moving.get("lon", 0.0))
-        lon_target = float(pos_target.get("lon", 0.0))
-        dec_moving = _extract_declination(pos_moving, lon_moving)
-        dec_target = _extract_declination(pos_target, lon_target)
-        speed_moving = float(pos_moving.get("speed_lon", 0.0))
-        speed_target = float(pos_target.get("speed_lon", 0.0))
-        retrograde = speed_moving < 0 or speed_target < 0
-
-        if is_parallel(dec_moving, dec_target, orb_deg_parallel):
-            delta = dec_moving - dec_target
-            motion = classify_applying_separating(lon_moving, speed_moving, lon_target)
-            corridor_width = adaptive_corridor_width(
-                allow_parallel,
-                speed_moving,
-                speed_target,
-                retrograde=retrograde,
-                aspect_strength=1.0,
-                minimum_orb_deg=0.1,
-            )
-            out.append(
-                CoarseHit(
-                    kind="decl_parallel",
-                    when_iso=iso,
-                    moving=moving,
-                    target=target,
-                    lon_moving=lon_moving,
-                    lon_target=lon_target,
-                    dec_moving=dec_moving,
-                    dec_target=dec_target,
-                    delta=delta,
-                    applying_or_separating=motion,
-                    orb_allow=allow_parallel,
-                    corridor_width_deg=corridor_width,
-                    corridor_profile=corridor_profile,
-                )
-            )
-        elif is_contraparallel(dec_moving, dec_target, orb_deg_contra):
-            delta = dec_moving + dec_target
-            motion = classify_applying_separating(lon_moving, speed_moving, lon_target)
-            corridor_width = adaptive_corridor_width(
-                allow_contra,
-                speed_moving,
-                speed_target,
-                retrograde=retrograde,
-                aspect_strength=1.0,
-                minimum_orb_deg=0.1,
+        out.extend(
+            _decl_hits_for_tick(
+                tick,
+                moving,
+                target,
+                pos_moving,
+                pos_target,
+                orb_deg_parallel,
+                orb_deg_contra,
             )
-            out.append(
-                CoarseHit(
-                    kind="decl_contra",
-                    when_iso=iso,
-                    moving=moving,
-                    target=target,
-                    lon_moving=lon_moving,
-                    lon_target=lon_target,
-                    dec_moving=dec_moving,
-                    dec_target=dec_target,
-                    delta=delta,
-                    applying_or_separating=motion,
-                    orb_allow=allow_contra,
-                    corridor_width_deg=corridor_width,
-                    corridor_profile=corridor_profile,
-                )
+        )
+    return out
+
+
+def _antiscia_hits_for_tick(
+    when: Tick,
+    moving: str,
+    target: str,
+    pos_moving: Mapping[str, float],
+    pos_target: Mapping[str, float],
+    orb_deg_antiscia: float,
+    orb_deg_contra: float,
+    *,
+    axis: str = DEFAULT_ANTISCIA_AXIS,
+) -> list[CoarseHit]:
+    """Evaluate antiscia and contra-antiscia contacts for a single sampled tick."""
+
+    out: list[CoarseHit] = []
+    iso: str | None = None
+    allow_antiscia = float(orb_deg_antiscia if orb_deg_antiscia is not None else 2.0)
+    allow_contra = float(orb_deg_contra if orb_deg_contra is not None else 2.0)
+    corridor_profile = "gaussian"
+
+    lon_moving = float(pos_moving.get("lon", 0.0))
+    lon_target = float(pos_target.get("lon", 0.0))
+    speed_moving = float(pos_moving.get("speed_lon", 0.0))
+    speed_target = float(pos_target.get("speed_lon", 0.0))
+    retrograde = speed_moving < 0 or speed_target < 0
+    dec_moving = _extract_declination(pos_moving, lon_moving)
+    dec_target = _extract_declination(pos_target, lon_target)
+
+    anti_lon = antiscia_lon(lon_moving, axis=axis)
+    contra_lon = contra_antiscia_lon(lon_moving, axis=axis)
+
+    for kind, mirror_lon, orb_deg, allow in (
+        ("antiscia", anti_lon, orb_deg_antiscia, allow_antiscia),
+        ("contra_antiscia", contra_lon, orb_deg_contra, allow_contra),
+    ):
+        delta = delta_angle(mirror_lon, lon_target)
+        if not is_within_orb(delta, orb_deg):
+            continue
+        if iso is None:
+            iso = iso_from_tick(when)
+        motion = classify_applying_separating(lon_moving, speed_moving, mirror_lon)
+        corridor_width = adaptive_corridor_width(
+            allow,
+            speed_moving,
+            speed_target,
+            retrograde=retrograde,
+            aspect_strength=1.0,
+            minimum_orb_deg=0.1,
+        )
+        out.append(
+            CoarseHit(
+                kind=kind,
+                when_iso=iso,
+                moving=moving,
+                target=target,
+                lon_moving=lon_moving,
+                lon_target=lon_target,
+                dec_moving=dec_moving,
+                dec_target=dec_target,
+                delta=delta,
+                applying_or_separating=motion,
+                mirror_lon=mirror_lon,
+                axis=axis,
+                orb_allow=allow,
+                corridor_width_deg=corridor_width,
+                corridor_profile=corridor_profile,
             )
+        )
     return out
 
 
 def detect_antiscia_contacts(
     provider,
-    iso_ticks: Iterable[str],
+    iso_ticks: Iterable[Tick],
     moving: str,
     target: str,
     orb_deg_antiscia: float = 2.0,
@@ -165,91 +248,30 @@ def detect_antiscia_contacts(
     *,
     axis: str = DEFAULT_ANTISCIA_AXIS,
 ) -> list[CoarseHit]:
-    """Detect antiscia and contra-antiscia contacts across ``iso_ticks``."""
+    """Detect antiscia and contra-antiscia contacts across ``iso_ticks``.
+
+    Ticks may be ISO-8601 strings or UTC Julian days.
+    """
 
     out: list[CoarseHit] = []
-    allow_antiscia = float(orb_deg_antiscia if orb_deg_antiscia is not None else 2.0)
-    allow_contra = float(orb_deg_contra if orb_deg_contra is not None else 2.0)
-    corridor_profile = "gaussian"
-    for iso in iso_ticks:
-        positions = provider.positions_ecliptic(iso, [moving, target])
+    for tick in iso_ticks:
+        positions = positions_at(provider, tick, [moving, target])
         pos_moving = positions.get(moving)
         pos_target = positions.get(target)
         if not pos_moving or not pos_target:
             continue
-
-        lon_moving = float(pos_moving.get("lon", 0.0))
-        lon_target = float(pos_target.get("lon", 0.0))
-        speed_moving = float(pos_moving.get("speed_lon", 0.0))
-        speed_target = float(pos_target.get("speed_lon", 0.0))
-        retrograde = speed_moving < 0 or speed_target < 0
-        dec_moving = _extract_declination(pos_moving, lon_moving)
-        dec_target = _extract_declination(pos_target, lon_target)
-
-        anti_lon = antiscia_lon(lon_moving, axis=axis)
-        contra_lon = contra_antiscia_lon(lon_moving, axis=axis)
-
-        d_anti = delta_angle(anti_lon, lon_target)
-        if is_within_orb(d_anti, orb_deg_antiscia):
-            motion = classify_applying_separating(lon_moving, speed_moving, anti_lon)
-            corridor_width = adaptive_corridor_width(
-                allow_antiscia,
-                speed_moving,
-                speed_target,
-                retrograde=retrograde,
-                aspect_strength=1.0,
-                minimum_orb_deg=0.1,
-            )
-            out.append(
-                CoarseHit(
-                    kind="antiscia",
-                    when_iso=iso,
-                    moving=moving,
-                    target=target,
-                    lon_moving=lon_moving,
-                    lon_target=lon_target,
-                    dec_moving=dec_moving,
-                    dec_target=dec_target,
-                    delta=d_anti,
-                    applying_or_separating=motion,
-                    mirror_lon=anti_lon,
-                    axis=axis,
-                    orb_allow=allow_antiscia,
-                    corridor_width_deg=corridor_width,
-                    corridor_profile=corridor_profile,
-                )
-            )
-
-        d_contra = delta_angle(contra_lon, lon_target)
-        if is_within_orb(d_contra, orb_deg_contra):
-            motion = classify_applying_separating(lon_moving, speed_moving, contra_lon)
-            corridor_width = adaptive_corridor_width(
-                allow_contra,
-                speed_moving,
-                speed_target,
-                retrograde=retrograde,
-                aspect_strength=1.0,
-                minimum_orb_deg=0.1,
-            )
-            out.append(
-                CoarseHit(
-                    kind="contra_antiscia",
-                    when_iso=iso,
-                    moving=moving,
-                    target=target,
-                    lon_moving=lon_moving,
-                    lon_target=lon_target,
-                    dec_moving=dec_moving,
-                    dec_target=dec_target,
-                    delta=d_contra,
-                    applying_or_separating=motion,
-                    mirror_lon=contra_lon,
-                    axis=axis,
-                    orb_allow=allow_contra,
-                    corridor_width_deg=corridor_width,
-                    corridor_profile=corridor_profile,
-                )
+        out.extend(
+            _antiscia_hits_for_tick(
+                tick,
+                moving,
+                target,
+                pos_moving,
+                pos_target,
+                orb_deg_antiscia,
+                orb_deg_contra,
+                axis=axis,
             )
+        )
     return out
 
 
@@ -269,6 +291,18 @@ except SyntaxError as exc:  # pragma: no cover - defensive for partial builds
             "sign ingress detector unavailable"
         ) from _INGRESS_IMPORT_ERROR
 
+# The combined finder reuses the ingress helpers, so it shares their guard.
+if _INGRESS_IMPORT_ERROR is None:
+    from .ephemeris_events import EphemerisEvents, find_ephemeris_events  # noqa: E402
+else:  # pragma: no cover - defensive for partial builds
+    EphemerisEvents = None  # type: ignore[assignment,misc]
+
+    def find_ephemeris_events(*_args, **_kwargs):  # type: ignore
+
+        raise RuntimeError(
+            "combined ephemeris event finder unavailable"
+        ) from _INGRESS_IMPORT_ERROR
+
 
 
 from .lunations import find_lunations  # noqa: E402
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
+
+from ..detectors_aspects import AspectHit
 from ..ephemeris import SwissEphemerisAdapter
 from ..ephemeris.swe import swe
 from ..ephemeris.utils import get_se_ephe_path
@@ -20,6 +23,8 @@ __all__ = [
     "moon_lon",
     "body_lon",
     "solve_zero_crossing",
+    "tick_speeds",
+    "natal_aspect_hits",
 ]
 
 _BODY_NAME_TO_ATTR = {
@@ -245,3 +250,105 @@ def solve_zero_crossing(
             left, f_left = mid, f_mid
 
     return root
+
+
+# --- Tick-sampled natal contacts ---------------------------------------------
+
+_PARTILE_THRESHOLD_DEG = 10.0 / 60.0
+
+
+def tick_speeds(longitudes: np.ndarray, step_days: float, initial: np.ndarray | float) -> np.ndarray:
+    """Return per-tick speeds from finite differences of ``longitudes``.
+
+    The first tick has no predecessor and reports ``initial`` instead.
+    """
+
+    speeds = np.empty_like(longitudes, dtype=float)
+    speeds[0] = initial
+    speeds[1:] = ((np.diff(longitudes, axis=0) + 180.0) % 360.0 - 180.0) / step_days
+    return speeds
+
+
+def natal_aspect_hits(
+    start: datetime,
+    step: timedelta,
+    longitudes: Mapping[str, np.ndarray],
+    speeds: Mapping[str, np.ndarray],
+    natal_longitudes: Mapping[str, float],
+    angles: Sequence[float],
+    orb_deg: float,
+    *,
+    kind: str,
+    family: str,
+) -> list[AspectHit]:
+    """Return aspect hits from moving longitudes sampled at ``start + k * step``.
+
+    Orb windows are located with array comparisons so only ticks inside an
+    orb are materialised.  Applying/separating states compare each hit with
+    the previous hit of the same ``(moving, target, angle)`` combination.
+    """
+
+    iso_cache: dict[int, str] = {}
+
+    def _iso(index: int) -> str:
+        value = iso_cache.get(index)
+        if value is None:
+            moment = start + step * index
+            value = moment.astimezone(UTC).isoformat().replace("+00:00", "Z")
+            iso_cache[index] = value
+        return value
+
+    limit = orb_deg + 1e-9
+    hits: list[AspectHit] = []
+    for moving, lon in longitudes.items():
+        speed = speeds[moving]
+        for target, natal_lon in natal_longitudes.items():
+            if moving == target:
+                continue
+            delta_lambda = (lon - natal_lon) % 360.0
+            separation = np.minimum(delta_lambda, 360.0 - delta_lambda)
+            for angle in angles:
+                offset = separation - angle
+                orb_abs = np.abs(offset)
+                previous: float | None = None
+                for index in np.flatnonzero(orb_abs <= limit).tolist():
+                    orb = float(orb_abs[index])
+                    signed = float(offset[index])
+                    if previous is None:
+                        if abs(signed) <= 1e-6:
+                            phase = "exact"
+                        else:
+                            phase = "applying" if signed < 0 else "separating"
+                    elif orb < previous - 1e-6:
+                        phase = "applying"
+                    elif orb > previous + 1e-6:
+                        phase = "separating"
+                    else:
+                        phase = "exact"
+                    previous = orb
+                    rate = float(speed[index])
+                    hits.append(
+                        AspectHit(
+                            kind=kind,
+                            when_iso=_iso(index),
+                            moving=moving,
+                            target=target,
+                            angle_deg=float(angle),
+                            lon_moving=float(lon[index]),
+                            lon_target=float(natal_lon),
+                            delta_lambda_deg=float(delta_lambda[index]),
+                            offset_deg=signed,
+                            orb_abs=orb,
+                            orb_allow=float(orb_deg),
+                            is_partile=orb <= _PARTILE_THRESHOLD_DEG,
+                            applying_or_separating=phase,
+                            family=family,
+                            corridor_width_deg=None,
+                            corridor_profile=None,
+                            speed_deg_per_day=rate,
+                            retrograde=rate < 0,
+                        )
+                    )
+
+    hits.sort(key=lambda hit: (hit.when_iso, hit.moving, hit.target, hit.angle_deg))
+    return hits
@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
+import logging
 import math
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from time import monotonic
+
+import numpy as np
 
 from astroengine.engine.ephe_runtime import init_ephe
 from astroengine.ephemeris.swe import has_swe, swe
 
+from ..cache.eclipse_catalogue import (
+    CATALOGUE,
+    KIND_LUNAR,
+    KIND_SOLAR,
+    RECORD_DTYPE,
+    EclipseCatalogue,
+    write_eclipse_catalogue,
+)
 from ..ephemeris.cache import calc_ut_cached
 from ..events import EclipseEvent
 from .common import jd_to_iso, moon_lon, sun_lon
 
-__all__ = ["find_eclipses"]
+__all__ = ["build_eclipse_catalogue", "find_eclipses"]
 
 Location = tuple[float, float] | tuple[float, float, float]
 
+_LOGGER = logging.getLogger(__name__)
+
+CATALOGUE_START_JD = 2086307.5  # 1000-01-01 (Julian calendar)
+CATALOGUE_END_JD = 2816787.5  # 3000-01-01
+
+_PHASES = {"solar": "new_moon", "lunar": "full_moon"}
+
 
 def _moon_latitude(jd_ut: float) -> float:
     """Return Moon ecliptic latitude in degrees."""
@@ -73,82 +93,158 @@ def _visible_at_location(
     return bool(retflag & swe().ECL_VISIBLE)
 
 
-def _solar_eclipses(
-    start_jd: float,
-    end_jd: float,
-    location: tuple[float, float, float] | None,
-) -> list[EclipseEvent]:
-    events: list[EclipseEvent] = []
+def _eclipse_maxima(
+    eclipse_type: str, start_jd: float, end_jd: float
+) -> Iterator[tuple[float, int]]:
+    """Yield ``(max_jd, swe_flags)`` for global eclipses in ``start_jd``..``end_jd``."""
+
+    search = (
+        swe().sol_eclipse_when_glob if eclipse_type == "solar" else swe().lun_eclipse_when
+    )
     jd = start_jd
     flags = init_ephe()
 
     while True:
-        retflag, tret = swe().sol_eclipse_when_glob(jd, flags)
+        retflag, tret = search(jd, flags)
         if retflag == 0:
             break
         max_jd = float(tret[0])
         if max_jd > end_jd:
             break
-        if max_jd < start_jd:
-            jd = max_jd + 1.0
-            continue
-
-        visible = _visible_at_location(max_jd, "solar", location)
-        events.append(
-            EclipseEvent(
-                ts=jd_to_iso(max_jd),
-                jd=max_jd,
-                eclipse_type="solar",
-                phase="new_moon",
-                sun_longitude=sun_lon(max_jd) % 360.0,
-                moon_longitude=moon_lon(max_jd) % 360.0,
-                moon_latitude=_moon_latitude(max_jd),
-                is_visible=visible,
-            )
-        )
-
+        if max_jd >= start_jd:
+            yield max_jd, int(retflag)
         jd = max_jd + 1.0
 
-    return events
 
+def _event(
+    eclipse_type: str,
+    max_jd: float,
+    sun_longitude: float,
+    moon_longitude: float,
+    moon_latitude: float,
+    location: tuple[float, float, float] | None,
+) -> EclipseEvent:
+    return EclipseEvent(
+        ts=jd_to_iso(max_jd),
+        jd=max_jd,
+        eclipse_type=eclipse_type,
+        phase=_PHASES[eclipse_type],
+        sun_longitude=sun_longitude,
+        moon_longitude=moon_longitude,
+        moon_latitude=moon_latitude,
+        is_visible=_visible_at_location(max_jd, eclipse_type, location),
+    )
 
-def _lunar_eclipses(
+
+def _search_eclipses(
+    eclipse_type: str,
     start_jd: float,
     end_jd: float,
     location: tuple[float, float, float] | None,
 ) -> list[EclipseEvent]:
-    events: list[EclipseEvent] = []
-    jd = start_jd
-    flags = init_ephe()
+    return [
+        _event(
+            eclipse_type,
+            max_jd,
+            sun_lon(max_jd) % 360.0,
+            moon_lon(max_jd) % 360.0,
+            _moon_latitude(max_jd),
+            location,
+        )
+        for max_jd, _ in _eclipse_maxima(eclipse_type, start_jd, end_jd)
+    ]
 
-    while True:
-        retflag, tret = swe().lun_eclipse_when(jd, flags)
-        if retflag == 0:
-            break
-        max_jd = float(tret[0])
-        if max_jd > end_jd:
-            break
-        if max_jd < start_jd:
-            jd = max_jd + 1.0
-            continue
-
-        visible = _visible_at_location(max_jd, "lunar", location)
-        events.append(
-            EclipseEvent(
-                ts=jd_to_iso(max_jd),
-                jd=max_jd,
-                eclipse_type="lunar",
-                phase="full_moon",
-                sun_longitude=sun_lon(max_jd) % 360.0,
-                moon_longitude=moon_lon(max_jd) % 360.0,
-                moon_latitude=_moon_latitude(max_jd),
-                is_visible=visible,
+
+# --- Precomputed catalogue ---------------------------------------------------
+
+_CATALOGUE: EclipseCatalogue | None = None
+_CATALOGUE_CHECKED_AT: float | None = None
+_CATALOGUE_RECHECK_SEC = 5.0
+
+
+def _open_catalogue() -> EclipseCatalogue | None:
+    """Return the mapped eclipse catalogue, reopening it if it was replaced."""
+
+    global _CATALOGUE, _CATALOGUE_CHECKED_AT
+
+    # Stat or reopen the file at most once per _CATALOGUE_RECHECK_SEC so a
+    # missing catalogue does not add a failed open to every search.
+    checked = _CATALOGUE_CHECKED_AT
+    now = monotonic()
+    if checked is not None and now - checked < _CATALOGUE_RECHECK_SEC:
+        return _CATALOGUE
+    _CATALOGUE_CHECKED_AT = now
+    if _CATALOGUE is not None and not _CATALOGUE.is_stale():
+        return _CATALOGUE
+    try:
+        _CATALOGUE = EclipseCatalogue.open(CATALOGUE)
+    except FileNotFoundError:
+        _CATALOGUE = None
+    except (OSError, ValueError) as exc:
+        _LOGGER.warning("Ignoring unreadable eclipse catalogue %s: %s", CATALOGUE, exc)
+        _CATALOGUE = None
+    return _CATALOGUE
+
+
+def build_eclipse_catalogue(
+    start_jd: float = CATALOGUE_START_JD,
+    end_jd: float = CATALOGUE_END_JD,
+    *,
+    path: str | Path | None = None,
+) -> Path:
+    """Search every global eclipse in ``start_jd``..``end_jd`` and write the catalogue.
+
+    Defaults cover 1000–3000 CE.  Each record stores the maximum, the
+    Swiss eclipse-type flags and the Sun/Moon positions at maximum, so
+    :func:`find_eclipses` never repeats the search for covered ranges.
+    """
+
+    global _CATALOGUE_CHECKED_AT
+
+    if end_jd <= start_jd:
+        raise ValueError("end_jd must be after start_jd")
+    if not has_swe():
+        raise RuntimeError("Swiss ephemeris not available; install astroengine[ephem]")
+
+    rows: list[tuple[float, float, float, float, int, int]] = []
+    for kind, eclipse_type in ((KIND_SOLAR, "solar"), (KIND_LUNAR, "lunar")):
+        for max_jd, flags in _eclipse_maxima(eclipse_type, start_jd, end_jd):
+            rows.append(
+                (
+                    max_jd,
+                    sun_lon(max_jd) % 360.0,
+                    moon_lon(max_jd) % 360.0,
+                    _moon_latitude(max_jd),
+                    kind,
+                    flags,
+                )
             )
-        )
+    records = np.array(rows, dtype=RECORD_DTYPE)
+    target = Path(path) if path is not None else CATALOGUE
+    written = write_eclipse_catalogue(target, start_jd, end_jd, records)
+    if target == CATALOGUE:
+        _CATALOGUE_CHECKED_AT = None
+    return written
 
-        jd = max_jd + 1.0
 
-    return events
+def _catalogue_events(
+    catalogue: EclipseCatalogue,
+    start_jd: float,
+    end_jd: float,
+    location: tuple[float, float, float] | None,
+) -> list[EclipseEvent]:
+    records = catalogue.between(start_jd, end_jd)
+    return [
+        _event(
+            "solar" if kind == KIND_SOLAR else "lunar",
+            jd,
+            sun_longitude,
+            moon_longitude,
+            moon_latitude,
+            location,
+        )
+        for jd, sun_longitude, moon_longitude, moon_latitude, kind, _ in records.tolist()
+    ]
 
 
 def find_eclipses(
@@ -157,16 +253,26 @@ def find_eclipses(
     *,
     location: Location | Sequence[float] | None = None,
 ) -> list[EclipseEvent]:
-    """Return solar and lunar eclipses in the supplied range."""
+    """Return solar and lunar eclipses in the supplied range.
+
+    Ranges covered by the catalogue written by :func:`build_eclipse_catalogue`
+    are answered by bisection; only ``location`` visibility is computed per
+    request.  Other ranges fall back to a live Swiss ephemeris search.
+    """
 
     if end_jd <= start_jd:
         return []
+
+    loc = _normalize_location(location)
+    catalogue = _open_catalogue()
+    if catalogue is not None and catalogue.covers(start_jd, end_jd):
+        return _catalogue_events(catalogue, start_jd, end_jd, loc)
+
     if swe is None:
         raise RuntimeError("Swiss ephemeris not available; install astroengine[ephem]")
 
-    loc = _normalize_location(location)
-    events = _solar_eclipses(start_jd, end_jd, loc) + _lunar_eclipses(
-        start_jd, end_jd, loc
+    events = _search_eclipses("solar", start_jd, end_jd, loc) + _search_eclipses(
+        "lunar", start_jd, end_jd, loc
     )
     events.sort(key=lambda event: event.jd)
     return events
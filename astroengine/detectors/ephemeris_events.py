@@ -0,0 +1,385 @@
+"""Combined station, ingress and lunation finder over a shared sample grid.
+
+:func:`find_ephemeris_events` samples every requested body once on a common
+Julian-day grid, locates sign changes of the speed (stations), of the
+30° sign index (ingresses) and of the 180° Sun–Moon phase index (lunations)
+with array operations, and then refines all brackets of a body together so
+each refinement iteration costs one batched ephemeris call per body rather
+than one call per root.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from ..ephemeris import SwissEphemerisAdapter
+from ..ephemeris.swe import swe
+from ..events import IngressEvent, LunationEvent, StationEvent
+from .common import _resolve_body_code, jd_to_iso
+from .ingresses import _default_bodies, _resolve_policy, sign_name
+from .stations import _BODY_CODES as _STATION_BODIES
+
+__all__ = ["EphemerisEvents", "Sampler", "find_ephemeris_events"]
+
+Sampler = Callable[[np.ndarray, Sequence[str]], tuple[np.ndarray, np.ndarray]]
+"""Return ``(longitude, speed)`` arrays shaped ``(len(jd), len(bodies))``."""
+
+_TOL_DAYS = 5e-6
+_STATION_VALUE_TOL = 5e-7
+_INGRESS_VALUE_TOL = 1e-5
+_LUNATION_VALUE_TOL = 5e-5
+_MAX_ITER = 64
+
+# Slow bodies are read from every n-th row of the shared grid; none of them
+# can station or change sign twice within a few days.
+_SAMPLE_STRIDE: dict[str, int] = {
+    "jupiter": 4,
+    "saturn": 4,
+    "uranus": 8,
+    "neptune": 8,
+    "pluto": 8,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EphemerisEvents:
+    """Events found by a single :func:`find_ephemeris_events` pass."""
+
+    stations: tuple[StationEvent, ...]
+    ingresses: tuple[IngressEvent, ...]
+    lunations: tuple[LunationEvent, ...]
+
+
+def _swiss_sampler(adapter: SwissEphemerisAdapter) -> Sampler:
+    def sample(jds: np.ndarray, bodies: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        codes = {name: _resolve_body_code(name, swe) for name in bodies}
+        arrays = adapter.compute_bodies_array(jds, codes, equatorial=False)
+        return arrays.longitude, arrays.speed_longitude
+
+    return sample
+
+
+def _wrap180(values: np.ndarray) -> np.ndarray:
+    return (values + 180.0) % 360.0 - 180.0
+
+
+def _refine(
+    evaluate: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    left: np.ndarray,
+    right: np.ndarray,
+    f_left: np.ndarray,
+    f_right: np.ndarray,
+    *,
+    value_tol: float,
+) -> np.ndarray:
+    """Return roots for every bracket using a vectorised Illinois iteration.
+
+    ``evaluate(indices, jd)`` returns the objective for the brackets listed in
+    ``indices`` at the matching ``jd`` values in one batched call.
+    """
+
+    a = left.astype(float)
+    b = right.astype(float)
+    fa = f_left.astype(float)
+    fb = f_right.astype(float)
+    roots = np.where(fa == 0.0, a, np.where(fb == 0.0, b, np.nan))
+    side = np.zeros(a.shape, dtype=np.int8)
+
+    for _ in range(_MAX_ITER):
+        idx = np.flatnonzero(np.isnan(roots))
+        if idx.size == 0:
+            break
+        ai, bi, fai, fbi = a[idx], b[idx], fa[idx], fb[idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = bi - fbi * (bi - ai) / (fbi - fai)
+        midpoint = ~np.isfinite(x) | (x <= ai) | (x >= bi)
+        x[midpoint] = 0.5 * (ai[midpoint] + bi[midpoint])
+        fx = evaluate(idx, x)
+
+        done = (np.abs(fx) <= value_tol) | (bi - ai <= _TOL_DAYS)
+        roots[idx[done]] = x[done]
+
+        keep = ~done
+        idx, x, fx = idx[keep], x[keep], fx[keep]
+        move_left = np.signbit(fx) == np.signbit(fa[idx])
+        lefts, rights = idx[move_left], idx[~move_left]
+        a[lefts], fa[lefts] = x[move_left], fx[move_left]
+        b[rights], fb[rights] = x[~move_left], fx[~move_left]
+        fb[lefts[side[lefts] < 0]] *= 0.5
+        fa[rights[side[rights] > 0]] *= 0.5
+        side[lefts] = -1
+        side[rights] = 1
+
+    leftover = np.isnan(roots)
+    roots[leftover] = 0.5 * (a[leftover] + b[leftover])
+    return roots
+
+
+def _grid(start_jd: float, end_jd: float, step_days: float) -> np.ndarray:
+    count = int(math.ceil((end_jd - start_jd) / step_days)) + 1
+    jds = start_jd + step_days * np.arange(count, dtype=float)
+    jds[-1] = end_jd
+    return jds
+
+
+def _sample_grid(
+    jds: np.ndarray, bodies: Sequence[str], sampler: Sampler
+) -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Return ``{body: (jd, unwrapped_longitude, speed)}`` on strided grid rows."""
+
+    groups: dict[int, list[str]] = {}
+    for name in bodies:
+        groups.setdefault(_SAMPLE_STRIDE.get(name, 1), []).append(name)
+
+    out: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    for stride, names in groups.items():
+        rows = np.arange(0, jds.size, stride)
+        if rows[-1] != jds.size - 1:
+            rows = np.append(rows, jds.size - 1)
+        grid = jds[rows]
+        longitude, speed = sampler(grid, tuple(names))
+        unwrapped = np.unwrap(np.asarray(longitude, dtype=float), period=360.0, axis=0)
+        speed = np.asarray(speed, dtype=float)
+        for column, name in enumerate(names):
+            out[name] = (grid, unwrapped[:, column], speed[:, column])
+    return out
+
+
+def _boundary_brackets(index: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(row, boundary)`` pairs where ``index`` crosses an integer.
+
+    Rising steps from ``i`` to ``j`` cross boundaries ``i+1 … j``; falling
+    steps cross ``i … j+1``.  Steps spanning several boundaries yield one
+    pair per boundary.
+    """
+
+    step = np.diff(index)
+    rows = np.flatnonzero(step)
+    if rows.size == 0:
+        return rows, rows
+    counts = np.abs(step[rows])
+    expanded = np.repeat(rows, counts)
+    within = np.arange(expanded.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    rising = np.repeat(step[rows] > 0, counts)
+    base = index[expanded]
+    boundary = np.where(rising, base + 1 + within, base - within)
+    return expanded, boundary
+
+
+def _stations(
+    name: str,
+    jds: np.ndarray,
+    speed: np.ndarray,
+    sampler: Sampler,
+) -> list[StationEvent]:
+    sign = np.sign(speed)
+    # A zero sample closes the previous bracket; only the first row may open one.
+    opens = sign[:-1] != 0
+    opens[0] = True
+    rows = np.flatnonzero((sign[:-1] != sign[1:]) & opens)
+    if rows.size == 0:
+        return []
+
+    def evaluate(idx: np.ndarray, x: np.ndarray) -> np.ndarray:
+        return sampler(x, (name,))[1][:, 0]
+
+    roots = _refine(
+        evaluate,
+        jds[rows],
+        jds[rows + 1],
+        speed[rows],
+        speed[rows + 1],
+        value_tol=_STATION_VALUE_TOL,
+    )
+    longitude = sampler(roots, (name,))[0][:, 0] % 360.0
+    retrograde = (speed[rows] > 0) | (speed[rows + 1] < 0)
+    return [
+        StationEvent(
+            ts=jd_to_iso(jd),
+            jd=jd,
+            body=name.capitalize(),
+            motion="stationary",
+            longitude=lon,
+            speed_longitude=0.0,
+            station_type="retrograde" if retro else "direct",
+        )
+        for jd, lon, retro in zip(
+            roots.tolist(), longitude.tolist(), retrograde.tolist()
+        )
+    ]
+
+
+def _ingresses(
+    label: str,
+    name: str,
+    jds: np.ndarray,
+    unwrapped: np.ndarray,
+    sampler: Sampler,
+) -> list[IngressEvent]:
+    rows, boundary = _boundary_brackets(np.floor(unwrapped / 30.0).astype(np.int64))
+    if rows.size == 0:
+        return []
+    target = boundary * 30.0
+    rising = unwrapped[rows + 1] > unwrapped[rows]
+
+    def evaluate(idx: np.ndarray, x: np.ndarray) -> np.ndarray:
+        return _wrap180(sampler(x, (name,))[0][:, 0] - target[idx])
+
+    roots = _refine(
+        evaluate,
+        jds[rows],
+        jds[rows + 1],
+        unwrapped[rows] - target,
+        unwrapped[rows + 1] - target,
+        value_tol=_INGRESS_VALUE_TOL,
+    )
+    longitude, speed = sampler(roots, (name,))
+    events: list[IngressEvent] = []
+    for jd, lon, rate, edge, up in zip(
+        roots.tolist(),
+        (longitude[:, 0] % 360.0).tolist(),
+        np.abs(speed[:, 0]).tolist(),
+        boundary.tolist(),
+        rising.tolist(),
+    ):
+        signed = rate if up else -rate
+        events.append(
+            IngressEvent(
+                ts=jd_to_iso(jd),
+                jd=jd,
+                body=label,
+                from_sign=sign_name(edge - 1 if up else edge),
+                to_sign=sign_name(edge if up else edge - 1),
+                longitude=lon,
+                motion="direct" if up else "retrograde",
+                speed_deg_per_day=signed,
+                speed_longitude=signed,
+            )
+        )
+    return events
+
+
+def _lunations(
+    jds: np.ndarray,
+    sun: np.ndarray,
+    moon: np.ndarray,
+    sampler: Sampler,
+) -> list[LunationEvent]:
+    phase = moon - sun
+    rows, boundary = _boundary_brackets(np.floor(phase / 180.0).astype(np.int64))
+    if rows.size == 0:
+        return []
+    target = boundary * 180.0
+
+    def evaluate(idx: np.ndarray, x: np.ndarray) -> np.ndarray:
+        longitude = sampler(x, ("sun", "moon"))[0]
+        return _wrap180(longitude[:, 1] - longitude[:, 0] - target[idx])
+
+    roots = _refine(
+        evaluate,
+        jds[rows],
+        jds[rows + 1],
+        phase[rows] - target,
+        phase[rows + 1] - target,
+        value_tol=_LUNATION_VALUE_TOL,
+    )
+    longitude = sampler(roots, ("sun", "moon"))[0] % 360.0
+    return [
+        LunationEvent(
+            ts=jd_to_iso(jd),
+            jd=jd,
+            phase="new_moon" if edge % 2 == 0 else "full_moon",
+            sun_longitude=sun_lon,
+            moon_longitude=moon_lon,
+        )
+        for jd, edge, (sun_lon, moon_lon) in zip(
+            roots.tolist(), boundary.tolist(), longitude.tolist()
+        )
+    ]
+
+
+def find_ephemeris_events(
+    start_jd: float,
+    end_jd: float,
+    *,
+    stations: Sequence[str] | None = None,
+    ingresses: Sequence[str] | None = None,
+    lunations: bool = True,
+    step_days: float = 0.5,
+    profile: Mapping[str, Any] | None = None,
+    sampler: Sampler | None = None,
+) -> EphemerisEvents:
+    """Return stations, sign ingresses and lunations from one shared sampling pass.
+
+    ``stations`` and ``ingresses`` default to the body sets used by
+    :func:`~astroengine.detectors.stations.find_stations` and
+    :func:`~astroengine.detectors.ingresses.find_sign_ingresses` (the latter
+    honouring ``profile``); pass an empty sequence to skip a detector.
+    ``step_days`` spaces the shared grid (Jupiter and slower bodies read a
+    coarser subset of its rows) and must keep every body's motion per step
+    below 180°.
+    ``sampler`` defaults to the default Swiss ephemeris adapter.
+    """
+
+    if step_days <= 0:
+        raise ValueError("step_days must be positive")
+    if end_jd <= start_jd:
+        return EphemerisEvents((), (), ())
+
+    station_bodies = tuple(
+        dict.fromkeys(
+            name.lower()
+            for name in (stations if stations is not None else _STATION_BODIES)
+            if name.lower() in _STATION_BODIES
+        )
+    )
+    if ingresses is None:
+        policy = _resolve_policy(include_moon=None, inner_mode=None, profile=profile)
+        ingress_labels = _default_bodies(policy) if policy.enabled else ()
+    else:
+        ingress_labels = tuple(dict.fromkeys(str(body) for body in ingresses))
+
+    bodies = tuple(
+        dict.fromkeys(
+            (
+                *station_bodies,
+                *(label.lower() for label in ingress_labels),
+                *(("sun", "moon") if lunations else ()),
+            )
+        )
+    )
+    if not bodies:
+        return EphemerisEvents((), (), ())
+
+    sample = sampler or _swiss_sampler(SwissEphemerisAdapter.get_default_adapter())
+    jd_grid = _grid(float(start_jd), float(end_jd), float(step_days))
+    grid = _sample_grid(jd_grid, bodies, sample)
+
+    station_events: list[StationEvent] = []
+    for name in station_bodies:
+        jds, _, speed = grid[name]
+        station_events.extend(_stations(name, jds, speed, sample))
+    station_events.sort(key=lambda event: event.jd)
+
+    ingress_events: list[IngressEvent] = []
+    for label in ingress_labels:
+        name = label.lower()
+        jds, unwrapped, _ = grid[name]
+        ingress_events.extend(_ingresses(label, name, jds, unwrapped, sample))
+    ingress_events.sort(key=lambda event: (event.jd, event.body.lower()))
+
+    lunation_events: list[LunationEvent] = []
+    if lunations:
+        jds, sun, _ = grid["sun"]
+        moon = grid["moon"][1]
+        lunation_events = _lunations(jds, sun, moon, sample)
+        lunation_events.sort(key=lambda event: event.jd)
+
+    return EphemerisEvents(
+        tuple(station_events), tuple(ingress_events), tuple(lunation_events)
+    )
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from .core.angles import DeltaLambdaTracker, classify_relative_motion, signed_delta
 from .core.bodies import body_class
+from .core.ticks import Tick, iso_from_tick, positions_at
 from .infrastructure.paths import profiles_dir
 from .refine import adaptive_corridor_width
 from .utils.io import load_json_document
@@ -233,20 +234,37 @@ def _resolve_enabled(policy: dict) -> dict[str, tuple[float, str]]:
     return angle_defs
 
 
-def detect_aspects(
-    provider,
-    iso_ticks: Iterable[str],
+@dataclass(frozen=True)
+class _AspectPlan:
+    """Pair-level aspect configuration resolved once per scan."""
+
+    moving: str
+    target: str
+    aspect_entries: tuple[tuple[str, float, str, float, float], ...]
+    partile_threshold: float
+    corridor_profile: str
+    corridor_minimum: float
+    domain_profile: dict[int, DomainW] | None = None
+    domain_target: DomainW | None = None
+    domain_system: str | None = None
+    domain_lat_lon: tuple[float, float] | None = None
+    domain_alphas: Sequence[float] | None = None
+
+
+def _prepare_aspect_plan(
     moving: str,
     target: str,
     *,
     policy_path: str | None = None,
     natal_chart=None,
     house_system: str | None = None,
-) -> list[AspectHit]:
+) -> _AspectPlan | None:
+    """Resolve orbs, corridor settings and domain weights for ``moving``/``target``."""
+
     policy = _load_policy(policy_path)
     angles_map = _resolve_enabled(policy)
     if not angles_map:
-        return []
+        return None
 
     partile_threshold = float(
         policy.get("partile_threshold_deg", _DEFAULT_PARTILE_THRESHOLD_DEG)
@@ -263,14 +281,10 @@ def detect_aspects(
         aspect_strength = max(orb_allow / max(default_orb, 1e-9), 0.25)
         aspect_entries.append((aspect_name, angle, family, orb_allow, aspect_strength))
 
-    delta_tracker = DeltaLambdaTracker()
-    out: list[AspectHit] = []
-
     domain_profile: dict[int, DomainW] | None = None
     domain_meta: dict[str, dict] = {}
     domain_target: DomainW | None = None
     domain_system = house_system
-    domain_location = None
     domain_alphas: Sequence[float] | None = None
     domain_lat_lon: tuple[float, float] | None = None
 
@@ -305,87 +319,154 @@ def detect_aspects(
             except (TypeError, ValueError):
                 domain_alphas = None
 
+    return _AspectPlan(
+        moving=moving,
+        target=target,
+        aspect_entries=tuple(aspect_entries),
+        partile_threshold=partile_threshold,
+        corridor_profile=corridor_profile,
+        corridor_minimum=corridor_minimum,
+        domain_profile=domain_profile,
+        domain_target=domain_target,
+        domain_system=domain_system,
+        domain_lat_lon=domain_lat_lon,
+        domain_alphas=domain_alphas,
+    )
+
+
+def _domain_weights_for_tick(
+    plan: _AspectPlan, iso: str, moving_pos
+) -> DomainW | None:
+    if plan.domain_profile is None or plan.domain_target is None:
+        return None
+    if plan.domain_lat_lon is None:
+        return plan.domain_target
+    if moving_pos is not None:
+        lat, lon = plan.domain_lat_lon
+        transit_chart = {
+            "ts": iso,
+            "lat": lat,
+            "lon": lon,
+            "positions": {plan.moving: moving_pos},
+        }
+        try:
+            transit_weights = _weights_for_body(
+                transit_chart,
+                plan.moving,
+                plan.domain_system or _house_system_class().PLACIDUS,
+                profile=plan.domain_profile,
+            )
+        except Exception:
+            transit_weights = None
+        if transit_weights is not None:
+            return _blend_domains(
+                [plan.domain_target, transit_weights],
+                alphas=plan.domain_alphas,
+            )
+    return plan.domain_target
+
+
+def _aspect_hits_for_tick(
+    plan: _AspectPlan,
+    when: Tick,
+    pos_moving,
+    pos_target,
+    delta_lambda: float,
+) -> list[AspectHit]:
+    """Evaluate every enabled aspect for one tick given the tracked Δλ."""
+
+    moving = plan.moving
+    target = plan.target
+    lon_moving = float(pos_moving["lon"])
+    lon_target = float(pos_target["lon"])
+    speed_moving = float(pos_moving.get("speed_lon", 0.0))
+    speed_target = float(pos_target.get("speed_lon", 0.0))
+    retrograde = speed_moving < 0 or speed_target < 0
+
+    out: list[AspectHit] = []
+    iso: str | None = None
+    for aspect_name, angle, family, orb_allow, aspect_strength in plan.aspect_entries:
+        offset = signed_delta(delta_lambda - angle)
+        if abs(offset) > orb_allow:
+            continue
+        if iso is None:
+            iso = iso_from_tick(when)
+        separation_for_motion = angle + offset
+        motion = classify_relative_motion(
+            separation_for_motion,
+            angle,
+            speed_moving,
+            speed_target,
+        )
+        is_partile = abs(offset) <= plan.partile_threshold
+        corridor_width = adaptive_corridor_width(
+            orb_allow,
+            speed_moving,
+            speed_target,
+            aspect_strength=aspect_strength,
+            retrograde=retrograde,
+            minimum_orb_deg=plan.corridor_minimum,
+        )
+        domain_weights = _domain_weights_for_tick(plan, iso, pos_moving)
+
+        out.append(
+            AspectHit(
+                kind=f"aspect_{aspect_name}",
+                when_iso=iso,
+                moving=moving,
+                target=target,
+                angle_deg=float(angle),
+                lon_moving=float(lon_moving),
+                lon_target=float(lon_target),
+                delta_lambda_deg=float(delta_lambda),
+                offset_deg=float(offset),
+                orb_abs=float(abs(offset)),
+                orb_allow=float(orb_allow),
+                is_partile=bool(is_partile),
+                applying_or_separating=motion.state,
+                family=family,
+                corridor_width_deg=float(corridor_width),
+                corridor_profile=plan.corridor_profile,
+                speed_deg_per_day=float(motion.relative_speed_deg_per_day),
+                retrograde=retrograde,
+                domain_weights=domain_weights,
+            )
+        )
+    return out
+
+
+def detect_aspects(
+    provider,
+    iso_ticks: Iterable[Tick],
+    moving: str,
+    target: str,
+    *,
+    policy_path: str | None = None,
+    natal_chart=None,
+    house_system: str | None = None,
+) -> list[AspectHit]:
+    plan = _prepare_aspect_plan(
+        moving,
+        target,
+        policy_path=policy_path,
+        natal_chart=natal_chart,
+        house_system=house_system,
+    )
+    if plan is None:
+        return []
+
+    delta_tracker = DeltaLambdaTracker()
+    out: list[AspectHit] = []
+
     body_pair = (moving, target)
-    for iso in iso_ticks:
-        positions = provider.positions_ecliptic(iso, body_pair)
-        lon_moving = float(positions[moving]["lon"])
-        lon_target = float(positions[target]["lon"])
-        speed_moving = float(positions[moving].get("speed_lon", 0.0))
-        speed_target = float(positions[target].get("speed_lon", 0.0))
-        retrograde = speed_moving < 0 or speed_target < 0
-
-        delta_lambda = delta_tracker.update(lon_target, lon_moving)
-        for aspect_name, angle, family, orb_allow, aspect_strength in aspect_entries:
-            offset = signed_delta(delta_lambda - angle)
-            if abs(offset) <= orb_allow:
-                separation_for_motion = angle + offset
-                motion = classify_relative_motion(
-                    separation_for_motion,
-                    angle,
-                    speed_moving,
-                    speed_target,
-                )
-                is_partile = abs(offset) <= partile_threshold
-                corridor_width = adaptive_corridor_width(
-                    orb_allow,
-                    speed_moving,
-                    speed_target,
-                    aspect_strength=aspect_strength,
-                    retrograde=retrograde,
-                    minimum_orb_deg=corridor_minimum,
-                )
-                domain_weights = None
-                if domain_profile is not None and domain_target is not None:
-                    if domain_lat_lon is None:
-                        domain_weights = domain_target
-                    else:
-                        moving_pos = positions.get(moving)
-                        if moving_pos is not None:
-                            lat, lon = domain_lat_lon
-                            transit_chart = {
-                                "ts": iso,
-                                "lat": lat,
-                                "lon": lon,
-                                "positions": {moving: moving_pos},
-                            }
-                            try:
-                                transit_weights = _weights_for_body(
-                                    transit_chart,
-                                    moving,
-                                    domain_system or _house_system_class().PLACIDUS,
-                                    profile=domain_profile,
-                                )
-                            except Exception:
-                                transit_weights = None
-                            if transit_weights is not None:
-                                domain_weights = _blend_domains(
-                                    [domain_target, transit_weights],
-                                    alphas=domain_alphas,
-                                )
-                        if domain_weights is None:
-                            domain_weights = domain_target
-
-                out.append(
-                    AspectHit(
-                        kind=f"aspect_{aspect_name}",
-                        when_iso=iso,
-                        moving=moving,
-                        target=target,
-                        angle_deg=float(angle),
-                        lon_moving=float(lon_moving),
-                        lon_target=float(lon_target),
-                        delta_lambda_deg=float(delta_lambda),
-                        offset_deg=float(offset),
-                        orb_abs=float(abs(offset)),
-                        orb_allow=float(orb_allow),
-                        is_partile=bool(is_partile),
-                        applying_or_separating=motion.state,
-                        family=family,
-                        corridor_width_deg=float(corridor_width),
-                        corridor_profile=corridor_profile,
-                        speed_deg_per_day=float(motion.relative_speed_deg_per_day),
-                        retrograde=retrograde,
-                        domain_weights=domain_weights,
-                    )
-                )
+    for tick in iso_ticks:
+        positions = positions_at(provider, tick, body_pair)
+        pos_moving = positions[moving]
+        pos_target = positions[target]
+        delta_lambda = delta_tracker.update(
+            float(pos_target["lon"]), float(pos_moving["lon"])
+        )
+        out.extend(
+            _aspect_hits_for_tick(plan, tick, pos_moving, pos_target, delta_lambda)
+        )
     return out
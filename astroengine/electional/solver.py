@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+import math
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol
 
-from ..astro.declination import DEFAULT_ANTISCIA_AXIS
+from ..astro.declination import DEFAULT_ANTISCIA_AXIS, antiscia_lon, contra_antiscia_lon
 from ..chart.config import ChartConfig
 from ..chart.natal import DEFAULT_BODIES
+from ..core.angles import signed_delta
 from ..core.bodies import canonical_name
 from ..detectors import CoarseHit, detect_antiscia_contacts, detect_decl_contacts
-from ..detectors_aspects import AspectHit, detect_aspects
+from ..detectors_aspects import AspectHit, _prepare_aspect_plan, detect_aspects
 from ..ephemeris import BodyPosition, SwissEphemerisAdapter
 from ..utils.angles import delta_angle, norm360
 
@@ -178,6 +180,13 @@ class Constraint(Protocol):
     def evaluate(self, ctx: SampleContext) -> ElectionalConstraintEvaluation:
         ...
 
+    def exclusion_days(self, ctx: SampleContext) -> float:
+        """Return days either side of ``ctx`` during which the constraint must fail.
+
+        ``0.0`` means the constraint may pass at ``ctx`` (or cannot be bounded).
+        """
+        ...
+
 
 _ASPECT_ANGLES: dict[str, float] = {
     "conjunction": 0.0,
@@ -234,6 +243,41 @@ def _resolve_aspect(name: str) -> tuple[str, float]:
     return key, _ASPECT_ANGLES[key]
 
 
+# Upper bounds on geocentric angular speed (deg/day).  A longitude, mirror
+# point or declination separation between two bodies cannot change faster
+# than the sum of their bounds, which turns an orb margin into a time window.
+_MAX_SPEED_DEG_PER_DAY: dict[str, float] = {
+    "Sun": 1.1,
+    "Moon": 16.5,
+    "Mercury": 2.6,
+    "Venus": 1.6,
+    "Mars": 1.2,
+    "Jupiter": 0.35,
+    "Saturn": 0.2,
+    "Uranus": 0.1,
+    "Neptune": 0.08,
+    "Pluto": 0.08,
+}
+
+_COARSE_STEP = timedelta(hours=6)
+# Shrinks exclusion windows slightly so rounding never hides a boundary tick.
+_EXCLUSION_SAFETY = 0.999
+
+
+def _pair_rate(first: str, second: str) -> float | None:
+    rate_a = _MAX_SPEED_DEG_PER_DAY.get(first)
+    rate_b = _MAX_SPEED_DEG_PER_DAY.get(second)
+    if rate_a is None or rate_b is None:
+        return None
+    return rate_a + rate_b
+
+
+def _exclusion(margin: float, rate: float | None) -> float:
+    if rate is None or rate <= 0.0 or margin <= 0.0:
+        return 0.0
+    return margin / rate
+
+
 def _minute_delta(step_minutes: int) -> timedelta:
     if step_minutes <= 0:
         raise ValueError("step_minutes must be positive")
@@ -257,6 +301,7 @@ class AspectConstraint:
         self.angle = angle
         self.max_orb = float(max_orb) if max_orb is not None else None
         self.target_is_axis = target_is_axis
+        self._orb_entries: tuple[tuple[float, float], ...] | None = None
 
     def required_bodies(self) -> Sequence[str]:
         names = [self.body]
@@ -347,6 +392,38 @@ class AspectConstraint:
         )
         return ElectionalConstraintEvaluation("aspect", True, detail)
 
+    def _matching_orbs(self) -> tuple[tuple[float, float], ...]:
+        if self._orb_entries is None:
+            plan = _prepare_aspect_plan(self.body, self.target)
+            entries: list[tuple[float, float]] = []
+            if plan is not None:
+                for name, angle, _family, orb_allow, _strength in plan.aspect_entries:
+                    if not f"aspect_{name}".endswith(self.aspect):
+                        continue
+                    allow = float(orb_allow)
+                    if self.max_orb is not None:
+                        allow = min(allow, self.max_orb + 1e-9)
+                    entries.append((float(angle), allow))
+            self._orb_entries = tuple(entries)
+        return self._orb_entries
+
+    def exclusion_days(self, ctx: SampleContext) -> float:
+        # Chart angles sweep the zodiac daily; only body pairs are bounded.
+        if self.target_is_axis:
+            return 0.0
+        body = ctx.positions.get(self.body)
+        target = ctx.positions.get(self.target)
+        if body is None or target is None:
+            return 0.0
+        entries = self._matching_orbs()
+        if not entries:
+            return math.inf
+        delta_lambda = norm360(float(target.longitude) - float(body.longitude))
+        margin = min(
+            abs(signed_delta(delta_lambda - angle)) - allow for angle, allow in entries
+        )
+        return _exclusion(margin, _pair_rate(self.body, self.target))
+
 
 class MoonVoidConstraint:
     def __init__(
@@ -411,6 +488,31 @@ class MoonVoidConstraint:
             reason = "void_expected" if self.require_void else "void_detected"
         return ElectionalConstraintEvaluation("moon", passed, detail, reason)
 
+    def exclusion_days(self, ctx: SampleContext) -> float:
+        moon = ctx.positions.get("Moon")
+        if moon is None:
+            return 0.0
+        moon_lon = float(moon.longitude)
+        windows: list[float] = []
+        for name in self.bodies:
+            pos = ctx.positions.get(name) if name != "Moon" else None
+            if pos is None:
+                continue
+            rate = _pair_rate("Moon", name)
+            if rate is None:
+                return 0.0
+            separation = norm360(moon_lon - float(pos.longitude))
+            for aspect in _MAJOR_ASPECTS:
+                delta = abs(delta_angle(separation, _ASPECT_ANGLES[aspect]))
+                if self.require_void:
+                    # An aspect in orb keeps the Moon out of void for a while.
+                    windows.append(_exclusion(self.max_orb - delta, rate))
+                else:
+                    windows.append(_exclusion(delta - self.max_orb, rate))
+        if not windows:
+            return 0.0
+        return max(windows) if self.require_void else min(windows)
+
 
 class MaleficAnglesConstraint:
     def __init__(self, *, allow_contact: bool, max_orb: float) -> None:
@@ -473,6 +575,9 @@ class MaleficAnglesConstraint:
             reason,
         )
 
+    def exclusion_days(self, ctx: SampleContext) -> float:
+        return 0.0
+
 
 class AntisciaConstraint:
     def __init__(
@@ -539,6 +644,16 @@ class AntisciaConstraint:
         )
         return ElectionalConstraintEvaluation("antiscia", True, detail)
 
+    def exclusion_days(self, ctx: SampleContext) -> float:
+        body = ctx.positions.get(self.body)
+        target = ctx.positions.get(self.target)
+        if body is None or target is None:
+            return 0.0
+        mirror = antiscia_lon if self.kind == "antiscia" else contra_antiscia_lon
+        mirror_lon = mirror(float(body.longitude), axis=self.axis)
+        delta = abs(delta_angle(mirror_lon, float(target.longitude)))
+        return _exclusion(delta - self.max_orb, _pair_rate(self.body, self.target))
+
 
 class DeclinationConstraint:
     def __init__(
@@ -600,6 +715,19 @@ class DeclinationConstraint:
         )
         return ElectionalConstraintEvaluation("declination", True, detail)
 
+    def exclusion_days(self, ctx: SampleContext) -> float:
+        body = ctx.positions.get(self.body)
+        target = ctx.positions.get(self.target)
+        if body is None or target is None:
+            return 0.0
+        dec_body = float(body.declination)
+        dec_target = float(target.declination)
+        if self.kind == "decl_parallel":
+            delta = abs(dec_body - dec_target)
+        else:
+            delta = abs(dec_body + dec_target)
+        return _exclusion(delta - self.max_orb, _pair_rate(self.body, self.target))
+
 
 def _normalize_constraints(
     payload: Sequence[Mapping[str, Any]]
@@ -736,19 +864,82 @@ def _score_evaluations(evaluations: Sequence[ElectionalConstraintEvaluation]) ->
     return score
 
 
+def _dense_contexts(
+    provider: ElectionalSampleProvider,
+    start: datetime,
+    step: timedelta,
+    total: int,
+) -> Iterator[tuple[datetime, SampleContext]]:
+    for index in range(total + 1):
+        ts = start + step * index
+        yield ts, provider.context(ts)
+
+
+def _pruned_contexts(
+    provider: ElectionalSampleProvider,
+    constraints: Sequence[Constraint],
+    start: datetime,
+    step: timedelta,
+    total: int,
+) -> Iterator[tuple[datetime, SampleContext]]:
+    """Yield fine-step contexts that survive the constraints' exclusion windows.
+
+    The window is sampled at ``_COARSE_STEP`` first.  Each coarse sample
+    excludes the fine ticks within the largest ``exclusion_days`` reported by
+    any constraint; only the remaining ticks between two coarse samples are
+    fetched, in chronological order.
+    """
+
+    step_days = step / timedelta(days=1)
+    stride = max(1, _COARSE_STEP // step)
+
+    def reach(ctx: SampleContext) -> int:
+        radius = max(constraint.exclusion_days(ctx) for constraint in constraints)
+        if radius <= 0.0:
+            return 0
+        if math.isinf(radius):
+            return total + 1
+        return math.ceil(radius * _EXCLUSION_SAFETY / step_days)
+
+    left = 0
+    left_ctx = provider.context(start)
+    left_reach = reach(left_ctx)
+    while left < total:
+        right = min(left + stride, total)
+        right_ctx = provider.context(start + step * right)
+        right_reach = reach(right_ctx)
+        for index in range(left + left_reach, min(right - right_reach, right - 1) + 1):
+            ts = start + step * index
+            yield ts, left_ctx if index == left else provider.context(ts)
+        left, left_ctx, left_reach = right, right_ctx, right_reach
+    if left_reach == 0:
+        yield start + step * left, left_ctx
+
+
 def search_constraints(
     params: ElectionalSearchParams,
     *,
     chart_config: ChartConfig | None = None,
     provider: ElectionalSampleProvider | None = None,
+    interval_pruning: bool | None = None,
 ) -> list[ElectionalCandidate]:
-    """Search for instants satisfying the supplied constraint payload."""
+    """Search for instants satisfying the supplied constraint payload.
+
+    With ``interval_pruning`` the window is first sampled coarsely and each
+    constraint reports how long it must keep failing around a sample, given
+    per-body speed bounds and its orb; only the surviving sub-windows are
+    sampled at ``step_minutes``.  The candidates are identical to a dense
+    scan.  Pruning defaults to on for the built-in Swiss provider and off for
+    custom providers, whose samples need not obey physical speed limits.
+    """
 
     if params.start > params.end:
         raise ValueError("start must precede end")
     step_delta = _minute_delta(int(params.step_minutes))
     constraints, bodies, axes = _normalize_constraints(params.constraints)
     sorted_bodies = sorted(bodies)
+    if interval_pruning is None:
+        interval_pruning = provider is None
     if provider is None:
         provider = SwissElectionalProvider(
             start=params.start,
@@ -758,18 +949,20 @@ def search_constraints(
             bodies=sorted_bodies,
             chart_config=chart_config,
         )
+    total = (params.end - params.start) // step_delta
+    if interval_pruning:
+        contexts = _pruned_contexts(provider, constraints, params.start, step_delta, total)
+    else:
+        contexts = _dense_contexts(provider, params.start, step_delta, total)
     candidates: list[ElectionalCandidate] = []
-    cursor = params.start
     limit = params.limit
-    while cursor <= params.end:
-        ctx = provider.context(cursor)
+    for ts, ctx in contexts:
         evaluations = [constraint.evaluate(ctx) for constraint in constraints]
         if all(ev.passed for ev in evaluations):
             score = _score_evaluations(evaluations)
-            candidates.append(ElectionalCandidate(ts=cursor, score=score, evaluations=evaluations))
+            candidates.append(ElectionalCandidate(ts=ts, score=score, evaluations=evaluations))
             if limit is not None and len(candidates) >= limit:
                 break
-        cursor += step_delta
     return candidates
 
 
@@ -15,6 +15,7 @@ from .context import (
 from .frames import TargetFrameResolver
 
 if TYPE_CHECKING:  # pragma: no cover
+    from .batch import scan_contacts_batch
     from .scanning import (
         FEATURE_DIRECTIONS,
         FEATURE_ECLIPSES,
@@ -35,6 +36,7 @@ if TYPE_CHECKING:  # pragma: no cover
 __all__ = [
     "events_to_dicts",
     "scan_contacts",
+    "scan_contacts_batch",
     "get_active_aspect_angles",
     "resolve_provider",
     "fast_scan",
@@ -73,6 +75,9 @@ _SCANNING_EXPORTS: set[str] = {
 }
 
 
+_BATCH_EXPORTS: set[str] = {"scan_contacts_batch"}
+
+
 def _load_scanning() -> ModuleType:
     return import_module(".scanning", __name__)
 
@@ -83,6 +88,10 @@ def __getattr__(name: str) -> Any:
         value = getattr(module, name)
         globals()[name] = value
         return value
+    if name in _BATCH_EXPORTS:
+        value = getattr(import_module(".batch", __name__), name)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module 'astroengine.engine' has no attribute '{name}'")
 
 
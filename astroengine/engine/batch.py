@@ -0,0 +1,540 @@
+"""Vectorised multi-pair contact scanning.
+
+:func:`scan_contacts_batch` evaluates ``N`` moving bodies against ``M``
+targets in one pass.  Positions are sampled once per tick for every body
+into NumPy arrays; orb windows for declination, antiscia and longitudinal
+aspects are then located for all pairs with array operations.  Only the
+(pair, tick) cells flagged by the vectorised pre-filter are handed to the
+scalar per-tick detectors, so the emitted :class:`LegacyTransitEvent`
+objects are identical to the ones :func:`~astroengine.engine.scanning.scan_contacts`
+returns for each pair.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from ..astro.declination import _axis_center
+from ..chart.config import ChartConfig
+from ..core.angles import normalize_degrees
+from ..core.bodies import canonical_name
+from ..core.ticks import IsoTickView, positions_at, utc_iso_from_jd
+from ..detectors import _antiscia_hits_for_tick, _decl_hits_for_tick, _extract_declination
+from ..detectors_aspects import _aspect_hits_for_tick, _prepare_aspect_plan
+from ..ephemeris import EphemerisConfig, SwissEphemerisAdapter
+from ..exporters import LegacyTransitEvent
+from ..plugins import DetectorContext, get_plugin_manager
+from ..providers import get_provider
+from ..transits.engine import TickCachingProvider
+from .frames import FrameAwareProvider, TargetFrameResolver
+from .profiles import resolve_profile
+from .scanning import (
+    TimelordCalculator,
+    _attach_event_metadata,
+    _configure_provider,
+    _event_from_aspect,
+    _event_from_decl,
+    _frame_resolver,
+    _jd_ticks,
+    _PairPlan,
+    _plan_pair,
+    _plugin_options,
+)
+
+__all__ = ["scan_contacts_batch"]
+
+
+_ORB_EPSILON = 1e-9
+_DEFAULT_CHUNK_TICKS = 2048
+
+
+@dataclass(slots=True)
+class _BodySamples:
+    """Per-tick samples for a set of bodies laid out as ``(ticks, bodies)``."""
+
+    names: tuple[str, ...]
+    payloads: list[list[Mapping[str, float] | None]]
+    lon: np.ndarray
+    dec: np.ndarray
+
+
+def _unique_canonical(names: Iterable[str]) -> list[str]:
+    out: list[str] = []
+    seen: set[str] = set()
+    for raw in names:
+        name = canonical_name(raw)
+        if name and name not in seen:
+            seen.add(name)
+            out.append(name)
+    return out
+
+
+def _normalize_deg_array(values: np.ndarray) -> np.ndarray:
+    """Vector counterpart of :func:`astroengine.core.angles.normalize_degrees`."""
+
+    wrapped = np.mod(values, 360.0)
+    wrapped[wrapped >= 360.0 - 1e-9] = 0.0
+    return wrapped
+
+
+def _signed_wrap(values: np.ndarray) -> np.ndarray:
+    return np.mod(values + 180.0, 360.0) - 180.0
+
+
+def _empty_samples(names: Sequence[str], tick_count: int) -> _BodySamples:
+    shape = (tick_count, len(names))
+    return _BodySamples(
+        names=tuple(names),
+        payloads=[[None] * len(names) for _ in range(tick_count)],
+        lon=np.full(shape, np.nan),
+        dec=np.full(shape, np.nan),
+    )
+
+
+def _record(samples: _BodySamples, row: int, col: int, data: Mapping[str, float]) -> None:
+    lon = float(data.get("lon", 0.0))
+    samples.payloads[row][col] = data
+    samples.lon[row, col] = lon
+    samples.dec[row, col] = _extract_declination(data, lon)
+
+
+def _sample_group(
+    provider: object,
+    ticks: Sequence[float],
+    moving: Sequence[str],
+    targets: Sequence[str],
+    resolver: TargetFrameResolver | None,
+) -> tuple[_BodySamples, _BodySamples]:
+    """Query ``provider`` once per tick for every moving and target body."""
+
+    overrides = resolver is not None and resolver.overrides_target()
+    provider_bodies = list(moving)
+    if not overrides:
+        provider_bodies.extend(name for name in targets if name not in moving)
+
+    moving_samples = _empty_samples(moving, len(ticks))
+    target_samples = _empty_samples(targets, len(ticks))
+    moving_index = {name: idx for idx, name in enumerate(moving)}
+    target_index = {name: idx for idx, name in enumerate(targets)}
+
+    time_dependent = overrides and resolver.time_dependent
+    for row, jd in enumerate(ticks):
+        result = positions_at(provider, jd, provider_bodies)
+        for name, data in result.items():
+            key = str(name).lower()
+            col = moving_index.get(key)
+            if col is not None:
+                _record(moving_samples, row, col, data)
+            if not overrides:
+                col = target_index.get(key)
+                if col is not None:
+                    _record(target_samples, row, col, data)
+        if overrides:
+            iso = utc_iso_from_jd(jd) if time_dependent else ""
+            for col, name in enumerate(targets):
+                _record(
+                    target_samples,
+                    row,
+                    col,
+                    dict(resolver.position_dict(iso, name)),
+                )
+    return moving_samples, target_samples
+
+
+@dataclass(slots=True)
+class _PairGrid:
+    """Pair-major bookkeeping for one gating group."""
+
+    plans: list[_PairPlan]
+    moving_idx: np.ndarray
+    target_idx: np.ndarray
+    aspect_plans: list[Any]
+    aspect_angles: np.ndarray
+    aspect_orbs: np.ndarray
+    decl_orbs: np.ndarray
+    mirror_orbs: np.ndarray
+    mirror_centers: np.ndarray
+
+
+def _build_pair_grid(
+    plans: list[_PairPlan],
+    moving: Sequence[str],
+    targets: Sequence[str],
+    *,
+    policy_path: str | None,
+    natal_chart: Any,
+    house_system: str | None,
+) -> _PairGrid:
+    moving_index = {name: idx for idx, name in enumerate(moving)}
+    target_index = {name: idx for idx, name in enumerate(targets)}
+    count = len(plans)
+
+    aspect_plans = [
+        _prepare_aspect_plan(
+            plan.moving,
+            plan.target,
+            policy_path=policy_path,
+            natal_chart=natal_chart,
+            house_system=house_system,
+        )
+        if plan.toggles.do_aspects
+        else None
+        for plan in plans
+    ]
+    angle_set: dict[float, None] = {}
+    for aspect_plan in aspect_plans:
+        if aspect_plan is not None:
+            for entry in aspect_plan.aspect_entries:
+                angle_set.setdefault(float(entry[1]), None)
+    angles = np.asarray(list(angle_set), dtype=float)
+    angle_pos = {angle: idx for idx, angle in enumerate(angle_set)}
+    # Orb of ``-inf`` marks aspects a pair does not evaluate.
+    aspect_orbs = np.full((count, angles.size), -np.inf)
+    for row, aspect_plan in enumerate(aspect_plans):
+        if aspect_plan is None:
+            continue
+        for _, angle, _, orb_allow, _ in aspect_plan.aspect_entries:
+            col = angle_pos[float(angle)]
+            aspect_orbs[row, col] = max(aspect_orbs[row, col], float(orb_allow))
+
+    decl_orbs = np.full((count, 2), -np.inf)
+    mirror_orbs = np.full((count, 2), -np.inf)
+    mirror_centers = np.zeros(count)
+    for row, plan in enumerate(plans):
+        ctx = plan.profile_ctx
+        toggles = plan.toggles
+        if toggles.do_declination and (toggles.do_parallels or toggles.do_contras):
+            decl_orbs[row] = (abs(ctx.decl_parallel_orb), abs(ctx.decl_contra_orb))
+        if toggles.do_mirrors:
+            mirror_orbs[row] = (abs(ctx.antiscia_orb), abs(ctx.contra_antiscia_orb))
+            mirror_centers[row] = _axis_center(ctx.antiscia_axis)
+
+    return _PairGrid(
+        plans=plans,
+        moving_idx=np.asarray([moving_index[p.moving] for p in plans], dtype=int),
+        target_idx=np.asarray([target_index[p.target] for p in plans], dtype=int),
+        aspect_plans=aspect_plans,
+        aspect_angles=angles,
+        aspect_orbs=aspect_orbs,
+        decl_orbs=decl_orbs,
+        mirror_orbs=mirror_orbs,
+        mirror_centers=mirror_centers,
+    )
+
+
+def _candidate_masks(
+    grid: _PairGrid,
+    lon_m: np.ndarray,
+    lon_t: np.ndarray,
+    dec_m: np.ndarray,
+    dec_t: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(ticks, pairs)`` masks of cells that may hold a contact."""
+
+    eps = _ORB_EPSILON
+    with np.errstate(invalid="ignore"):
+        decl_mask = (np.abs(dec_m - dec_t) <= grid.decl_orbs[:, 0] + eps) | (
+            np.abs(dec_m + dec_t) <= grid.decl_orbs[:, 1] + eps
+        )
+
+        anti = np.mod(2.0 * grid.mirror_centers - lon_m, 360.0)
+        contra = np.mod(2.0 * np.mod(grid.mirror_centers + 90.0, 360.0) - lon_m, 360.0)
+        mirror_mask = (np.abs(_signed_wrap(lon_t - anti)) <= grid.mirror_orbs[:, 0] + eps) | (
+            np.abs(_signed_wrap(lon_t - contra)) <= grid.mirror_orbs[:, 1] + eps
+        )
+
+        aspect_mask = np.zeros(lon_m.shape, dtype=bool)
+        if grid.aspect_angles.size:
+            separation = _normalize_deg_array(lon_t - lon_m)
+            for col, angle in enumerate(grid.aspect_angles):
+                orbs = grid.aspect_orbs[:, col]
+                aspect_mask |= np.abs(_signed_wrap(separation - angle)) <= orbs + eps
+    return decl_mask, mirror_mask, aspect_mask
+
+
+def _unwrap_turns(separation: np.ndarray, carry: np.ndarray | None) -> tuple[np.ndarray, np.ndarray]:
+    """Replicate :class:`~astroengine.core.angles.AngleTracker` turn counting.
+
+    ``carry`` holds ``(last_normalised, turns)`` per pair from the previous
+    chunk so unwrapping stays continuous across chunk boundaries.
+    """
+
+    if carry is None:
+        previous = separation[:1]
+        base_turns = np.zeros(separation.shape[1])
+    else:
+        previous = carry[0][None, :]
+        base_turns = carry[1]
+    stacked = np.vstack([previous, separation])
+    steps = np.diff(stacked, axis=0)
+    with np.errstate(invalid="ignore"):
+        increments = np.where(steps > 180.0, -1.0, np.where(steps < -180.0, 1.0, 0.0))
+    turns = base_turns + np.cumsum(increments, axis=0)
+    last = separation[-1].copy()
+    missing = np.isnan(last)
+    if missing.any():
+        last[missing] = previous[-1][missing]
+    return turns, np.vstack([last, turns[-1]])
+
+
+def _scan_group(
+    grid: _PairGrid,
+    ticks: Sequence[float],
+    moving_samples: _BodySamples,
+    target_samples: _BodySamples,
+    *,
+    chunk_ticks: int,
+) -> list[tuple[list[LegacyTransitEvent], list[LegacyTransitEvent], list[LegacyTransitEvent]]]:
+    pair_count = len(grid.plans)
+    decl_events: list[list[LegacyTransitEvent]] = [[] for _ in range(pair_count)]
+    mirror_events: list[list[LegacyTransitEvent]] = [[] for _ in range(pair_count)]
+    aspect_events: list[list[LegacyTransitEvent]] = [[] for _ in range(pair_count)]
+
+    carry: np.ndarray | None = None
+    for lo in range(0, len(ticks), chunk_ticks):
+        hi = min(lo + chunk_ticks, len(ticks))
+        lon_m = moving_samples.lon[lo:hi][:, grid.moving_idx]
+        lon_t = target_samples.lon[lo:hi][:, grid.target_idx]
+        dec_m = moving_samples.dec[lo:hi][:, grid.moving_idx]
+        dec_t = target_samples.dec[lo:hi][:, grid.target_idx]
+        decl_mask, mirror_mask, aspect_mask = _candidate_masks(
+            grid, lon_m, lon_t, dec_m, dec_t
+        )
+        turns, carry = _unwrap_turns(_normalize_deg_array(lon_t - lon_m), carry)
+
+        candidates = decl_mask | mirror_mask | aspect_mask
+        pair_cols, tick_rows = np.nonzero(candidates.T)
+        for col, row in zip(pair_cols.tolist(), tick_rows.tolist(), strict=True):
+            plan = grid.plans[col]
+            tick = lo + row
+            pos_m = moving_samples.payloads[tick][grid.moving_idx[col]]
+            pos_t = target_samples.payloads[tick][grid.target_idx[col]]
+            if not pos_m or not pos_t:
+                continue
+            when = ticks[tick]
+            ctx = plan.profile_ctx
+            toggles = plan.toggles
+
+            if decl_mask[row, col]:
+                for hit in _decl_hits_for_tick(
+                    when,
+                    plan.moving,
+                    plan.target,
+                    pos_m,
+                    pos_t,
+                    ctx.decl_parallel_orb,
+                    ctx.decl_contra_orb,
+                ):
+                    if hit.kind == "decl_parallel":
+                        if not toggles.do_parallels:
+                            continue
+                        allow = ctx.decl_parallel_orb
+                    else:
+                        if not toggles.do_contras:
+                            continue
+                        allow = ctx.decl_contra_orb
+                    decl_events[col].append(
+                        _event_from_decl(hit, orb_allow=allow, scoring=plan.scoring)
+                    )
+
+            if mirror_mask[row, col]:
+                for hit in _antiscia_hits_for_tick(
+                    when,
+                    plan.moving,
+                    plan.target,
+                    pos_m,
+                    pos_t,
+                    ctx.antiscia_orb,
+                    ctx.contra_antiscia_orb,
+                    axis=ctx.antiscia_axis,
+                ):
+                    allow = (
+                        ctx.antiscia_orb
+                        if hit.kind == "antiscia"
+                        else ctx.contra_antiscia_orb
+                    )
+                    mirror_events[col].append(
+                        _event_from_decl(hit, orb_allow=allow, scoring=plan.scoring)
+                    )
+
+            aspect_plan = grid.aspect_plans[col]
+            if aspect_mask[row, col] and aspect_plan is not None:
+                delta_lambda = (
+                    normalize_degrees(float(pos_t["lon"]) - float(pos_m["lon"]))
+                    + float(turns[row, col]) * 360.0
+                )
+                for aspect_hit in _aspect_hits_for_tick(
+                    aspect_plan, when, pos_m, pos_t, delta_lambda
+                ):
+                    aspect_events[col].append(
+                        _event_from_aspect(aspect_hit, scoring=plan.scoring)
+                    )
+
+    return list(zip(decl_events, mirror_events, aspect_events, strict=True))
+
+
+def scan_contacts_batch(
+    start_iso: str,
+    end_iso: str,
+    moving: Iterable[str],
+    targets: Iterable[str],
+    provider_name: str = "swiss",
+    *,
+    ephemeris_config: EphemerisConfig | None = None,
+    decl_parallel_orb: float | None = None,
+    decl_contra_orb: float | None = None,
+    antiscia_orb: float | None = None,
+    contra_antiscia_orb: float | None = None,
+    step_minutes: int | None = None,
+    aspects_policy_path: str | None = None,
+    provider: object | None = None,
+    target_frame: str = "transit",
+    target_resolver: TargetFrameResolver | None = None,
+    timelord_calculator: TimelordCalculator | None = None,
+    chart_config: ChartConfig | None = None,
+    profile: Mapping[str, Any] | None = None,
+    profile_id: str | None = None,
+    include_declination: bool = True,
+    include_mirrors: bool = True,
+    include_aspects: bool = True,
+    antiscia_axis: str | None = None,
+    tradition_profile: str | None = None,
+    chart_sect: str | None = None,
+    nodes_variant: str = "mean",
+    lilith_variant: str = "mean",
+    chunk_ticks: int = _DEFAULT_CHUNK_TICKS,
+) -> list[LegacyTransitEvent]:
+    """Scan every ``moving`` × ``targets`` pair in one vectorised pass.
+
+    Arguments mirror :func:`~astroengine.engine.scanning.scan_contacts`.  The
+    result is the concatenation of the per-pair ``scan_contacts`` outputs
+    (pairs in ``moving``-major order) stably sorted by timestamp and
+    descending score.  A body is never paired with itself unless the target
+    frame overrides target positions (e.g. transit Mars to natal Mars).
+    ``chunk_ticks`` bounds the ``(ticks, pairs)`` working arrays.
+    """
+
+    moving_names = _unique_canonical(moving)
+    target_names = _unique_canonical(targets)
+    if not moving_names or not target_names:
+        return []
+
+    base_provider = provider or get_provider(provider_name)
+    nodes_variant = (nodes_variant or "mean").lower()
+    lilith_variant = (lilith_variant or "mean").lower()
+    _configure_provider(
+        base_provider,
+        ephemeris_config,
+        nodes_variant=nodes_variant,
+        lilith_variant=lilith_variant,
+    )
+
+    resolver = _frame_resolver(target_frame, target_resolver)
+    overrides = resolver is not None and resolver.overrides_target()
+
+    if chart_config is not None:
+        SwissEphemerisAdapter.configure_defaults(chart_config=chart_config)
+
+    def _pair_provider(target: str) -> object:
+        if overrides:
+            return FrameAwareProvider(base_provider, target, resolver)
+        return base_provider
+
+    profile_data = resolve_profile(profile, profile_id)
+    plans: list[_PairPlan] = []
+    for moving_name in moving_names:
+        for target_name in target_names:
+            if moving_name == target_name and not overrides:
+                continue
+            plan = _plan_pair(
+                moving_name,
+                target_name,
+                _pair_provider(target_name),
+                profile_data,
+                decl_parallel_orb=decl_parallel_orb,
+                decl_contra_orb=decl_contra_orb,
+                antiscia_orb=antiscia_orb,
+                contra_antiscia_orb=contra_antiscia_orb,
+                antiscia_axis=antiscia_axis,
+                tradition_profile=tradition_profile,
+                chart_sect=chart_sect,
+                include_declination=include_declination,
+                include_mirrors=include_mirrors,
+                include_aspects=include_aspects,
+                nodes_variant=nodes_variant,
+                lilith_variant=lilith_variant,
+                step_minutes=step_minutes,
+            )
+            if plan.supported:
+                plans.append(plan)
+    if not plans:
+        return []
+
+    natal_chart = resolver.natal_chart if resolver is not None else None
+    house_system = chart_config.house_system if chart_config is not None else None
+    chunk = max(int(chunk_ticks), 1)
+
+    # Body gating may assign different cadences to different moving bodies;
+    # each cadence forms its own tick grid sampled exactly once.
+    groups: dict[int, list[_PairPlan]] = {}
+    for plan in plans:
+        groups.setdefault(plan.step_minutes, []).append(plan)
+
+    per_pair: dict[int, list[LegacyTransitEvent]] = {}
+    plan_order = {id(plan): index for index, plan in enumerate(plans)}
+    plugin_manager = get_plugin_manager()
+    for group_step, group_plans in groups.items():
+        ticks = _jd_ticks(start_iso, end_iso, step=dt.timedelta(minutes=group_step))
+        group_moving = list(dict.fromkeys(plan.moving for plan in group_plans))
+        group_targets = list(dict.fromkeys(plan.target for plan in group_plans))
+        moving_samples, target_samples = _sample_group(
+            base_provider, ticks, group_moving, group_targets, resolver
+        )
+        grid = _build_pair_grid(
+            group_plans,
+            group_moving,
+            group_targets,
+            policy_path=aspects_policy_path,
+            natal_chart=natal_chart,
+            house_system=house_system,
+        )
+        results = _scan_group(
+            grid, ticks, moving_samples, target_samples, chunk_ticks=chunk
+        )
+        for plan, (decl, mirror, aspect) in zip(group_plans, results, strict=True):
+            events = [
+                _attach_event_metadata(event, plan, timelord_calculator)
+                for event in (*decl, *mirror, *aspect)
+            ]
+            plugin_context = DetectorContext(
+                provider=TickCachingProvider(_pair_provider(plan.target)),
+                provider_name=provider_name,
+                start_iso=start_iso,
+                end_iso=end_iso,
+                ticks=IsoTickView(ticks),
+                moving=plan.moving,
+                target=plan.target,
+                options=_plugin_options(
+                    plan,
+                    requested_step_minutes=step_minutes,
+                    aspects_policy_path=aspects_policy_path,
+                ),
+                existing_events=tuple(events),
+            )
+            for plugin_event in plugin_manager.run_detectors(plugin_context) or ():
+                events.append(
+                    _attach_event_metadata(plugin_event, plan, timelord_calculator)
+                )
+            events.sort(key=lambda event: (event.timestamp, -event.score))
+            per_pair[plan_order[id(plan)]] = events
+
+    merged: list[LegacyTransitEvent] = []
+    for index in range(len(plans)):
+        merged.extend(per_pair.get(index, ()))
+    merged.sort(key=lambda event: (event.timestamp, -event.score))
+    return merged
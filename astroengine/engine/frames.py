@@ -10,6 +10,7 @@ from ..chart.composite import CompositeChart
 from ..chart.directions import DirectedChart, compute_solar_arc_chart
 from ..chart.natal import NatalChart
 from ..chart.progressions import ProgressedChart, compute_secondary_progressed_chart
+from ..core.ticks import positions_at, utc_iso_from_jd
 
 __all__ = [
     "TargetFrameResolver",
@@ -125,6 +126,12 @@ class TargetFrameResolver:
         self._name_lookup = self._build_name_lookup()
         return self._name_lookup.get(body_lower, body)
 
+    @property
+    def time_dependent(self) -> bool:
+        """Return ``True`` when target positions vary with the query instant."""
+
+        return self.frame in {"progressed", "directed"}
+
     def overrides_target(self) -> bool:
         if self.frame == "natal":
             return bool(self._static_positions) or self.natal_chart is not None
@@ -240,6 +247,16 @@ class FrameAwareProvider:
 
     def positions_ecliptic(self, iso_utc: str, bodies: Iterable[str]):
         base = dict(self._provider.positions_ecliptic(iso_utc, bodies))
+        return self._override(base, iso_utc, bodies)
+
+    def positions_ecliptic_jd(self, jd_utc: float, bodies: Iterable[str]):
+        bodies = tuple(bodies)
+        base = dict(positions_at(self._provider, jd_utc, bodies))
+        # Natal and composite targets ignore the timestamp, so skip formatting.
+        iso_utc = utc_iso_from_jd(jd_utc) if self._resolver.time_dependent else ""
+        return self._override(base, iso_utc, bodies)
+
+    def _override(self, base: dict, iso_utc: str, bodies: Iterable[str]):
         if not self._resolver.overrides_target():
             return base
 
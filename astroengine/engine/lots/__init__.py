@@ -1,6 +1,7 @@
 """Arabic Lots engine with DSL compilation, evaluation, and event scanning."""
 
 from .aspects import AspectHit, aspects_to_lots
+from .batch import BatchProgram, compile_batch, evaluate_batch, evaluate_charts
 from .builtins import (
     LotsProfile,
     builtin_profile,
@@ -24,13 +25,14 @@ from .dsl import (
     parse_lot_defs,
 )
 from .eval import ChartContext, ChartLocation, evaluate
-from .events import LotEvent, scan_lot_events
-from .sect import is_day
+from .events import LotEvent, scan_lot_events, scan_lots_events
+from .sect import day_mask, is_day
 
 __all__ = [
     "Add",
     "Arc",
     "AspectHit",
+    "BatchProgram",
     "ChartContext",
     "ChartLocation",
     "Expr",
@@ -46,9 +48,13 @@ __all__ = [
     "Wrap",
     "aspects_to_lots",
     "builtin_profile",
+    "compile_batch",
     "compile_program",
+    "day_mask",
     "detect_cycles",
     "evaluate",
+    "evaluate_batch",
+    "evaluate_charts",
     "load_custom_profiles",
     "is_day",
     "load_custom_profiles",
@@ -59,4 +65,5 @@ __all__ = [
     "parse_lot_defs",
     "save_custom_profile",
     "scan_lot_events",
+    "scan_lots_events",
 ]
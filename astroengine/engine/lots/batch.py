@@ -0,0 +1,169 @@
+"""Array evaluation of compiled Arabic Lots programs.
+
+:func:`compile_batch` turns a :class:`~astroengine.engine.lots.dsl.CompiledProgram`
+into NumPy closures once, so every lot can be evaluated for ``N`` charts or
+``N`` time samples in a single pass.  ``IfDay`` branches evaluate both arms
+and select per row with the sect mask.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .dsl import Add, Arc, CompiledProgram, Expr, IfDay, Number, Ref, Sub, Wrap
+from .eval import ChartContext
+from .sect import GeoLocation, day_mask
+
+__all__ = ["BatchProgram", "compile_batch", "evaluate_batch", "evaluate_charts"]
+
+_Values = dict[str, np.ndarray]
+_Kernel = Callable[[_Values, _Values, "np.ndarray | None"], np.ndarray]
+
+
+@dataclass(frozen=True)
+class BatchProgram:
+    """Array-compiled lots program.
+
+    ``points`` lists the chart points (positions or angles) the program
+    reads, and ``needs_sect`` is ``True`` when any lot uses ``IfDay``.
+    """
+
+    order: tuple[str, ...]
+    points: tuple[str, ...]
+    needs_sect: bool
+    kernels: Mapping[str, _Kernel]
+
+
+def _compile_expr(expr: Expr, lots: frozenset[str], points: dict[str, None]) -> tuple[_Kernel, bool]:
+    if isinstance(expr, Number):
+        value = expr.value % 360.0
+        return (lambda _p, _r, _d: np.float64(value)), False
+    if isinstance(expr, Ref):
+        name = expr.name
+        if name in lots:
+            return (lambda _p, results, _d: results[name]), False
+        key = name.strip()
+        points.setdefault(key, None)
+        return (lambda values, _r, _d: values[key]), False
+    if isinstance(expr, (Add, Sub, Arc)):
+        first, second = (
+            (expr.first, expr.second) if isinstance(expr, Arc) else (expr.left, expr.right)
+        )
+        left, left_sect = _compile_expr(first, lots, points)
+        right, right_sect = _compile_expr(second, lots, points)
+        if isinstance(expr, Add):
+            return (
+                lambda p, r, d: np.mod(left(p, r, d) + right(p, r, d), 360.0)
+            ), left_sect or right_sect
+        return (
+            lambda p, r, d: np.mod(left(p, r, d) - right(p, r, d), 360.0)
+        ), left_sect or right_sect
+    if isinstance(expr, Wrap):
+        inner, inner_sect = _compile_expr(expr.value, lots, points)
+        return (lambda p, r, d: np.mod(inner(p, r, d), 360.0)), inner_sect
+    if isinstance(expr, IfDay):
+        day, _ = _compile_expr(expr.day_expr, lots, points)
+        night, _ = _compile_expr(expr.night_expr, lots, points)
+
+        def branch(p: _Values, r: _Values, d: np.ndarray | None) -> np.ndarray:
+            if d is None:
+                raise ValueError("is_day is required for programs using IfDay")
+            return np.mod(np.where(d, day(p, r, d), night(p, r, d)), 360.0)
+
+        return branch, True
+    raise TypeError(f"Unsupported expression {expr!r}")
+
+
+def compile_batch(program: CompiledProgram) -> BatchProgram:
+    """Compile ``program`` into array kernels evaluated in dependency order."""
+
+    lots = frozenset(program.order)
+    points: dict[str, None] = {}
+    kernels: dict[str, _Kernel] = {}
+    needs_sect = False
+    for name in program.order:
+        kernel, uses_sect = _compile_expr(program.definitions[name], lots, points)
+        kernels[name] = kernel
+        needs_sect = needs_sect or uses_sect
+    return BatchProgram(tuple(program.order), tuple(points), needs_sect, kernels)
+
+
+def evaluate_batch(
+    program: BatchProgram | CompiledProgram,
+    points: Mapping[str, ArrayLike],
+    *,
+    is_day: ArrayLike | bool | None = None,
+) -> dict[str, np.ndarray]:
+    """Evaluate every lot for each row of ``points``.
+
+    ``points`` maps chart point names to longitudes shaped ``(N,)`` (scalars
+    broadcast); ``is_day`` is a boolean array or scalar selecting the sect
+    per row and is only required when the program uses ``IfDay``.  Returns
+    ``{lot: longitudes}`` normalised to ``[0, 360)``.
+    """
+
+    batch = program if isinstance(program, BatchProgram) else compile_batch(program)
+    arrays = [np.asarray(points[name], dtype=float) if name in points else None for name in batch.points]
+    missing = [name for name, array in zip(batch.points, arrays) if array is None]
+    if missing:
+        raise KeyError(f"Unknown point: {missing[0]}")
+    day = None if is_day is None else np.asarray(is_day, dtype=bool)
+    shape = np.broadcast_shapes(*(array.shape for array in arrays), () if day is None else day.shape)
+    values = {
+        name: np.mod(np.broadcast_to(array, shape), 360.0)
+        for name, array in zip(batch.points, arrays)
+    }
+    results: dict[str, np.ndarray] = {}
+    for name in batch.order:
+        value = np.mod(batch.kernels[name](values, results, day), 360.0)
+        results[name] = value if value.shape == shape else np.full(shape, value)
+    return results
+
+
+def evaluate_charts(
+    program: BatchProgram | CompiledProgram, charts: Sequence[ChartContext]
+) -> dict[str, np.ndarray]:
+    """Evaluate every lot for each of ``charts`` in one array pass.
+
+    Points resolve as in :meth:`ChartContext.get_point` (positions before
+    angles) and sect via :meth:`ChartContext.is_day` when needed.
+    """
+
+    batch = program if isinstance(program, BatchProgram) else compile_batch(program)
+    points = {
+        name: np.array([chart.get_point(name) for chart in charts], dtype=float)
+        for name in batch.points
+    }
+    is_day = _chart_day_mask(charts) if batch.needs_sect else None
+    results = evaluate_batch(batch, points, is_day=is_day)
+    return {
+        name: value if value.shape == (len(charts),) else np.full(len(charts), value)
+        for name, value in results.items()
+    }
+
+
+def _chart_day_mask(charts: Sequence[ChartContext]) -> np.ndarray:
+    """Vector form of :meth:`ChartContext.is_day` over ``charts``."""
+
+    mask = np.zeros(len(charts), dtype=bool)
+    pending: list[int] = []
+    for index, chart in enumerate(charts):
+        if chart.is_day_override is not None:
+            mask[index] = bool(chart.is_day_override)
+        elif chart.moment is None or chart.location is None:
+            raise ValueError("moment and location are required for sect determination")
+        elif chart.sun_altitude is not None:
+            mask[index] = chart.sun_altitude > 0.0
+        else:
+            pending.append(index)
+    if pending:
+        selected = [charts[index] for index in pending]
+        mask[pending] = day_mask(
+            [chart.moment for chart in selected],
+            [GeoLocation(chart.location.latitude, chart.location.longitude) for chart in selected],
+        )
+    return mask
@@ -6,10 +6,12 @@ import datetime as _dt
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 
+import numpy as np
+
 from ...scoring.policy import OrbPolicy
 from .aspects import _angles_from_harmonics, _resolve_orb, _severity
 
-__all__ = ["LotEvent", "scan_lot_events"]
+__all__ = ["LotEvent", "scan_lot_events", "scan_lots_events"]
 
 
 @dataclass(frozen=True)
@@ -50,14 +52,16 @@ def _bisect(
     end: _dt.datetime,
     *,
     iterations: int = 12,
+    diff_low: float | None = None,
 ) -> _dt.datetime:
     low = start
     high = end
+    if diff_low is None:
+        body_low, _ = _get_longitude(ephem, body, low)
+        diff_low = _angular_separation(body_low, lot) - target
     for _ in range(iterations):
         mid = low + (high - low) / 2
-        body_low, _ = _get_longitude(ephem, body, low)
         body_mid, _ = _get_longitude(ephem, body, mid)
-        diff_low = _angular_separation(body_low, lot) - target
         diff_mid = _angular_separation(body_mid, lot) - target
         if diff_low == 0.0:
             return low
@@ -67,9 +71,19 @@ def _bisect(
             high = mid
         else:
             low = mid
+            diff_low = diff_mid
     return low + (high - low) / 2
 
 
+def _time_grid(t0: _dt.datetime, t1: _dt.datetime, step: _dt.timedelta) -> list[_dt.datetime]:
+    grid = [t0]
+    current = t0
+    while current < t1:
+        current = min(current + step, t1)
+        grid.append(current)
+    return grid
+
+
 def _event_metadata(angle: float, harmonic: int) -> dict[str, object]:
     return {"aspect_angle": angle, "harmonic": harmonic}
 
@@ -89,60 +103,112 @@ def scan_lot_events(
 ) -> list[LotEvent]:
     """Scan ``bodies`` for aspect hits to a single lot between ``t0`` and ``t1``."""
 
+    return scan_lots_events(
+        ephem,
+        {lot_name: lot_lambda},
+        bodies,
+        t0,
+        t1,
+        policy,
+        harmonics,
+        kind=kind,
+        step_hours=step_hours,
+    )
+
+
+def scan_lots_events(
+    ephem: object,
+    lots: Mapping[str, float],
+    bodies: Iterable[str],
+    t0: _dt.datetime,
+    t1: _dt.datetime,
+    policy: OrbPolicy,
+    harmonics: Iterable[int],
+    *,
+    kind: str = "transit",
+    step_hours: float = 12.0,
+) -> list[LotEvent]:
+    """Scan ``bodies`` for aspect hits to every lot in ``lots`` between ``t0`` and ``t1``.
+
+    Each body is sampled once on the shared time grid; sign changes are
+    located for all lots and aspect angles with array operations and only
+    the resulting brackets are refined against the ephemeris.
+    """
+
     if t1 <= t0:
         return []
-    angles = _angles_from_harmonics(harmonics)
+    angles = np.asarray(_angles_from_harmonics(harmonics), dtype=float)
     step = _dt.timedelta(hours=max(0.1, float(step_hours)))
-    lot_lambda = lot_lambda % 360.0
+    grid = _time_grid(t0, t1, step)
 
     events: list[LotEvent] = []
     for body in bodies:
-        for angle in angles:
-            current = t0
-            body_val, body_speed = _get_longitude(ephem, body, current)
-            allowance = _resolve_orb(policy, body, angle)
-            target = angle if abs(_angular_separation(body_val, lot_lambda) - angle) <= abs(_angular_separation(body_val, lot_lambda) + angle) else -angle
-            diff_prev = _angular_separation(body_val, lot_lambda) - target
-            while current < t1:
-                next_time = min(current + step, t1)
-                body_next, _ = _get_longitude(ephem, body, next_time)
-                diff_next = _angular_separation(body_next, lot_lambda) - target
+        longitudes = np.array([_get_longitude(ephem, body, moment)[0] for moment in grid])
+        for lot_name, lot_value in lots.items():
+            lot_lambda = float(lot_value) % 360.0
+            separation = (longitudes - lot_lambda + 180.0) % 360.0 - 180.0
+            first = separation[0]
+            targets = np.where(
+                np.abs(first - angles) <= np.abs(first + angles), angles, -angles
+            )
+            diff = separation[None, :] - targets[:, None]
+            brackets = (diff[:, :-1] == 0.0) | (diff[:, :-1] * diff[:, 1:] <= 0.0)
+            for row, column in zip(*np.nonzero(brackets), strict=True):
+                angle = float(angles[row])
+                diff_prev = float(diff[row, column])
                 if diff_prev == 0.0:
-                    root = current
-                elif diff_prev * diff_next <= 0.0:
-                    root = _bisect(ephem, body, lot_lambda, target, current, next_time)
+                    root = grid[column]
                 else:
-                    root = None
-                if root is not None:
-                    body_root, body_speed = _get_longitude(ephem, body, root)
-                    separation = abs(_angular_separation(body_root, lot_lambda))
-                    orb = abs(separation - angle)
-                    if orb <= allowance:
-                        severity = _severity(orb, allowance)
-                        applying: bool | None = None
-                        if body_speed is not None:
-                            delta = _angular_separation(body_root, lot_lambda)
-                            target = angle if abs(delta - angle) <= abs(delta + angle) else -angle
-                            diff = delta - target
-                            if diff > 0:
-                                applying = body_speed < 0
-                            elif diff < 0:
-                                applying = body_speed > 0
-                        events.append(
-                            LotEvent(
-                                lot=lot_name,
-                                body=body,
-                                kind=kind,
-                                timestamp=root,
-                                angle=angle,
-                                orb=orb,
-                                severity=severity,
-                                applying=applying,
-                                metadata=_event_metadata(angle, int(round(360 / angle)) if angle else 0),
-                            )
-                        )
-                diff_prev = diff_next
-                current = next_time
-                body_val = body_next
+                    root = _bisect(
+                        ephem,
+                        body,
+                        lot_lambda,
+                        float(targets[row]),
+                        grid[column],
+                        grid[column + 1],
+                        diff_low=diff_prev,
+                    )
+                event = _root_event(
+                    ephem, body, lot_name, lot_lambda, angle, root, policy, kind
+                )
+                if event is not None:
+                    events.append(event)
     events.sort(key=lambda event: event.timestamp)
     return events
+
+
+def _root_event(
+    ephem: object,
+    body: str,
+    lot_name: str,
+    lot_lambda: float,
+    angle: float,
+    root: _dt.datetime,
+    policy: OrbPolicy,
+    kind: str,
+) -> LotEvent | None:
+    body_root, body_speed = _get_longitude(ephem, body, root)
+    delta = _angular_separation(body_root, lot_lambda)
+    orb = abs(abs(delta) - angle)
+    allowance = _resolve_orb(policy, body, angle)
+    if orb > allowance:
+        return None
+    applying: bool | None = None
+    if body_speed is not None:
+        target = angle if abs(delta - angle) <= abs(delta + angle) else -angle
+        diff = delta - target
+        if diff > 0:
+            applying = body_speed < 0
+        elif diff < 0:
+            applying = body_speed > 0
+    return LotEvent(
+        lot=lot_name,
+        body=body,
+        kind=kind,
+        timestamp=root,
+        angle=angle,
+        orb=orb,
+        severity=_severity(orb, allowance),
+        applying=applying,
+        metadata=_event_metadata(angle, int(round(360 / angle)) if angle else 0),
+    )
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import datetime as _dt
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 
-__all__ = ["GeoLocation", "is_day"]
+import numpy as np
+
+__all__ = ["GeoLocation", "day_mask", "is_day", "solar_altitudes"]
 
 
 @dataclass(frozen=True)
@@ -100,3 +103,59 @@ def is_day(
         return sun_altitude > 0.0
     altitude = _solar_altitude(moment, location)
     return altitude > 0.0
+
+
+def solar_altitudes(
+    moments: Sequence[_dt.datetime],
+    location: GeoLocation | Sequence[GeoLocation],
+) -> np.ndarray:
+    """Vector form of the solar altitude used by :func:`is_day`, in degrees.
+
+    ``location`` is shared by every moment or given per moment.
+    """
+
+    if isinstance(location, GeoLocation):
+        latitude, longitude = location.latitude, location.longitude
+    else:
+        latitude = np.array([place.latitude for place in location], dtype=float)
+        longitude = np.array([place.longitude for place in location], dtype=float)
+
+    jd = np.array([_julian_day(moment) for moment in moments], dtype=float)
+    minutes = np.array(
+        [
+            utc.hour * 60 + utc.minute + utc.second / 60.0
+            for utc in (_to_utc(moment) for moment in moments)
+        ],
+        dtype=float,
+    )
+    t = (jd - 2451545.0) / 36525.0
+    mean_long = np.radians((280.46646 + 36000.76983 * t) % 360.0)
+    mean_anom = np.radians((357.52911 + 35999.05029 * t) % 360.0)
+    ecliptic_long = mean_long + np.radians(1.914602 - 0.004817 * t) * np.sin(mean_anom)
+    ecliptic_long += np.radians(0.019993 - 0.000101 * t) * np.sin(2 * mean_anom)
+    obliquity = np.radians(23.439291 - 0.0130042 * t)
+    decl = np.arcsin(np.sin(obliquity) * np.sin(ecliptic_long))
+
+    e = 0.016708634 - 0.000042037 * t
+    y = np.tan(obliquity / 2.0) ** 2
+    eq_time = (
+        y * np.sin(2 * mean_long)
+        - 2 * e * np.sin(mean_anom)
+        + 4 * e * y * np.sin(mean_anom) * np.cos(2 * mean_long)
+        - 0.5 * y * y * np.sin(4 * mean_long)
+        - 1.25 * e * e * np.sin(2 * mean_anom)
+    ) * (180.0 / math.pi) * 4.0
+
+    true_solar_time = (minutes + eq_time + 4 * longitude) % 1440
+    hour_angle = np.radians(true_solar_time / 4.0 - 180.0)
+    lat_rad = np.radians(latitude)
+    sin_alt = np.sin(lat_rad) * np.sin(decl) + np.cos(lat_rad) * np.cos(decl) * np.cos(hour_angle)
+    return np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+
+
+def day_mask(
+    moments: Sequence[_dt.datetime], location: GeoLocation | Sequence[GeoLocation]
+) -> np.ndarray:
+    """Return a boolean array matching :func:`is_day` for each of ``moments``."""
+
+    return solar_altitudes(moments, location) > 0.0
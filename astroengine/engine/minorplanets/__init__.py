@@ -11,12 +11,17 @@ from .mpc_ingest import (
     Counts,
     MinorPlanet,
     MinorPlanetBase,
+    MpcColumns,
     MpcRow,
     download_mpcorb,
     export_parquet,
     export_zarr_angles,
     filter_rows,
+    ingest_mpcorb,
+    iter_mpcorb_columns,
+    longitude_grid,
     parse_mpcorb,
+    quantise_longitudes,
     upsert_rows,
 )
 
@@ -24,12 +29,17 @@ __all__ = [
     "Counts",
     "MinorPlanet",
     "MinorPlanetBase",
+    "MpcColumns",
     "MpcRow",
     "download_mpcorb",
     "export_parquet",
     "export_zarr_angles",
     "filter_rows",
+    "ingest_mpcorb",
+    "iter_mpcorb_columns",
+    "longitude_grid",
     "parse_mpcorb",
+    "quantise_longitudes",
     "upsert_rows",
     "CuratedMinorPlanet",
     "CURATED_MINOR_PLANETS",
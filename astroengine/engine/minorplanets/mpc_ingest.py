@@ -6,15 +6,27 @@ import datetime as _dt
 import gzip
 import hashlib
 import math
+import mmap
 import os
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import requests
-from sqlalchemy import JSON, Column, DateTime, Float, Integer, String, func, select
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.orm import DeclarativeBase, Session
 
 from astroengine.core.dependencies import require_dependency
@@ -24,12 +36,17 @@ __all__ = [
     "Counts",
     "MinorPlanet",
     "MinorPlanetBase",
+    "MpcColumns",
     "MpcRow",
     "download_mpcorb",
     "export_parquet",
     "export_zarr_angles",
     "filter_rows",
+    "ingest_mpcorb",
+    "iter_mpcorb_columns",
+    "longitude_grid",
     "parse_mpcorb",
+    "quantise_longitudes",
     "upsert_rows",
 ]
 
@@ -223,107 +240,345 @@ class tempfile_path:
             self.tmp.unlink()
 
 
+# Fixed-width field layout of a catalogue line (0-based, end-exclusive).
+_NUMBER = (0, 7)
+_ABS_MAG = (8, 14)
+_SLOPE = (14, 20)
+_EPOCH = (20, 32)
+_MEAN_ANOMALY = (32, 44)
+_ARG_PERI = (44, 56)
+_ASC_NODE = (56, 68)
+_INCLINATION = (68, 80)
+_ECCENTRICITY = (80, 92)
+_MEAN_MOTION = (92, 105)
+_SEMI_MAJOR = (105, 118)
+_UNCERTAINTY = (118, 120)
+_PROVISIONAL = (120, 136)
+_NAME_START = 166
+
+_ELEMENT_FIELDS = (
+    "epoch_jd",
+    "mean_anomaly_deg",
+    "argument_perihelion_deg",
+    "ascending_node_deg",
+    "inclination_deg",
+    "eccentricity",
+    "mean_motion_deg_per_day",
+    "semi_major_axis_au",
+    "perihelion_distance_au",
+)
+_RECORD_FIELDS = (
+    "mpc_number",
+    "provisional_designation",
+    "name",
+    "kind",
+    "absolute_magnitude",
+    "slope",
+    "uncertainty",
+    *_ELEMENT_FIELDS,
+)
+
+_CHUNK_BYTES = 4 << 20
+_UPSERT_BATCH = 5000
+_IDENTITY_COLUMNS = ("mpc_number", "provisional_designation", "name")
+_SPACE = 32
+
+
+@dataclass(slots=True)
+class MpcColumns:
+    """Column-oriented block of parsed catalogue rows.
+
+    Float columns use ``NaN`` for absent optional values (number, H, G and
+    uncertainty); string columns hold ``None``.
+    """
+
+    mpc_number: np.ndarray
+    provisional_designation: np.ndarray
+    name: np.ndarray
+    kind: np.ndarray
+    absolute_magnitude: np.ndarray
+    slope: np.ndarray
+    uncertainty: np.ndarray
+    epoch_jd: np.ndarray
+    mean_anomaly_deg: np.ndarray
+    argument_perihelion_deg: np.ndarray
+    ascending_node_deg: np.ndarray
+    inclination_deg: np.ndarray
+    eccentricity: np.ndarray
+    mean_motion_deg_per_day: np.ndarray
+    semi_major_axis_au: np.ndarray
+    perihelion_distance_au: np.ndarray
+    line: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.epoch_jd.shape[0])
+
+    def take(self, index: np.ndarray) -> MpcColumns:
+        """Return the rows selected by a boolean mask or index array."""
+
+        return MpcColumns(*(getattr(self, name)[index] for name in self.__slots__))
+
+    def filter(self, H_max: float | None = 12.0, U_max: int | None = 5) -> MpcColumns:
+        """Vector form of :func:`filter_rows`."""
+
+        keep = np.ones(len(self), dtype=bool)
+        if H_max is not None:
+            keep &= ~(self.absolute_magnitude > H_max)
+        if U_max is not None:
+            keep &= ~(self.uncertainty > U_max)
+        return self if keep.all() else self.take(keep)
+
+    def records(self) -> Iterator[dict[str, object]]:
+        """Yield :meth:`MpcRow.as_dict`-shaped mappings without building rows."""
+
+        columns = (
+            _optional_ints(self.mpc_number),
+            self.provisional_designation.tolist(),
+            self.name.tolist(),
+            self.kind.tolist(),
+            _optional_floats(self.absolute_magnitude),
+            _optional_floats(self.slope),
+            _optional_ints(self.uncertainty),
+            *(getattr(self, name).tolist() for name in _ELEMENT_FIELDS),
+        )
+        for values, line in zip(zip(*columns), self.line.tolist()):
+            record: dict[str, object] = dict(zip(_RECORD_FIELDS, values))
+            record["family"] = None
+            record["source"] = {"line": line}
+            yield record
+
+    def rows(self) -> list[MpcRow]:
+        """Materialise the block as :class:`MpcRow` objects."""
+
+        return [MpcRow(**record) for record in self.records()]
+
+
+def _optional_floats(values: np.ndarray) -> list[float | None]:
+    return [None if value != value else value for value in values.tolist()]
+
+
+def _optional_ints(values: np.ndarray) -> list[int | None]:
+    return [None if value != value else int(value) for value in values.tolist()]
+
+
 def parse_mpcorb(path: str | os.PathLike[str]) -> list[MpcRow]:
     """Parse MPCORB data into :class:`MpcRow` structures."""
 
-    path = Path(path)
-    opener = gzip.open if path.suffix == ".gz" else open
-    rows: list[MpcRow] = []
-    with opener(path, "rt", encoding="utf8", errors="ignore") as handle:
-        for raw_line in handle:
-            if not raw_line or raw_line.startswith("#"):
-                continue
-            line = raw_line.rstrip("\n")
-            if not line.strip():
-                continue
+    return [row for block in iter_mpcorb_columns(path) for row in block.rows()]
+
+
+def iter_mpcorb_columns(
+    path: str | os.PathLike[str], *, chunk_bytes: int = _CHUNK_BYTES
+) -> Iterator[MpcColumns]:
+    """Yield :class:`MpcColumns` blocks parsed from roughly ``chunk_bytes`` of input.
+
+    Plain files are memory-mapped and gzip files are decompressed chunk by
+    chunk, so memory stays bounded by the chunk size regardless of catalogue
+    length.  Comment lines and rows that fail to parse are skipped.
+    """
+
+    for buffer in _iter_line_chunks(Path(path), chunk_bytes):
+        block = _parse_chunk(buffer)
+        if len(block):
+            yield block
+
+
+def _iter_line_chunks(path: Path, chunk_bytes: int) -> Iterator[np.ndarray]:
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be positive")
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as handle:
+            tail = b""
+            while True:
+                data = handle.read(chunk_bytes)
+                if not data:
+                    break
+                data = tail + data
+                cut = data.rfind(b"\n") + 1
+                if cut == 0:
+                    tail = data
+                    continue
+                tail = data[cut:]
+                yield np.frombuffer(data, dtype=np.uint8, count=cut)
+            if tail:
+                yield np.frombuffer(tail, dtype=np.uint8)
+        return
+
+    if path.stat().st_size == 0:
+        return
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        size = len(mapped)
+        start = 0
+        while start < size:
+            stop = min(size, start + chunk_bytes)
+            if stop < size:
+                newline = mapped.rfind(b"\n", start, stop)
+                stop = newline + 1 if newline >= start else (mapped.find(b"\n", stop) + 1 or size)
+            # Copy out of the map so no exported buffer outlives it.
+            yield np.frombuffer(mapped[start:stop], dtype=np.uint8)
+            start = stop
+
+
+def _line_grid(buffer: np.ndarray) -> np.ndarray:
+    """Return a ``(lines, width)`` space-padded byte grid of non-comment lines."""
+
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [buffer.size]))
+    lengths = ends - starts
+    carriage = (lengths > 0) & (buffer[np.maximum(ends - 1, 0)] == ord("\r"))
+    lengths = lengths - carriage
+    keep = lengths > 0
+    keep[keep] = buffer[starts[keep]] != ord("#")
+    starts = starts[keep]
+    lengths = lengths[keep]
+    if not starts.size:
+        return np.empty((0, _NAME_START), dtype=np.uint8)
+
+    width = max(int(lengths.max()), _NAME_START)
+    steps = np.diff(starts)
+    if starts.size > 1 and lengths.min() == width and (steps == steps[0]).all():
+        # Fixed-length records: view the lines in place instead of gathering bytes.
+        return np.lib.stride_tricks.as_strided(
+            buffer[starts[0] :], shape=(starts.size, width), strides=(int(steps[0]), 1)
+        ).copy()
+    columns = np.arange(width, dtype=np.int32)
+    index = np.minimum(starts.astype(np.int32)[:, None] + columns, buffer.size - 1)
+    return np.where(columns < lengths[:, None], buffer[index], np.uint8(_SPACE))
+
+
+def _field_bytes(grid: np.ndarray, start: int, stop: int) -> np.ndarray:
+    return np.ascontiguousarray(grid[:, start:stop]).view(f"S{stop - start}").ravel()
+
+
+def _blank(grid: np.ndarray, start: int, stop: int) -> np.ndarray:
+    return (grid[:, start:stop] == _SPACE).all(axis=1)
+
+
+def _numeric_field(
+    grid: np.ndarray, span: tuple[int, int], kind: type
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(values, present, invalid)`` for a fixed-width numeric field.
+
+    Values parse exactly as ``int``/``float`` would; only chunks containing a
+    malformed token fall back to converting element by element.
+    """
+
+    blank = _blank(grid, *span)
+    raw = np.where(blank, b"0", _field_bytes(grid, *span))
+    invalid = np.zeros(raw.shape[0], dtype=bool)
+    try:
+        values = raw.astype(np.int64 if kind is int else np.float64).astype(np.float64)
+    except ValueError:
+        values = np.empty(raw.shape[0], dtype=np.float64)
+        for index, token in enumerate(raw.tolist()):
             try:
-                row = _parse_line(line)
+                values[index] = kind(token)
             except ValueError:
-                continue
-            rows.append(row)
-    return rows
-
-
-def _parse_line(line: str) -> MpcRow:
-    number = _parse_int(line[0:7])
-    absolute_magnitude = _parse_float(line[8:14])
-    slope = _parse_float(line[14:20])
-    epoch_field = line[20:32].strip() or line[19:32].strip()
-    epoch_jd = _parse_epoch(epoch_field)
-    mean_anomaly = _parse_float(line[32:44])
-    arg_peri = _parse_float(line[44:56])
-    ascending_node = _parse_float(line[56:68])
-    inclination = _parse_float(line[68:80])
-    eccentricity = _parse_float(line[80:92])
-    mean_motion = _parse_float(line[92:105])
-    semi_major = _parse_float(line[105:118])
-    uncertainty = _parse_int(line[118:120])
-    provisional = line[120:136].strip() or None
-    name = line[166:].strip() or None
-    if semi_major is None and mean_motion is not None:
-        semi_major = _semi_major_from_mean_motion(mean_motion)
-    if mean_motion is None and semi_major is not None:
-        mean_motion = _mean_motion_from_semi_major(semi_major)
-
-    perihelion = semi_major * (1.0 - eccentricity) if semi_major is not None else None
-
-    if None in (
-        epoch_jd,
-        mean_anomaly,
-        arg_peri,
-        ascending_node,
-        inclination,
-        eccentricity,
-        mean_motion,
-        semi_major,
-        perihelion,
+                values[index] = np.nan
+                invalid[index] = True
+    values[blank] = np.nan
+    return values, ~blank, invalid
+
+
+def _epoch_field(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(epoch_jd, invalid)``; epochs repeat, so each distinct token is parsed once."""
+
+    # The column before the epoch is only consulted when the field is empty.
+    tokens = np.where(
+        _blank(grid, *_EPOCH),
+        _field_bytes(grid, _EPOCH[0] - 1, _EPOCH[1]),
+        _field_bytes(grid, *_EPOCH),
+    )
+    unique, inverse = np.unique(tokens, return_inverse=True)
+    parsed = np.empty(unique.shape[0], dtype=np.float64)
+    for index, token in enumerate(unique.tolist()):
+        try:
+            parsed[index] = _parse_epoch(token.decode("ascii", "ignore"))
+        except (ValueError, KeyError):
+            parsed[index] = np.nan
+    epochs = parsed[inverse.ravel()]
+    return epochs, np.isnan(epochs)
+
+
+def _text_field(grid: np.ndarray, start: int, stop: int | None = None) -> np.ndarray:
+    stop = grid.shape[1] if stop is None else min(stop, grid.shape[1])
+    if start >= stop:
+        return np.full(grid.shape[0], None, dtype=object)
+    stripped = np.char.strip(_field_bytes(grid, start, stop))
+    return np.array(
+        [token.decode("utf8", "ignore") or None for token in stripped.tolist()], dtype=object
+    )
+
+
+def _parse_chunk(buffer: np.ndarray) -> MpcColumns:
+    grid = _line_grid(buffer)
+
+    fields = {}
+    invalid = np.zeros(grid.shape[0], dtype=bool)
+    required = np.ones(grid.shape[0], dtype=bool)
+    for name, span, kind, needed in (
+        ("mpc_number", _NUMBER, int, False),
+        ("absolute_magnitude", _ABS_MAG, float, False),
+        ("slope", _SLOPE, float, False),
+        ("mean_anomaly_deg", _MEAN_ANOMALY, float, True),
+        ("argument_perihelion_deg", _ARG_PERI, float, True),
+        ("ascending_node_deg", _ASC_NODE, float, True),
+        ("inclination_deg", _INCLINATION, float, True),
+        ("eccentricity", _ECCENTRICITY, float, True),
+        ("mean_motion_deg_per_day", _MEAN_MOTION, float, False),
+        ("semi_major_axis_au", _SEMI_MAJOR, float, False),
+        ("uncertainty", _UNCERTAINTY, int, False),
     ):
-        raise ValueError("Incomplete MPC row")
-
-    kind = _classify_minor_planet(semi_major)
-    source = {"line": line.strip()}
-    return MpcRow(
-        mpc_number=number,
-        provisional_designation=provisional,
-        name=name,
-        kind=kind,
-        family=None,
-        absolute_magnitude=absolute_magnitude,
-        slope=slope,
-        uncertainty=uncertainty,
+        values, present, bad = _numeric_field(grid, span, kind)
+        fields[name] = (values, present)
+        invalid |= bad
+        if needed:
+            required &= present
+    epoch_jd, bad_epoch = _epoch_field(grid)
+
+    mean_motion, has_motion = fields["mean_motion_deg_per_day"]
+    semi_major, has_axis = fields["semi_major_axis_au"]
+    derive_axis = ~has_axis & has_motion
+    derive_motion = has_axis & ~has_motion
+    invalid |= derive_axis & ~(mean_motion > 0.0)
+    invalid |= derive_motion & ~(semi_major > 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        semi_major = np.where(
+            derive_axis,
+            np.power(_GAUSSIAN_GRAVITATIONAL_CONSTANT / np.radians(mean_motion), 2.0 / 3.0),
+            semi_major,
+        )
+        mean_motion = np.where(
+            derive_motion,
+            np.degrees(_GAUSSIAN_GRAVITATIONAL_CONSTANT / np.power(semi_major, 1.5)),
+            mean_motion,
+        )
+
+    valid = ~invalid & ~bad_epoch & required & (has_axis | has_motion)
+    eccentricity = fields["eccentricity"][0]
+    block = MpcColumns(
+        mpc_number=fields["mpc_number"][0],
+        provisional_designation=_text_field(grid, *_PROVISIONAL),
+        name=_text_field(grid, _NAME_START),
+        kind=np.where(
+            semi_major >= 30.0, "tno", np.where(semi_major >= 5.5, "centaur", "asteroid")
+        ).astype(object),
+        absolute_magnitude=fields["absolute_magnitude"][0],
+        slope=fields["slope"][0],
+        uncertainty=fields["uncertainty"][0],
         epoch_jd=epoch_jd,
-        mean_anomaly_deg=mean_anomaly,
-        argument_perihelion_deg=arg_peri,
-        ascending_node_deg=ascending_node,
-        inclination_deg=inclination,
+        mean_anomaly_deg=fields["mean_anomaly_deg"][0],
+        argument_perihelion_deg=fields["argument_perihelion_deg"][0],
+        ascending_node_deg=fields["ascending_node_deg"][0],
+        inclination_deg=fields["inclination_deg"][0],
         eccentricity=eccentricity,
         mean_motion_deg_per_day=mean_motion,
         semi_major_axis_au=semi_major,
-        perihelion_distance_au=perihelion,
-        source=source,
+        perihelion_distance_au=semi_major * (1.0 - eccentricity),
+        line=_text_field(grid, 0),
     )
-
-
-def _classify_minor_planet(semi_major_axis: float) -> str:
-    if semi_major_axis >= 30.0:
-        return "tno"
-    if semi_major_axis >= 5.5:
-        return "centaur"
-    return "asteroid"
-
-
-def _parse_int(value: str) -> int | None:
-    value = value.strip()
-    if not value:
-        return None
-    return int(value)
-
-
-def _parse_float(value: str) -> float | None:
-    value = value.strip()
-    if not value:
-        return None
-    return float(value)
+    return block if valid.all() else block.take(valid)
 
 
 def _mean_motion_from_semi_major(semi_major: float) -> float:
@@ -381,29 +636,129 @@ def filter_rows(rows: Sequence[MpcRow], H_max: float = 12.0, U_max: int = 5) ->
     return filtered
 
 
-def upsert_rows(session: Session, rows: Sequence[MpcRow]) -> Counts:
-    """Insert or update :class:`MpcRow` entries into the database."""
+def upsert_rows(
+    session: Session, rows: Iterable[MpcRow], *, batch_size: int = _UPSERT_BATCH
+) -> Counts:
+    """Insert or update :class:`MpcRow` entries into the database.
+
+    Rows are matched on MPC number, else provisional designation, else name,
+    and written in batches of ``batch_size``: one ``IN`` lookup per identity
+    column, then a single executemany ``INSERT`` and a single bulk ``UPDATE``
+    keyed by primary key.  Repeated identities count as updates, as they
+    would when rows are merged one at a time.
+    """
 
     counts = Counts()
-    for row in rows:
-        statement = None
-        if row.mpc_number is not None:
-            statement = select(MinorPlanet).where(MinorPlanet.mpc_number == row.mpc_number)
-        elif row.provisional_designation:
-            statement = select(MinorPlanet).where(
-                MinorPlanet.provisional_designation == row.provisional_designation
-            )
-        elif row.name:
-            statement = select(MinorPlanet).where(MinorPlanet.name == row.name)
+    _upsert_records(session, (row.as_dict() for row in rows), counts, batch_size)
+    return counts
+
+
+def ingest_mpcorb(
+    session: Session,
+    path: str | os.PathLike[str],
+    *,
+    H_max: float | None = 12.0,
+    U_max: int | None = 5,
+    batch_size: int = _UPSERT_BATCH,
+    chunk_bytes: int = _CHUNK_BYTES,
+) -> Counts:
+    """Stream ``path`` through the columnar parser into the database.
+
+    Equivalent to ``upsert_rows(session, filter_rows(parse_mpcorb(path)))``
+    without materialising :class:`MpcRow` objects; pass ``None`` to disable
+    either filter.  The caller owns the transaction.
+    """
+
+    counts = Counts()
+    for block in iter_mpcorb_columns(path, chunk_bytes=chunk_bytes):
+        block = block.filter(H_max, U_max)
+        _upsert_records(session, block.records(), counts, batch_size)
+    return counts
 
-        existing = session.scalar(statement) if statement is not None else None
-        if existing is None:
-            session.add(MinorPlanet.from_row(row))
+
+def _identity(record: dict[str, object]) -> tuple[str, object] | None:
+    for column in _IDENTITY_COLUMNS:
+        value = record[column]
+        if value is not None and value != "":
+            return column, value
+    return None
+
+
+def _upsert_records(
+    session: Session,
+    records: Iterable[dict[str, object]],
+    counts: Counts,
+    batch_size: int,
+) -> None:
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    batch: list[dict[str, object]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            _upsert_batch(session, batch, counts)
+            batch = []
+    if batch:
+        _upsert_batch(session, batch, counts)
+
+
+def _upsert_batch(session: Session, batch: list[dict[str, object]], counts: Counts) -> None:
+    identities = [_identity(record) for record in batch]
+    wanted: dict[str, set[object]] = {column: set() for column in _IDENTITY_COLUMNS}
+    for identity in identities:
+        if identity is not None:
+            wanted[identity[0]].add(identity[1])
+
+    # column -> value -> pending values dict (existing rows carry ``body_id``).
+    index: dict[str, dict[object, dict[str, object]]] = {
+        column: {} for column in _IDENTITY_COLUMNS
+    }
+    existing: dict[int, dict[str, object]] = {}
+    session.flush()
+    for column, values in wanted.items():
+        if not values:
+            continue
+        attribute = getattr(MinorPlanet, column)
+        result = session.execute(
+            select(MinorPlanet.body_id, attribute, MinorPlanet.name)
+            .where(attribute.in_(values))
+            .order_by(MinorPlanet.body_id)
+        )
+        for body_id, value, name in result:
+            if value in index[column]:
+                continue
+            target = existing.setdefault(body_id, {"body_id": body_id, "name": name})
+            index[column][value] = target
+
+    inserts: list[dict[str, object]] = []
+    for record, identity in zip(batch, identities):
+        values = _column_values(record)
+        target = index[identity[0]].get(identity[1]) if identity is not None else None
+        if target is None:
+            target = values
+            inserts.append(target)
             counts.inserted += 1
         else:
-            existing.update_from_row(row)
+            values["name"] = values["name"] or target["name"]
+            target.update(values)
             counts.updated += 1
-    return counts
+        for column in _IDENTITY_COLUMNS:
+            value = target[column]
+            if value is not None and value != "":
+                index[column].setdefault(value, target)
+
+    if inserts:
+        session.execute(insert(MinorPlanet), inserts)
+    updates = [values for values in existing.values() if "epoch_jd" in values]
+    if updates:
+        session.execute(update(MinorPlanet), updates)
+
+
+def _column_values(record: dict[str, object]) -> dict[str, object]:
+    values = {name: record[name] for name in _RECORD_FIELDS}
+    values["family"] = record.get("family")
+    values["data_source"] = record.get("source") or {}
+    return values
 
 
 def export_parquet(rows: Sequence[MpcRow], path: str | os.PathLike[str]) -> Path:
@@ -427,7 +782,10 @@ def export_zarr_angles(
     *,
     scale: int = 100,
 ) -> Path:
-    """Export quantised longitudes to a Zarr array on disk."""
+    """Export quantised longitudes to a Zarr array on disk.
+
+    See :func:`longitude_grid` for how ``ephem`` is sampled.
+    """
 
     try:
         import zarr
@@ -439,24 +797,51 @@ def export_zarr_angles(
     out_path = Path(out_dir)
     out_path.mkdir(parents=True, exist_ok=True)
     timestamps = _build_time_grid(start, end, step)
-    data = np.empty((len(rows), len(timestamps)), dtype=np.uint16)
-
-    for i, row in enumerate(rows):
-        for j, moment in enumerate(timestamps):
-            lon = float(ephem.longitude(row, moment)) % 360.0
-            if lon < 0.0:
-                lon += 360.0
-            data[i, j] = int(round(lon * scale)) % (360 * scale)
+    data = quantise_longitudes(longitude_grid(ephem, rows, timestamps), scale=scale)
 
     store_path = out_path / "angles.zarr"
     zarr.save_array(store_path, data, compressor=zarr.Blosc())
     return store_path
 
 
+def longitude_grid(
+    ephem, rows: Sequence[MpcRow], moments: Sequence[_dt.datetime]
+) -> np.ndarray:
+    """Return ecliptic longitudes shaped ``(len(rows), len(moments))``.
+
+    Ephemerides exposing ``longitudes(rows, moments)`` are asked for the
+    whole grid in one call; otherwise ``longitude(row, moment)`` is sampled
+    per cell.
+    """
+
+    batched = getattr(ephem, "longitudes", None)
+    if batched is not None:
+        grid = np.asarray(batched(rows, moments), dtype=float)
+        if grid.shape != (len(rows), len(moments)):
+            raise ValueError(
+                f"ephemeris returned shape {grid.shape}, expected {(len(rows), len(moments))}"
+            )
+        return grid
+    grid = np.empty((len(rows), len(moments)), dtype=float)
+    for i, row in enumerate(rows):
+        grid[i] = [float(ephem.longitude(row, moment)) for moment in moments]
+    return grid
+
+
+def quantise_longitudes(longitudes: np.ndarray, *, scale: int = 100) -> np.ndarray:
+    """Wrap longitudes to ``[0, 360)`` and store them as ``uint16`` steps of ``1/scale``°."""
+
+    full_circle = 360 * scale
+    if full_circle > np.iinfo(np.uint16).max + 1:
+        raise ValueError("scale is too fine for uint16 storage")
+    steps = np.rint(np.mod(np.asarray(longitudes, dtype=float), 360.0) * scale)
+    return np.mod(steps, full_circle).astype(np.uint16)
+
+
 def _build_time_grid(start: _dt.datetime, end: _dt.datetime, step: _dt.timedelta) -> list[_dt.datetime]:
-    moments: list[_dt.datetime] = []
-    current = start
-    while current <= end:
-        moments.append(current)
-        current = current + step
-    return moments
+    if step <= _dt.timedelta(0):
+        raise ValueError("step must be positive")
+    if end < start:
+        return []
+    count = (end - start) // step + 1
+    return [start + step * index for index in range(count)]
@@ -12,12 +12,12 @@ import logging
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime
-from itertools import tee
 from typing import Any, TYPE_CHECKING
 
 from ..chart.config import ChartConfig
 from ..core.bodies import canonical_name
 from ..core.engine import get_active_aspect_angles
+from ..core.ticks import IsoTickView, Tick, jd_ticks
 from ..detectors import CoarseHit
 from ..detectors import common as detectors_common
 from ..detectors import detect_antiscia_contacts, detect_decl_contacts
@@ -204,22 +204,26 @@ def _attach_timelords(
     event.metadata.setdefault("timelords", stack.to_dict())
 
 
-def _iso_ticks(
+def _jd_ticks(
     start_iso: str,
     end_iso: str,
     *,
     step: dt.timedelta,
-) -> Iterable[str]:
-    """Yield ISO-8601 timestamps separated by ``step``."""
+) -> tuple[float, ...]:
+    """Return UTC Julian-day ticks separated by ``step`` (minimum one minute)."""
 
     start_dt = dt.datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
     end_dt = dt.datetime.fromisoformat(end_iso.replace("Z", "+00:00"))
     seconds = max(step.total_seconds(), 60.0)
-    current = start_dt
-    delta = dt.timedelta(seconds=seconds)
-    while current <= end_dt:
-        yield current.replace(tzinfo=dt.UTC).isoformat().replace("+00:00", "Z")
-        current += delta
+    if end_dt < start_dt:
+        return ()
+    return tuple(
+        jd_ticks(
+            start_dt.replace(tzinfo=dt.UTC),
+            end_dt.replace(tzinfo=dt.UTC),
+            dt.timedelta(seconds=seconds),
+        )
+    )
 
 
 def _resolution_from_minutes(step_minutes: int) -> str:
@@ -407,7 +411,7 @@ def _event_from_aspect(
 
 def _declination_events(
     provider: object,
-    ticks: Iterable[str],
+    ticks: Iterable[Tick],
     *,
     moving: str,
     target: str,
@@ -450,7 +454,7 @@ def _declination_events(
 
 def _mirror_events(
     provider: object,
-    ticks: Iterable[str],
+    ticks: Iterable[Tick],
     *,
     moving: str,
     target: str,
@@ -483,7 +487,7 @@ def _mirror_events(
 
 def _aspect_events(
     provider: object,
-    ticks: Iterable[str],
+    ticks: Iterable[Tick],
     *,
     moving: str,
     target: str,
@@ -540,6 +544,184 @@ def _collect_support_metadata(
     return set(supported_bodies), skipped_bodies, skip_payload
 
 
+def _configure_provider(
+    provider: object,
+    ephemeris_config: EphemerisConfig | None,
+    *,
+    nodes_variant: str,
+    lilith_variant: str,
+) -> None:
+    """Apply ``ephemeris_config`` to ``provider`` when it supports configuration."""
+
+    if ephemeris_config is None:
+        return
+    configure = getattr(provider, "configure", None)
+    if not callable(configure):
+        return
+    cfg_kwargs = {
+        "topocentric": ephemeris_config.topocentric,
+        "observer": ephemeris_config.observer,
+        "sidereal": ephemeris_config.sidereal,
+        "time_scale": ephemeris_config.time_scale,
+    }
+    params = inspect.signature(configure).parameters
+    if "nodes_variant" in params:
+        cfg_kwargs["nodes_variant"] = nodes_variant
+    if "lilith_variant" in params:
+        cfg_kwargs["lilith_variant"] = lilith_variant
+    configure(**cfg_kwargs)
+
+
+def _frame_resolver(
+    target_frame: str,
+    target_resolver: TargetFrameResolver | None,
+) -> TargetFrameResolver | None:
+    """Return a resolver matching ``target_frame`` derived from ``target_resolver``."""
+
+    frame = (target_frame or "transit").lower()
+    resolver = target_resolver
+    if resolver is not None and frame != "transit" and resolver.frame != frame:
+        resolver = TargetFrameResolver(
+            frame,
+            natal_chart=target_resolver.natal_chart,
+            composite_chart=target_resolver.composite_chart,
+            static_positions=target_resolver.static_positions,
+        )
+    return resolver
+
+
+@dataclass(slots=True)
+class _PairPlan:
+    """Resolved per-pair configuration shared by single and batch scans."""
+
+    moving: str
+    target: str
+    profile_ctx: ScanProfileContext
+    toggles: ScanFeatureToggles
+    scoring: _ScoringContext
+    feature_metadata: dict[str, object]
+    supported: bool
+    skipped_bodies: list[str]
+    skip_payload: dict[str, object] | None
+    step_minutes: int
+    resolution: str
+
+
+def _plan_pair(
+    moving: str,
+    target: str,
+    provider: object,
+    profile_data: Mapping[str, Any],
+    *,
+    decl_parallel_orb: float | None,
+    decl_contra_orb: float | None,
+    antiscia_orb: float | None,
+    contra_antiscia_orb: float | None,
+    antiscia_axis: str | None,
+    tradition_profile: str | None,
+    chart_sect: str | None,
+    include_declination: bool,
+    include_mirrors: bool,
+    include_aspects: bool,
+    nodes_variant: str,
+    lilith_variant: str,
+    step_minutes: int | None,
+) -> _PairPlan:
+    profile_ctx = build_scan_profile_context(
+        profile_data,
+        moving=moving,
+        target=target,
+        decl_parallel_orb=decl_parallel_orb,
+        decl_contra_orb=decl_contra_orb,
+        antiscia_orb=antiscia_orb,
+        contra_antiscia_orb=contra_antiscia_orb,
+        antiscia_axis=antiscia_axis,
+        tradition_profile=tradition_profile,
+        chart_sect=chart_sect,
+    )
+
+    feature_plan = profile_ctx.plan_features(
+        include_declination=include_declination,
+        include_mirrors=include_mirrors,
+        include_aspects=include_aspects,
+    )
+
+    scoring_ctx = _ScoringContext(
+        resonance_weights=profile_ctx.resonance_weights,
+        tradition=profile_ctx.tradition,
+        chart_sect=profile_ctx.chart_sect,
+        uncertainty_bias=profile_ctx.uncertainty_bias,
+    )
+
+    feature_metadata = feature_plan.plugin_metadata()
+    feature_metadata.setdefault(
+        "variants", {"nodes": nodes_variant, "lilith": lilith_variant}
+    )
+
+    supported_set, skipped_bodies, skip_metadata_payload = _collect_support_metadata(
+        moving,
+        target,
+        provider,
+        feature_metadata=feature_metadata,
+    )
+
+    requested_step = int(step_minutes) if step_minutes is not None else 60
+    gated_step_minutes, gated_resolution = _gated_step_minutes(requested_step, moving)
+
+    return _PairPlan(
+        moving=moving,
+        target=target,
+        profile_ctx=profile_ctx,
+        toggles=feature_plan.toggles,
+        scoring=scoring_ctx,
+        feature_metadata=feature_metadata,
+        supported=moving in supported_set and target in supported_set,
+        skipped_bodies=skipped_bodies,
+        skip_payload=skip_metadata_payload,
+        step_minutes=gated_step_minutes,
+        resolution=gated_resolution,
+    )
+
+
+def _attach_event_metadata(
+    event: LegacyTransitEvent,
+    plan: _PairPlan,
+    calculator: TimelordCalculator | None,
+) -> LegacyTransitEvent:
+    _attach_timelords(event, calculator)
+    if plan.skip_payload:
+        provenance = event.metadata.setdefault("provenance", {})
+        if isinstance(provenance, dict):
+            provenance.setdefault("skipped_bodies", plan.skip_payload["skipped_bodies"])
+    return event
+
+
+def _plugin_options(
+    plan: _PairPlan,
+    *,
+    requested_step_minutes: int | None,
+    aspects_policy_path: str | None,
+) -> dict[str, object]:
+    profile_ctx = plan.profile_ctx
+    return {
+        "decl_parallel_orb": profile_ctx.decl_parallel_orb,
+        "decl_contra_orb": profile_ctx.decl_contra_orb,
+        "antiscia_orb": profile_ctx.antiscia_orb,
+        "contra_antiscia_orb": profile_ctx.contra_antiscia_orb,
+
+        "step_minutes": plan.step_minutes,
+        "requested_step_minutes": requested_step_minutes,
+        "gated_resolution": plan.resolution,
+
+        "aspects_policy_path": aspects_policy_path,
+        "antiscia_axis": profile_ctx.antiscia_axis,
+        **plan.feature_metadata,
+        "declination_flags": dict(profile_ctx.declination_flags),
+        "antiscia_flags": dict(profile_ctx.antiscia_flags),
+        "skipped_bodies": list(plan.skipped_bodies),
+    }
+
+
 def scan_contacts(
     start_iso: str,
     end_iso: str,
@@ -579,31 +761,14 @@ def scan_contacts(
     base_provider = provider or get_provider(provider_name)
     nodes_variant = (nodes_variant or "mean").lower()
     lilith_variant = (lilith_variant or "mean").lower()
-    if ephemeris_config is not None:
-        configure = getattr(base_provider, "configure", None)
-        if callable(configure):
-            cfg_kwargs = {
-                "topocentric": ephemeris_config.topocentric,
-                "observer": ephemeris_config.observer,
-                "sidereal": ephemeris_config.sidereal,
-                "time_scale": ephemeris_config.time_scale,
-            }
-            params = inspect.signature(configure).parameters
-            if "nodes_variant" in params:
-                cfg_kwargs["nodes_variant"] = nodes_variant
-            if "lilith_variant" in params:
-                cfg_kwargs["lilith_variant"] = lilith_variant
-            configure(**cfg_kwargs)
+    _configure_provider(
+        base_provider,
+        ephemeris_config,
+        nodes_variant=nodes_variant,
+        lilith_variant=lilith_variant,
+    )
 
-    frame = (target_frame or "transit").lower()
-    resolver = target_resolver
-    if resolver is not None and frame != "transit" and resolver.frame != frame:
-        resolver = TargetFrameResolver(
-            frame,
-            natal_chart=target_resolver.natal_chart,
-            composite_chart=target_resolver.composite_chart,
-            static_positions=target_resolver.static_positions,
-        )
+    resolver = _frame_resolver(target_frame, target_resolver)
 
     scan_provider: object = base_provider
     if resolver is not None and resolver.overrides_target():
@@ -613,10 +778,11 @@ def scan_contacts(
         SwissEphemerisAdapter.configure_defaults(chart_config=chart_config)
 
     profile_data = resolve_profile(profile, profile_id)
-    profile_ctx = build_scan_profile_context(
+    plan = _plan_pair(
+        moving,
+        target,
+        scan_provider,
         profile_data,
-        moving=moving,
-        target=target,
         decl_parallel_orb=decl_parallel_orb,
         decl_contra_orb=decl_contra_orb,
         antiscia_orb=antiscia_orb,
@@ -624,90 +790,53 @@ def scan_contacts(
         antiscia_axis=antiscia_axis,
         tradition_profile=tradition_profile,
         chart_sect=chart_sect,
-    )
-
-    feature_plan = profile_ctx.plan_features(
         include_declination=include_declination,
         include_mirrors=include_mirrors,
         include_aspects=include_aspects,
+        nodes_variant=nodes_variant,
+        lilith_variant=lilith_variant,
+        step_minutes=step_minutes,
     )
-    toggles = feature_plan.toggles
-
-    decl_parallel_allow = profile_ctx.decl_parallel_orb
-    decl_contra_allow = profile_ctx.decl_contra_orb
-    antiscia_allow = profile_ctx.antiscia_orb
-    contra_antiscia_allow = profile_ctx.contra_antiscia_orb
-    axis = profile_ctx.antiscia_axis
-
-    scoring_ctx = _ScoringContext(
-        resonance_weights=profile_ctx.resonance_weights,
-        tradition=profile_ctx.tradition,
-        chart_sect=profile_ctx.chart_sect,
-        uncertainty_bias=profile_ctx.uncertainty_bias,
-    )
-
-
-    feature_metadata = feature_plan.plugin_metadata()
-    feature_metadata.setdefault(
-        "variants", {"nodes": nodes_variant, "lilith": lilith_variant}
-    )
+    profile_ctx = plan.profile_ctx
+    toggles = plan.toggles
 
     events: list[LegacyTransitEvent] = []
-    supported_set, skipped_bodies, skip_metadata_payload = _collect_support_metadata(
-        moving,
-        target,
-        scan_provider,
-        feature_metadata=feature_metadata,
-    )
-    if moving not in supported_set or target not in supported_set:
+    if not plan.supported:
         return events
 
-    requested_step = int(step_minutes) if step_minutes is not None else 60
-    gated_step_minutes, gated_resolution = _gated_step_minutes(requested_step, moving)
-
-    tick_source = _iso_ticks(
+    ticks = _jd_ticks(
         start_iso,
         end_iso,
-        step=dt.timedelta(minutes=gated_step_minutes),
+        step=dt.timedelta(minutes=plan.step_minutes),
     )
 
-    decl_ticks, mirror_ticks, aspect_ticks, plugin_ticks = tee(tick_source, 4)
-
     cached_provider = TickCachingProvider(scan_provider)
 
-
     def _append_event(event: LegacyTransitEvent) -> None:
-        _attach_timelords(event, timelord_calculator)
-        if skip_metadata_payload:
-            provenance = event.metadata.setdefault("provenance", {})
-            if isinstance(provenance, dict):
-                provenance.setdefault(
-                    "skipped_bodies", skip_metadata_payload["skipped_bodies"]
-                )
-        events.append(event)
+        events.append(_attach_event_metadata(event, plan, timelord_calculator))
 
     for event in _declination_events(
         cached_provider,
-        decl_ticks,
+        ticks,
         moving=moving,
         target=target,
-        parallel_orb=decl_parallel_allow,
-        contra_orb=decl_contra_allow,
+        parallel_orb=profile_ctx.decl_parallel_orb,
+        contra_orb=profile_ctx.decl_contra_orb,
         toggles=toggles,
-        scoring=scoring_ctx,
+        scoring=plan.scoring,
     ):
         _append_event(event)
 
     for event in _mirror_events(
         cached_provider,
-        mirror_ticks,
+        ticks,
         moving=moving,
         target=target,
-        antiscia_orb=antiscia_allow,
-        contra_antiscia_orb=contra_antiscia_allow,
-        axis=axis,
+        antiscia_orb=profile_ctx.antiscia_orb,
+        contra_antiscia_orb=profile_ctx.contra_antiscia_orb,
+        axis=profile_ctx.antiscia_axis,
         toggles=toggles,
-        scoring=scoring_ctx,
+        scoring=plan.scoring,
     ):
         _append_event(event)
 
@@ -718,12 +847,12 @@ def scan_contacts(
 
     for event in _aspect_events(
         cached_provider,
-        aspect_ticks,
+        ticks,
         moving=moving,
         target=target,
         policy_path=aspects_policy_path,
         toggles=toggles,
-        scoring=scoring_ctx,
+        scoring=plan.scoring,
         natal_chart=natal_chart_for_domains,
         house_system=house_system_for_domains,
     ):
@@ -734,26 +863,14 @@ def scan_contacts(
         provider_name=provider_name,
         start_iso=start_iso,
         end_iso=end_iso,
-        ticks=tuple(plugin_ticks),
+        ticks=IsoTickView(ticks),
         moving=moving,
         target=target,
-        options={
-            "decl_parallel_orb": decl_parallel_allow,
-            "decl_contra_orb": decl_contra_allow,
-            "antiscia_orb": antiscia_allow,
-            "contra_antiscia_orb": contra_antiscia_allow,
-
-            "step_minutes": gated_step_minutes,
-            "requested_step_minutes": step_minutes,
-            "gated_resolution": gated_resolution,
-
-            "aspects_policy_path": aspects_policy_path,
-            "antiscia_axis": axis,
-            **feature_metadata,
-            "declination_flags": dict(profile_ctx.declination_flags),
-            "antiscia_flags": dict(profile_ctx.antiscia_flags),
-            "skipped_bodies": list(skipped_bodies),
-        },
+        options=_plugin_options(
+            plan,
+            requested_step_minutes=step_minutes,
+            aspects_policy_path=aspects_policy_path,
+        ),
         existing_events=tuple(events),
     )
     plugin_events = get_plugin_manager().run_detectors(plugin_context)
@@ -1,9 +1,28 @@
 from __future__ import annotations
 
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 
 from .swe import swe
 
+__all__ = [
+    "ChebyshevSegmentCache",
+    "calc_ut_cached",
+    "default_segment_directory",
+    "julday_cached",
+    "segment_cache",
+    "warm_segments",
+]
+
 
 def _init_ephe(*args, **kwargs):
     """Lazily import the Swiss ephemeris initialiser."""
@@ -25,3 +44,356 @@ def julday_cached(y: int, m: int, d: int, ut: float):
     """Cached wrapper for swe().julday; avoids recomputing repeated JDs."""
     _init_ephe()
     return swe().julday(y, m, d, ut)
+
+
+# ---------------------------------------------------------------------------
+# Piecewise Chebyshev segments
+# ---------------------------------------------------------------------------
+
+CalcFn = Callable[[float, int, int], tuple[Iterable[float], int]]
+
+_SEGMENT_EPOCH_JD = 2451545.0  # J2000 anchors segment boundaries
+_DEFAULT_SEGMENT_DAYS = 8.0
+# Swiss body codes -> segment span (days); fast movers get shorter spans.
+_SEGMENT_DAYS: dict[int, float] = {
+    0: 4.0,  # Sun
+    1: 1.0,  # Moon
+    2: 4.0,  # Mercury
+    3: 4.0,  # Venus
+    4: 4.0,  # Mars
+    11: 1.0,  # True node
+    13: 0.5,  # Osculating apogee
+}
+# lon, lat, dist, speed_lon, speed_lat, speed_dist
+_DEFAULT_TOLERANCE = (1e-6, 1e-6, 1e-9, 1e-5, 1e-5, 1e-8)
+# Flags whose output depends on global Swiss state (topocentre, ayanamsha).
+_FLG_TOPOCTR = 32 * 1024
+_FLG_SIDEREAL = 64 * 1024
+_MANIFEST = "manifest.json"
+
+
+def default_segment_directory() -> Path:
+    """Return the directory holding persisted Chebyshev segment tables."""
+
+    from ..infrastructure.home import ae_home
+
+    return ae_home() / "cache" / "chebyshev"
+
+
+@dataclass(slots=True)
+class _SegmentTable:
+    """Contiguous run of pre-built segments for one body/flag-set."""
+
+    first_index: int
+    span_days: float
+    coeffs: np.ndarray  # (segments, degree + 1, 6); NaN rows fall back to exact
+    ret_flag: int
+
+    def lookup(self, index: int) -> np.ndarray | None:
+        row = index - self.first_index
+        if row < 0 or row >= self.coeffs.shape[0]:
+            return None
+        coeffs = self.coeffs[row]
+        if math.isnan(coeffs[0, 0]):
+            return None
+        return coeffs
+
+
+class ChebyshevSegmentCache:
+    """Serve ``calc_ut`` results from piecewise Chebyshev polynomials.
+
+    Time is divided into fixed segments per body (one day for the Moon,
+    four for the inner planets, eight for slower bodies).  Each segment is
+    fitted on Chebyshev nodes for all six ``calc_ut`` components and
+    validated against exact samples at the ends and between every pair of
+    nodes; segments exceeding ``tolerance`` are
+    never interpolated, so every returned value is within the bound of the
+    underlying ephemeris.  A segment is fitted only once ``build_after``
+    requests land in it, which keeps one-off chart lookups on the exact
+    path.  In-memory segments live in an LRU capped at ``max_segments``;
+    tables persisted by :func:`warm_segments` are memory-mapped.
+    """
+
+    def __init__(
+        self,
+        *,
+        degree: int = 12,
+        tolerance: Iterable[float] = _DEFAULT_TOLERANCE,
+        max_segments: int = 16_384,
+        build_after: int = 2,
+        calc: CalcFn | None = None,
+    ) -> None:
+        if degree < 2:
+            raise ValueError("degree must be at least 2")
+        self.degree = int(degree)
+        self.tolerance = np.asarray(tuple(tolerance), dtype=float)
+        self.max_segments = max(int(max_segments), 1)
+        self.build_after = max(int(build_after), 1)
+        self._calc = calc
+        count = self.degree + 1
+        theta = np.pi * (np.arange(count) + 0.5) / count
+        self._nodes = np.cos(theta)
+        self._fit_matrix = (2.0 / count) * np.cos(np.outer(np.arange(count), theta))
+        self._fit_matrix[0] *= 0.5
+        # Interpolation error peaks between nodes, so validate at both ends
+        # and at every midpoint between neighbouring nodes.
+        ordered = np.sort(self._nodes)
+        self._check_x = np.concatenate(([-1.0], 0.5 * (ordered[:-1] + ordered[1:]), [1.0]))
+        self._check_basis = np.polynomial.chebyshev.chebvander(self._check_x, self.degree)
+        self._segments: OrderedDict[tuple[int, int, int], tuple[np.ndarray, int] | None] = (
+            OrderedDict()
+        )
+        self._pending: OrderedDict[tuple[int, int, int], int] = OrderedDict()
+        self._tables: dict[tuple[int, int], _SegmentTable] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    @staticmethod
+    def segment_days(ipl: int) -> float:
+        """Return the segment span in days used for Swiss body ``ipl``."""
+
+        return _SEGMENT_DAYS.get(int(ipl), _DEFAULT_SEGMENT_DAYS)
+
+    def _effective_flags(self, flags: int) -> int:
+        if self._calc is None:
+            return int(flags) | int(_init_ephe())
+        return int(flags)
+
+    def _exact(self, jd: float, ipl: int, flags: int) -> tuple[tuple[float, ...], int]:
+        if self._calc is None:
+            values, ret_flag = swe().calc_ut(jd, ipl, flags)
+        else:
+            values, ret_flag = self._calc(jd, ipl, flags)
+        return tuple(float(v) for v in values), int(ret_flag)
+
+    def calc_ut(self, jd: float, ipl: int, flags: int = 0) -> tuple[tuple[float, ...], int]:
+        """Return ``(values, ret_flag)`` matching ``swe.calc_ut`` for ``jd``."""
+
+        ipl = int(ipl)
+        flags = self._effective_flags(flags)
+        if flags & (_FLG_TOPOCTR | _FLG_SIDEREAL):
+            return self._exact(jd, ipl, flags)
+
+        span = self.segment_days(ipl)
+        index = math.floor((jd - _SEGMENT_EPOCH_JD) / span)
+        table = self._tables.get((ipl, flags))
+        if table is not None and table.span_days == span:
+            coeffs = table.lookup(index)
+            if coeffs is not None:
+                with self._lock:
+                    self.hits += 1
+                return self._evaluate(coeffs, jd, index, span), table.ret_flag
+
+        key = (ipl, flags, index)
+        with self._lock:
+            if key in self._segments:
+                entry = self._segments[key]
+                self._segments.move_to_end(key)
+                build = False
+            else:
+                entry = None
+                seen = self._pending.pop(key, 0) + 1
+                build = seen >= self.build_after
+                if not build:
+                    self._pending[key] = seen
+                    while len(self._pending) > self.max_segments:
+                        self._pending.popitem(last=False)
+
+        if build:
+            entry = self._fit(ipl, flags, index, span)
+            with self._lock:
+                self._segments[key] = entry
+                while len(self._segments) > self.max_segments:
+                    self._segments.popitem(last=False)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if entry is None:
+            return self._exact(jd, ipl, flags)
+        coeffs, ret_flag = entry
+        return self._evaluate(coeffs, jd, index, span), ret_flag
+
+    def _evaluate(
+        self, coeffs: np.ndarray, jd: float, index: int, span: float
+    ) -> tuple[float, ...]:
+        x = 2.0 * (jd - _SEGMENT_EPOCH_JD - index * span) / span - 1.0
+        basis = [1.0, x]
+        two_x = 2.0 * x
+        for _ in range(coeffs.shape[0] - 2):
+            basis.append(two_x * basis[-1] - basis[-2])
+        values = np.dot(basis, coeffs).tolist()
+        values[0] %= 360.0
+        return tuple(values)
+
+    # ------------------------------------------------------------------
+    # Fitting
+    # ------------------------------------------------------------------
+    def _fit(
+        self, ipl: int, flags: int, index: int, span: float
+    ) -> tuple[np.ndarray, int] | None:
+        start = _SEGMENT_EPOCH_JD + index * span
+        half = span / 2.0
+        ret_flag: int | None = None
+        samples: list[tuple[float, ...]] = []
+        for x in self._nodes:
+            values, flag = self._exact(start + (x + 1.0) * half, ipl, flags)
+            if flag < 0 or len(values) < 6:
+                return None
+            ret_flag = flag if ret_flag is None else ret_flag
+            samples.append(values[:6])
+        grid = np.asarray(samples)
+        grid[:, 0] = np.unwrap(grid[:, 0], period=360.0)
+        coeffs = self._fit_matrix @ grid
+
+        approx = self._check_basis @ coeffs
+        for row, x in enumerate(self._check_x):
+            values, flag = self._exact(start + (x + 1.0) * half, ipl, flags)
+            if flag < 0:
+                return None
+            error = np.abs(approx[row] - np.asarray(values[:6]))
+            error[0] = abs((approx[row, 0] - values[0] + 180.0) % 360.0 - 180.0)
+            if np.any(error > self.tolerance):
+                return None
+        return coeffs, int(ret_flag if ret_flag is not None else flags)
+
+    def build_table(
+        self, ipl: int, flags: int, start_jd: float, end_jd: float
+    ) -> int:
+        """Fit every segment covering ``start_jd``..``end_jd`` and keep the table.
+
+        Returns the number of segments that passed validation.
+        """
+
+        ipl = int(ipl)
+        flags = self._effective_flags(flags)
+        span = self.segment_days(ipl)
+        first = math.floor((start_jd - _SEGMENT_EPOCH_JD) / span)
+        last = math.floor((end_jd - _SEGMENT_EPOCH_JD) / span)
+        coeffs = np.full((last - first + 1, self.degree + 1, 6), np.nan)
+        ret_flag = flags
+        built = 0
+        for row, index in enumerate(range(first, last + 1)):
+            entry = self._fit(ipl, flags, index, span)
+            if entry is None:
+                continue
+            coeffs[row], ret_flag = entry
+            built += 1
+        self._tables[(ipl, flags)] = _SegmentTable(first, span, coeffs, ret_flag)
+        return built
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, directory: str | Path) -> Path:
+        """Persist built tables to ``directory`` as ``.npy`` files plus a manifest."""
+
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for (ipl, flags), table in sorted(self._tables.items()):
+            name = f"seg_{ipl}_{flags}.npy"
+            # Write beside the destination and swap in, so tables currently
+            # memory-mapped from ``target`` stay valid.
+            staging = target / f".{name}.tmp"
+            with staging.open("wb") as handle:
+                np.save(handle, np.asarray(table.coeffs))
+            os.replace(staging, target / name)
+            entries.append(
+                {
+                    "ipl": ipl,
+                    "flags": flags,
+                    "first_index": table.first_index,
+                    "span_days": table.span_days,
+                    "ret_flag": table.ret_flag,
+                    "file": name,
+                }
+            )
+        manifest = {"version": 1, "epoch_jd": _SEGMENT_EPOCH_JD, "tables": entries}
+        path = target / _MANIFEST
+        path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        return path
+
+    def load(self, directory: str | Path) -> int:
+        """Memory-map tables persisted by :meth:`save`; return the count loaded."""
+
+        source = Path(directory)
+        manifest_path = source / _MANIFEST
+        if not manifest_path.exists():
+            return 0
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if float(manifest.get("epoch_jd", 0.0)) != _SEGMENT_EPOCH_JD:
+            return 0
+        loaded = 0
+        for entry in manifest.get("tables", []):
+            coeffs = np.load(source / entry["file"], mmap_mode="r")
+            self._tables[(int(entry["ipl"]), int(entry["flags"]))] = _SegmentTable(
+                int(entry["first_index"]),
+                float(entry["span_days"]),
+                coeffs,
+                int(entry["ret_flag"]),
+            )
+            loaded += 1
+        return loaded
+
+    def clear(self) -> None:
+        """Drop in-memory segments, pending counters and loaded tables."""
+
+        with self._lock:
+            self._segments.clear()
+            self._pending.clear()
+            self._tables.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_DEFAULT_CACHE: ChebyshevSegmentCache | None = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def segment_cache() -> ChebyshevSegmentCache:
+    """Return the shared segment cache, loading warmed tables on first use."""
+
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        with _DEFAULT_CACHE_LOCK:
+            if _DEFAULT_CACHE is None:
+                cache = ChebyshevSegmentCache()
+                try:
+                    cache.load(default_segment_directory())
+                except (OSError, ValueError, KeyError):
+                    cache.clear()
+                _DEFAULT_CACHE = cache
+    return _DEFAULT_CACHE
+
+
+def warm_segments(
+    codes: Iterable[int],
+    flag_sets: Iterable[int],
+    start_jd: float,
+    end_jd: float,
+    *,
+    cache: ChebyshevSegmentCache | None = None,
+    directory: str | Path | None = None,
+) -> int:
+    """Build and persist Chebyshev tables for ``codes`` × ``flag_sets``.
+
+    Returns the total number of validated segments written.
+    """
+
+    if end_jd < start_jd:
+        raise ValueError("end_jd must not be before start_jd")
+    target_cache = cache if cache is not None else segment_cache()
+    flags_list = list(dict.fromkeys(int(flags) for flags in flag_sets))
+    total = 0
+    for code in dict.fromkeys(int(code) for code in codes):
+        for flags in flags_list:
+            total += target_cache.build_table(code, flags, start_jd, end_jd)
+    target_cache.save(directory if directory is not None else default_segment_directory())
+    return total
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from functools import lru_cache
@@ -13,9 +13,11 @@ from pathlib import Path
 from types import ModuleType
 from typing import TYPE_CHECKING, ClassVar, Final
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
-from .cache import calc_ut_cached
+from .cache import calc_ut_cached, segment_cache
 from .house_systems import (
     HOUSE_CODE_BYTES_BY_NAME,
     resolve_house_code,
@@ -42,6 +44,7 @@ if TYPE_CHECKING:  # pragma: no cover - runtime import avoided for typing only
 __all__ = [
     "swe_calc",
     "BodyPosition",
+    "BodyPositionArrays",
     "EquatorialPosition",
     "HousePositions",
 
@@ -77,6 +80,12 @@ def _update_swe_cache_hit_ratio() -> None:
     _swe_cache_hit_ratio().set(_swe_calc_hits / total)
 
 
+def _segment_cache_enabled() -> bool:
+    """Return whether ``ASTROENGINE_SEGMENT_CACHE`` opts into segment interpolation."""
+
+    return os.getenv("ASTROENGINE_SEGMENT_CACHE", "").strip().lower() in {"1", "true", "yes"}
+
+
 @lru_cache(maxsize=1)
 def _node_variant_codes() -> Mapping[str, int]:
     swe = _swe()
@@ -136,6 +145,100 @@ class EquatorialPosition:
     speed_declination: float
 
 
+@dataclass(frozen=True, slots=True)
+class BodyPositionArrays:
+    """Struct-of-arrays positions for many bodies across many Julian days.
+
+    Every array field is shaped ``(len(julian_day), len(bodies))`` with
+    columns ordered as :attr:`bodies`.
+    """
+
+    bodies: tuple[str, ...]
+    julian_day: np.ndarray
+    longitude: np.ndarray
+    latitude: np.ndarray
+    distance_au: np.ndarray
+    speed_longitude: np.ndarray
+    speed_latitude: np.ndarray
+    speed_distance: np.ndarray
+    right_ascension: np.ndarray
+    declination: np.ndarray
+    speed_ra: np.ndarray
+    speed_declination: np.ndarray
+
+    def column(self, body: str) -> int:
+        """Return the column index for ``body``."""
+
+        try:
+            return self.bodies.index(body)
+        except ValueError:
+            raise KeyError(body) from None
+
+    def position(self, row: int, body: str) -> BodyPosition:
+        """Return the :class:`BodyPosition` for ``body`` at ``row``."""
+
+        col = self.column(body)
+        return BodyPosition(
+            body=body,
+            julian_day=float(self.julian_day[row]),
+            longitude=float(self.longitude[row, col]),
+            latitude=float(self.latitude[row, col]),
+            distance_au=float(self.distance_au[row, col]),
+            speed_longitude=float(self.speed_longitude[row, col]),
+            speed_latitude=float(self.speed_latitude[row, col]),
+            speed_distance=float(self.speed_distance[row, col]),
+            declination=float(self.declination[row, col]),
+            speed_declination=float(self.speed_declination[row, col]),
+        )
+
+
+def _ecliptic_to_equatorial(
+    lon: np.ndarray,
+    lat: np.ndarray,
+    speed_lon: np.ndarray,
+    speed_lat: np.ndarray,
+    obliquity: np.ndarray | float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Rotate ecliptic coordinates and speeds into the equatorial frame.
+
+    Inputs are degrees (and degrees/day) and broadcast against
+    ``obliquity``; returns ``(ra, dec, speed_ra, speed_dec)``.
+    """
+
+    lam = np.radians(lon)
+    beta = np.radians(lat)
+    dlam = np.radians(speed_lon)
+    dbeta = np.radians(speed_lat)
+    eps = np.radians(obliquity)
+    cos_eps = np.cos(eps)
+    sin_eps = np.sin(eps)
+
+    cos_beta = np.cos(beta)
+    sin_beta = np.sin(beta)
+    cos_lam = np.cos(lam)
+    sin_lam = np.sin(lam)
+
+    x = cos_beta * cos_lam
+    y = cos_beta * sin_lam
+    z = sin_beta
+    dx = -sin_beta * cos_lam * dbeta - cos_beta * sin_lam * dlam
+    dy = -sin_beta * sin_lam * dbeta + cos_beta * cos_lam * dlam
+    dz = cos_beta * dbeta
+
+    y_eq = y * cos_eps - z * sin_eps
+    z_eq = y * sin_eps + z * cos_eps
+    dy_eq = dy * cos_eps - dz * sin_eps
+    dz_eq = dy * sin_eps + dz * cos_eps
+
+    ra = np.degrees(np.arctan2(y_eq, x)) % 360.0
+    dec = np.degrees(np.arcsin(np.clip(z_eq, -1.0, 1.0)))
+    rho2 = x * x + y_eq * y_eq
+    with np.errstate(divide="ignore", invalid="ignore"):
+        speed_ra = np.degrees((x * dy_eq - y_eq * dx) / rho2)
+        speed_dec = np.degrees(dz_eq / np.sqrt(rho2))
+    return ra, dec, speed_ra, speed_dec
+
+
 @dataclass(frozen=True, slots=True)
 class SolarCycleEvents:
     """Sunrise, sunset, and transit metadata for a single day."""
@@ -359,6 +462,7 @@ class SwissEphemerisAdapter:
             lilith_variant=chart_config.lilith_variant,
         )
         self._last_house_metadata: dict[str, object] | None = None
+        self.use_segment_cache = _segment_cache_enabled()
 
         self.ephemeris_path, base_flag = self._configure_ephemeris_path(ephemeris_path)
         self._base_flag = base_flag
@@ -696,78 +800,153 @@ class SwissEphemerisAdapter:
                 operation="single",
             ).observe(duration)
 
-    def compute_bodies_many(
-        self, jd_ut: float, bodies: Mapping[str, int]
-    ) -> dict[str, BodyPosition]:
-        """Return body positions for ``bodies`` using shared Swiss calls."""
+    def _rotation_supported(self) -> bool:
+        """Return ``True`` when equatorial values can be rotated from ecliptic.
 
-        if not bodies:
-            return {}
+        Sidereal, J2000 and nutation-free frames do not share the true
+        obliquity of date, so those configurations keep the dedicated
+        ``FLG_EQUATORIAL`` call.
+        """
 
-        self._apply_sidereal_mode()
         swe = _swe()
-        calc_flags = self._calc_flags
-        fallback_flags = self._fallback_flags
-        equatorial_flag = swe().FLG_EQUATORIAL
+        blocked = int(swe.FLG_SIDEREAL | swe.FLG_J2000 | swe.FLG_NONUT)
+        return not ((self._calc_flags | self._fallback_flags) & blocked)
+
+    @staticmethod
+    def _true_obliquity(jd_ut: float) -> float:
+        values, _ = calc_ut_cached(jd_ut, int(_swe().ECL_NUT), 0)
+        return float(values[0])
 
+    def _body_specs(
+        self, bodies: Mapping[str, int]
+    ) -> tuple[list[tuple[str, int, bool]], list[int]]:
         body_specs: list[tuple[str, int, bool]] = []
-        unique_codes: set[int] = set()
+        unique_codes: dict[int, None] = {}
         for name, raw_code in bodies.items():
             override_code, derived = self._variant_override(name)
             effective = int(override_code if override_code is not None else raw_code)
             body_specs.append((name, effective, derived))
-            unique_codes.add(effective)
+            unique_codes.setdefault(effective, None)
+        return body_specs, list(unique_codes)
+
+    def _vector_block(
+        self, jds: Sequence[float], codes: Sequence[int], extra_flags: int = 0
+    ) -> np.ndarray:
+        """Return Swiss vectors shaped ``(len(jds), len(codes), 6)``."""
+
+        calc = segment_cache().calc_ut if self.use_segment_cache else calc_ut_cached
+        primary = self._calc_flags | extra_flags
+        fallback = self._fallback_flags | extra_flags
+        out = np.empty((len(jds), len(codes), 6), dtype=float)
+        for row, jd_ut in enumerate(jds):
+            for col, code in enumerate(codes):
+                try:
+                    values, ret_flag = calc(jd_ut, code, primary)
+                except Exception:
+                    values, ret_flag = calc(jd_ut, code, fallback)
+                else:
+                    if ret_flag < 0 and fallback != primary:
+                        values, ret_flag = calc(jd_ut, code, fallback)
+                if ret_flag < 0:
+                    raise RuntimeError(
+                        f"Swiss ephemeris returned error code {ret_flag}"
+                    )
+                out[row, col] = values[:6]
+        return out
 
-        def _compute_vector(code: int, primary: int, fallback: int) -> tuple[float, ...]:
-            try:
-                values, ret_flag = calc_ut_cached(jd_ut, code, primary)
-            except Exception:
-                values, ret_flag = calc_ut_cached(jd_ut, code, fallback)
-            else:
-                if ret_flag < 0 and fallback != primary:
-                    values, ret_flag = calc_ut_cached(jd_ut, code, fallback)
-
-            if ret_flag < 0:
-                raise RuntimeError(f"Swiss ephemeris returned error code {ret_flag}")
-            return tuple(values)
-
-        ecliptic_data: dict[int, tuple[float, ...]] = {}
-        equatorial_data: dict[int, tuple[float, ...]] = {}
-        for code in unique_codes:
-            ecliptic_data[code] = _compute_vector(code, calc_flags, fallback_flags)
-            equatorial_data[code] = _compute_vector(
-                code,
-                calc_flags | equatorial_flag,
-                fallback_flags | equatorial_flag,
+    def compute_bodies_array(
+        self,
+        jd_ut: Sequence[float] | np.ndarray,
+        bodies: Mapping[str, int],
+        *,
+        equatorial: bool = True,
+    ) -> BodyPositionArrays:
+        """Return struct-of-arrays positions for ``bodies`` at every ``jd_ut``.
+
+        Each distinct body code is evaluated once per Julian day in the
+        ecliptic frame; right ascension and declination are obtained by a
+        vectorised rotation through the true obliquity of date.  Frames that
+        cannot be rotated that way issue a second ``FLG_EQUATORIAL`` call.
+        With ``equatorial=False`` the equatorial step is skipped and those
+        fields are ``NaN``.
+        """
+
+        jds = np.atleast_1d(np.asarray(jd_ut, dtype=float))
+        if jds.ndim != 1:
+            raise ValueError("jd_ut must be a scalar or a one-dimensional sequence")
+        self._apply_sidereal_mode()
+        body_specs, codes = self._body_specs(bodies)
+        names = tuple(name for name, _, _ in body_specs)
+        columns = [codes.index(code) for _, code, _ in body_specs]
+        derived = np.array([flag for _, _, flag in body_specs], dtype=bool)
+        jd_list = jds.tolist()
+
+        ecliptic = self._vector_block(jd_list, codes)[:, columns, :]
+        lon = ecliptic[..., 0].copy()
+        lat = ecliptic[..., 1].copy()
+        speed_lat = ecliptic[..., 4].copy()
+        lon[:, derived] += 180.0
+        lat[:, derived] *= -1.0
+        speed_lat[:, derived] *= -1.0
+        lon %= 360.0
+        speed_lon = ecliptic[..., 3]
+
+        if not equatorial:
+            ra = np.full_like(lon, np.nan)
+            dec, speed_ra, speed_dec = ra.copy(), ra.copy(), ra.copy()
+        elif self._rotation_supported():
+            obliquity = np.array(
+                [self._true_obliquity(jd) for jd in jd_list], dtype=float
+            )[:, None]
+            ra, dec, speed_ra, speed_dec = _ecliptic_to_equatorial(
+                lon, lat, speed_lon, speed_lat, obliquity
             )
+        else:
+            vectors = self._vector_block(
+                jd_list, codes, int(_swe().FLG_EQUATORIAL)
+            )[:, columns, :]
+            ra = vectors[..., 0].copy()
+            dec = vectors[..., 1].copy()
+            speed_ra = vectors[..., 3]
+            speed_dec = vectors[..., 4].copy()
+            ra[:, derived] = (ra[:, derived] + 180.0) % 360.0
+            dec[:, derived] *= -1.0
+            speed_dec[:, derived] *= -1.0
+
+        return BodyPositionArrays(
+            bodies=names,
+            julian_day=jds,
+            longitude=lon,
+            latitude=lat,
+            distance_au=ecliptic[..., 2],
+            speed_longitude=speed_lon,
+            speed_latitude=speed_lat,
+            speed_distance=ecliptic[..., 5],
+            right_ascension=ra,
+            declination=dec,
+            speed_ra=speed_ra,
+            speed_declination=speed_dec,
+        )
 
-        positions: dict[str, BodyPosition] = {}
-        for name, effective_code, derived in body_specs:
-            lon, lat, dist, speed_lon, speed_lat, speed_dist = ecliptic_data[
-                effective_code
-            ]
-            if derived:
-                lon = (lon + 180.0) % 360.0
-                lat = -lat
-                speed_lat = -speed_lat
+    def compute_bodies_many(
+        self, jd_ut: float, bodies: Mapping[str, int]
+    ) -> dict[str, BodyPosition]:
+        """Return body positions for ``bodies`` using shared Swiss calls.
 
-            eq_xx = equatorial_data[effective_code]
-            _, decl, _, _, speed_decl, _ = eq_xx
+        When :attr:`use_segment_cache` is set (opt-in through
+        ``ASTROENGINE_SEGMENT_CACHE=1``), vectors are interpolated from the
+        shared :class:`~astroengine.ephemeris.cache.ChebyshevSegmentCache`
+        whose segments are validated to a fixed error bound; otherwise every
+        value comes from an exact Swiss call.  Declinations
+        come from :meth:`compute_bodies_array`, so tropical charts need one
+        Swiss call per body.
+        """
 
-            positions[name] = BodyPosition(
-                body=name,
-                julian_day=jd_ut,
-                longitude=lon % 360.0,
-                latitude=lat,
-                distance_au=dist,
-                speed_longitude=speed_lon,
-                speed_latitude=speed_lat,
-                speed_distance=speed_dist,
-                declination=decl,
-                speed_declination=speed_decl,
-            )
+        if not bodies:
+            return {}
 
-        return positions
+        arrays = self.compute_bodies_array(jd_ut, bodies)
+        return {name: arrays.position(0, name) for name in arrays.bodies}
 
     def body_positions(
         self, jd_ut: float, bodies: Mapping[str, int]
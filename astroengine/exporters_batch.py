@@ -2,11 +2,259 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
 
-from .canonical import events_from_any, parquet_write_canonical
+from .canonical import CANONICAL_COLUMNS, canonical_row_values
 
-__all__ = ["export_parquet_dataset"]
+__all__ = [
+    "PARTITION_COLUMNS",
+    "CanonicalColumnBuffer",
+    "export_parquet_dataset",
+    "stream_parquet_dataset",
+]
+
+PARTITION_COLUMNS = ("natal_id", "event_year")
+
+_STRING_COLUMNS = frozenset(
+    {"ts", "moving", "target", "aspect", "profile_id", "natal_id", "meta_json"}
+)
+_INDEX = {name: index for index, name in enumerate(CANONICAL_COLUMNS)}
+_NATAL = _INDEX["natal_id"]
+_FIXED_ROW_BYTES = 8 * (len(CANONICAL_COLUMNS) - len(_STRING_COLUMNS)) + 4 * len(_STRING_COLUMNS)
+
+
+def _load_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "pyarrow is required for Parquet export. Install 'pyarrow' to enable."
+        ) from exc
+    return pa, pq
+
+
+def _arrow_schema(pa: Any, columns: Sequence[str]) -> Any:
+    types = {
+        "orb": pa.float64(),
+        "orb_abs": pa.float64(),
+        "applying": pa.bool_(),
+        "score": pa.float64(),
+        "event_year": pa.int64(),
+    }
+    return pa.schema([(name, types.get(name, pa.string())) for name in columns])
+
+
+class CanonicalColumnBuffer:
+    """Append-only per-column buffers of canonical event rows.
+
+    Rows are stored column-wise as plain Python lists so an Arrow record batch
+    can be built with one ``pa.array`` call per column.  ``nbytes`` is an
+    estimate of the encoded size used to decide when to flush.
+    """
+
+    __slots__ = ("columns", "_indexes", "_data", "nbytes")
+
+    def __init__(self, columns: Sequence[str] = CANONICAL_COLUMNS) -> None:
+        self.columns = tuple(columns)
+        self._indexes = tuple(_INDEX[name] for name in self.columns)
+        self._data: list[list[Any]] = [[] for _ in self.columns]
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data[0]) if self._data else 0
+
+    def append(self, values: Sequence[Any]) -> None:
+        """Append one row of :data:`~astroengine.canonical.CANONICAL_COLUMNS` values."""
+
+        size = _FIXED_ROW_BYTES
+        for column, index in zip(self._data, self._indexes):
+            value = values[index]
+            column.append(value)
+            if value.__class__ is str:
+                size += len(value)
+        self.nbytes += size
+
+    def to_record_batch(self, schema: Any) -> Any:
+        """Return the buffered rows as a ``pyarrow.RecordBatch`` for ``schema``."""
+
+        import pyarrow as pa
+
+        arrays = [
+            pa.array(column, type=field.type) for column, field in zip(self._data, schema)
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def clear(self) -> None:
+        for column in self._data:
+            column.clear()
+        self.nbytes = 0
+
+
+class _PartitionedWriter:
+    """Route rows to per-partition buffers and Parquet files under ``root``.
+
+    With no partition columns every row shares one buffer; ``single_file``
+    then names the output file instead of ``root/part-N.parquet``.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        partition_by: Sequence[str],
+        *,
+        single_file: Path | None = None,
+        compression: str,
+        max_batch_rows: int,
+        max_buffer_bytes: int,
+        max_open_files: int,
+    ) -> None:
+        self._pa, self._pq = _load_pyarrow()
+        self.root = root
+        self.single_file = single_file
+        self.partition_by = tuple(partition_by)
+        self._keys = tuple(_INDEX[name] for name in self.partition_by)
+        self.file_columns = tuple(c for c in CANONICAL_COLUMNS if c not in self.partition_by)
+        self.schema = _arrow_schema(self._pa, self.file_columns)
+        self.compression = compression
+        self.max_batch_rows = max_batch_rows
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_open_files = max_open_files
+        self._buffers: dict[tuple[Any, ...], CanonicalColumnBuffer] = {}
+        self._writers: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self._parts: dict[tuple[Any, ...], int] = {}
+        self._buffered_bytes = 0
+
+    def write(self, values: Sequence[Any]) -> None:
+        key = tuple(values[index] for index in self._keys)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = CanonicalColumnBuffer(self.file_columns)
+        before = buffer.nbytes
+        buffer.append(values)
+        self._buffered_bytes += buffer.nbytes - before
+        if len(buffer) >= self.max_batch_rows:
+            self._flush(key)
+        while self._buffered_bytes > self.max_buffer_bytes and self._buffers:
+            self._flush(max(self._buffers, key=lambda k: self._buffers[k].nbytes))
+
+    def _file_path(self, key: tuple[Any, ...]) -> Path:
+        if self.single_file is not None:
+            return self.single_file
+        directory = self.root
+        for name, value in zip(self.partition_by, key):
+            directory = directory / f"{name}={quote(str(value), safe='')}"
+        part = self._parts.get(key, 0)
+        self._parts[key] = part + 1
+        return directory / f"part-{part}.parquet"
+
+    def _writer(self, key: tuple[Any, ...]) -> Any:
+        writer = self._writers.get(key)
+        if writer is not None:
+            self._writers.move_to_end(key)
+            return writer
+        while len(self._writers) >= self.max_open_files:
+            _, oldest = self._writers.popitem(last=False)
+            oldest.close()
+        target = self._file_path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        writer = self._pq.ParquetWriter(
+            str(target),
+            self.schema,
+            compression=self.compression,
+        )
+        self._writers[key] = writer
+        return writer
+
+    def _flush(self, key: tuple[Any, ...]) -> None:
+        buffer = self._buffers.pop(key)
+        self._buffered_bytes -= buffer.nbytes
+        if len(buffer):
+            self._writer(key).write_batch(buffer.to_record_batch(self.schema))
+
+    def close(self, *, flush: bool = True) -> None:
+        try:
+            if flush:
+                for key in list(self._buffers):
+                    self._flush(key)
+        finally:
+            for writer in self._writers.values():
+                writer.close()
+            self._writers.clear()
+
+
+def stream_parquet_dataset(
+    path: str | Path,
+    events: Iterable[Mapping[str, object] | object],
+    *,
+    partition_by: Sequence[str] | None = PARTITION_COLUMNS,
+    compression: str = "snappy",
+    max_batch_rows: int = 65_536,
+    max_buffer_bytes: int = 64 * 1024 * 1024,
+    max_open_files: int = 64,
+) -> int:
+    """Stream canonical events into Parquet with bounded memory.
+
+    Events are consumed one at a time and appended straight into column
+    buffers, so memory stays proportional to ``max_buffer_bytes`` rather than
+    to the input size.  A buffer is written as a record batch once it reaches
+    ``max_batch_rows``; when all buffers together exceed ``max_buffer_bytes``
+    the largest is flushed early.
+
+    Parameters
+    ----------
+    path:
+        Destination. A path ending with ``.parquet`` is written as a single
+        file; otherwise a Hive-style dataset directory partitioned by
+        ``partition_by`` is created (``natal_id=.../event_year=.../part-N.parquet``).
+    events:
+        Iterable (typically a generator) of mappings or objects accepted by
+        :func:`astroengine.canonical.event_from_legacy`.
+    partition_by:
+        Subset of :data:`PARTITION_COLUMNS`, in directory order.  Ignored for
+        single-file output.
+    max_open_files:
+        Upper bound on simultaneously open partition files; the least recently
+        used writer is closed and a new part file is started if its partition
+        receives more rows later.
+    """
+
+    if max_batch_rows <= 0 or max_buffer_bytes <= 0 or max_open_files <= 0:
+        raise ValueError("batch, buffer and open-file limits must be positive")
+    target = Path(path)
+    single_file = str(path).endswith(".parquet")
+    partitions = () if single_file else tuple(partition_by or ())
+    unknown = set(partitions) - set(PARTITION_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unsupported partition columns: {sorted(unknown)}")
+
+    writer = _PartitionedWriter(
+        target,
+        partitions,
+        single_file=target if single_file else None,
+        compression=compression,
+        max_batch_rows=max_batch_rows,
+        max_buffer_bytes=max_buffer_bytes,
+        max_open_files=max_open_files,
+    )
+
+    total = 0
+    try:
+        for obj in events:
+            values = canonical_row_values(obj)
+            if values[_NATAL] is None:
+                values = values[:_NATAL] + ("unknown",) + values[_NATAL + 1 :]
+            writer.write(values)
+            total += 1
+    except BaseException:
+        writer.close(flush=False)
+        raise
+    writer.close()
+    return total
 
 
 def export_parquet_dataset(
@@ -16,6 +264,9 @@ def export_parquet_dataset(
         | Iterable[Mapping[str, object]]
         | Iterable[object]
     ),
+    *,
+    partition_by: Sequence[str] | None = PARTITION_COLUMNS,
+    compression: str = "snappy",
 ) -> int:
     """Write canonical events to a Parquet file or dataset directory.
 
@@ -26,8 +277,10 @@ def export_parquet_dataset(
         written, otherwise a partitioned dataset directory is created.
     events:
         Iterable of mappings or objects consumable by
-        :func:`astroengine.canonical.events_from_any`.
+        :func:`astroengine.canonical.events_from_any`.  The input is streamed
+        through :func:`stream_parquet_dataset` and never materialised.
     """
 
-    canonical = events_from_any(events)
-    return parquet_write_canonical(path, canonical)
+    return stream_parquet_dataset(
+        path, events, partition_by=partition_by, compression=compression
+    )
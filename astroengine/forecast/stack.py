@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Iterable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Protocol
 
-from ..chart import NatalChart, TransitScanner
+import numpy as np
+
+from ..chart import NatalChart
 from ..chart.natal import DEFAULT_BODIES
 from ..config.settings import Settings
 from ..core.transit_engine import scan_transits
 from ..detectors.directed_aspects import solar_arc_natal_aspects
 from ..detectors.progressed_aspects import progressed_natal_aspects
 from ..detectors_aspects import AspectHit
+from ..ephemeris import SwissEphemerisAdapter
+from ..scoring import OrbCalculator
 
 __all__ = [
     "ForecastEvent",
@@ -158,51 +163,231 @@ def _speed_hours(speed_deg_per_day: float | None, orb_allow: float) -> float:
     return (orb_allow / abs(speed_deg_per_day)) * 24.0
 
 
-def _transit_window(
-    scanner: TransitScanner,
-    natal_chart: NatalChart,
+def _progression_window(
     hit: AspectHit,
     *,
     window: ForecastWindow,
 ) -> tuple[datetime, datetime]:
     center = datetime.fromisoformat(hit.when_iso.replace("Z", "+00:00")).astimezone(UTC)
-    contacts = scanner.scan(natal_chart, center)
-    angle = int(round(float(hit.angle_deg)))
-    for contact in contacts:
-        if (
-            contact.transiting_body.lower() == hit.moving.lower()
-            and contact.natal_body.lower() == hit.target.lower()
-            and contact.angle == angle
-        ):
-            start_dt = contact.ingress.astimezone(UTC) if contact.ingress else center
-            end_dt = contact.egress.astimezone(UTC) if contact.egress else center
-            if end_dt < start_dt:
-                start_dt, end_dt = end_dt, start_dt
-            start_dt = max(start_dt, window.start)
-            end_dt = min(end_dt, window.end)
-            return start_dt, end_dt
-    code = DEFAULT_BODIES.get(hit.moving)
-    if code is not None:
-        moment = center
-        adapter = scanner.adapter
-        jd = adapter.julian_day(moment)
-        sample = adapter.body_position(jd, code, body_name=hit.moving)
-        speed = float(sample.speed_longitude)
-    else:
-        speed = 0.0
+    speed = float(getattr(hit, "speed_deg_per_day", 0.0) or 0.0)
     span_hours = _speed_hours(speed, float(hit.orb_allow))
     return _clamp_window(center, window, span_hours=span_hours)
 
 
-def _progression_window(
+# Spacing of the motion grid sampled alongside each transit chunk; Hermite
+# interpolation on it resolves contact boundaries to well under a minute.
+_MOTION_STEP = timedelta(hours=6)
+_BOUNDARY_TOLERANCE_DAYS = 1.0 / 86400.0
+
+
+@dataclass(frozen=True, slots=True)
+class _ChunkTask:
+    natal_iso: str
+    origin: datetime
+    start: datetime
+    end: datetime
+    aspects: tuple[str, ...]
+    orb_deg: float
+    bodies: tuple[tuple[str, int], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _ChunkResult:
+    hits: list[AspectHit]
+    days: np.ndarray
+    longitude: np.ndarray
+    speed: np.ndarray
+
+
+_WORKER_ADAPTER: SwissEphemerisAdapter | None = None
+
+
+def _init_chunk_worker() -> None:
+    """Give each pool worker its own adapter and Swiss Ephemeris state."""
+
+    global _WORKER_ADAPTER
+    _WORKER_ADAPTER = SwissEphemerisAdapter()
+
+
+def _sample_motion(
+    origin: datetime,
+    start: datetime,
+    end: datetime,
+    bodies: Mapping[str, int],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(days, longitude, speed)`` sampled every :data:`_MOTION_STEP`.
+
+    ``days`` counts from ``origin`` so chunks sampled in different processes
+    share one time axis.
+    """
+
+    adapter = _WORKER_ADAPTER or SwissEphemerisAdapter.get_default_adapter()
+    step_days = _MOTION_STEP.total_seconds() / 86400.0
+    first = (start - origin).total_seconds() / 86400.0
+    last = (end - origin).total_seconds() / 86400.0
+    count = max(2, math.ceil((last - first) / step_days) + 1)
+    days = np.minimum(first + np.arange(count) * step_days, last)
+    arrays = adapter.compute_bodies_array(adapter.julian_day(origin) + days, bodies)
+    return days, np.asarray(arrays.longitude), np.asarray(arrays.speed_longitude)
+
+
+def _scan_chunk(task: _ChunkTask) -> _ChunkResult:
+    """Find transit hits in one chunk and sample the motion behind them."""
+
+    hits = scan_transits(
+        natal_ts=task.natal_iso,
+        start_ts=_isoformat(task.start),
+        end_ts=_isoformat(task.end),
+        aspects=list(task.aspects),
+        orb_deg=task.orb_deg,
+        bodies=None,
+        targets=None,
+        step_days=1.0,
+    )
+    days, longitude, speed = _sample_motion(
+        task.origin, task.start, task.end, dict(task.bodies)
+    )
+    return _ChunkResult(hits=list(hits), days=days, longitude=longitude, speed=speed)
+
+
+class _MotionGrid:
+    """Longitudes stitched from chunk samples with Hermite interpolation."""
+
+    def __init__(
+        self, origin: datetime, bodies: Sequence[str], results: Sequence[_ChunkResult]
+    ) -> None:
+        self.origin = origin
+        self._columns = {name: index for index, name in enumerate(bodies)}
+        days: list[np.ndarray] = []
+        longitude: list[np.ndarray] = []
+        speed: list[np.ndarray] = []
+        last = -math.inf
+        for result in sorted(results, key=lambda item: float(item.days[0])):
+            keep = result.days > last
+            days.append(result.days[keep])
+            longitude.append(result.longitude[keep])
+            speed.append(result.speed[keep])
+            last = float(result.days[-1])
+        self._days = np.concatenate(days)
+        self._longitude = np.unwrap(np.concatenate(longitude), period=360.0, axis=0)
+        self._speed = np.concatenate(speed)
+
+    def day(self, moment: datetime) -> float:
+        return (moment - self.origin).total_seconds() / 86400.0
+
+    def moment(self, day: float) -> datetime:
+        return self.origin + timedelta(days=day)
+
+    def has(self, body: str) -> bool:
+        return body in self._columns
+
+    def _interpolate(self, col: int, day: float) -> tuple[float, float]:
+        knots = self._days
+        index = int(np.clip(np.searchsorted(knots, day, side="right") - 1, 0, knots.size - 2))
+        width = float(knots[index + 1] - knots[index])
+        t = (day - float(knots[index])) / width
+        p0 = float(self._longitude[index, col])
+        p1 = float(self._longitude[index + 1, col])
+        m0 = float(self._speed[index, col]) * width
+        m1 = float(self._speed[index + 1, col]) * width
+        t2 = t * t
+        t3 = t2 * t
+        value = (
+            (2 * t3 - 3 * t2 + 1) * p0
+            + (t3 - 2 * t2 + t) * m0
+            + (-2 * t3 + 3 * t2) * p1
+            + (t3 - t2) * m1
+        )
+        slope = (
+            (6 * t2 - 6 * t) * (p0 - p1) + (3 * t2 - 4 * t + 1) * m0 + (3 * t2 - 2 * t) * m1
+        ) / width
+        return value, slope
+
+    def speed(self, body: str, day: float) -> float:
+        return self._interpolate(self._columns[body], day)[1]
+
+    def contact_window(
+        self,
+        body: str,
+        day: float,
+        *,
+        target_lon: float,
+        angle: float,
+        threshold: float,
+    ) -> tuple[float, float] | None:
+        """Return ``(ingress, egress)`` days around ``day`` or ``None``.
+
+        Boundaries that lie beyond the sampled span are reported at the
+        span's edges.  ``None`` means ``day`` itself is outside the orb.
+        """
+
+        col = self._columns[body]
+
+        def excess(values: np.ndarray | float) -> np.ndarray | float:
+            delta = np.mod(np.asarray(values) - target_lon, 360.0)
+            return np.abs(np.minimum(delta, 360.0 - delta) - angle) - threshold
+
+        def excess_at(point: float) -> float:
+            return float(excess(self._interpolate(col, point)[0]))
+
+        if excess_at(day) > 1e-9:
+            return None
+
+        def refine(inside: float, outside: float) -> float:
+            while abs(outside - inside) > _BOUNDARY_TOLERANCE_DAYS:
+                mid = 0.5 * (inside + outside)
+                if excess_at(mid) > 0.0:
+                    outside = mid
+                else:
+                    inside = mid
+            return 0.5 * (inside + outside)
+
+        knots = self._days
+        outside = np.flatnonzero(excess(self._longitude[:, col]) > 0.0)
+
+        before = outside[knots[outside] < day]
+        if before.size:
+            index = int(before[-1])
+            ingress = refine(min(float(knots[index + 1]), day), float(knots[index]))
+        else:
+            ingress = float(knots[0])
+
+        after = outside[knots[outside] > day]
+        if after.size:
+            index = int(after[0])
+            inside = max(float(knots[index - 1]), day) if index else day
+            egress = refine(inside, float(knots[index]))
+        else:
+            egress = float(knots[-1])
+        return ingress, egress
+
+
+def _transit_window(
+    grid: _MotionGrid,
+    orbs: OrbCalculator,
     hit: AspectHit,
     *,
     window: ForecastWindow,
 ) -> tuple[datetime, datetime]:
     center = datetime.fromisoformat(hit.when_iso.replace("Z", "+00:00")).astimezone(UTC)
-    speed = float(getattr(hit, "speed_deg_per_day", 0.0) or 0.0)
-    span_hours = _speed_hours(speed, float(hit.orb_allow))
-    return _clamp_window(center, window, span_hours=span_hours)
+    if not grid.has(hit.moving):
+        return _clamp_window(center, window, span_hours=0.0)
+    day = grid.day(center)
+    threshold = orbs.orb_for(hit.moving, hit.target, float(hit.angle_deg))
+    bounds = grid.contact_window(
+        hit.moving,
+        day,
+        target_lon=float(hit.lon_target),
+        angle=float(hit.angle_deg),
+        threshold=threshold,
+    )
+    if bounds is None:
+        speed = grid.speed(hit.moving, day)
+        span_hours = _speed_hours(speed, float(hit.orb_allow))
+        return _clamp_window(center, window, span_hours=span_hours)
+    start_dt = max(grid.moment(bounds[0]), window.start)
+    end_dt = min(grid.moment(bounds[1]), window.end)
+    return start_dt, end_dt
 
 
 def _transit_events(
@@ -213,6 +398,14 @@ def _transit_events(
     start_iso: str,
     end_iso: str,
 ) -> Iterable[ForecastEvent]:
+    """Return transit events with contact windows from one ephemeris pass.
+
+    Each chunk returns its hits together with a batched motion grid for the
+    moving bodies, so ingress/egress for every hit are solved on the stitched
+    grid instead of re-scanning the ephemeris per hit.  Chunks fan out to a
+    process pool when ``settings.perf.workers`` allows it.
+    """
+
     aspects = _resolve_transit_aspects(settings)
     if not aspects:
         return []
@@ -232,36 +425,36 @@ def _transit_events(
     except (TypeError, ValueError):
         worker_count = 1
 
-    chunks = _chunk_window(chart.window, max_days)
-
-    def _scan_chunk(bounds: tuple[datetime, datetime]) -> list[AspectHit]:
-        chunk_start, chunk_end = bounds
-        return scan_transits(
-            natal_ts=natal_iso,
-            start_ts=_isoformat(chunk_start),
-            end_ts=_isoformat(chunk_end),
-            aspects=aspects,
+    bodies = tuple((name, int(code)) for name, code in DEFAULT_BODIES.items())
+    tasks = [
+        _ChunkTask(
+            natal_iso=natal_iso,
+            origin=chart.window.start,
+            start=chunk_start,
+            end=chunk_end,
+            aspects=tuple(aspects),
             orb_deg=orb_allow,
-            bodies=None,
-            targets=None,
-            step_days=1.0,
+            bodies=bodies,
         )
+        for chunk_start, chunk_end in _chunk_window(chart.window, max_days)
+    ]
 
-    hits: list[AspectHit] = []
-    if worker_count > 1 and len(chunks) > 1:
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            futures = [executor.submit(_scan_chunk, bounds) for bounds in chunks]
-            for future in futures:
-                hits.extend(future.result())
+    if worker_count > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(worker_count, len(tasks)),
+            initializer=_init_chunk_worker,
+        ) as pool:
+            results = list(pool.map(_scan_chunk, tasks))
     else:
-        for bounds in chunks:
-            hits.extend(_scan_chunk(bounds))
+        results = [_scan_chunk(task) for task in tasks]
 
+    hits = [hit for result in results for hit in result.hits]
     hits.sort(key=lambda item: getattr(item, "when_iso", ""))
-    scanner = TransitScanner()
+    grid = _MotionGrid(chart.window.start, [name for name, _ in bodies], results)
+    orbs = OrbCalculator()
     events: list[ForecastEvent] = []
     for hit in hits:
-        start_dt, end_dt = _transit_window(scanner, chart.natal_chart, hit, window=chart.window)
+        start_dt, end_dt = _transit_window(grid, orbs, hit, window=chart.window)
         events.append(
             ForecastEvent(
                 start=start_dt,
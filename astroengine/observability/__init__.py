@@ -12,6 +12,10 @@ from .metrics import (
     EPHEMERIS_CACHE_HITS,
     EPHEMERIS_CACHE_MISSES,
     EPHEMERIS_SWE_CACHE_HIT_RATIO,
+    POSITION_CACHE_ENTRIES,
+    POSITION_CACHE_EVICTIONS,
+    POSITION_CACHE_HITS,
+    POSITION_CACHE_MISSES,
     PROVIDER_CACHE_HITS,
     PROVIDER_FAILURES,
     PROVIDER_QUERIES,
@@ -32,6 +36,10 @@ __all__ = [
     "EPHEMERIS_CACHE_MISSES",
     "EPHEMERIS_CACHE_COMPUTE_DURATION",
     "EPHEMERIS_SWE_CACHE_HIT_RATIO",
+    "POSITION_CACHE_ENTRIES",
+    "POSITION_CACHE_EVICTIONS",
+    "POSITION_CACHE_HITS",
+    "POSITION_CACHE_MISSES",
     "PROVIDER_CACHE_HITS",
     "PROVIDER_FAILURES",
     "PROVIDER_QUERIES",
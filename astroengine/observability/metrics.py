@@ -15,11 +15,17 @@ __all__ = [
     "EPHEMERIS_CACHE_HITS",
     "EPHEMERIS_CACHE_MISSES",
     "EPHEMERIS_SWE_CACHE_HIT_RATIO",
+    "POSITION_CACHE_ENTRIES",
+    "POSITION_CACHE_EVICTIONS",
+    "POSITION_CACHE_HITS",
+    "POSITION_CACHE_MISSES",
     "PROVIDER_CACHE_HITS",
     "PROVIDER_FAILURES",
     "PROVIDER_QUERIES",
     "PROVIDER_REGISTRATIONS",
     "PROVIDER_REGISTRY_ACTIVE",
+    "RATE_LIMIT_REJECTIONS",
+    "RATE_LIMIT_STORE_ERRORS",
     "ProviderMetricRecorder",
     "ensure_metrics_registered",
     "get_provider_metrics",
@@ -78,6 +84,30 @@ EPHEMERIS_SWE_CACHE_HIT_RATIO = Gauge(
 )
 
 
+POSITION_CACHE_HITS = Counter(
+    "astroengine_position_cache_hits_total",
+    "Body positions served from the shared cross-request position cache.",
+    registry=None,
+)
+
+POSITION_CACHE_MISSES = Counter(
+    "astroengine_position_cache_misses_total",
+    "Body positions the shared position cache had to request from a provider.",
+    registry=None,
+)
+
+POSITION_CACHE_EVICTIONS = Counter(
+    "astroengine_position_cache_evictions_total",
+    "Entries evicted from the shared position cache by its LRU bound.",
+    registry=None,
+)
+
+POSITION_CACHE_ENTRIES = Gauge(
+    "astroengine_position_cache_entries",
+    "Number of body positions currently held by the shared position cache.",
+    registry=None,
+)
+
 COMPUTE_ERRORS = Counter(
     "astroengine_compute_errors_total",
     "Count of runtime failures across compute-heavy routines.",
@@ -86,6 +116,21 @@ COMPUTE_ERRORS = Counter(
 )
 
 
+RATE_LIMIT_REJECTIONS = Counter(
+    "astroengine_rate_limit_rejected_total",
+    "Requests rejected by API token-bucket rate limiters.",
+    ("scope",),
+    registry=None,
+)
+
+RATE_LIMIT_STORE_ERRORS = Counter(
+    "astroengine_rate_limit_store_errors_total",
+    "Rate-limit store failures answered from the in-process fallback buckets.",
+    ("store",),
+    registry=None,
+)
+
+
 def _iter_metrics() -> Iterable[Counter | Gauge | Histogram]:
     yield ASPECT_COMPUTE_DURATION
     yield DIRECTION_COMPUTE_DURATION
@@ -94,7 +139,13 @@ def _iter_metrics() -> Iterable[Counter | Gauge | Histogram]:
     yield EPHEMERIS_CACHE_MISSES
     yield EPHEMERIS_CACHE_COMPUTE_DURATION
     yield EPHEMERIS_SWE_CACHE_HIT_RATIO
+    yield POSITION_CACHE_HITS
+    yield POSITION_CACHE_MISSES
+    yield POSITION_CACHE_EVICTIONS
+    yield POSITION_CACHE_ENTRIES
     yield COMPUTE_ERRORS
+    yield RATE_LIMIT_REJECTIONS
+    yield RATE_LIMIT_STORE_ERRORS
     yield PROVIDER_REGISTRATIONS
     yield PROVIDER_REGISTRY_ACTIVE
     yield PROVIDER_QUERIES
@@ -7,8 +7,11 @@ from collections.abc import Sequence
 from datetime import date
 from pathlib import Path
 
-from ..cache.positions_cache import warm_daily
+from ..cache.positions_cache import backfill_store
 from ..detectors.common import enable_cache, iso_to_jd
+from ..ephemeris import SwissEphemerisAdapter
+from ..ephemeris.cache import warm_segments
+from ..ephemeris.swe import swe
 
 DEFAULT_BODIES: Sequence[str] = (
     "sun",
@@ -60,7 +63,10 @@ def warm_ephemeris_cache(
     start: date = DEFAULT_START,
     end: date = DEFAULT_END,
 ) -> tuple[str, str, int]:
-    """Warm the daily ephemeris cache between ``start`` and ``end`` (inclusive)."""
+    """Backfill the memory-mapped daily positions store for ``start``..``end``.
+
+    Returns the ISO bounds and the number of newly computed (day, body) cells.
+    """
 
     if end < start:
         raise ValueError("end date must not be before start date")
@@ -70,10 +76,42 @@ def warm_ephemeris_cache(
 
     start_iso = start.isoformat()
     end_iso = end.isoformat()
-    entries = warm_daily(bodies, iso_to_jd(start_iso), iso_to_jd(end_iso))
+    entries = backfill_store(bodies, iso_to_jd(start_iso), iso_to_jd(end_iso))
     return start_iso, end_iso, int(entries)
 
 
+def warm_segment_cache(
+    bodies: Sequence[str] = DEFAULT_BODIES,
+    *,
+    start: date = DEFAULT_START,
+    end: date = DEFAULT_END,
+) -> int:
+    """Build Chebyshev segment tables used by ``compute_bodies_many``.
+
+    Tables cover the ecliptic and equatorial flag-sets of the default
+    adapter and are written beneath ``$ASTROENGINE_HOME/cache/chebyshev``.
+    """
+
+    if end < start:
+        raise ValueError("end date must not be before start date")
+
+    _ensure_environment()
+    adapter = SwissEphemerisAdapter()
+    codes = []
+    for name in bodies:
+        code = getattr(swe(), name.upper(), None)
+        if code is not None:
+            codes.append(int(code))
+    flags = int(adapter._calc_flags)
+    flag_sets = (flags, flags | int(swe().FLG_EQUATORIAL))
+    return warm_segments(
+        codes,
+        flag_sets,
+        iso_to_jd(start.isoformat()),
+        iso_to_jd(end.isoformat()) + 1.0,
+    )
+
+
 def main() -> int:
     """CLI entry point used by the Makefile target."""
 
@@ -81,9 +119,10 @@ def main() -> int:
     start = _parse_date_env("AE_WARM_START", DEFAULT_START)
     end = _parse_date_env("AE_WARM_END", DEFAULT_END)
     start_iso, end_iso, entries = warm_ephemeris_cache(bodies, start=start, end=end)
+    segments = warm_segment_cache(bodies, start=start, end=end)
     print(
         f"Cache warmed [{', '.join(bodies)}] for {start_iso} "
-        f"→ {end_iso} ({entries} entries)"
+        f"→ {end_iso} ({entries} entries, {segments} Chebyshev segments)"
     )
     return 0
 
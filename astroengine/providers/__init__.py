@@ -98,6 +98,10 @@ class EphemerisProvider(Protocol):
 
         ...
 
+    # Providers may additionally implement ``positions_ecliptic_jd(jd_utc, bodies)``
+    # accepting a UTC Julian day; dense scanners use it via
+    # :func:`astroengine.core.ticks.positions_at` to skip ISO round-trips.
+
     def position(self, body: str, ts_utc: str) -> BodyPosition:
         """Fetch a canonical body position at the supplied UTC timestamp."""
 
@@ -10,6 +10,7 @@ LOG = logging.getLogger(__name__)
 
 from astroengine.canonical import BodyPosition
 from astroengine.core.bodies import canonical_name
+from astroengine.core.ticks import utc_datetime_from_jd
 from astroengine.core.time import TimeConversion, to_tt
 from astroengine.ephemeris import (
     EphemerisAdapter,
@@ -198,6 +199,11 @@ class SwissProvider:
         except AttributeError:  # pragma: no cover - legacy adapter fallback
             self._adapter = EphemerisAdapter(new_config)
 
+    def cache_fingerprint(self) -> tuple[object, ...]:
+        """Return the configuration that determines this provider's output."""
+
+        return (self._config, self._variant_config)
+
     @staticmethod
     def _normalize_iso(iso_utc: str) -> datetime:
         dt = datetime.fromisoformat(iso_utc.replace("Z", "+00:00"))
@@ -243,7 +249,18 @@ class SwissProvider:
         self, iso_utc: str, bodies: Iterable[str]
     ) -> dict[str, dict[str, float]]:
 
-        conversion = self._time_conversion(iso_utc)
+        return self._positions_for(self._time_conversion(iso_utc), bodies)
+
+    def positions_ecliptic_jd(
+        self, jd_utc: float, bodies: Iterable[str]
+    ) -> dict[str, dict[str, float]]:
+        """Return ecliptic positions for a UTC Julian day without ISO parsing."""
+
+        return self._positions_for(to_tt(utc_datetime_from_jd(jd_utc)), bodies)
+
+    def _positions_for(
+        self, conversion: TimeConversion, bodies: Iterable[str]
+    ) -> dict[str, dict[str, float]]:
         out: dict[str, dict[str, float]] = {}
         issues: list[SupportIssue] = []
         for name in bodies:
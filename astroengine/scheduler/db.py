@@ -44,16 +44,27 @@ def _close_connection() -> None:
         _connection = None
 
 
+def open_connection() -> sqlite3.Connection:
+    """Open a new connection to the queue database.
+
+    SQLite connections are bound to the thread that created them, so
+    background threads (e.g. heartbeat senders) open their own.
+    """
+
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(DB_PATH)
+    con.row_factory = sqlite3.Row
+    apply_default_pragmas(con)
+    con.executescript(DDL)
+    return con
+
+
 def get_connection() -> sqlite3.Connection:
     global _connection
     if _connection is None:
         with _connection_lock:
             if _connection is None:
-                DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-                con = sqlite3.connect(DB_PATH)
-                con.row_factory = sqlite3.Row
-                apply_default_pragmas(con)
-                con.executescript(DDL)
+                con = open_connection()
                 atexit.register(_close_connection)
                 _connection = con
     return _connection
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import sqlite3
 import uuid
+from collections.abc import Iterable
 from typing import Any
 
 from .db import get_connection, now
@@ -61,7 +62,11 @@ def _recover_stale(cur: sqlite3.Cursor, t: int) -> None:
     )
 
 
-def claim_one() -> dict[str, Any] | None:
+def claim_batch(limit: int) -> list[dict[str, Any]]:
+    """Claim up to ``limit`` runnable jobs in a single write transaction."""
+
+    if limit <= 0:
+        return []
     con = get_connection()
     cur = con.cursor()
     t = now()
@@ -70,53 +75,97 @@ def claim_one() -> dict[str, Any] | None:
         cur.execute("BEGIN IMMEDIATE")
         _recover_stale(cur, t)
 
-        while True:
-            row = cur.execute(
-                """
-                SELECT * FROM jobs
-                 WHERE state='queued'
-                   AND (run_at IS NULL OR run_at <= ?)
-                   AND (backoff_until IS NULL OR backoff_until <= ?)
-                 ORDER BY priority ASC, COALESCE(run_at, 0) ASC, created_at ASC
-                 LIMIT 1
-                """,
-                (t, t),
-            ).fetchone()
-            if row is None:
-                con.commit()
-                return None
-
-            jid = row["id"]
-            cur.execute(
-                """
-                UPDATE jobs
-                   SET state='running',
-                       attempts=attempts+1,
-                       heartbeat_at=?,
-                       updated_at=?
-                 WHERE id=? AND state='queued'
-                """,
-                (t, t, jid),
-            )
-            if cur.rowcount:
-                job_row = cur.execute(
-                    "SELECT * FROM jobs WHERE id=?", (jid,)
-                ).fetchone()
-                con.commit()
-                return dict(job_row) if job_row else None
-            # Another worker claimed it; try again.
+        rows = cur.execute(
+            """
+            SELECT id FROM jobs
+             WHERE state='queued'
+               AND (run_at IS NULL OR run_at <= ?)
+               AND (backoff_until IS NULL OR backoff_until <= ?)
+             ORDER BY priority ASC, COALESCE(run_at, 0) ASC, created_at ASC
+             LIMIT ?
+            """,
+            (t, t, int(limit)),
+        ).fetchall()
+        if not rows:
+            con.commit()
+            return []
+
+        ids = [str(row["id"]) for row in rows]
+        marks = ",".join("?" * len(ids))
+        # BEGIN IMMEDIATE holds the write lock, so no other worker can
+        # claim these rows between the SELECT and the UPDATE.
+        cur.execute(
+            f"""
+            UPDATE jobs
+               SET state='running',
+                   attempts=attempts+1,
+                   heartbeat_at=?,
+                   updated_at=?
+             WHERE state='queued' AND id IN ({marks})
+            """,
+            (t, t, *ids),
+        )
+        claimed = {
+            str(row["id"]): dict(row)
+            for row in cur.execute(
+                f"SELECT * FROM jobs WHERE id IN ({marks})", ids
+            ).fetchall()
+        }
+        con.commit()
+        return [claimed[jid] for jid in ids if jid in claimed]
+    except BaseException:
+        con.rollback()
+        raise
     finally:
         cur.close()
 
 
+def claim_one() -> dict[str, Any] | None:
+    jobs = claim_batch(1)
+    return jobs[0] if jobs else None
+
+
 def heartbeat(job_id: str) -> None:
+    heartbeat_many([job_id])
+
+
+def heartbeat_many(
+    job_ids: Iterable[str], *, con: sqlite3.Connection | None = None
+) -> None:
+    """Refresh the lease on every running job in ``job_ids``."""
+
+    ids = list(job_ids)
+    if not ids:
+        return
+    con = con if con is not None else get_connection()
+    t = now()
+    cur = con.cursor()
+    try:
+        cur.execute(
+            f"UPDATE jobs SET heartbeat_at=?, updated_at=? "
+            f"WHERE state='running' AND id IN ({','.join('?' * len(ids))})",
+            (t, t, *ids),
+        )
+        con.commit()
+    finally:
+        cur.close()
+
+
+def requeue(job_ids: Iterable[str]) -> None:
+    """Return claimed jobs to the queue without counting the attempt."""
+
+    ids = list(job_ids)
+    if not ids:
+        return
     con = get_connection()
     t = now()
     cur = con.cursor()
     try:
         cur.execute(
-            "UPDATE jobs SET heartbeat_at=?, updated_at=? WHERE id=? AND state='running'",
-            (t, t, job_id),
+            f"UPDATE jobs SET state='queued', attempts=MAX(attempts-1, 0), "
+            f"heartbeat_at=NULL, updated_at=? "
+            f"WHERE state='running' AND id IN ({','.join('?' * len(ids))})",
+            (t, *ids),
         )
         con.commit()
     finally:
@@ -3,9 +3,21 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import signal
+import sqlite3
+import threading
 import time
 import traceback
 from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from threading import Event
 from typing import Any
 
@@ -13,7 +25,8 @@ from app.devmode.backups import run_backup_job
 
 from ..detectors.directed_aspects import solar_arc_natal_aspects
 from ..detectors.progressed_aspects import progressed_natal_aspects
-from .queue import claim_one, done, fail, heartbeat
+from .db import open_connection
+from .queue import claim_batch, claim_one, done, fail, heartbeat_many, requeue
 
 LOG = logging.getLogger(__name__)
 
@@ -33,6 +46,73 @@ def _summarize_result(result: Any) -> dict[str, Any]:
     return {"ok": True}
 
 
+def _run_job(jtype: str, payload: dict[str, Any]) -> tuple[bool, Any]:
+    """Execute one job and return ``(ok, summary_or_error)``.
+
+    Runs inside pool processes, so only the small summary crosses the
+    process boundary rather than the handler's full result.
+    """
+
+    try:
+        handler = HANDLERS.get(jtype)
+        if handler is None:
+            raise RuntimeError(f"No handler for {jtype}")
+        return True, _summarize_result(handler(payload))
+    except Exception as exc:
+        return False, f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}"
+
+
+class _HeartbeatThread(threading.Thread):
+    """Refresh job leases in the background while handlers run."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="astroengine-scheduler-heartbeat", daemon=True)
+        self._interval = interval
+        self._jobs: set[str] = set()
+        self._lock = threading.Lock()
+        self._stopped = Event()
+
+    def add(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.add(job_id)
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.discard(job_id)
+
+    def run(self) -> None:
+        con = open_connection()
+        try:
+            while not self._stopped.wait(self._interval):
+                with self._lock:
+                    ids = list(self._jobs)
+                try:
+                    heartbeat_many(ids, con=con)
+                except sqlite3.Error as exc:
+                    LOG.warning("Scheduler heartbeat failed: %s", exc)
+        finally:
+            con.close()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def _start_heartbeat(heartbeat_sec: float) -> _HeartbeatThread | None:
+    if heartbeat_sec <= 0:
+        return None
+    beats = _HeartbeatThread(heartbeat_sec)
+    beats.start()
+    return beats
+
+
+def _finish(job_id: str, ok: bool, outcome: Any) -> None:
+    if ok:
+        done(job_id, {"summary": outcome})
+    else:
+        fail(job_id, error=str(outcome))
+
+
 def run_worker(
     sleep_sec: float = 1.0,
     heartbeat_sec: float = 10.0,
@@ -41,39 +121,183 @@ def run_worker(
     max_iterations: int | None = None,
 ) -> None:
     iterations = 0
+    beats = _start_heartbeat(heartbeat_sec)
+
+    try:
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                break
+            if max_iterations is not None and iterations >= max_iterations:
+                break
+
+            job = claim_one()
+            iterations += 1
+
+            if job is None:
+                time.sleep(sleep_sec)
+                continue
+
+            jid = str(job["id"])
+            if beats is not None:
+                beats.add(jid)
+            try:
+                ok, outcome = _run_job(str(job["type"]), json.loads(str(job["payload"])))
+            finally:
+                if beats is not None:
+                    beats.discard(jid)
+            _finish(jid, ok, outcome)
+    finally:
+        if beats is not None:
+            beats.stop()
+
 
-    while True:
-        if stop_event is not None and stop_event.is_set():
-            break
-        if max_iterations is not None and iterations >= max_iterations:
-            break
+def _init_pool_process() -> None:
+    # Interrupts are handled by the parent, which decides whether in-flight
+    # jobs finish or are requeued.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
 
-        job = claim_one()
-        iterations += 1
 
-        if job is None:
-            time.sleep(sleep_sec)
-            continue
+def _install_sigterm(stop: Event) -> Callable[[], None] | None:
+    if threading.current_thread() is not threading.main_thread():
+        return None
 
-        jid = str(job["id"])
-        jtype = str(job["type"])
-        payload = json.loads(str(job["payload"]))
-        claimed_at = time.time()
+    def _handle(signum, frame) -> None:  # pragma: no cover - signal delivery
+        LOG.info("SIGTERM received; draining scheduler worker pool")
+        stop.set()
 
+    previous = signal.signal(signal.SIGTERM, _handle)
+    return lambda: signal.signal(signal.SIGTERM, previous)
+
+
+def _terminate_workers(pool: ProcessPoolExecutor) -> None:
+    terminate = getattr(pool, "terminate_workers", None)
+    if terminate is not None:  # pragma: no cover - Python 3.14+
+        terminate()
+        return
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _requeue_unfinished(job_ids: list[str], beats: _HeartbeatThread | None) -> None:
+    if not job_ids:
+        return
+    LOG.warning("Requeueing %d unfinished scheduler jobs", len(job_ids))
+    if beats is not None:
+        for jid in job_ids:
+            beats.discard(jid)
+    requeue(job_ids)
+
+
+def run_worker_pool(
+    concurrency: int | None = None,
+    *,
+    batch_size: int | None = None,
+    sleep_sec: float = 1.0,
+    heartbeat_sec: float = 10.0,
+    grace_sec: float = 30.0,
+    stop_event: Event | None = None,
+    max_iterations: int | None = None,
+    executor: Executor | None = None,
+) -> None:
+    """Run jobs concurrently on a process pool.
+
+    Up to ``concurrency`` jobs (default: CPU count) run at once.  Free
+    slots are filled by claiming at most ``batch_size`` jobs per queue
+    transaction.  Leases for running jobs are refreshed every
+    ``heartbeat_sec`` from a background thread.  On SIGTERM or
+    ``stop_event`` the pool stops claiming and gives in-flight jobs
+    ``grace_sec`` to finish.  Jobs that have not started are returned to
+    the queue; jobs still running have their worker processes terminated
+    before being requeued.  ``executor`` may supply a pre-built executor
+    (e.g. a thread pool); its running jobs cannot be interrupted, so they
+    are waited on instead of requeued.
+    """
+
+    workers = max(int(concurrency or os.cpu_count() or 1), 1)
+    batch = max(int(batch_size or workers), 1)
+    stop = stop_event if stop_event is not None else Event()
+    restore_signal = _install_sigterm(stop)
+    pool = executor or ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_pool_process
+    )
+    beats = _start_heartbeat(heartbeat_sec)
+    in_flight: dict[Future[tuple[bool, Any]], str] = {}
+
+    def _settle(future: Future[tuple[bool, Any]]) -> None:
+        jid = in_flight.pop(future)
+        if beats is not None:
+            beats.discard(jid)
         try:
-            handler = HANDLERS.get(jtype)
-            if handler is None:
-                raise RuntimeError(f"No handler for {jtype}")
-            result = handler(payload)
-            if heartbeat_sec > 0 and time.time() - claimed_at >= heartbeat_sec:
-                heartbeat(jid)
-            done(jid, {"summary": _summarize_result(result)})
-        except Exception as exc:  # pragma: no cover - defensive
-            fail(
-                jid,
-                error=f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}",
-            )
+            ok, outcome = future.result()
+        except BrokenProcessPool:
+            if stop.is_set():
+                requeue([jid])
+                return
+            ok, outcome = False, "BrokenProcessPool: worker process died"
+        except Exception as exc:
+            ok, outcome = False, f"{type(exc).__name__}: {exc}"
+        _finish(jid, ok, outcome)
+
+    iterations = 0
+    try:
+        while not stop.is_set():
+            if max_iterations is not None and iterations >= max_iterations:
+                break
+            capacity = workers - len(in_flight)
+            requested = min(batch, capacity)
+            claimed = claim_batch(requested) if requested > 0 else []
+            iterations += 1
 
+            for job in claimed:
+                jid = str(job["id"])
+                future = pool.submit(
+                    _run_job, str(job["type"]), json.loads(str(job["payload"]))
+                )
+                in_flight[future] = jid
+                if beats is not None:
+                    beats.add(jid)
+
+            if not in_flight:
+                stop.wait(sleep_sec)
+                continue
+            # A full batch hints at more queued work: top up free slots at once.
+            more_waiting = requested > 0 and len(claimed) == requested
+            timeout = 0 if more_waiting and len(in_flight) < workers else sleep_sec
+            finished, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in finished:
+                _settle(future)
+    finally:
+        if in_flight:
+            finished, _ = wait(in_flight, timeout=grace_sec)
+            for future in finished:
+                _settle(future)
+        if in_flight:
+            # Jobs still waiting in the executor never started and can go
+            # straight back to the queue.
+            cancelled = [future for future in list(in_flight) if future.cancel()]
+            _requeue_unfinished([in_flight.pop(future) for future in cancelled], beats)
+        if in_flight and executor is None:
+            # Running jobs are only requeued once their workers are gone, so
+            # nothing is executed twice.
+            _terminate_workers(pool)
+            _requeue_unfinished(list(in_flight.values()), beats)
+            in_flight.clear()
+        elif in_flight:
+            LOG.warning(
+                "Waiting for %d running scheduler jobs on the supplied executor",
+                len(in_flight),
+            )
+            for future in list(in_flight):
+                wait([future])
+                _settle(future)
+        if executor is None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if beats is not None:
+            beats.stop()
+        if restore_signal is not None:
+            restore_signal()
 
-__all__ = ["HANDLERS", "run_worker"]
 
+__all__ = ["HANDLERS", "run_worker", "run_worker_pool"]
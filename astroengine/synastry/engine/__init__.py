@@ -11,6 +11,7 @@ from .core import (
     DEFAULT_WEIGHTS,
     HARMONIOUS_ASPECTS,
     NEUTRAL_ASPECTS,
+    ChartPopulation,
     ChartPositions,
     EclipticPosition,
     GridCell,
@@ -18,12 +19,15 @@ from .core import (
     OrbPolicy,
     Overlay,
     OverlayLine,
+    PopulationMatch,
     Scores,
     Weights,
     build_grid,
     compute_scores,
     detect_hits,
     make_overlay,
+    population_scores,
+    search_population,
 )
 
 __all__ = [
@@ -48,5 +52,9 @@ __all__ = [
     "build_grid",
     "make_overlay",
     "compute_scores",
+    "ChartPopulation",
+    "PopulationMatch",
+    "population_scores",
+    "search_population",
 ]
 
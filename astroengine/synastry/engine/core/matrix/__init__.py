@@ -17,6 +17,7 @@ from .policy import (
     OrbPolicy,
     Weights,
 )
+from .population import ChartPopulation, PopulationMatch, population_scores, search_population
 from .scoring import compute_scores
 
 __all__ = [
@@ -40,5 +41,9 @@ __all__ = [
     "build_grid",
     "make_overlay",
     "compute_scores",
+    "ChartPopulation",
+    "PopulationMatch",
+    "population_scores",
+    "search_population",
 ]
 
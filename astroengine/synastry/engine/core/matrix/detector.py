@@ -89,10 +89,7 @@ def detect_hits(
 
     separation = _pairwise_separation(lons_a, lons_b, nodes_a, nodes_b)
 
-    base_orbs = np.empty_like(separation, dtype=float)
-    for i, body_a in enumerate(names_a):
-        for j, body_b in enumerate(names_b):
-            base_orbs[i, j] = policy.base_orb(body_a, body_b)
+    base_orbs = policy.base_orb_matrix(names_a, names_b)
 
     hits: list[Hit] = []
     aspects_list = [int(a) for a in aspects]
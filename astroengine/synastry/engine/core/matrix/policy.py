@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from astroengine.core.bodies import ALL_SUPPORTED_BODIES, body_class, canonical_name
 
 __all__ = [
@@ -86,6 +88,26 @@ class OrbPolicy:
             return float(min(present))
         return float(self.default_base_orb)
 
+    def base_orb_matrix(self, bodies_a: Sequence[str], bodies_b: Sequence[str]) -> np.ndarray:
+        """Return :meth:`base_orb` for every ``(a, b)`` pair as a ``(len(a), len(b))`` array."""
+
+        names_a = [canonical_name(body) for body in bodies_a]
+        names_b = [canonical_name(body) for body in bodies_b]
+        single_a = np.array([self._single_orbs.get(name, np.nan) for name in names_a], dtype=float)
+        single_b = np.array([self._single_orbs.get(name, np.nan) for name in names_b], dtype=float)
+        with np.errstate(invalid="ignore"):
+            orbs = np.fmin(single_a[:, None], single_b[None, :])
+        orbs[np.isnan(orbs)] = float(self.default_base_orb)
+        if self._pair_orbs:
+            index_a = np.array(names_a, dtype=object)
+            index_b = np.array(names_b, dtype=object)
+            for pair, value in self._pair_orbs.items():
+                first, second = (*pair, *pair)[:2]
+                hit = (index_a[:, None] == first) & (index_b[None, :] == second)
+                hit |= (index_a[:, None] == second) & (index_b[None, :] == first)
+                orbs[hit] = value
+        return orbs
+
     def cap(self, aspect: int) -> float:
         """Return the maximum orb allowance for ``aspect``."""
 
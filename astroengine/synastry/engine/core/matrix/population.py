@@ -0,0 +1,250 @@
+"""One-to-many synastry search over a stored chart population."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from astroengine.core.bodies import canonical_name
+
+from .detector import _is_node, _prepare
+from .models import ChartPositions
+from .policy import (
+    ASPECT_FAMILY_MAP,
+    DEFAULT_ASPECT_SET,
+    DEFAULT_ORB_POLICY,
+    DEFAULT_WEIGHTS,
+    OrbPolicy,
+    Weights,
+)
+from .scoring import _body_family
+
+__all__ = ["ChartPopulation", "PopulationMatch", "population_scores", "search_population"]
+
+_EPSILON = 1e-9
+_DEFAULT_CHUNK = 8192
+
+
+@dataclass(frozen=True)
+class ChartPopulation:
+    """Longitudes of ``N`` stored charts as an ``(N, len(bodies))`` matrix.
+
+    Columns are canonical body names; ``NaN`` marks a body a chart lacks.
+    """
+
+    ids: np.ndarray
+    bodies: tuple[str, ...]
+    longitudes: np.ndarray
+
+    def __post_init__(self) -> None:
+        longitudes = np.asarray(self.longitudes, dtype=float)
+        if longitudes.ndim != 2 or longitudes.shape[1] != len(self.bodies):
+            raise ValueError("longitudes must be shaped (charts, bodies)")
+        if len(self.ids) != longitudes.shape[0]:
+            raise ValueError("ids and longitudes disagree on the number of charts")
+        object.__setattr__(self, "ids", np.asarray(self.ids, dtype=object))
+        object.__setattr__(self, "longitudes", longitudes % 360.0)
+
+    def __len__(self) -> int:
+        return int(self.longitudes.shape[0])
+
+    @classmethod
+    def from_positions(
+        cls,
+        charts: Mapping[Hashable, ChartPositions | Mapping[str, object]],
+        *,
+        bodies: Iterable[str] | None = None,
+    ) -> ChartPopulation:
+        """Build a population from ``{chart_id: positions}``.
+
+        ``bodies`` restricts and orders the columns; by default every body
+        seen in any chart is kept in first-seen order.
+        """
+
+        prepared = {
+            key: value if isinstance(value, ChartPositions) else ChartPositions(value)
+            for key, value in charts.items()
+        }
+        if bodies is None:
+            columns = tuple(
+                dict.fromkeys(
+                    name for chart in prepared.values() for name in chart.canonical_bodies()
+                )
+            )
+        else:
+            columns = tuple(dict.fromkeys(canonical_name(name) for name in bodies))
+        longitudes = np.full((len(prepared), len(columns)), np.nan)
+        for row, chart in enumerate(prepared.values()):
+            values = chart.longitude_map()
+            for column, name in enumerate(columns):
+                if name in values:
+                    longitudes[row, column] = values[name]
+        return cls(np.array(list(prepared), dtype=object), columns, longitudes)
+
+
+@dataclass(frozen=True)
+class PopulationMatch:
+    """Score summary for one population chart against the query chart.
+
+    ``score`` equals ``compute_scores(detect_hits(...)).overall`` for the pair.
+    """
+
+    id: Hashable
+    index: int
+    score: float
+    raw_total: float
+    hits: int
+
+
+@dataclass(frozen=True)
+class _AspectTerms:
+    angle: float
+    orb: np.ndarray  # effective orb per (query body, population body)
+    weight: np.ndarray  # score multiplier per (query body, population body)
+
+
+def _aspect_terms(
+    names_a: Sequence[str],
+    bodies_b: Sequence[str],
+    aspects: Iterable[int],
+    policy: OrbPolicy,
+    weights: Weights,
+) -> list[_AspectTerms]:
+    base_orbs = policy.base_orb_matrix(names_a, bodies_b)
+    body_weight = np.outer(
+        [weights.body_weight(_body_family(name)) for name in names_a],
+        [weights.body_weight(_body_family(name)) for name in bodies_b],
+    )
+    terms = []
+    for aspect in sorted({int(value) for value in aspects}):
+        weight = body_weight * weights.aspect_weight(ASPECT_FAMILY_MAP.get(aspect, "neutral"))
+        if aspect == 0:
+            weight = weight * float(weights.conjunction_sign)
+        terms.append(_AspectTerms(float(aspect), np.minimum(base_orbs, policy.cap(aspect)), weight))
+    return terms
+
+
+def _separation(
+    lons_a: np.ndarray,
+    nodes_a: np.ndarray,
+    block: np.ndarray,
+    nodes_b: np.ndarray,
+) -> np.ndarray:
+    """Return ``(charts, query bodies, population bodies)`` separations in ``[0, 180]``."""
+
+    separation = np.abs((lons_a[None, :, None] - block[:, None, :] + 180.0) % 360.0 - 180.0)
+    if nodes_a.any() or nodes_b.any():
+        # Node axes also aspect through the anti-node; take the nearer end.
+        anti = np.abs((lons_a[None, :, None] + 180.0 - block[:, None, :] + 180.0) % 360.0 - 180.0)
+        anti_b = np.abs((lons_a[None, :, None] - block[:, None, :] + 360.0) % 360.0 - 180.0)
+        if nodes_a.any():
+            separation[:, nodes_a, :] = np.minimum(separation, anti)[:, nodes_a, :]
+        if nodes_b.any():
+            separation[:, :, nodes_b] = np.minimum(separation, anti_b)[:, :, nodes_b]
+    return separation
+
+
+def population_scores(
+    chart: ChartPositions,
+    population: ChartPopulation,
+    *,
+    aspects: Iterable[int] = DEFAULT_ASPECT_SET,
+    policy: OrbPolicy = DEFAULT_ORB_POLICY,
+    weights: Weights = DEFAULT_WEIGHTS,
+    gamma: float = 1.0,
+    chunk_size: int = _DEFAULT_CHUNK,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(score, raw_total, hit_count)`` arrays for every population chart.
+
+    The population is processed ``chunk_size`` charts at a time so peak
+    memory stays at a few ``(chunk, query bodies, population bodies)``
+    arrays regardless of population size.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    count = len(population)
+    score = np.zeros(count)
+    raw_total = np.zeros(count)
+    hits = np.zeros(count, dtype=np.int64)
+
+    names_a, canonical_a, lons_a = _prepare(chart)
+    if not names_a or not population.bodies or not count:
+        return score, raw_total, hits
+    nodes_a = np.array([_is_node(name) for name in canonical_a], dtype=bool)
+    nodes_b = np.array([_is_node(name) for name in population.bodies], dtype=bool)
+    terms = _aspect_terms(names_a, population.bodies, aspects, policy, weights)
+
+    for start in range(0, count, chunk_size):
+        block = population.longitudes[start : start + chunk_size]
+        separation = _separation(lons_a, nodes_a, block, nodes_b)
+        present = ~np.isnan(separation)
+        for term in terms:
+            epsilon = np.abs(separation - term.angle)
+            with np.errstate(invalid="ignore"):
+                mask = present & (epsilon <= term.orb + _EPSILON)
+            if not mask.any():
+                continue
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.clip(epsilon / term.orb, 0.0, 1.0)
+            severity = 0.5 * (1.0 + np.cos(np.pi * ratio))
+            if gamma != 1.0:
+                severity = severity ** float(gamma)
+            severity = np.where(term.orb > _EPSILON, severity, epsilon <= _EPSILON)
+            severity = np.where(mask, np.clip(severity, 0.0, 1.0), 0.0)
+            stop = start + block.shape[0]
+            score[start:stop] += (severity * term.weight).sum(axis=(1, 2))
+            raw_total[start:stop] += severity.sum(axis=(1, 2))
+            hits[start:stop] += mask.sum(axis=(1, 2))
+    return score, raw_total, hits
+
+
+def search_population(
+    chart: ChartPositions,
+    population: ChartPopulation,
+    *,
+    top_k: int = 10,
+    aspects: Iterable[int] = DEFAULT_ASPECT_SET,
+    policy: OrbPolicy = DEFAULT_ORB_POLICY,
+    weights: Weights = DEFAULT_WEIGHTS,
+    gamma: float = 1.0,
+    min_score: float | None = None,
+    chunk_size: int = _DEFAULT_CHUNK,
+) -> list[PopulationMatch]:
+    """Return the ``top_k`` population charts ranked by synastry score.
+
+    Ties are broken by population order; charts scoring below
+    ``min_score`` are dropped.
+    """
+
+    if top_k <= 0:
+        return []
+    score, raw_total, hits = population_scores(
+        chart,
+        population,
+        aspects=aspects,
+        policy=policy,
+        weights=weights,
+        gamma=gamma,
+        chunk_size=chunk_size,
+    )
+    candidates = np.arange(score.size)
+    if min_score is not None:
+        candidates = candidates[score >= float(min_score)]
+    if candidates.size > top_k:
+        keep = np.argpartition(-score[candidates], top_k - 1)[:top_k]
+        threshold = score[candidates[keep]].min()
+        candidates = candidates[score[candidates] >= threshold]
+    order = candidates[np.lexsort((candidates, -score[candidates]))][:top_k]
+    return [
+        PopulationMatch(
+            id=population.ids[index],
+            index=int(index),
+            score=float(score[index]),
+            raw_total=float(raw_total[index]),
+            hits=int(hits[index]),
+        )
+        for index in order.tolist()
+    ]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import dataclass
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
 from .context import TimelordContext, build_context
@@ -76,54 +77,182 @@ def _resolve_systems(
     return resolved
 
 
+# Deepest level each generator supports; ``None`` depth requests this.
+_MAX_DEPTH = {
+    "profections": 3,
+    "vimshottari": 5,
+    "zodiacal_releasing_spirit": 4,
+    "zodiacal_releasing_fortune": 4,
+}
+
+# Iteration order matches the legacy ``iter_periods`` order.
+_SYSTEM_KEYS = (
+    "profections",
+    "vimshottari",
+    "zodiacal_releasing_spirit",
+    "zodiacal_releasing_fortune",
+)
+
+
+class _LevelIndex:
+    """Periods of one system level sorted by start for bisect lookups.
+
+    ``reach[i]`` is the latest end among the first ``i + 1`` periods, so a
+    backwards walk from the last period starting before a query stops as soon
+    as nothing earlier can still be active, even if periods overlap.
+    """
+
+    __slots__ = ("periods", "starts", "ends", "reach")
+
+    def __init__(self, periods: Iterable[TimelordPeriod]) -> None:
+        ordered = sorted(periods, key=lambda period: period.start)
+        self.periods = ordered
+        self.starts = [period.start for period in ordered]
+        self.ends = [period.end for period in ordered]
+        self.reach: list[datetime] = []
+        latest: datetime | None = None
+        for end in self.ends:
+            latest = end if latest is None or end > latest else latest
+            self.reach.append(latest)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[TimelordPeriod]:
+        """Return periods with ``period.start <= end`` and ``period.end > start``."""
+
+        found: list[TimelordPeriod] = []
+        index = bisect_right(self.starts, end) - 1
+        while index >= 0 and self.reach[index] > start:
+            if self.ends[index] > start:
+                found.append(self.periods[index])
+            index -= 1
+        found.reverse()
+        return found
+
+
 @dataclass
 class TimelordCalculator:
-    """Precomputes timelord periods for repeated lookups."""
+    """Precomputes timelord periods for repeated lookups.
+
+    Periods are generated lazily per system, only as deep as the queries
+    require, and indexed per level so point and range lookups bisect instead
+    of scanning every period.
+    """
 
     context: TimelordContext
     until: datetime
     include_fortune: bool = False
     systems: tuple[str, ...] | None = None
+    _selected: set[str] = field(init=False, repr=False)
+    _periods: dict[str, tuple[int, list[TimelordPeriod]]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _indexes: dict[str, dict[str, _LevelIndex]] = field(
+        init=False, repr=False, default_factory=dict
+    )
 
     def __post_init__(self) -> None:
-        selected = _resolve_systems(self.systems, self.include_fortune)
+        self._selected = _resolve_systems(self.systems, self.include_fortune)
 
-        self.profections = (
-            generate_profection_periods(self.context, self.until)
-            if "profections" in selected
-            else []
-        )
-        self.vimshottari = (
-            generate_vimshottari_periods(self.context, self.until)
-            if "vimshottari" in selected
-            else []
-        )
-        self.zr_spirit = (
-            generate_zodiacal_releasing(self.context, self.until, lot="spirit")
-            if "zodiacal_releasing_spirit" in selected
-            else []
-        )
-        self.zr_fortune = (
-            generate_zodiacal_releasing(self.context, self.until, lot="fortune")
-            if "zodiacal_releasing_fortune" in selected
-            else []
+    def _generator(self, key: str) -> Callable[[int], list[TimelordPeriod]]:
+        if key == "profections":
+            return lambda _depth: generate_profection_periods(self.context, self.until)
+        if key == "vimshottari":
+            return lambda depth: generate_vimshottari_periods(
+                self.context, self.until, levels=depth
+            )
+        lot = "fortune" if key == "zodiacal_releasing_fortune" else "spirit"
+        return lambda depth: generate_zodiacal_releasing(
+            self.context, self.until, lot=lot, levels=depth
         )
 
+    def _system_periods(self, key: str, depth: int | None = None) -> list[TimelordPeriod]:
+        if key not in self._selected:
+            return []
+        limit = _MAX_DEPTH[key]
+        wanted = limit if depth is None else max(1, min(int(depth), limit))
+        cached = self._periods.get(key)
+        if cached is None or cached[0] < wanted:
+            cached = (wanted, self._generator(key)(wanted))
+            self._periods[key] = cached
+            self._indexes.pop(key, None)
+        return cached[1]
+
+    def _level_indexes(self, key: str, depth: int | None) -> dict[str, _LevelIndex]:
+        periods = self._system_periods(key, depth)
+        indexes = self._indexes.get(key)
+        if indexes is None:
+            grouped: dict[str, list[TimelordPeriod]] = {}
+            for period in periods:
+                grouped.setdefault(period.level, []).append(period)
+            indexes = {level: _LevelIndex(items) for level, items in grouped.items()}
+            self._indexes[key] = indexes
+        return indexes
+
+    @property
+    def profections(self) -> list[TimelordPeriod]:
+        return self._system_periods("profections")
+
+    @property
+    def vimshottari(self) -> list[TimelordPeriod]:
+        return self._system_periods("vimshottari")
+
+    @property
+    def zr_spirit(self) -> list[TimelordPeriod]:
+        return self._system_periods("zodiacal_releasing_spirit")
+
+    @property
+    def zr_fortune(self) -> list[TimelordPeriod]:
+        return self._system_periods("zodiacal_releasing_fortune")
+
     def iter_periods(self) -> Iterable[TimelordPeriod]:
-        yield from self.profections
-        yield from self.vimshottari
-        yield from self.zr_spirit
-        yield from self.zr_fortune
+        for key in _SYSTEM_KEYS:
+            yield from self._system_periods(key)
+
+    def _overlapping(
+        self, start: datetime, end: datetime, depth: int | None
+    ) -> list[TimelordPeriod]:
+        found: list[TimelordPeriod] = []
+        for key in _SYSTEM_KEYS:
+            if key not in self._selected:
+                continue
+            for level, index in self._level_indexes(key, depth).items():
+                if depth is not None and _LEVEL_ORDER.get(level, 99) >= depth:
+                    continue
+                found.extend(index.overlapping(start, end))
+        return found
+
+    def active_stack(self, moment: datetime, *, depth: int | None = None) -> TimelordStack:
+        """Return the periods active at ``moment``.
+
+        ``depth`` limits the stack to the first ``depth`` levels of each
+        system (``1`` keeps only annual/maha/L1 periods) and avoids generating
+        deeper levels until they are requested.
+        """
 
-    def active_stack(self, moment: datetime) -> TimelordStack:
         reference = moment.astimezone(UTC)
-        active: list[TimelordPeriod] = []
-        for period in self.iter_periods():
-            if period.contains(reference):
-                active.append(period)
+        active = [
+            period
+            for period in self._overlapping(reference, reference, depth)
+            if period.contains(reference)
+        ]
         active.sort(key=_period_sort_key)
         return TimelordStack(moment=reference, periods=tuple(active))
 
+    def periods_between(
+        self, start: datetime, end: datetime, *, depth: int | None = None
+    ) -> list[TimelordPeriod]:
+        """Return every period active at some point in ``[start, end]``.
+
+        Results are ordered by start time, then by system and level.
+        """
+
+        lower = start.astimezone(UTC)
+        upper = end.astimezone(UTC)
+        if upper < lower:
+            raise ValueError("end must not precede start")
+        found = self._overlapping(lower, upper, depth)
+        found.sort(key=lambda period: (period.start, *_period_sort_key(period)))
+        return found
+
 
 def _period_sort_key(period: TimelordPeriod) -> tuple[int, int]:
     system_rank = _SYSTEM_ORDER.get(period.system, 99)
@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import datetime as _dt
+import heapq
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Iterable, Iterator, Literal, Mapping, MutableMapping, Sequence
 
 from ..chart.natal import BODY_EXPANSIONS, DEFAULT_BODIES, build_body_map
@@ -11,11 +17,18 @@ from ..core.angles import classify_relative_motion, signed_delta
 from ..core.angles import normalize_degrees as _normalize_degrees
 from ..core.bodies import canonical_name
 from ..core.qcache import DEFAULT_QSEC, qbin, qcache
+from ..core.ticks import jd_from_tick, positions_at
 from ..core.time import to_tt
 from ..detectors_aspects import AspectHit
 from ..ephemeris import EphemerisAdapter, EphemerisConfig, EphemerisSample
 from ..ephemeris.refinement import SECONDS_PER_DAY, RefineResult, refine_event
 from ..ephemeris.swisseph_adapter import SwissEphemerisAdapter, VariantConfig
+from ..observability.metrics import (
+    POSITION_CACHE_ENTRIES,
+    POSITION_CACHE_EVICTIONS,
+    POSITION_CACHE_HITS,
+    POSITION_CACHE_MISSES,
+)
 
 try:  # pragma: no cover - optional canonical schema
     from ..canonical import TransitEvent, events_from_any
@@ -39,8 +52,11 @@ __all__ = [
     "FEATURE_RETURNS",
     "FEATURE_PROFECTIONS",
     "FEATURE_TIMELORDS",
+    "SharedPositionCache",
     "TickCachingProvider",
+    "iter_scan_transits",
     "scan_transits",
+    "shared_position_cache",
     "_aspect_definitions",
 ]
 
@@ -408,20 +424,160 @@ class TransitScanService:
             )
 
 
+class SharedPositionCache:
+    """Process-wide LRU of body positions shared across scan sessions.
+
+    Entries are keyed by ``(provider class, provider.cache_fingerprint(),
+    qbin(jd), body)`` so concurrent requests over overlapping windows reuse
+    each other's provider calls.  Providers whose class does not define
+    ``cache_fingerprint`` (or that return ``None`` from it) bypass the tier,
+    since their output may depend on state the key cannot see.
+    """
+
+    def __init__(self, maxsize: int = 65_536, *, qsec: float = DEFAULT_QSEC) -> None:
+        self.maxsize = max(int(maxsize), 0)
+        self.qsec = float(qsec)
+        self._data: OrderedDict[tuple[Hashable, ...], Mapping[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def namespace(self, provider: object) -> tuple[Hashable, ...] | None:
+        """Return the key prefix for ``provider`` or ``None`` when uncacheable."""
+
+        if self.maxsize == 0:
+            return None
+        cls = type(provider)
+        fingerprint_fn = getattr(cls, "cache_fingerprint", None)
+        if fingerprint_fn is None:
+            return None
+        fingerprint = fingerprint_fn(provider)
+        if fingerprint is None:
+            return None
+        try:
+            hash(fingerprint)
+        except TypeError:
+            return None
+        return (f"{cls.__module__}.{cls.__qualname__}", fingerprint)
+
+    def bin(self, jd_utc: float) -> int:
+        """Quantize ``jd_utc``; bins are centred on whole ``qsec`` instants."""
+
+        return qbin(float(jd_utc) + self.qsec / (2.0 * SECONDS_PER_DAY), self.qsec)
+
+    def get_many(
+        self, namespace: tuple[Hashable, ...], bin_key: int, bodies: Sequence[str]
+    ) -> dict[str, Mapping[str, float]]:
+        """Return cached positions for the lower-cased ``bodies`` that are present."""
+
+        found: dict[str, Mapping[str, float]] = {}
+        with self._lock:
+            for body in bodies:
+                key = (*namespace, bin_key, body)
+                value = self._data.get(key)
+                if value is not None:
+                    self._data.move_to_end(key)
+                    found[body] = value
+            hits = len(found)
+            misses = len(bodies) - hits
+            self.hits += hits
+            self.misses += misses
+        if hits:
+            POSITION_CACHE_HITS.inc(hits)
+        if misses:
+            POSITION_CACHE_MISSES.inc(misses)
+        return found
+
+    def put_many(
+        self,
+        namespace: tuple[Hashable, ...],
+        bin_key: int,
+        positions: Mapping[str, Mapping[str, float]],
+    ) -> None:
+        """Store lower-cased ``positions`` and evict least recently used entries.
+
+        Each value is copied into a read-only mapping so sessions sharing an
+        entry cannot see one another's (or the provider's) later mutations.
+        """
+
+        evicted = 0
+        frozen = {
+            body: MappingProxyType(dict(value)) for body, value in positions.items()
+        }
+        with self._lock:
+            for body, value in frozen.items():
+                key = (*namespace, bin_key, body)
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                evicted += 1
+            self.evictions += evicted
+            size = len(self._data)
+        if evicted:
+            POSITION_CACHE_EVICTIONS.inc(evicted)
+        POSITION_CACHE_ENTRIES.set(size)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+        POSITION_CACHE_ENTRIES.set(0)
+
+
+_SHARED_POSITION_CACHE: SharedPositionCache | None = None
+_SHARED_POSITION_CACHE_LOCK = threading.Lock()
+
+
+def shared_position_cache() -> SharedPositionCache:
+    """Return the process-wide cache sized by ``AE_POSITION_CACHE_SIZE``."""
+
+    global _SHARED_POSITION_CACHE
+    if _SHARED_POSITION_CACHE is None:
+        with _SHARED_POSITION_CACHE_LOCK:
+            if _SHARED_POSITION_CACHE is None:
+                size = int(os.getenv("AE_POSITION_CACHE_SIZE", "65536"))
+                _SHARED_POSITION_CACHE = SharedPositionCache(size)
+    return _SHARED_POSITION_CACHE
+
+
 class TickCachingProvider:
-    """Memoize ``positions_ecliptic`` calls for a single scan session."""
+    """Memoize ``positions_ecliptic`` calls for a single scan session.
 
-    __slots__ = ("_provider", "_cache", "_canonical_cache")
+    Both ISO-8601 and Julian-day (``positions_ecliptic_jd``) requests are
+    cached; JD ticks are keyed on the float value so dense scans never
+    format or parse timestamp strings.  Session misses fall through to a
+    :class:`SharedPositionCache` (the process-wide one by default), which
+    only requests the bodies it does not already hold from the provider.
+    Pass ``shared_cache=False`` to keep the cache strictly per session.
+    """
 
-    def __init__(self, provider: object) -> None:
+    __slots__ = ("_provider", "_cache", "_canonical_cache", "_shared")
+
+    def __init__(
+        self,
+        provider: object,
+        *,
+        shared_cache: SharedPositionCache | Literal[False] | None = None,
+    ) -> None:
         self._provider = provider
         self._cache: dict[
-            tuple[str, tuple[str, ...]], Mapping[str, Mapping[str, float]]
+            tuple[str | float, tuple[str, ...]], Mapping[str, Mapping[str, float]]
         ] = {}
         self._canonical_cache: dict[frozenset[str], tuple[str, ...]] = {}
+        if shared_cache is False:
+            self._shared: SharedPositionCache | None = None
+        else:
+            self._shared = shared_cache if shared_cache is not None else shared_position_cache()
 
-    def positions_ecliptic(
-        self, iso_utc: str, bodies: Iterable[str] | None
+    def _lookup(
+        self, tick: str | float, bodies: Iterable[str] | None
     ) -> Mapping[str, Mapping[str, float]]:
         if bodies is None:
             raise TypeError("positions_ecliptic requires an iterable of body names")
@@ -436,12 +592,11 @@ class TickCachingProvider:
         if canonical is None:
             canonical = tuple(sorted(canonical_key))
             self._canonical_cache[canonical_key] = canonical
-        key = (iso_utc, canonical)
+        key = (tick, canonical)
 
         normalized = self._cache.get(key)
         if normalized is None:
-            result = self._provider.positions_ecliptic(iso_utc, bodies_tuple)
-            normalized = {name.lower(): data for name, data in result.items()}
+            normalized = self._fetch(tick, bodies_tuple, lowered)
             self._cache[key] = normalized
 
         return {
@@ -450,6 +605,40 @@ class TickCachingProvider:
             if name_lower in normalized
         }
 
+    def _fetch(
+        self, tick: str | float, bodies: tuple[str, ...], lowered: tuple[str, ...]
+    ) -> dict[str, Mapping[str, float]]:
+        shared = self._shared
+        namespace = shared.namespace(self._provider) if shared is not None else None
+        if shared is None or namespace is None:
+            result = positions_at(self._provider, tick, bodies)
+            return {name.lower(): data for name, data in result.items()}
+
+        wanted: dict[str, str] = {}
+        for name, name_lower in zip(bodies, lowered, strict=False):
+            wanted.setdefault(name_lower, name)
+        bin_key = shared.bin(jd_from_tick(tick))
+        normalized = shared.get_many(namespace, bin_key, tuple(wanted))
+        missing = [name for name_lower, name in wanted.items() if name_lower not in normalized]
+        if missing:
+            result = positions_at(self._provider, tick, missing)
+            fresh = {
+                name.lower(): MappingProxyType(dict(data)) for name, data in result.items()
+            }
+            shared.put_many(namespace, bin_key, fresh)
+            normalized.update(fresh)
+        return normalized
+
+    def positions_ecliptic(
+        self, iso_utc: str, bodies: Iterable[str] | None
+    ) -> Mapping[str, Mapping[str, float]]:
+        return self._lookup(iso_utc, bodies)
+
+    def positions_ecliptic_jd(
+        self, jd_utc: float, bodies: Iterable[str] | None
+    ) -> Mapping[str, Mapping[str, float]]:
+        return self._lookup(float(jd_utc), bodies)
+
     def __getattr__(self, name: str):  # pragma: no cover - delegation passthrough
         return getattr(self._provider, name)
 
@@ -616,7 +805,98 @@ def _aspect_definitions(aspects: Iterable[object] | None) -> list[tuple[str, flo
     return resolved
 
 
-def scan_transits(
+# Coarse steps per streamed chunk: bounds per-series sample caches and how
+# far any one series runs ahead before the merge can release earlier hits.
+_STREAM_CHUNK_STEPS = 8
+
+
+def _iter_series_hits(
+    service: TransitScanService,
+    moving_name: str,
+    moving_code: int,
+    target_name: str,
+    target_lon: float,
+    aspect_name: str,
+    aspect_angle: float,
+    family: str,
+    start_dt: _dt.datetime,
+    end_dt: _dt.datetime,
+    *,
+    step_hours: float,
+    orb_allow: float,
+    partile_limit: float,
+) -> Iterator[tuple[_dt.datetime, AspectHit | None]]:
+    """Yield ``(moment, hit)`` pairs for one crossing series in time order.
+
+    The window is scanned in chunks of whole coarse steps, so the sampling
+    grid matches a single pass; after each chunk a ``(chunk_end, None)``
+    marker reports progress to the merge.
+    """
+
+    chunk = _dt.timedelta(hours=step_hours) * _STREAM_CHUNK_STEPS
+    chunk_start = start_dt
+    while chunk_start < end_dt:
+        chunk_end = min(chunk_start + chunk, end_dt)
+        events = service.iter_longitude_crossings(
+            moving_code,
+            target_lon,
+            aspect_angle,
+            chunk_start,
+            chunk_end,
+            step_hours=step_hours,
+            refinement="accurate",
+        )
+        for event in events:
+            event_time = event.timestamp
+            if event_time is None:
+                continue
+
+            moment = event_time.astimezone(_dt.UTC)
+            sample_meta = event.metadata.get("sample")
+
+            moving_lon: float
+            moving_speed: float
+            if isinstance(sample_meta, dict) and sample_meta.get("longitude") is not None:
+                moving_lon = float(sample_meta["longitude"]) % 360.0
+                moving_speed = float(sample_meta.get("speed_longitude", 0.0))
+            else:
+                sample = service.adapter.sample(moving_code, moment)
+                moving_lon = float(sample.longitude % 360.0)
+                moving_speed = float(sample.speed_longitude)
+
+            delta_lambda = _normalize_degrees(target_lon - moving_lon)
+            offset = signed_delta(delta_lambda - aspect_angle)
+            if abs(offset) > orb_allow:
+                continue
+            motion = classify_relative_motion(
+                aspect_angle + offset,
+                aspect_angle,
+                moving_speed,
+                0.0,
+            )
+            yield moment, AspectHit(
+                kind=f"aspect_{aspect_name}",
+                when_iso=moment.isoformat().replace("+00:00", "Z"),
+                moving=moving_name,
+                target=target_name,
+                angle_deg=float(aspect_angle),
+                lon_moving=moving_lon,
+                lon_target=float(target_lon),
+                delta_lambda_deg=float(delta_lambda),
+                offset_deg=float(offset),
+                orb_abs=float(abs(offset)),
+                orb_allow=float(orb_allow),
+                is_partile=abs(offset) <= partile_limit,
+                applying_or_separating=motion.state,
+                family=family,
+                corridor_width_deg=None,
+                corridor_profile=None,
+            )
+        yield chunk_end, None
+        chunk_start = chunk_end
+
+
+def iter_scan_transits(
     natal_ts: str,
     start_ts: str,
     end_ts: str,
@@ -626,13 +906,20 @@ def scan_transits(
     bodies: Iterable[str] | None = None,
     targets: Iterable[str] | None = None,
     step_days: float = 1.0,
-) -> list[AspectHit]:
-    """Scan transit contacts against natal longitudes."""
+) -> Iterator[AspectHit]:
+    """Stream transit contacts against natal longitudes in time order.
+
+    Every moving/target/aspect series runs as its own chunked generator and
+    the series are merged with a heap, so hits are released as soon as no
+    series can still produce an earlier one and memory stays bounded by the
+    number of series rather than the window length.  Ties keep the
+    body/target/aspect order used by :func:`scan_transits`.
+    """
 
     start_dt = _parse_iso8601(start_ts)
     end_dt = _parse_iso8601(end_ts)
     if end_dt <= start_dt:
-        return []
+        return iter(())
 
     natal_dt = _parse_iso8601(natal_ts)
     adapter = SwissEphemerisAdapter.get_default_adapter()
@@ -645,7 +932,7 @@ def scan_transits(
         else dict(moving_map)
     )
     if not moving_map or not target_map:
-        return []
+        return iter(())
 
     natal_jd = adapter.julian_day(natal_dt)
     target_longitudes: dict[str, float] = {}
@@ -655,73 +942,60 @@ def scan_transits(
 
     aspect_defs = _aspect_definitions(aspects)
     if not aspect_defs:
-        return []
+        return iter(())
 
     step_hours = max(float(step_days) * 24.0, 1.0)
     orb_allow = max(float(orb_deg), 0.0)
     partile_limit = min(orb_allow, 0.1)
 
-    hits: list[AspectHit] = []
-    for moving_name, moving_code in moving_map.items():
-        for target_name, target_lon in target_longitudes.items():
-            for aspect_name, aspect_angle, family in aspect_defs:
-                events = service.iter_longitude_crossings(
-                    moving_code,
-                    target_lon,
-                    aspect_angle,
-                    start_dt,
-                    end_dt,
-                    step_hours=step_hours,
-                    refinement="accurate",
-                )
-                for event in events:
-                    event_time = event.timestamp
-                    if event_time is None:
-                        continue
-
-                    moment = event_time.astimezone(_dt.UTC)
-                    sample_meta = event.metadata.get("sample")
-
-                    moving_lon: float
-                    moving_speed: float
-                    if isinstance(sample_meta, dict) and sample_meta.get("longitude") is not None:
-                        moving_lon = float(sample_meta["longitude"]) % 360.0
-                        moving_speed = float(sample_meta.get("speed_longitude", 0.0))
-                    else:
-                        sample = service.adapter.sample(moving_code, moment)
-                        moving_lon = float(sample.longitude % 360.0)
-                        moving_speed = float(sample.speed_longitude)
-
-                    delta_lambda = _normalize_degrees(target_lon - moving_lon)
-                    offset = signed_delta(delta_lambda - aspect_angle)
-                    if abs(offset) > orb_allow:
-                        continue
-                    motion = classify_relative_motion(
-                        aspect_angle + offset,
-                        aspect_angle,
-                        moving_speed,
-                        0.0,
-                    )
-                    hits.append(
-                        AspectHit(
-                            kind=f"aspect_{aspect_name}",
-                            when_iso=moment.isoformat().replace("+00:00", "Z"),
-                            moving=moving_name,
-                            target=target_name,
-                            angle_deg=float(aspect_angle),
-                            lon_moving=moving_lon,
-                            lon_target=float(target_lon),
-                            delta_lambda_deg=float(delta_lambda),
-                            offset_deg=float(offset),
-                            orb_abs=float(abs(offset)),
-                            orb_allow=float(orb_allow),
-                            is_partile=abs(offset) <= partile_limit,
-                            applying_or_separating=motion.state,
-                            family=family,
-                            corridor_width_deg=None,
-                            corridor_profile=None,
-                        )
-                    )
+    series = [
+        _iter_series_hits(
+            service,
+            moving_name,
+            moving_code,
+            target_name,
+            target_lon,
+            aspect_name,
+            aspect_angle,
+            family,
+            start_dt,
+            end_dt,
+            step_hours=step_hours,
+            orb_allow=orb_allow,
+            partile_limit=partile_limit,
+        )
+        for moving_name, moving_code in moving_map.items()
+        for target_name, target_lon in target_longitudes.items()
+        for aspect_name, aspect_angle, family in aspect_defs
+    ]
+    merged = heapq.merge(*series, key=lambda item: item[0])
+    return (hit for _, hit in merged if hit is not None)
+
+
+def scan_transits(
+    natal_ts: str,
+    start_ts: str,
+    end_ts: str,
+    *,
+    aspects: Iterable[object] | None = None,
+    orb_deg: float = 1.0,
+    bodies: Iterable[str] | None = None,
+    targets: Iterable[str] | None = None,
+    step_days: float = 1.0,
+) -> list[AspectHit]:
+    """Scan transit contacts against natal longitudes."""
 
+    hits = list(
+        iter_scan_transits(
+            natal_ts,
+            start_ts,
+            end_ts,
+            aspects=aspects,
+            orb_deg=orb_deg,
+            bodies=bodies,
+            targets=targets,
+            step_days=step_days,
+        )
+    )
     hits.sort(key=lambda item: item.when_iso)
     return hits
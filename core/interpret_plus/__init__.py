@@ -1,11 +1,23 @@
 """Relationship interpretation scaffolding utilities."""
 
-from .engine import ARCHETYPES, ASPECT_SYMBOLS, Finding, interpret, load_rules
+from .engine import (
+    ARCHETYPES,
+    ASPECT_SYMBOLS,
+    CompiledPack,
+    Finding,
+    compile_pack,
+    interpret,
+    load_rules,
+    pack_etag,
+)
 
 __all__ = [
     "ASPECT_SYMBOLS",
     "ARCHETYPES",
+    "CompiledPack",
     "Finding",
+    "compile_pack",
     "interpret",
     "load_rules",
+    "pack_etag",
 ]
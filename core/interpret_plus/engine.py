@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 import os
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from collections.abc import Mapping, MutableMapping, Sequence
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 try:  # pragma: no cover - optional dependency for richer rulepacks
@@ -536,25 +538,34 @@ def _pair_key(match: Mapping[str, Any]) -> tuple[str, str] | None:
     return None
 
 
+def _score(rule: Rule, match: Mapping[str, Any], profile_factor: float) -> tuple[float, float]:
+    """Return ``(raw_score, score)`` for ``match`` under ``rule``."""
+
+    then = rule.get("then", {}) or {}
+    base_score = float(then.get("base_score", 1.0))
+    include_weight = float(rule.get("meta", {}).get("include_weight", 1.0))
+    strength = float(match.get("strength", 1.0))
+    raw_score = base_score * _strength_transform(strength, then.get("score_fn"))
+    score = raw_score * profile_factor * include_weight
+    return raw_score, _apply_boost(score, then.get("boost"))
+
+
 def _prepare_candidate(
     rule: Rule,
     match: Mapping[str, Any],
     pack: Pack,
     scope: str,
     profile: str | None,
+    *,
+    profile_factor: float | None = None,
 ) -> dict[str, Any] | None:
     then = rule.get("then", {}) or {}
     tags = list(then.get("tags", []))
 
-    base_score = float(then.get("base_score", 1.0))
-    include_weight = float(rule.get("meta", {}).get("include_weight", 1.0))
     strength = float(match.get("strength", 1.0))
-    score_fn = then.get("score_fn")
-    transformed_strength = _strength_transform(strength, score_fn)
-    raw_score = base_score * transformed_strength
-    profile_factor = _profile_multiplier(tags, pack, profile)
-    score = raw_score * profile_factor * include_weight
-    score = _apply_boost(score, then.get("boost"))
+    if profile_factor is None:
+        profile_factor = _profile_multiplier(tags, pack, profile)
+    raw_score, score = _score(rule, match, profile_factor)
 
     primary = match.get("primary", {})
     aspect = primary.get("aspect") if isinstance(primary, Mapping) else None
@@ -650,45 +661,376 @@ def _apply_limits(candidates: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     return results
 
 
-# --------------------------- Engine ----------------------------------------
-def interpret(request: Request, rules: Sequence[Rule] | Pack) -> list[Finding]:
-    """Evaluate the supplied rules or rulepack against the request payload."""
+# --------------------------- Compiled Matcher -----------------------------
+_ANY = ("any",)
+_WILDCARD_FAMILY = object()
+_COMPILED_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True)
+class _Condition:
+    """Synastry condition with its sets normalised once at compile time."""
+
+    aspects: frozenset[str]
+    aspect_in: frozenset[str]
+    families: frozenset[str]
+    bodies: frozenset[str]
+    bodies_a: frozenset[str]
+    bodies_b: frozenset[str]
+    min_severity: float
+
+    @classmethod
+    def from_mapping(cls, cond: Mapping[str, Any]) -> _Condition:
+        aspects = {_normalise_aspect(item) for item in cond.get("aspects", [])}
+        aspects.discard(None)
+        return cls(
+            aspects=frozenset(aspects),
+            aspect_in=frozenset(str(name).lower() for name in cond.get("aspect_in", [])),
+            families=frozenset(str(name).lower() for name in cond.get("family", [])),
+            bodies=frozenset(_coerce_seq(cond.get("bodies"))),
+            bodies_a=frozenset(_coerce_seq(cond.get("bodiesA"))),
+            bodies_b=frozenset(_coerce_seq(cond.get("bodiesB"))),
+            min_severity=float(cond.get("min_severity", 0.0)),
+        )
+
+    def body_tokens(self) -> list[tuple[Any, ...]]:
+        """Index tokens a hit must share for :func:`_matches_bodies` to pass."""
+
+        if self.bodies_a or self.bodies_b:
+            if self.bodies_a and "*" not in self.bodies_a:
+                return [("a", body) for body in self.bodies_a]
+            if self.bodies_b and "*" not in self.bodies_b:
+                return [("b", body) for body in self.bodies_b]
+            return [_ANY]
+        if not self.bodies:
+            return [_ANY]
+        if len(self.bodies) == 1:
+            return [("body", next(iter(self.bodies)))]
+        if len(self.bodies) == 2:
+            return [("pair", self.bodies)]
+        return []
 
+    def family_keys(self) -> list[Any]:
+        """Aspect families a matching hit can belong to (``None`` for unknown aspects)."""
+
+        allowed: set[Any] | None = None
+        if self.aspects:
+            allowed = {_aspect_family(name) for name in self.aspects}
+        if self.aspect_in:
+            names = {_aspect_family(name) for name in self.aspect_in}
+            allowed = names if allowed is None else allowed & names
+        if self.families:
+            allowed = set(self.families) if allowed is None else allowed & self.families
+        return [_WILDCARD_FAMILY] if allowed is None else list(allowed)
+
+    def accepts(self, hit: _PreparedHit) -> bool:
+        aspect = hit.aspect
+        if self.aspects and aspect not in self.aspects:
+            return False
+        if self.aspect_in and (aspect or "") not in self.aspect_in:
+            return False
+        if self.families and hit.family not in self.families:
+            return False
+        a, b = hit.a, hit.b
+        if self.bodies_a or self.bodies_b:
+            if self.bodies_a and "*" not in self.bodies_a and a not in self.bodies_a:
+                return False
+            if self.bodies_b and "*" not in self.bodies_b and b not in self.bodies_b:
+                return False
+        elif self.bodies:
+            if len(self.bodies) == 1:
+                if a not in self.bodies and b not in self.bodies:
+                    return False
+            elif {a, b} != self.bodies:
+                return False
+        return hit.severity >= self.min_severity
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedHit:
+    raw: Mapping[str, Any]
+    a: Any
+    b: Any
+    aspect: str | None
+    family: str | None
+    severity: float
+
+    @classmethod
+    def from_hit(cls, hit: Mapping[str, Any]) -> _PreparedHit:
+        aspect = _normalise_aspect(hit.get("aspect"))
+        return cls(
+            raw=hit,
+            a=hit.get("a"),
+            b=hit.get("b"),
+            aspect=aspect,
+            family=_aspect_family(aspect),
+            severity=float(hit.get("severity", 0.0)),
+        )
+
+    def tokens(self) -> set[tuple[Any, ...]]:
+        tokens = {_ANY, ("a", self.a), ("b", self.b), ("body", self.a), ("body", self.b)}
+        pair = {self.a, self.b}
+        if len(pair) == 2:
+            tokens.add(("pair", frozenset(pair)))
+        return tokens
+
+    def enriched(self) -> SynastryHit:
+        enriched = dict(self.raw)
+        enriched["aspect"] = self.aspect
+        enriched["family"] = self.family
+        enriched["strength"] = self.severity
+        return enriched
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledRule:
+    rule: Rule
+    # Index into ``CompiledPack.conditions``: the rule's own condition, or
+    # the ``any``/``all`` sub-conditions of its group block.
+    condition: int | None = None
+    group_mode: str | None = None
+    group_conditions: tuple[int, ...] = ()
+    group_threshold: int | None = None
+
+
+@dataclass(slots=True)
+class CompiledPack:
+    """Rulepack prepared for repeated :func:`interpret` calls.
+
+    Rules are normalised once and grouped by scope.  Synastry conditions are
+    indexed by ``(body token, aspect family)`` so each hit is only tested
+    against conditions that mention its bodies and family (or leave them
+    open).  Build instances with :func:`compile_pack`.
+    """
+
+    pack: Pack
+    etag: str
+    rules: dict[Any, list[_CompiledRule]]
+    conditions: list[_Condition]
+    index: dict[tuple[Any, Any], list[int]]
+    _profile_factors: dict[tuple[Any, int, str | None], float] = field(default_factory=dict)
+
+    def match_conditions(self, hits: Sequence[Mapping[str, Any]]) -> list[list[SynastryHit]]:
+        """Return the enriched hits accepted by each condition, in hit order."""
+
+        matched: list[list[SynastryHit]] = [[] for _ in self.conditions]
+        if not self.conditions:
+            return matched
+        index = self.index
+        for raw in hits:
+            hit = _PreparedHit.from_hit(raw)
+            candidates: list[int] = []
+            for token in hit.tokens():
+                candidates.extend(index.get((token, hit.family), ()))
+                candidates.extend(index.get((token, _WILDCARD_FAMILY), ()))
+            for position in candidates:
+                if self.conditions[position].accepts(hit):
+                    matched[position].append(hit.enriched())
+        return matched
+
+    def profile_multiplier(
+        self, scope: Any, rule_number: int, tags: Sequence[str], profile: str | None
+    ) -> float:
+        key = (scope, rule_number, profile)
+        factor = self._profile_factors.get(key)
+        if factor is None:
+            factor = _profile_multiplier(tags, self.pack, profile)
+            self._profile_factors[key] = factor
+        return factor
+
+
+def _as_pack(rules: Sequence[Rule] | Pack) -> Pack:
     if isinstance(rules, Mapping) and "rules" in rules:
-        pack = rules  # type: ignore[assignment]
+        return rules  # type: ignore[return-value]
+    return {
+        "rulepack": "inline",
+        "version": "1",
+        "rules": list(rules),
+        "profiles": {"default": {"tags": {}}},
+        "tag_map": {},
+        "meta": {},
+    }
+
+
+def pack_etag(rules: Sequence[Rule] | Pack) -> str:
+    """Return a content hash identifying a rulepack or inline rule list."""
+
+    encoded = json.dumps(
+        _as_pack(rules), sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _build_compiled(pack: Pack, etag: str) -> CompiledPack:
+    conditions: list[_Condition] = []
+    index: dict[tuple[Any, Any], list[int]] = defaultdict(list)
+
+    def add(cond: Mapping[str, Any]) -> int:
+        position = len(conditions)
+        condition = _Condition.from_mapping(cond)
+        conditions.append(condition)
+        for token in condition.body_tokens():
+            for family_key in condition.family_keys():
+                index[(token, family_key)].append(position)
+        return position
+
+    rules: dict[Any, list[_CompiledRule]] = defaultdict(list)
+    for raw_rule in pack.get("rules", []):
+        rule = _normalise_rule(raw_rule)
+        scope = rule.get("scope")
+        if scope != "synastry":
+            rules[scope].append(_CompiledRule(rule))
+            continue
+        cond = rule.get("when", {}) or {}
+        if "group" not in cond:
+            rules[scope].append(_CompiledRule(rule, condition=add(cond)))
+            continue
+        block = cond.get("group") or {}
+        mode = "any" if "any" in block else "all" if "all" in block else None
+        subconditions = tuple(add(sub) for sub in (block.get(mode) or [])) if mode else ()
+        threshold = block.get("count") or block.get("count_at_least")
+        rules[scope].append(
+            _CompiledRule(
+                rule,
+                group_mode=mode if block else None,
+                group_conditions=subconditions,
+                group_threshold=int(threshold) if threshold is not None else None,
+            )
+        )
+    return CompiledPack(pack, etag, dict(rules), conditions, dict(index))
+
+
+_compiled_cache: OrderedDict[str, CompiledPack] = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_pack(rules: Sequence[Rule] | Pack, *, etag: str | None = None) -> CompiledPack:
+    """Return a :class:`CompiledPack`, reusing cached compilations by ``etag``.
+
+    ``etag`` defaults to :func:`pack_etag`; callers that already track a
+    content hash for the pack (for example a file's digest) can pass it to
+    skip rehashing.
+    """
+
+    pack = _as_pack(rules)
+    key = etag or pack_etag(pack)
+    with _compiled_lock:
+        compiled = _compiled_cache.get(key)
+        if compiled is not None:
+            _compiled_cache.move_to_end(key)
+            return compiled
+    compiled = _build_compiled(pack, key)
+    with _compiled_lock:
+        _compiled_cache[key] = compiled
+        while len(_compiled_cache) > _COMPILED_CACHE_SIZE:
+            _compiled_cache.popitem(last=False)
+    return compiled
+
+
+def _group_matches(entry: _CompiledRule, matched: Sequence[Sequence[SynastryHit]]) -> list[SynastryHit]:
+    if entry.group_mode == "any":
+        unique: dict[tuple[Any, Any, Any], SynastryHit] = {}
+        for position in entry.group_conditions:
+            for hit in matched[position]:
+                unique.setdefault((hit.get("a"), hit.get("b"), hit.get("aspect")), hit)
+        matches = list(unique.values())
+    elif entry.group_mode == "all":
+        matches = []
+        for position in entry.group_conditions:
+            if not matched[position]:
+                return []
+            matches.extend(matched[position])
     else:
-        pack = {
-            "rulepack": "inline",
-            "version": "1",
-            "rules": list(rules),
-            "profiles": {"default": {"tags": {}}},
-            "tag_map": {},
-            "meta": {},
+        return []
+    if entry.group_threshold is not None and len(matches) < entry.group_threshold:
+        return []
+    return matches
+
+
+def _compiled_synastry_matches(
+    entry: _CompiledRule, matched: Sequence[Sequence[SynastryHit]]
+) -> list[dict[str, Any]]:
+    if entry.condition is None:
+        hits = _group_matches(entry, matched)
+        if not hits:
+            return []
+        strength = sum(float(hit.get("strength", 0.0)) for hit in hits) / len(hits)
+        return [{"kind": "group", "hits": hits, "strength": strength, "primary": hits[0]}]
+    return [
+        {
+            "kind": "synastry",
+            "hits": [hit],
+            "strength": float(hit.get("strength", 0.0)),
+            "primary": hit,
         }
+        for hit in matched[entry.condition]
+    ]
 
+
+# --------------------------- Engine ----------------------------------------
+def interpret(
+    request: Request,
+    rules: Sequence[Rule] | Pack | CompiledPack,
+    *,
+    etag: str | None = None,
+) -> list[Finding]:
+    """Evaluate the supplied rules or rulepack against the request payload.
+
+    ``rules`` may be a pack, an inline rule list or a :class:`CompiledPack`;
+    the first two are compiled through the cache in :func:`compile_pack`.
+    """
+
+    compiled = rules if isinstance(rules, CompiledPack) else compile_pack(rules, etag=etag)
+    pack = compiled.pack
     scope = request.get("scope")
     profile = request.get("profile")
+    entries = compiled.rules.get(scope, [])
 
-    matches: list[dict[str, Any]] = []
-    for raw_rule in pack.get("rules", []):
-        rule = _normalise_rule(raw_rule)
-        if rule.get("scope") != scope:
-            continue
+    matched: list[list[SynastryHit]] = []
+    if scope == "synastry" and entries:
+        matched = compiled.match_conditions(request.get("hits", []) or [])
 
+    matches: list[dict[str, Any]] = []
+    for rule_number, entry in enumerate(entries):
+        rule = entry.rule
         if scope == "synastry":
-            hits = request.get("hits", []) or []
-            for match in _match_synastry(rule, hits):
-                candidate = _prepare_candidate(rule, match, pack, scope, profile)
-                if candidate:
-                    matches.append(candidate)
+            rule_matches = _compiled_synastry_matches(entry, matched)
         else:
-            for match in _match_chart(rule, request):
-                candidate = _prepare_candidate(rule, match, pack, scope, profile)
-                if candidate:
-                    matches.append(candidate)
+            rule_matches = _match_chart(rule, request)
+        if not rule_matches:
+            continue
+        then = rule.get("then", {}) or {}
+        profile_factor = compiled.profile_multiplier(scope, rule_number, then.get("tags", []), profile)
+        for match in rule_matches:
+            # Score-only stubs go through conflict resolution and limits;
+            # text and metadata are rendered for the survivors alone.
+            raw_score, score = _score(rule, match, profile_factor)
+            matches.append(
+                {
+                    "rule_id": rule.get("id", "rule"),
+                    "raw_score": raw_score,
+                    "score": score,
+                    "limit": then.get("limit"),
+                    "has_boost": bool(then.get("boost")),
+                    "conflict_key": _build_conflict_key(match, rule, scope),
+                    "pair_key": _pair_key(match),
+                    "rule": rule,
+                    "match": match,
+                    "profile_factor": profile_factor,
+                }
+            )
 
-    resolved = _resolve_conflicts(matches)
-    limited = _apply_limits(resolved)
+    limited = [
+        _prepare_candidate(
+            stub["rule"],
+            stub["match"],
+            pack,
+            scope,
+            profile,
+            profile_factor=stub["profile_factor"],
+        )
+        for stub in _apply_limits(_resolve_conflicts(matches))
+    ]
 
     findings: list[Finding] = []
     for cand in limited:
@@ -711,7 +1053,10 @@ def interpret(request: Request, rules: Sequence[Rule] | Pack) -> list[Finding]:
 __all__ = [
     "ARCHETYPES",
     "ASPECT_SYMBOLS",
+    "CompiledPack",
     "Finding",
+    "compile_pack",
     "interpret",
     "load_rules",
+    "pack_etag",
 ]
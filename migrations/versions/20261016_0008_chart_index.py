@@ -0,0 +1,94 @@
+"""Add chart position and tag index tables."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.chart_index import position_rows, tag_rows
+
+revision = "20261016_0008_chart_index"
+down_revision = "20241202_0006_chart_soft_delete"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_BATCH = 1000
+
+
+def _backfill() -> None:
+    """Index charts stored before this revision, reading them in id order."""
+
+    bind = op.get_bind()
+    charts = sa.table(
+        "charts",
+        sa.column("id", sa.Integer()),
+        sa.column("bodies", sa.JSON()),
+        sa.column("houses", sa.JSON()),
+        sa.column("tags", sa.JSON()),
+    )
+    positions = sa.table(
+        "chart_positions",
+        sa.column("chart_id", sa.Integer()),
+        sa.column("body", sa.String()),
+        sa.column("longitude", sa.Float()),
+        sa.column("sign", sa.Integer()),
+        sa.column("house", sa.Integer()),
+    )
+    tags = sa.table("chart_tags", sa.column("chart_id", sa.Integer()), sa.column("tag", sa.String()))
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(charts.c.id, charts.c.bodies, charts.c.houses, charts.c.tags)
+            .where(charts.c.id > last_id)
+            .order_by(charts.c.id)
+            .limit(_BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            return
+        position_batch: list[dict] = []
+        tag_batch: list[dict] = []
+        for chart_id, bodies, houses, chart_tags in rows:
+            position_batch.extend(position_rows(chart_id, bodies, houses))
+            tag_batch.extend(tag_rows(chart_id, chart_tags))
+        if position_batch:
+            bind.execute(positions.insert(), position_batch)
+        if tag_batch:
+            bind.execute(tags.insert(), tag_batch)
+        last_id = int(rows[-1][0])
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chart_positions",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("chart_id", sa.Integer(), nullable=False),
+        sa.Column("body", sa.String(length=64), nullable=False),
+        sa.Column("longitude", sa.Float(), nullable=False),
+        sa.Column("sign", sa.Integer(), nullable=False),
+        sa.Column("house", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["chart_id"], ["charts.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("chart_id", "body", name="uq_chart_positions_chart_body"),
+    )
+    op.create_index("ix_chart_positions_body_longitude", "chart_positions", ["body", "longitude"])
+    op.create_index("ix_chart_positions_body_sign", "chart_positions", ["body", "sign"])
+    op.create_index("ix_chart_positions_body_house", "chart_positions", ["body", "house"])
+
+    op.create_table(
+        "chart_tags",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("chart_id", sa.Integer(), nullable=False),
+        sa.Column("tag", sa.String(length=64), nullable=False),
+        sa.ForeignKeyConstraint(["chart_id"], ["charts.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("chart_id", "tag", name="uq_chart_tags_chart_tag"),
+    )
+    op.create_index("ix_chart_tags_tag_chart", "chart_tags", ["tag", "chart_id"])
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chart_tags_tag_chart", table_name="chart_tags")
+    op.drop_table("chart_tags")
+    op.drop_index("ix_chart_positions_body_house", table_name="chart_positions")
+    op.drop_index("ix_chart_positions_body_sign", table_name="chart_positions")
+    op.drop_index("ix_chart_positions_body_longitude", table_name="chart_positions")
+    op.drop_table("chart_positions")
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 import astroengine.analysis.astrocartography as astrocartography
@@ -61,3 +63,98 @@ def test_compute_lines_reflects_swisseph_availability(monkeypatch: pytest.Monkey
     assert line.body == "sun"
     assert line.kind == "MC"
     assert line.coordinates
+
+
+class MovingAdapter(DummyAdapter):
+    """Adapter whose Sun/Moon RA advances with the requested moment."""
+
+    def julian_day(self, moment: datetime) -> float:
+        return 2451545.0 + moment.hour / 24.0
+
+    def body_equatorial(self, jd_ut: float, code: int):
+        offset = (jd_ut - 2451545.0) * 360.0
+        if code == 42:
+            return SimpleNamespace(right_ascension=(100.0 + offset) % 360.0, declination=20.0)
+        return SimpleNamespace(right_ascension=(160.0 + offset) % 360.0, declination=-10.0)
+
+
+def test_batch_matches_single_moments_and_finds_parans(monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy_swe = DummySweModule()
+    dummy_swe.MOON = 7
+    monkeypatch.setattr(astrocartography, "has_swe", lambda: True)
+    monkeypatch.setattr(astrocartography, "swe", lambda: dummy_swe)
+
+    adapter = MovingAdapter()
+    moments = [datetime(2024, 1, 1, hour, tzinfo=timezone.utc) for hour in (0, 6, 12)]
+    batch = astrocartography.compute_astrocartography_batch(
+        moments, bodies=("sun", "moon"), adapter=adapter, show_parans=True
+    )
+
+    assert len(batch) == 3
+    for moment, result in zip(moments, batch):
+        single = astrocartography.compute_astrocartography_lines(
+            moment, bodies=("sun", "moon"), adapter=adapter, show_parans=True
+        )
+        assert single == result
+    first = batch[0]
+    assert [(line.body, line.kind) for line in first.lines[:4]] == [
+        ("sun", "MC"),
+        ("sun", "IC"),
+        ("sun", "ASC"),
+        ("sun", "DSC"),
+    ]
+    assert first.lines[0].coordinates == ((100.0, -90.0), (100.0, 90.0))
+    # A body at declination 20° is circumpolar beyond latitude 70°.
+    asc = first.lines[2].coordinates
+    assert max(abs(lat) for _, lat in asc) <= 70.0
+
+    separation = math.degrees(
+        math.acos(
+            math.sin(math.radians(20.0)) * math.sin(math.radians(-10.0))
+            + math.cos(math.radians(20.0)) * math.cos(math.radians(10.0)) * 0.5
+        )
+    )
+    pairs = {(p["primary"]["body"], p["secondary"]["body"]) for p in first.parans}
+    assert ("sun", "moon") in pairs and ("moon", "sun") in pairs
+    for paran in first.parans:
+        meridian = next(
+            line
+            for line in first.lines
+            if line.body == paran["primary"]["body"] and line.kind == paran["primary"]["kind"]
+        )
+        assert paran["longitude"] == pytest.approx(meridian.coordinates[0][0])
+        assert paran["metadata"]["angular_separation_deg"] == pytest.approx(separation)
+
+
+def _reference_rdp(points, tolerance):
+    if len(points) < 3:
+        return points
+    (x1, y1), (x2, y2) = points[0], points[-1]
+    best, index = 0.0, 0
+    for i in range(1, len(points) - 1):
+        x0, y0 = points[i]
+        if (x1, y1) == (x2, y2):
+            dist = math.hypot(x0 - x1, y0 - y1)
+        else:
+            dist = abs((y2 - y1) * x0 - (x2 - x1) * y0 + x2 * y1 - y2 * x1) / math.hypot(
+                x2 - x1, y2 - y1
+            )
+        if dist > best:
+            best, index = dist, i
+    if best > tolerance:
+        return _reference_rdp(points[: index + 1], tolerance)[:-1] + _reference_rdp(
+            points[index:], tolerance
+        )
+    return (points[0], points[-1])
+
+
+def test_batched_rdp_matches_recursive_form() -> None:
+    rng = np.random.default_rng(7)
+    tracks = [
+        tuple((float(x), float(y)) for x, y in zip(np.cumsum(rng.normal(size=n)), range(n)))
+        for n in (2, 3, 17, 80)
+    ]
+    for tolerance in (0.0, 0.3, 2.0):
+        for track in tracks:
+            expected = track if tolerance <= 0.0 else _reference_rdp(track, tolerance)
+            assert astrocartography._rdp_simplify(track, tolerance) == expected
@@ -0,0 +1,120 @@
+"""Tests for the shared-grid station/ingress/lunation engine."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+import astroengine.detectors.ephemeris_events as ephemeris_events
+
+_ORIGIN = 2460000.5
+_WAVE = 2.0 * math.pi / 50.0
+
+
+class AnalyticSampler:
+    """Closed-form longitudes; Mercury loops so it stations and retrogrades."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, ...]] = []
+
+    @staticmethod
+    def _body(name: str, t: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if name == "mercury":
+            longitude = 105.0 + 0.5 * t + 10.0 * np.sin(_WAVE * t)
+            return longitude, 0.5 + 10.0 * _WAVE * np.cos(_WAVE * t)
+        rate = {"sun": 1.0, "moon": 13.0}.get(name, 0.1)
+        return 280.0 + rate * t, np.full_like(t, rate)
+
+    def __call__(self, jds, bodies):
+        self.calls.append(tuple(bodies))
+        t = np.asarray(jds, dtype=float) - _ORIGIN
+        pairs = [self._body(name, t) for name in bodies]
+        longitude = np.stack([lon for lon, _ in pairs], axis=1) % 360.0
+        speed = np.stack([rate for _, rate in pairs], axis=1)
+        return longitude, speed
+
+
+def _mercury_stations(days: float) -> list[float]:
+    base = math.acos(-0.5 / (10.0 * _WAVE)) / _WAVE
+    period = 2.0 * math.pi / _WAVE
+    roots = []
+    for cycle in range(int(days // period) + 1):
+        roots.extend((cycle * period + base, (cycle + 1) * period - base))
+    return sorted(root for root in roots if 0.0 <= root <= days)
+
+
+def test_stations_are_refined_and_classified() -> None:
+    sampler = AnalyticSampler()
+    result = ephemeris_events.find_ephemeris_events(
+        _ORIGIN,
+        _ORIGIN + 200.0,
+        stations=["Mercury"],
+        ingresses=(),
+        lunations=False,
+        sampler=sampler,
+    )
+
+    expected = _mercury_stations(200.0)
+    assert [event.jd - _ORIGIN for event in result.stations] == pytest.approx(expected, abs=1e-4)
+    assert [event.station_type for event in result.stations] == ["retrograde", "direct"] * (
+        len(expected) // 2
+    )
+    assert all(event.body == "Mercury" for event in result.stations)
+    assert result.ingresses == () and result.lunations == ()
+
+
+def test_ingresses_cover_both_directions() -> None:
+    result = ephemeris_events.find_ephemeris_events(
+        _ORIGIN,
+        _ORIGIN + 100.0,
+        stations=(),
+        ingresses=["Sun", "mercury"],
+        lunations=False,
+        sampler=AnalyticSampler(),
+    )
+
+    sun = [event for event in result.ingresses if event.body == "Sun"]
+    assert [event.jd - _ORIGIN for event in sun] == pytest.approx([20.0, 50.0, 80.0], abs=1e-5)
+    assert [(event.from_sign, event.to_sign) for event in sun] == [
+        ("Capricorn", "Aquarius"),
+        ("Aquarius", "Pisces"),
+        ("Pisces", "Aries"),
+    ]
+    assert min(sun[-1].longitude, 360.0 - sun[-1].longitude) < 1e-5
+
+    mercury = [event for event in result.ingresses if event.body == "mercury"]
+    assert {event.motion for event in mercury} == {"direct", "retrograde"}
+    for event in mercury:
+        assert (event.longitude + 1e-5) % 30.0 < 2e-5
+        assert (event.speed_longitude < 0) == (event.motion == "retrograde")
+    jds = [event.jd for event in result.ingresses]
+    assert jds == sorted(jds)
+
+
+def test_lunations_alternate_and_refinement_is_batched() -> None:
+    sampler = AnalyticSampler()
+    result = ephemeris_events.find_ephemeris_events(
+        _ORIGIN, _ORIGIN + 120.0, stations=(), ingresses=(), sampler=sampler
+    )
+
+    assert [event.jd - _ORIGIN for event in result.lunations] == pytest.approx(
+        [15.0 * k for k in range(1, 9)], abs=1e-5
+    )
+    assert [event.phase for event in result.lunations] == ["full_moon", "new_moon"] * 4
+    new_moon = result.lunations[1]
+    assert new_moon.moon_longitude == pytest.approx(new_moon.sun_longitude, abs=1e-4)
+    # One grid call, then every bracket shares each refinement call.
+    assert len(sampler.calls) < len(result.lunations)
+
+
+def test_empty_and_invalid_requests() -> None:
+    sampler = AnalyticSampler()
+    empty = ephemeris_events.find_ephemeris_events(_ORIGIN, _ORIGIN, sampler=sampler)
+    assert empty == ephemeris_events.EphemerisEvents((), (), ())
+    assert sampler.calls == []
+    with pytest.raises(ValueError):
+        ephemeris_events.find_ephemeris_events(
+            _ORIGIN, _ORIGIN + 1.0, step_days=0.0, sampler=sampler
+        )
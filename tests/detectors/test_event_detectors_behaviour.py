@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 import astroengine.detectors.directed_aspects as directed
@@ -100,18 +101,22 @@ def test_progressed_aspects_track_motion_and_orb(detector_stubs, monkeypatch: py
     }
     natal_chart = SimpleNamespace(positions=natal_positions)
 
-    def fake_progressed_chart(*_args, **_kwargs):
-        moment = _kwargs["current"] if "current" in _kwargs else _args[1]
-        delta_days = int((moment - start).total_seconds() // 86400)
-        longitude = {0: 90.0, 1: 92.0}.get(delta_days, 95.0)
-        positions = {
-            "Sun": SimpleNamespace(longitude=0.0, speed_longitude=0.0),
-            "Mars": SimpleNamespace(longitude=longitude, speed_longitude=0.5),
-        }
-        return SimpleNamespace(chart=SimpleNamespace(positions=positions))
+    class FakeEphemeris:
+        bodies = ("Sun", "Mars")
+
+        @classmethod
+        def sample(cls, natal_moment, *_args, **_kwargs):
+            assert natal_moment == start
+            return cls()
+
+        def positions(self, elapsed_days):
+            mars = [{0: 90.0, 1: 92.0}.get(int(day), 95.0) for day in elapsed_days]
+            longitudes = np.column_stack([np.zeros(len(mars)), mars])
+            speeds = np.column_stack([np.zeros(len(mars)), np.full(len(mars), 0.5)])
+            return longitudes, speeds
 
     monkeypatch.setattr(progressed, "compute_natal_chart", lambda *args, **kwargs: natal_chart)
-    monkeypatch.setattr(progressed, "compute_secondary_progressed_chart", fake_progressed_chart)
+    monkeypatch.setattr(progressed, "ProgressedEphemeris", FakeEphemeris)
 
     hits = progressed.progressed_natal_aspects(
         "1970-01-01T00:00:00Z",
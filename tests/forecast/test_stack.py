@@ -2,15 +2,16 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
 import pytest
 
 from astroengine.chart import ChartLocation
 from astroengine.chart.natal import NatalChart
-from astroengine.chart.transits import TransitContact
 from astroengine.config.settings import Settings
 from astroengine.detectors_aspects import AspectHit
 from astroengine.ephemeris.swisseph_adapter import HousePositions
 from astroengine.forecast.stack import ForecastChart, ForecastWindow, build_forecast_stack
+from astroengine.scoring import OrbCalculator
 
 
 @pytest.fixture()
@@ -122,44 +123,40 @@ def test_build_forecast_stack_merges_components(monkeypatch: pytest.MonkeyPatch,
     def fake_solar_arc(**_: object) -> list[AspectHit]:
         return [solar_arc_hit]
 
-    ingress = base_time - timedelta(hours=12)
-    egress = base_time + timedelta(hours=18)
+    sampled: list[tuple[datetime, datetime]] = []
 
-    contact = TransitContact(
-        moment=base_time,
-        julian_day=0.0,
-        transiting_body="Mars",
-        natal_body="Sun",
-        angle=0,
-        orb=0.2,
-        separation=0.2,
-        orb_allow=1.5,
-        ingress=ingress,
-        ingress_jd=0.0,
-        egress=egress,
-        egress_jd=0.0,
-    )
+    def fake_sample_motion(origin, start, end, bodies):  # type: ignore[no-untyped-def]
+        # Mars moves 4°/day and sits exactly on the natal Sun (0°) at the hit.
+        sampled.append((start, end))
+        days = np.linspace(0.0, (end - origin).total_seconds() / 86400.0, 29)
+        names = list(bodies)
+        longitude = np.zeros((days.size, len(names)))
+        speed = np.zeros((days.size, len(names)))
+        mars = names.index("Mars")
+        longitude[:, mars] = np.mod(4.0 * (days - 2.0), 360.0)
+        speed[:, mars] = 4.0
+        return days, longitude, speed
 
     monkeypatch.setattr("astroengine.forecast.stack.scan_transits", fake_scan_transits)
     monkeypatch.setattr("astroengine.forecast.stack.progressed_natal_aspects", fake_progressed)
     monkeypatch.setattr("astroengine.forecast.stack.solar_arc_natal_aspects", fake_solar_arc)
+    monkeypatch.setattr("astroengine.forecast.stack._sample_motion", fake_sample_motion)
 
-    class DummyScanner:
-        def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
-            self.adapter = type("Adapter", (), {})()
-
-        def scan(self, natal_chart, moment):  # type: ignore[no-untyped-def]
-            return [contact]
-
-    monkeypatch.setattr("astroengine.forecast.stack.TransitScanner", DummyScanner)
+    # Mars/Sun conjunction orb (6°) at 4°/day gives a 36h half-window.
+    half_window = timedelta(days=OrbCalculator().orb_for("Mars", "Sun", 0.0) / 4.0)
+    ingress = base_time - half_window
+    egress = base_time + half_window
 
     events = build_forecast_stack(settings, sample_chart)
 
     assert len(events) == 3
 
     transit_event = next(event for event in events if event["technique"] == "transits")
-    assert transit_event["start"] == ingress.astimezone(UTC).isoformat().replace("+00:00", "Z")
-    assert transit_event["end"] == egress.astimezone(UTC).isoformat().replace("+00:00", "Z")
+    start = datetime.fromisoformat(transit_event["start"].replace("Z", "+00:00"))
+    end = datetime.fromisoformat(transit_event["end"].replace("Z", "+00:00"))
+    assert abs((start - ingress).total_seconds()) < 2.0
+    assert abs((end - egress).total_seconds()) < 2.0
+    assert sampled == [(sample_chart.window.start, sample_chart.window.end)]
     assert pytest.approx(transit_event["exactness"], rel=1e-6) == 0.2
 
     techniques = {event["technique"] for event in events}
@@ -192,3 +189,78 @@ def test_forecast_stack_respects_component_settings(monkeypatch: pytest.MonkeyPa
 
     assert len(events) == 1
     assert events[0]["technique"] == "solar_arc"
+
+
+def test_transit_windows_span_chunks_from_pooled_scan(
+    monkeypatch: pytest.MonkeyPatch, sample_chart: ForecastChart
+) -> None:
+    import astroengine.forecast.stack as stack
+
+    settings = Settings()
+    settings.perf.max_scan_days = 2
+    settings.perf.workers = 2
+    settings.forecast_stack.components["progressions"] = False
+    settings.forecast_stack.components["solar_arc"] = False
+    origin = sample_chart.window.start
+    hit_time = origin + timedelta(days=4)
+
+    def fake_scan_transits(*, start_ts: str, end_ts: str, **_: object) -> list[AspectHit]:
+        start = datetime.fromisoformat(start_ts.replace("Z", "+00:00"))
+        end = datetime.fromisoformat(end_ts.replace("Z", "+00:00"))
+        if not start <= hit_time < end:
+            return []
+        return [
+            _make_hit(
+                when=hit_time,
+                moving="Moon",
+                target="Sun",
+                angle=90,
+                orb_abs=0.0,
+                orb_allow=1.0,
+                speed=None,
+                family="major",
+            )
+        ]
+
+    def fake_sample_motion(origin_, start, end, bodies):  # type: ignore[no-untyped-def]
+        first = (start - origin_).total_seconds() / 86400.0
+        last = (end - origin_).total_seconds() / 86400.0
+        days = np.linspace(first, last, 9)
+        names = list(bodies)
+        longitude = np.zeros((days.size, len(names)))
+        speed = np.zeros((days.size, len(names)))
+        moon = names.index("Moon")
+        longitude[:, moon] = np.mod(90.0 + 13.0 * (days - 4.0), 360.0)
+        speed[:, moon] = 13.0
+        return days, longitude, speed
+
+    initialised: list[object] = []
+
+    class InlinePool:
+        def __init__(self, *, max_workers, initializer):  # type: ignore[no-untyped-def]
+            initialised.append(max_workers)
+            self._initializer = initializer
+
+        def __enter__(self):  # type: ignore[no-untyped-def]
+            return self
+
+        def __exit__(self, *_exc):  # type: ignore[no-untyped-def]
+            return False
+
+        def map(self, fn, items):  # type: ignore[no-untyped-def]
+            return [fn(item) for item in items]
+
+    monkeypatch.setattr(stack, "scan_transits", fake_scan_transits)
+    monkeypatch.setattr(stack, "_sample_motion", fake_sample_motion)
+    monkeypatch.setattr(stack, "ProcessPoolExecutor", InlinePool)
+
+    events = stack.build_forecast_stack(settings, sample_chart)
+
+    assert initialised == [2]
+    assert len(events) == 1
+    # Moon/Sun square orb at 13°/day straddles the 2-day chunk boundary at day 4.
+    half_window = timedelta(days=OrbCalculator().orb_for("Moon", "Sun", 90.0) / 13.0)
+    start = datetime.fromisoformat(events[0]["start"].replace("Z", "+00:00"))
+    end = datetime.fromisoformat(events[0]["end"].replace("Z", "+00:00"))
+    assert abs((start - (hit_time - half_window)).total_seconds()) < 2.0
+    assert abs((end - (hit_time + half_window)).total_seconds()) < 2.0
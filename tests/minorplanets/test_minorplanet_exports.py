@@ -14,6 +14,8 @@ pq = pytest.importorskip(
     reason="pyarrow not installed; install extras with `pip install -e .[exporters,providers]`.",
 )
 
+import numpy as np
+
 from astroengine.engine.minorplanets import mpc_ingest
 
 
@@ -23,6 +25,17 @@ class DummyEphem:
         return (base + moment.timetuple().tm_yday) % 360.0
 
 
+class BatchedEphem(DummyEphem):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def longitudes(self, rows, moments) -> np.ndarray:
+        self.calls += 1
+        base = np.array([(row.mpc_number or 0) * 1.0 for row in rows])
+        days = np.array([moment.timetuple().tm_yday for moment in moments])
+        return base[:, None] + days[None, :] - 360.0
+
+
 def _row(number: int) -> mpc_ingest.MpcRow:
     return mpc_ingest.MpcRow(
         mpc_number=number,
@@ -66,3 +79,19 @@ def test_export_zarr_angles(tmp_path: Path) -> None:
     arr = zarr.open(store_path, mode="r")
     assert arr.shape == (2, 2)
     assert arr[0, 0] != arr[0, 1]
+
+
+def test_longitude_grid_prefers_batched_ephemeris() -> None:
+    rows = [_row(1), _row(2), _row(3)]
+    start = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+    moments = mpc_ingest._build_time_grid(start, start + dt.timedelta(days=3), dt.timedelta(hours=12))
+    assert len(moments) == 7 and moments[-1] == start + dt.timedelta(days=3)
+
+    batched = BatchedEphem()
+    grid = mpc_ingest.longitude_grid(batched, rows, moments)
+    assert batched.calls == 1
+    np.testing.assert_allclose(grid % 360.0, mpc_ingest.longitude_grid(DummyEphem(), rows, moments))
+
+    steps = mpc_ingest.quantise_longitudes(np.array([-0.004, 359.996, 12.345]), scale=100)
+    assert steps.dtype == np.uint16
+    assert steps.tolist() == [0, 0, 1234]
@@ -232,3 +232,66 @@ def test_missing_semi_major_reconstructed(tmp_path: Path) -> None:
     assert len(rows) == 1
     row = rows[0]
     assert row.semi_major_axis_au == pytest.approx(semi_major, rel=1e-7)
+
+
+def test_columns_stream_in_chunks_and_filter(tmp_path: Path) -> None:
+    lines = [
+        _mpc_line(
+            number,
+            3.0 + number,
+            0.15,
+            2459200.5,
+            10.0 * number,
+            73.59748,
+            80.30563,
+            10.58764,
+            0.0785020,
+            0.21456678,
+            2.7678531,
+            number % 10,
+            f"X{number:04d}",
+            f"({number}) Rock",
+        )
+        for number in range(1, 41)
+    ]
+    path = tmp_path / "many.dat"
+    path.write_text("\n".join(["# header", *lines]) + "\n")
+
+    blocks = list(mpc_ingest.iter_mpcorb_columns(path, chunk_bytes=1024))
+    assert len(blocks) > 1
+    assert sum(len(block) for block in blocks) == 40
+
+    rows = [row for block in blocks for row in block.rows()]
+    assert rows == mpc_ingest.parse_mpcorb(path)
+    assert [row.mpc_number for row in rows] == list(range(1, 41))
+    assert rows[4].name == "(5) Rock" and rows[4].mean_anomaly_deg == 50.0
+
+    kept = [row for block in blocks for row in block.filter(H_max=12.0, U_max=5).rows()]
+    assert kept == mpc_ingest.filter_rows(rows)
+
+
+def test_ingest_mpcorb_streams_into_database(tmp_path: Path) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    def line(number: int, H: float) -> str:
+        return _mpc_line(
+            number, H, 0.15, 2459200.5, 1.0, 2.0, 3.0, 4.0, 0.1, 0.2, 2.8, 0, "", f"({number})"
+        )
+
+    path = tmp_path / "ingest.dat"
+    path.write_text("\n".join([line(1, 3.3), line(2, 15.0), line(3, 5.0)]) + "\n")
+    engine = create_engine("sqlite:///:memory:")
+    mpc_ingest.MinorPlanetBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        counts = mpc_ingest.ingest_mpcorb(session, path)
+        session.commit()
+        assert (counts.inserted, counts.updated) == (2, 0)
+        counts = mpc_ingest.ingest_mpcorb(session, path, H_max=None)
+        session.commit()
+        assert (counts.inserted, counts.updated) == (1, 2)
+        numbers = session.scalars(
+            mpc_ingest.select(mpc_ingest.MinorPlanet.mpc_number).order_by("mpc_number")
+        ).all()
+        assert numbers == [1, 2, 3]
@@ -6,10 +6,12 @@ from sqlalchemy.orm import Session
 from astroengine.engine.minorplanets import mpc_ingest
 
 
-def _row(number: int, name: str, semi_major: float) -> mpc_ingest.MpcRow:
+def _row(
+    number: int | None, name: str | None, semi_major: float, provisional: str | None = None
+) -> mpc_ingest.MpcRow:
     return mpc_ingest.MpcRow(
         mpc_number=number,
-        provisional_designation=None,
+        provisional_designation=provisional,
         name=name,
         kind="asteroid",
         family=None,
@@ -48,3 +50,36 @@ def test_upsert_inserts_and_updates(tmp_path) -> None:
 
         stored = session.query(mpc_ingest.MinorPlanet).filter_by(mpc_number=1).one()
         assert stored.semi_major_axis_au == 2.80
+
+
+def test_bulk_upsert_matches_identities_across_batches() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    mpc_ingest.MinorPlanetBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        mpc_ingest.upsert_rows(session, [_row(1, "Ceres", 2.77)])
+        session.commit()
+
+        rows = [
+            _row(1, None, 2.78),
+            _row(None, None, 2.5, provisional="2024 AB"),
+            _row(3, "Juno", 2.67),
+            _row(None, "Vesta", 2.36),
+            _row(None, "Vesta", 2.37),
+            _row(3, None, 2.68),
+            _row(None, None, 2.6, provisional="2024 AB"),
+        ]
+        counts = mpc_ingest.upsert_rows(session, rows, batch_size=2)
+        session.commit()
+        assert (counts.inserted, counts.updated) == (3, 4)
+
+        stored = {
+            (body.mpc_number, body.provisional_designation, body.name): body.semi_major_axis_au
+            for body in session.query(mpc_ingest.MinorPlanet)
+        }
+        assert stored == {
+            (1, None, "Ceres"): 2.78,
+            (None, "2024 AB", None): 2.6,
+            (3, None, "Juno"): 2.68,
+            (None, None, "Vesta"): 2.37,
+        }
@@ -0,0 +1,79 @@
+"""Population search tests for the synastry engine."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from astroengine.synastry.engine import (
+    DEFAULT_ASPECT_SET,
+    DEFAULT_ORB_POLICY,
+    DEFAULT_WEIGHTS,
+    ChartPopulation,
+    ChartPositions,
+    compute_scores,
+    detect_hits,
+    population_scores,
+    search_population,
+)
+
+_BODIES = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Saturn", "True Node", "Ascendant")
+
+
+def _charts(seed: int, count: int) -> dict[str, dict[str, float]]:
+    rng = np.random.default_rng(seed)
+    charts = {}
+    for index in range(count):
+        values = rng.uniform(0.0, 360.0, len(_BODIES))
+        charts[f"chart-{index}"] = {
+            body: float(value) for body, value in zip(_BODIES, values) if rng.random() > 0.15
+        }
+    return charts
+
+
+@pytest.mark.parametrize("gamma", [1.0, 2.0])
+def test_population_scores_match_pairwise_scoring(gamma: float) -> None:
+    query = ChartPositions(_charts(7, 1)["chart-0"])
+    charts = _charts(11, 60)
+    population = ChartPopulation.from_positions(charts)
+
+    score, raw_total, hits = population_scores(query, population, gamma=gamma, chunk_size=7)
+
+    for row, positions in enumerate(charts.values()):
+        pairwise = detect_hits(
+            query,
+            ChartPositions(positions),
+            aspects=DEFAULT_ASPECT_SET,
+            policy=DEFAULT_ORB_POLICY,
+            gamma=gamma,
+        )
+        expected = compute_scores(pairwise, DEFAULT_WEIGHTS)
+        assert score[row] == pytest.approx(expected.overall, abs=1e-9)
+        assert raw_total[row] == pytest.approx(expected.raw_total, abs=1e-9)
+        assert hits[row] == len(pairwise)
+
+
+def test_search_population_ranks_top_k_with_stable_ties() -> None:
+    query = ChartPositions({"Sun": 10.0, "Moon": 100.0})
+    population = ChartPopulation.from_positions(
+        {
+            "none": {"Sun": 47.0},
+            "trine": {"Venus": 130.0},
+            "twin": {"Venus": 130.0},
+            "double": {"Venus": 130.0, "Jupiter": 220.0},
+        }
+    )
+
+    matches = search_population(query, population, top_k=3, aspects=(120,), chunk_size=2)
+    assert [match.id for match in matches] == ["double", "trine", "twin"]
+    assert matches[0].hits == 2
+    assert matches[1].score == pytest.approx(matches[2].score)
+
+    ranked = search_population(query, population, top_k=10, aspects=(120,), min_score=1e-6)
+    assert [match.id for match in ranked][-1] == "twin"
+    assert search_population(query, population, top_k=0) == []
+
+
+def test_population_rejects_mismatched_shapes() -> None:
+    with pytest.raises(ValueError):
+        ChartPopulation(ids=np.array(["a"]), bodies=("sun",), longitudes=np.zeros((2, 1)))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
 
 import pytest
@@ -153,3 +154,180 @@ def test_create_chart_stores_timezone_metadata_for_nonexistent_local() -> None:
     assert metadata["gap_seconds"] == 3600
     assert metadata["utc"] == resolution.utc.isoformat().replace("+00:00", "Z")
 
+
+def test_bulk_import_upserts_by_chart_key() -> None:
+    _clear_charts()
+    records = [
+        {
+            "chart_key": "bulk-a",
+            "name": "A",
+            "kind": "natal",
+            "dt_utc": "2020-01-01T00:00:00Z",
+            "lat": 1,
+            "lon": 2,
+        },
+        {"chart_key": "bulk-b", "name": "B", "kind": "natal", "tags": ["Client"]},
+        {"chart_key": "bulk-c", "dt_utc": "not-a-date"},
+    ]
+    response = client.post("/v1/charts/import/bulk", json={"charts": records})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == 2 and result["updated"] == 0
+    assert [failure["index"] for failure in result["failures"]] == [2]
+    assert result["ids"][2] is None
+
+    renamed = client.post(
+        "/v1/charts/import/bulk",
+        json={"charts": [{"chart_key": "bulk-a", "name": "A2", "kind": "natal"}]},
+    ).json()
+    assert renamed["created"] == 0 and renamed["updated"] == 1
+    assert renamed["ids"][0] == result["ids"][0]
+
+    chart = client.get(f"/v1/charts/{result['ids'][0]}").json()
+    assert chart["name"] == "A2"
+    assert client.get(f"/v1/charts/{result['ids'][1]}").json()["tags"] == ["client"]
+
+
+def test_bulk_create_streams_progress_and_reports_failures() -> None:
+    pytest.importorskip("swisseph")
+    _clear_charts()
+    births = [
+        {"name": "UTC", "dt_utc": "2000-01-01T12:00:00Z", "tz": "UTC", "lat": 51.5, "lon": -0.1},
+        {
+            "name": "Local",
+            "dt_local": "1990-06-15T08:30:00",
+            "tz": "Europe/Paris",
+            "lat": 48.9,
+            "lon": 2.35,
+        },
+        {
+            "name": "Bad",
+            "dt_local": "1990-06-15T08:30:00",
+            "tz": "Nowhere/Void",
+            "lat": 0.0,
+            "lon": 0.0,
+        },
+    ]
+    response = client.post("/v1/charts/bulk", params={"stream": True}, json={"charts": births})
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines() if line]
+    assert {event["stage"] for event in events[:-1]} == {"timezone", "compute", "insert"}
+    result = events[-1]["result"]
+    assert result["created"] == 2
+    assert [failure["index"] for failure in result["failures"]] == [2]
+
+    local = client.get(f"/v1/charts/{result['ids'][1]}").json()
+    assert local["metadata"]["timezone_resolution"]["source"] == "local"
+    assert local["bodies"]
+
+
+def test_bulk_stream_stops_run_when_client_disconnects() -> None:
+    import asyncio
+    import threading
+    import time
+
+    from app.routers.charts import ChartBulkResult, _stream_progress
+
+    reports: list[int] = []
+    finished = threading.Event()
+
+    def _run(progress) -> ChartBulkResult:
+        try:
+            for step in range(1_000):
+                progress("compute", step, 1_000)
+                reports.append(step)
+                time.sleep(0.01)
+            return ChartBulkResult(processed=0, created=0, updated=0)
+        finally:
+            finished.set()
+
+    response = _stream_progress(_run)
+
+    async def _read_first_line() -> str:
+        lines = response.body_iterator
+        first = await anext(lines)
+        await lines.aclose()
+        return first
+
+    assert json.loads(asyncio.run(_read_first_line()))["stage"] == "compute"
+    assert finished.wait(2)
+    assert len(reports) < 1_000
+
+
+def test_position_search_uses_index_for_ranges_signs_and_tags() -> None:
+    _clear_charts()
+    cusps = [float(30 * index) for index in range(12)]
+    with session_scope() as db:
+        repo = ChartRepo()
+        leo = repo.create(
+            db,
+            chart_key="mars-leo",
+            dt_utc=datetime(2001, 1, 1, tzinfo=UTC),
+            bodies={"Mars": {"longitude": 136.5}, "Sun": {"longitude": 359.0}},
+            houses={"cusps": cusps, "ascendant": 0.0, "midheaven": 270.0},
+            tags=["client"],
+        )
+        repo.create(
+            db,
+            chart_key="mars-leo-other",
+            dt_utc=datetime(2002, 1, 1, tzinfo=UTC),
+            bodies={"Mars": {"longitude": 134.0}},
+            tags=["prospect"],
+        )
+        repo.create(
+            db,
+            chart_key="mars-virgo",
+            dt_utc=datetime(2003, 1, 1, tzinfo=UTC),
+            bodies={"Mars": {"longitude": 160.0}, "Sun": {"longitude": 1.5}},
+            tags=["client"],
+        )
+        leo_id = leo.id
+
+    def _keys(query: dict) -> list[str]:
+        response = client.post("/v1/charts/search", json=query)
+        assert response.status_code == 200
+        return sorted(item["chart_key"] for item in response.json())
+
+    mars_15_leo = {"body": "Mars", "longitude": 135.0, "orb": 3.0}
+    assert _keys({"positions": [mars_15_leo]}) == ["mars-leo", "mars-leo-other"]
+    assert _keys({"positions": [mars_15_leo], "tags": ["Client"]}) == ["mars-leo"]
+    assert _keys({"positions": [{"body": "Sun", "longitude": 0.0, "orb": 2.0}]}) == [
+        "mars-leo",
+        "mars-virgo",
+    ]
+    assert _keys({"positions": [{"body": "mars", "sign": "Leo", "house": 5}]}) == ["mars-leo"]
+    assert _keys({"positions": [{"body": "Midheaven", "sign": 9}]}) == ["mars-leo"]
+    unknown_sign = {"positions": [{"body": "Mars", "sign": "Ophiuchus"}]}
+    assert client.post("/v1/charts/search", json=unknown_sign).status_code == 422
+
+    client.patch(f"/v1/charts/{leo_id}/tags", json={"tags": ["archived"]})
+    assert _keys({"positions": [mars_15_leo], "tags": ["client"]}) == []
+    listed = client.get("/v1/charts", params=[("tag", "archived")]).json()
+    assert [item["chart_key"] for item in listed] == ["mars-leo"]
+
+
+def test_index_follows_any_session_and_caps_tag_length() -> None:
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session
+
+    from app.db.models import ChartPosition, ChartTag
+
+    _clear_charts()
+    long_tag = "x" * 70
+    with Session(bind=engine) as db:
+        chart = ChartRepo().create(
+            db,
+            chart_key="plain-session",
+            dt_utc=datetime(2004, 1, 1, tzinfo=UTC),
+            bodies={"Venus": {"longitude": 45.0}},
+            tags=[long_tag],
+        )
+        db.commit()
+        chart_id = chart.id
+        bodies = db.execute(
+            select(ChartPosition.body).where(ChartPosition.chart_id == chart_id)
+        ).scalars()
+        tags = db.execute(select(ChartTag.tag).where(ChartTag.chart_id == chart_id)).scalars()
+        assert list(bodies) == ["venus"]
+        assert list(tags) == ["x" * 64]
+    assert client.get(f"/v1/charts/{chart_id}").json()["tags"] == ["x" * 64]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from astroengine.api.rate_limit import (
+    LocalRedisStandIn,
+    MemoryBucketStore,
+    RedisBucketStore,
+    SQLiteBucketStore,
+    TokenBucketRateLimiter,
+    create_bucket_store,
+    heavy_endpoint_rate_limiter,
+)
+from astroengine.observability.metrics import RATE_LIMIT_REJECTIONS, RATE_LIMIT_STORE_ERRORS
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _decisions(limiter: TokenBucketRateLimiter, identity: str, count: int) -> list[bool]:
+    async def run() -> list[bool]:
+        return [(await limiter.check(identity)).allowed for _ in range(count)]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite", "redis"])
+def test_token_bucket_bursts_then_refills(backend, tmp_path) -> None:
+    store = {
+        "memory": lambda: MemoryBucketStore(stripes=4),
+        "sqlite": lambda: SQLiteBucketStore(tmp_path / "buckets.sqlite"),
+        "redis": lambda: RedisBucketStore(LocalRedisStandIn()),
+    }[backend]()
+    clock = Clock()
+    limiter = TokenBucketRateLimiter(3, 30.0, scope="t", store=store, clock=clock)
+
+    assert _decisions(limiter, "alice", 4) == [True, True, True, False]
+    assert _decisions(limiter, "bob", 1) == [True]
+
+    denied = asyncio.run(limiter.check("alice"))
+    assert (denied.allowed, denied.remaining) == (False, 0)
+    assert denied.reset_seconds == pytest.approx(10.0)
+
+    clock.now += 10.0
+    allowed = asyncio.run(limiter.check("alice"))
+    assert (allowed.allowed, allowed.remaining) == (True, 0)
+    assert allowed.reset_seconds == pytest.approx(30.0)
+    clock.now += 60.0
+    assert _decisions(limiter, "alice", 4) == [True, True, True, False]
+
+
+def test_sqlite_store_is_shared_between_workers(tmp_path) -> None:
+    path = tmp_path / "shared.sqlite"
+    clock = Clock()
+    workers = [
+        TokenBucketRateLimiter(4, 60.0, store=SQLiteBucketStore(path), clock=clock)
+        for _ in range(2)
+    ]
+    decisions = [_decisions(workers[i % 2], "carol", 1)[0] for i in range(6)]
+    assert decisions == [True, True, True, True, False, False]
+
+
+def test_memory_store_drops_refilled_buckets() -> None:
+    store = MemoryBucketStore(stripes=1, sweep_every=10)
+    for index in range(9):
+        store.take_now(f"id{index}", 5.0, 1.0, 0.0)
+    assert len(store) == 9
+    store.take_now("late", 5.0, 1.0, 100.0)
+    assert len(store) == 1
+
+
+def test_store_failures_fall_back_and_count(tmp_path) -> None:
+    class Broken:
+        name = "broken"
+
+        async def take(self, *_args):
+            raise ConnectionError("down")
+
+    before = RATE_LIMIT_STORE_ERRORS.labels(store="broken")._value.get()
+    limiter = TokenBucketRateLimiter(2, 60.0, store=Broken(), clock=Clock())
+    assert _decisions(limiter, "dave", 3) == [True, True, False]
+    assert RATE_LIMIT_STORE_ERRORS.labels(store="broken")._value.get() == before + 3
+
+    with pytest.raises(ValueError):
+        asyncio.run(LocalRedisStandIn().eval("return 1", 0))
+    with pytest.raises(ValueError):
+        create_bucket_store("memcached://localhost")
+    assert isinstance(create_bucket_store("memory"), MemoryBucketStore)
+    shared = create_bucket_store(f"sqlite:///{tmp_path}/buckets.sqlite")
+    assert shared.path == tmp_path / "buckets.sqlite"
+
+
+def test_sqlite_store_lock_contention_falls_back_quickly(tmp_path) -> None:
+    import sqlite3
+    import time
+
+    path = tmp_path / "locked.sqlite"
+    store = SQLiteBucketStore(path, busy_timeout=0.01)
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        before = RATE_LIMIT_STORE_ERRORS.labels(store="sqlite")._value.get()
+        limiter = TokenBucketRateLimiter(2, 60.0, store=store, clock=Clock())
+        started = time.monotonic()
+        assert _decisions(limiter, "erin", 3) == [True, True, False]
+        assert time.monotonic() - started < 1.0
+        assert RATE_LIMIT_STORE_ERRORS.labels(store="sqlite")._value.get() == before + 3
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
+
+
+def test_heavy_endpoint_dependency_uses_app_store(tmp_path) -> None:
+    app = FastAPI()
+    app.state.rate_limit_store = SQLiteBucketStore(tmp_path / "app.sqlite")
+
+    @app.get("/heavy", dependencies=[Depends(heavy_endpoint_rate_limiter("heavy", limit=2))])
+    def heavy() -> dict[str, bool]:
+        return {"ok": True}
+
+    before = RATE_LIMIT_REJECTIONS.labels(scope="heavy")._value.get()
+    client = TestClient(app)
+    first = client.get("/heavy")
+    assert first.status_code == 200
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert client.get("/heavy").status_code == 200
+
+    limited = client.get("/heavy")
+    assert limited.status_code == 429
+    assert limited.json()["detail"]["code"] == "rate_limited"
+    assert int(limited.headers["Retry-After"]) == 30
+    assert RATE_LIMIT_REJECTIONS.labels(scope="heavy")._value.get() == before + 1
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from app.routers import interpret as interpret_router  # noqa: E402
+
+PACK = {
+    "rulepack": "cached-pack",
+    "version": "1",
+    "rules": [
+        {
+            "id": "sun_moon",
+            "scope": "synastry",
+            "when": {"bodiesA": ["Sun"], "bodiesB": ["Moon"], "family": ["harmonious"]},
+            "then": {"title": "Sun–Moon", "tags": ["chemistry"], "base_score": 0.8},
+        }
+    ],
+}
+
+
+def test_rulepacks_parse_once_per_file_version(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "cached.json"
+    path.write_text(json.dumps(PACK), encoding="utf-8")
+    monkeypatch.setattr(interpret_router, "RULEPACK_DIRS", [str(tmp_path)])
+    monkeypatch.setattr(interpret_router, "_PACKS", {})
+
+    loads: list[str] = []
+    real_load = interpret_router.load_rules
+
+    def counting_load(target: str):
+        loads.append(target)
+        return real_load(target)
+
+    monkeypatch.setattr(interpret_router, "load_rules", counting_load)
+
+    request = interpret_router.FindingsRequest(
+        rulepack_id="cached-pack",
+        scope="synastry",
+        hits=[{"a": "Sun", "b": "Moon", "aspect": "trine", "severity": 0.6}],
+    )
+    first = interpret_router.relationship_findings(request)
+    second = interpret_router.relationship_findings(request)
+    assert [finding.id for finding in first.findings] == ["sun_moon"]
+    assert second.findings == first.findings
+    assert second.meta["rulepack"] == "cached-pack"
+    assert loads == [str(path)]
+    compiled = interpret_router._compiled_pack(str(path))
+    assert compiled is interpret_router._compiled_pack(str(path))
+
+    path.write_text(json.dumps({**PACK, "description": "edited"}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert interpret_router._discover_rulepacks()[0].description == "edited"
+    assert len(loads) == 2
+    assert interpret_router._compiled_pack(str(path)) is not compiled
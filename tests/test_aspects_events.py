@@ -1,6 +1,6 @@
 from datetime import UTC, datetime, timedelta
 
-from astroengine.engine.lots import aspects_to_lots, scan_lot_events
+from astroengine.engine.lots import aspects_to_lots, scan_lot_events, scan_lots_events
 from astroengine.engine.lots.aspects import AspectHit
 from astroengine.engine.lots.events import LotEvent
 from astroengine.scoring.policy import OrbPolicy
@@ -78,3 +78,50 @@ def test_event_scan_checks_each_angle():
     )
     angles = {round(event.angle, 6) for event in events}
     assert {0.0, 90.0}.issubset(angles)
+
+
+class CountingEphemeris(LinearEphemeris):
+    def __init__(self, start: datetime, base: float, speed: float) -> None:
+        super().__init__(start, base, speed)
+        self.calls = 0
+
+    def sample(self, body: str, moment: datetime):
+        self.calls += 1
+        return super().sample(body, moment)
+
+
+def test_multi_lot_scan_shares_body_samples():
+    start = datetime(2023, 1, 1, tzinfo=UTC)
+    end = start + timedelta(days=30)
+    lots = {"Fortune": 10.0, "Spirit": 105.0}
+
+    shared = CountingEphemeris(start, base=0.0, speed=1.0)
+    combined = scan_lots_events(shared, lots, ["Mars"], start, end, _policy(), [1, 4])
+
+    separate = []
+    single_calls = 0
+    for name, longitude in lots.items():
+        ephem = CountingEphemeris(start, base=0.0, speed=1.0)
+        separate.extend(
+            scan_lot_events(ephem, longitude, ["Mars"], start, end, _policy(), [1, 4], lot_name=name)
+        )
+        single_calls += ephem.calls
+
+    key = lambda event: (event.timestamp, event.lot, event.angle)  # noqa: E731
+    assert sorted(combined, key=key) == sorted(separate, key=key)
+    assert {(event.lot, event.angle) for event in combined} == {("Fortune", 0.0), ("Spirit", 90.0)}
+    assert shared.calls < single_calls
+
+
+def test_event_after_exact_grid_hit_keeps_scan_target():
+    # The opposition lands exactly on a grid step; deciding applying/separating
+    # there must not flip the side the scan tracks, which used to report a
+    # phantom opposition 13 degrees wide one step later.
+    start = datetime(2023, 1, 1, tzinfo=UTC)
+    ephem = LinearEphemeris(start, base=280.0, speed=13.0)
+    events = scan_lots_events(
+        ephem, {"Fortune": 0.0}, ["Mars"], start, start + timedelta(days=30), _policy(20.0), [2]
+    )
+    assert {event.angle for event in events} == {0.0, 180.0}
+    assert max(event.orb for event in events) < 0.01
+    assert all(event.timestamp < start + timedelta(days=21, hours=1) for event in events)
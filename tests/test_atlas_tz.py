@@ -9,6 +9,7 @@ from astroengine.atlas.tz import (
     to_utc,
     to_utc_with_timezone,
     tzid_for,
+    tzids_for,
 )
 
 NYC = (40.7128, -74.0060)
@@ -22,6 +23,11 @@ def test_tzid_basic():
     assert tzid_for(*LON) == "Europe/London"
 
 
+def test_tzids_for_matches_single_lookups():
+    assert tzids_for([NYC, LON, NYC]) == [tzid_for(*NYC), "Europe/London", tzid_for(*NYC)]
+    assert tzids_for([]) == []
+
+
 
 def test_ambiguous_fall_back():
     dt = datetime(2025, 11, 2, 1, 30)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from astroengine.cache.eclipse_catalogue import (
+    KIND_LUNAR,
+    KIND_SOLAR,
+    RECORD_DTYPE,
+    EclipseCatalogue,
+    write_eclipse_catalogue,
+)
+
+_START = 2451545.0
+
+
+def test_catalogue_round_trip_and_range_queries(tmp_path) -> None:
+    records = np.array(
+        [
+            (_START + 40.0, 10.0, 190.0, 0.1, KIND_LUNAR, 4),
+            (_START + 25.0, 5.0, 5.0, -0.2, KIND_SOLAR, 8),
+        ],
+        dtype=RECORD_DTYPE,
+    )
+    path = write_eclipse_catalogue(tmp_path / "eclipses.bin", _START, _START + 100.0, records)
+
+    catalogue = EclipseCatalogue.open(path)
+    assert len(catalogue) == 2
+    assert catalogue.records["jd"].tolist() == [_START + 25.0, _START + 40.0]
+    assert catalogue.covers(_START, _START + 100.0)
+    assert not catalogue.covers(_START - 1.0, _START + 10.0)
+    assert catalogue.between(_START + 25.0, _START + 40.0)["kind"].tolist() == [
+        KIND_SOLAR,
+        KIND_LUNAR,
+    ]
+    assert len(catalogue.between(_START + 26.0, _START + 39.0)) == 0
+
+    empty = EclipseCatalogue.open(
+        write_eclipse_catalogue(tmp_path / "none.bin", _START, _START + 1.0, records[:0])
+    )
+    assert len(empty) == 0 and len(empty.between(_START, _START + 1.0)) == 0
+
+
+def test_catalogue_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "junk.bin"
+    path.write_bytes(b"x" * 128)
+    with pytest.raises(ValueError):
+        EclipseCatalogue.open(path)
+
+
+@pytest.fixture
+def fake_eclipse_swe(tmp_path, monkeypatch):
+    import astroengine.detectors.eclipses as eclipses
+
+    calls = {"glob": 0, "loc": 0}
+
+    def sol_glob(jd, _flags):
+        calls["glob"] += 1
+        return (4, [_START + 10.0, 0.0]) if jd < _START + 10.0 else (0, [])
+
+    def lun_glob(jd, _flags):
+        calls["glob"] += 1
+        return (16, [_START + 24.0, 0.0]) if jd < _START + 24.0 else (0, [])
+
+    def lun_loc(_start, _geopos, _flags):
+        calls["loc"] += 1
+        return (16 | 128, [_START + 24.0], [])
+
+    fake_swe = SimpleNamespace(
+        MOON=1,
+        FLG_SPEED=256,
+        ECL_VISIBLE=128,
+        sol_eclipse_when_glob=sol_glob,
+        lun_eclipse_when=lun_glob,
+        sol_eclipse_when_loc=lambda *_: (0, [], []),
+        lun_eclipse_when_loc=lun_loc,
+    )
+    monkeypatch.setattr(eclipses, "has_swe", lambda: True)
+    monkeypatch.setattr(eclipses, "swe", lambda: fake_swe)
+    monkeypatch.setattr(eclipses, "init_ephe", lambda: 0)
+    monkeypatch.setattr(eclipses, "calc_ut_cached", lambda jd, *_: ([0.0, 0.5], 1))
+    monkeypatch.setattr(eclipses, "sun_lon", lambda jd: jd - _START)
+    monkeypatch.setattr(eclipses, "moon_lon", lambda jd: jd - _START + 180.0)
+    monkeypatch.setattr(eclipses, "CATALOGUE", tmp_path / "eclipses.bin")
+    monkeypatch.setattr(eclipses, "_CATALOGUE", None)
+    monkeypatch.setattr(eclipses, "_CATALOGUE_CHECKED_AT", None)
+    return eclipses, calls
+
+
+def test_find_eclipses_answers_covered_ranges_from_catalogue(fake_eclipse_swe) -> None:
+    eclipses, calls = fake_eclipse_swe
+    live = eclipses.find_eclipses(_START, _START + 30.0)
+
+    path = eclipses.build_eclipse_catalogue(_START, _START + 30.0)
+    assert len(EclipseCatalogue.open(path)) == 2
+    assert EclipseCatalogue.open(path).records["swe_flags"].tolist() == [4, 16]
+
+    calls["glob"] = 0
+    cached = eclipses.find_eclipses(_START, _START + 30.0)
+    assert cached == live
+    assert calls["glob"] == 0
+
+    lunar_only = eclipses.find_eclipses(_START + 20.0, _START + 30.0, location=(0.0, 51.5))
+    assert [event.eclipse_type for event in lunar_only] == ["lunar"]
+    assert lunar_only[0].is_visible is True
+    assert calls == {"glob": 0, "loc": 1}
+
+    # Ranges outside the searched span fall back to the live search.
+    eclipses.find_eclipses(_START - 5.0, _START + 30.0)
+    assert calls["glob"] > 0
+
+
+def test_missing_catalogue_is_rechecked_at_most_once_per_interval(
+    fake_eclipse_swe, monkeypatch
+) -> None:
+    eclipses, _ = fake_eclipse_swe
+    opens = 0
+    real_open = EclipseCatalogue.open
+
+    def counting_open(path):
+        nonlocal opens
+        opens += 1
+        return real_open(path)
+
+    clock = [100.0]
+    monkeypatch.setattr(eclipses.EclipseCatalogue, "open", staticmethod(counting_open))
+    monkeypatch.setattr(eclipses, "monotonic", lambda: clock[0])
+
+    for _ in range(3):
+        eclipses.find_eclipses(_START, _START + 30.0)
+    assert opens == 1
+
+    clock[0] += eclipses._CATALOGUE_RECHECK_SEC
+    eclipses.find_eclipses(_START, _START + 30.0)
+    assert opens == 2
+
+    # Writing the default catalogue makes the next search pick it up at once.
+    eclipses.build_eclipse_catalogue(_START, _START + 30.0)
+    eclipses.find_eclipses(_START, _START + 30.0)
+    assert opens == 3
+    assert eclipses._CATALOGUE is not None
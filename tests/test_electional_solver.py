@@ -1,3 +1,5 @@
+import math
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -161,3 +163,92 @@ def test_search_constraints_finds_weighted_solutions_with_tolerance():
     assert 0.0 < aspect_eval.detail["orb"] <= 0.5
     assert 0.0 < antiscia_eval.detail["orb"] <= 0.5
     assert second.score > 0
+
+
+class LinearProvider:
+    """Bodies moving at constant speed; declination follows the ecliptic."""
+
+    _MOTION = {
+        "Moon": (10.0, 13.2),
+        "Sun": (280.0, 1.0),
+        "Venus": (250.0, 1.2),
+        "Mars": (40.0, 0.6),
+        "Saturn": (345.0, 0.05),
+    }
+
+    def __init__(self, start: datetime) -> None:
+        self._start = start
+        self.calls = 0
+
+    def context(self, ts: datetime) -> SampleContext:
+        self.calls += 1
+        days = (ts - self._start) / timedelta(days=1)
+        positions = {}
+        for name, (lon0, speed) in self._MOTION.items():
+            lon = (lon0 + speed * days) % 360.0
+            decl = math.degrees(math.asin(math.sin(math.radians(lon)) * 0.3978))
+            positions[name] = replace(
+                _body(name, lon), speed_longitude=speed, declination=decl
+            )
+        return SampleContext(
+            ts=ts,
+            iso=ts.isoformat().replace("+00:00", "Z"),
+            positions=positions,
+            axes={"asc": 0.0, "desc": 180.0, "mc": 270.0, "ic": 90.0},
+        )
+
+
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        [
+            {"aspect": {"body": "moon", "target": "sun", "type": "trine", "max_orb": 2.0}},
+            {"moon": {"void_of_course": False, "max_orb": 3.0}},
+        ],
+        [{"declination": {"body": "moon", "target": "venus", "type": "parallel", "max_orb": 0.5}}],
+        [{"declination": {"body": "moon", "target": "sun", "type": "contra", "max_orb": 1.0}}],
+        [{"antiscia": {"body": "moon", "target": "mars", "type": "contra", "max_orb": 2.0}}],
+        [
+            {"moon": {"void_of_course": True, "max_orb": 6.0}},
+            {"aspect": {"body": "moon", "target": "asc", "type": "square", "max_orb": 3.0}},
+        ],
+    ],
+)
+def test_interval_pruning_matches_dense_scan(constraints):
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    params = ElectionalSearchParams(
+        start=start,
+        end=start + timedelta(days=30),
+        step_minutes=15,
+        constraints=constraints,
+        latitude=0.0,
+        longitude=0.0,
+    )
+    dense_provider = LinearProvider(start)
+    pruned_provider = LinearProvider(start)
+
+    dense = search_constraints(params, provider=dense_provider)
+    pruned = search_constraints(params, provider=pruned_provider, interval_pruning=True)
+
+    assert dense
+    assert pruned == dense
+    assert pruned_provider.calls < dense_provider.calls
+
+
+def test_interval_pruning_skips_unreachable_windows():
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    params = ElectionalSearchParams(
+        start=start,
+        end=start + timedelta(days=10),
+        step_minutes=5,
+        constraints=[
+            {"aspect": {"body": "sun", "target": "mars", "type": "conjunction", "max_orb": 1.0}}
+        ],
+        latitude=0.0,
+        longitude=0.0,
+    )
+    provider = LinearProvider(start)
+
+    assert search_constraints(params, provider=provider, interval_pruning=True) == []
+    # Only the coarse six-hourly grid is sampled.
+    assert provider.calls == 41
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from astroengine.ephemeris.cache import ChebyshevSegmentCache, warm_segments
+
+_MOON = 1
+_JUPITER = 5
+
+
+class AnalyticCalc:
+    """Smooth synthetic ``calc_ut`` with a periodic perturbation."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, jd: float, ipl: int, flags: int):
+        self.calls += 1
+        rate = 13.18 if ipl == _MOON else 0.083
+        t = jd - 2451545.0
+        lon = (218.3 + rate * t + 6.29 * math.sin(t * 2 * math.pi / 27.55)) % 360.0
+        speed = rate + 6.29 * (2 * math.pi / 27.55) * math.cos(t * 2 * math.pi / 27.55)
+        lat = 5.1 * math.sin(t * 2 * math.pi / 27.21)
+        dist = 0.00257 + 0.0001 * math.cos(t * 2 * math.pi / 27.55)
+        return (lon, lat, dist, speed, 0.0, 0.0), flags
+
+
+class NoisyCalc(AnalyticCalc):
+    """Calc with a discontinuity that cannot meet the error bound."""
+
+    def __call__(self, jd: float, ipl: int, flags: int):
+        values, flag = super().__call__(jd, ipl, flags)
+        step = 1e-3 if (jd * 1000.0) % 2.0 < 1.0 else 0.0
+        return (values[0] + step, *values[1:]), flag
+
+
+def test_segments_interpolate_within_tolerance() -> None:
+    calc = AnalyticCalc()
+    cache = ChebyshevSegmentCache(calc=calc, build_after=1)
+    for step in range(200):
+        jd = 2460300.0 + step * 0.137
+        values, flag = cache.calc_ut(jd, _MOON, 258)
+        exact, _ = calc(jd, _MOON, 258)
+        assert flag == 258
+        assert abs((values[0] - exact[0] + 180.0) % 360.0 - 180.0) < 1e-6
+        assert 0.0 <= values[0] < 360.0
+        assert values[1:4] == pytest.approx(exact[1:4], abs=1e-6)
+    assert cache.hits == 200
+
+
+def test_one_off_requests_stay_on_exact_path() -> None:
+    calc = AnalyticCalc()
+    cache = ChebyshevSegmentCache(calc=calc)
+    cache.calc_ut(2460300.25, _JUPITER, 258)
+    assert calc.calls == 1
+    assert cache.misses == 1
+    # A second request in the same segment triggers the fit.
+    cache.calc_ut(2460300.5, _JUPITER, 258)
+    assert calc.calls > 2
+    assert cache.hits == 1
+
+
+def test_segments_failing_validation_fall_back_to_exact() -> None:
+    calc = NoisyCalc()
+    cache = ChebyshevSegmentCache(calc=calc, build_after=1)
+    jd = 2460300.3
+    values, _ = cache.calc_ut(jd, _MOON, 258)
+    assert values == calc(jd, _MOON, 258)[0]
+    assert cache.misses == 1
+
+
+def test_memory_is_bounded_by_max_segments() -> None:
+    cache = ChebyshevSegmentCache(calc=AnalyticCalc(), build_after=1, max_segments=4)
+    for day in range(20):
+        cache.calc_ut(2460300.5 + day, _MOON, 258)
+    assert len(cache._segments) == 4
+
+
+def test_warm_segments_round_trip(tmp_path) -> None:
+    calc = AnalyticCalc()
+    cache = ChebyshevSegmentCache(calc=calc)
+    built = warm_segments(
+        [_MOON, _JUPITER], [258], 2460300.0, 2460330.0, cache=cache, directory=tmp_path
+    )
+    assert built > 30
+    assert (tmp_path / "manifest.json").exists()
+
+    restored = ChebyshevSegmentCache(calc=calc)
+    assert restored.load(tmp_path) == 2
+    before = calc.calls
+    values, _ = restored.calc_ut(2460315.3, _MOON, 258)
+    assert calc.calls == before
+    assert values == pytest.approx(cache.calc_ut(2460315.3, _MOON, 258)[0])
+
+
+@pytest.mark.parametrize(
+    ("ipl", "start_jd", "days"),
+    [
+        (_MOON, 2460400.0, 6.0),
+        # Mercury stations retrograde on 2024-04-01; speed crosses zero here.
+        (2, 2460396.0, 12.0),
+    ],
+)
+def test_swiss_segments_hold_bound_on_dense_grid(ipl: int, start_jd: float, days: float) -> None:
+    swe = pytest.importorskip("swisseph")
+
+    def calc(jd: float, body: int, flags: int):
+        return swe.calc_ut(jd, body, flags)
+
+    cache = ChebyshevSegmentCache(calc=calc, build_after=1)
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    steps = 2000
+    for step in range(steps + 1):
+        jd = start_jd + days * step / steps
+        values, _ = cache.calc_ut(jd, ipl, flags)
+        exact, _ = calc(jd, ipl, flags)
+        error = [abs(a - b) for a, b in zip(values[:6], exact[:6], strict=True)]
+        error[0] = abs((values[0] - exact[0] + 180.0) % 360.0 - 180.0)
+        assert all(e <= t for e, t in zip(error, cache.tolerance, strict=True)), (jd, error)
+    assert cache.hits > 0
@@ -1,8 +1,19 @@
 from datetime import UTC, datetime
 
+import numpy as np
 import pytest
 
-from astroengine.engine.lots import ChartContext, ChartLocation, builtin_profile, evaluate
+from astroengine.engine.lots import (
+    ChartContext,
+    ChartLocation,
+    builtin_profile,
+    compile_batch,
+    compile_program,
+    evaluate,
+    evaluate_batch,
+    evaluate_charts,
+    parse_lot_defs,
+)
 
 
 def _chart_context(positions: dict[str, float], *, is_day: bool) -> ChartContext:
@@ -50,3 +61,53 @@ def test_fortune_night_formula():
     values = evaluate(profile, ctx)
     assert pytest.approx(values["Fortune"], rel=1e-6) == 140.0
     assert pytest.approx(values["Spirit"], rel=1e-6) == 320.0
+
+
+def test_batch_evaluation_matches_scalar_per_chart():
+    program = builtin_profile("Hellenistic").compile()
+    base = {
+        "Sun": 100.0,
+        "Moon": 10.0,
+        "ASC": 50.0,
+        "Mercury": 30.0,
+        "Venus": 80.0,
+        "Mars": 150.0,
+        "Jupiter": 200.0,
+        "Saturn": 250.0,
+    }
+    charts = [
+        _chart_context({**base, "Moon": moon, "ASC": asc}, is_day=day)
+        for moon, asc, day in [(10.0, 50.0, True), (10.0, 50.0, False), (355.0, 725.0, True)]
+    ]
+    batch = evaluate_charts(program, charts)
+    assert set(batch) == set(program.order)
+    for index, chart in enumerate(charts):
+        expected = evaluate(program, chart)
+        for name, value in expected.items():
+            assert batch[name][index] == pytest.approx(value, abs=1e-9)
+
+
+def test_evaluate_batch_masks_sect_and_broadcasts_points():
+    program = compile_program(
+        parse_lot_defs(
+            """
+            Fortune = if_day(ASC + Moon - Sun, ASC + Sun - Moon)
+            Offset = Fortune + 15
+            """
+        )
+    )
+    batch = compile_batch(program)
+    assert batch.needs_sect
+    assert set(batch.points) == {"ASC", "Sun", "Moon"}
+
+    values = evaluate_batch(
+        batch,
+        {"ASC": 50.0, "Sun": np.array([100.0, 100.0]), "Moon": 10.0},
+        is_day=np.array([True, False]),
+    )
+    assert values["Fortune"].tolist() == pytest.approx([320.0, 140.0])
+    assert values["Offset"].tolist() == pytest.approx([335.0, 155.0])
+    with pytest.raises(ValueError):
+        evaluate_batch(batch, {"ASC": 50.0, "Sun": 100.0, "Moon": 10.0})
+    with pytest.raises(KeyError):
+        evaluate_batch(batch, {"ASC": 50.0, "Sun": 100.0}, is_day=True)
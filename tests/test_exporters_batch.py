@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from astroengine.canonical import parquet_write_canonical
+from astroengine.exporters_batch import stream_parquet_dataset
+
+
+def _events(count: int):
+    for index in range(count):
+        yield {
+            "ts": f"{2024 + index % 3}-05-0{1 + index % 7}T12:00:00Z",
+            "moving": "Mars",
+            "target": "natal_Sun",
+            "kind": "square" if index % 2 else "Trine",
+            "orb": (index % 10) / 10.0 - 0.5,
+            "applying": index % 2 == 0,
+            "score": None if index % 5 == 0 else float(index),
+            "meta": {"natal_id": f"n{index % 4}"} if index % 6 else {"seq": index},
+        }
+
+
+def _sorted(table, columns):
+    return table.select(columns).sort_by([("meta_json", "ascending"), ("ts", "ascending")])
+
+
+def test_single_file_matches_canonical_writer(tmp_path) -> None:
+    expected = tmp_path / "expected.parquet"
+    actual = tmp_path / "actual.parquet"
+    parquet_write_canonical(str(expected), _events(50))
+
+    assert stream_parquet_dataset(actual, _events(50), max_batch_rows=7) == 50
+    assert pq.read_table(actual).equals(pq.read_table(expected))
+    assert pq.ParquetFile(actual).metadata.num_row_groups == 8
+
+
+def test_partitioned_stream_with_tiny_limits_round_trips(tmp_path) -> None:
+    expected = tmp_path / "expected"
+    parquet_write_canonical(str(expected), _events(120))
+
+    actual = tmp_path / "actual"
+    written = stream_parquet_dataset(
+        actual, _events(120), max_batch_rows=5, max_buffer_bytes=2048, max_open_files=2
+    )
+    assert written == 120
+
+    columns = ["ts", "aspect", "orb", "score", "natal_id", "event_year", "meta_json"]
+    got = ds.dataset(str(actual), partitioning="hive").to_table()
+    want = ds.dataset(str(expected), partitioning="hive").to_table()
+    assert _sorted(got, columns).equals(_sorted(want, columns))
+    assert set(got.column("natal_id").to_pylist()) == {"n0", "n1", "n2", "n3", "unknown"}
+    # Evicted writers reopen their partition as a new part file.
+    assert len(list((actual / "natal_id=n1").glob("*/part-1.parquet"))) > 0
+
+
+def test_partition_subset_and_validation(tmp_path) -> None:
+    root = tmp_path / "by_year"
+    stream_parquet_dataset(root, _events(30), partition_by=("event_year",))
+    assert sorted(p.name for p in root.iterdir()) == [
+        "event_year=2024",
+        "event_year=2025",
+        "event_year=2026",
+    ]
+    table = pq.read_table(root / "event_year=2025" / "part-0.parquet")
+    assert "natal_id" in table.column_names and "event_year" not in table.column_names
+
+    assert stream_parquet_dataset(tmp_path / "empty", iter(())) == 0
+    assert not (tmp_path / "empty").exists()
+    with pytest.raises(ValueError):
+        stream_parquet_dataset(tmp_path / "bad", _events(1), partition_by=("moving",))
+    with pytest.raises(ValueError):
+        stream_parquet_dataset(tmp_path / "bad", _events(1), max_batch_rows=0)
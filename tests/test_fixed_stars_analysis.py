@@ -110,3 +110,54 @@ def test_star_parans_returns_events_when_ra_matches() -> None:
     assert first["star_event"] == "culminate"
     assert first["planet_event"] == "culminate"
     assert first["dt_diff_min"] <= 5.0
+
+
+def test_star_event_table_matches_scalar_transit_times() -> None:
+    from astroengine.core.stars_plus import Location, StarEventTable, approximate_transit_times
+    from astroengine.core.stars_plus.catalog import BUILTIN_STARS
+    from astroengine.core.stars_plus.geometry import julian_day
+
+    location = Location(lat_deg=51.5, lon_east_deg=-0.1)
+    table = StarEventTable.build(BUILTIN_STARS, location)
+    days = [datetime(2024, 3, 1, tzinfo=UTC) + timedelta(days=30 * k) for k in range(4)]
+    base = [julian_day(day) for day in days]
+    times = table.times(base)
+
+    for d, day in enumerate(days):
+        for s, name in enumerate(table.names):
+            star = BUILTIN_STARS[name]
+            expected = approximate_transit_times(
+                day, location.lon_east_deg, star.ra_deg, star.dec_deg, location.lat_deg
+            )
+            for e, event in enumerate(("rise", "set", "culminate")):
+                if expected[event] is None:
+                    assert math.isnan(times[d, s, e])
+                    continue
+                actual = day + timedelta(days=float(times[d, s, e] - base[d]))
+                assert abs((actual - expected[event]).total_seconds()) < 1.0
+
+
+def test_star_parans_samples_each_body_once_per_day() -> None:
+    calls: list[tuple[datetime, str]] = []
+
+    def provider_radec(moment: datetime, body: str) -> tuple[float, float]:
+        calls.append((moment, body))
+        return (15.0 if body == "Mars" else 200.0), 10.0
+
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    events = star_parans(
+        start,
+        start + timedelta(days=9),
+        (40.0, -74.0),
+        ["Mars", "Venus"],
+        provider_radec,
+        tolerance_minutes=4.0,
+    )
+
+    assert len(calls) == 20
+    assert events
+    assert all(event["dt_diff_min"] <= 4.0 for event in events)
+    assert [event["time"] for event in events] == sorted(event["time"] for event in events)
+    assert {event["planet"] for event in events} == {"Mars", "Venus"}
+    with pytest.raises(ValueError):
+        star_parans(start, start, (0.0, 0.0), ["Mars"], provider_radec, event_pairs=[("rise", "noon")])
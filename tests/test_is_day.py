@@ -1,8 +1,9 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
+import numpy as np
 import pytest
 
-from astroengine.engine.lots.sect import GeoLocation, is_day
+from astroengine.engine.lots.sect import GeoLocation, day_mask, is_day, solar_altitudes
 
 
 def test_is_day_equator_noon():
@@ -29,3 +30,18 @@ def test_requires_timezone():
     location = GeoLocation(latitude=0.0, longitude=0.0)
     with pytest.raises(ValueError):
         is_day(naive, location)
+
+
+def test_day_mask_matches_scalar_checks():
+    start = datetime(2023, 3, 1, tzinfo=UTC)
+    moments = [start + timedelta(hours=7 * k) for k in range(60)]
+    places = [GeoLocation(latitude=51.5, longitude=-0.1), GeoLocation(latitude=-33.9, longitude=151.2)]
+
+    for place in places:
+        expected = [is_day(moment, place) for moment in moments]
+        assert day_mask(moments, place).tolist() == expected
+
+    per_moment = [places[k % 2] for k in range(len(moments))]
+    expected = [is_day(moment, place) for moment, place in zip(moments, per_moment)]
+    assert day_mask(moments, per_moment).tolist() == expected
+    assert np.all(np.abs(solar_altitudes(moments, places[0])) <= 90.0)
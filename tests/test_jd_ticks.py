@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import datetime as dt
+import math
+
+from astroengine.core.ticks import (
+    IsoTickView,
+    jd_from_utc_datetime,
+    jd_ticks,
+    positions_at,
+    utc_iso_from_jd,
+)
+from astroengine.detectors import detect_antiscia_contacts, detect_decl_contacts
+from astroengine.detectors_aspects import detect_aspects
+from astroengine.engine import scan_contacts
+from astroengine.transits.engine import TickCachingProvider
+
+_BASE = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+
+
+class IsoOnlyProvider:
+    """Linear-motion provider that only understands ISO timestamps."""
+
+    def __init__(self) -> None:
+        self.iso_calls = 0
+
+    def _at(self, days: float, bodies):
+        out = {}
+        for body in bodies:
+            name = str(body).lower()
+            if name == "moon":
+                lon = (10.0 + 13.2 * days) % 360.0
+                speed = 13.2
+            elif name == "sun":
+                lon = (280.0 + 1.0 * days) % 360.0
+                speed = 1.0
+            else:
+                continue
+            decl = math.degrees(math.asin(math.sin(math.radians(lon)) * 0.3978))
+            out[body] = {"lon": lon, "decl": decl, "speed_lon": speed}
+        return out
+
+    def positions_ecliptic(self, iso: str, bodies):
+        self.iso_calls += 1
+        moment = dt.datetime.fromisoformat(iso.replace("Z", "+00:00"))
+        return self._at((moment - _BASE).total_seconds() / 86400.0, bodies)
+
+
+class JdProvider(IsoOnlyProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.jd_calls = 0
+
+    def positions_ecliptic_jd(self, jd_utc: float, bodies):
+        self.jd_calls += 1
+        return self._at(jd_utc - jd_from_utc_datetime(_BASE), bodies)
+
+
+def _iso_grid(step: dt.timedelta, count: int) -> list[str]:
+    return [
+        (_BASE + step * index).isoformat().replace("+00:00", "Z")
+        for index in range(count)
+    ]
+
+
+def test_jd_ticks_render_exact_iso_timestamps() -> None:
+    step = dt.timedelta(minutes=7)
+    end = _BASE + dt.timedelta(days=400)
+    ticks = list(jd_ticks(_BASE, end, step))
+    expected_count = int((end - _BASE) / step) + 1
+    assert len(ticks) == expected_count
+    assert [utc_iso_from_jd(jd) for jd in ticks[:3]] == _iso_grid(step, 3)
+    assert utc_iso_from_jd(ticks[-1]) == _iso_grid(step, expected_count)[-1]
+
+
+def test_detectors_match_for_iso_and_jd_ticks() -> None:
+    step = dt.timedelta(hours=6)
+    iso_ticks = _iso_grid(step, 240)
+    jd = list(jd_ticks(_BASE, _BASE + step * 239, step))
+    provider = JdProvider()
+
+    assert detect_aspects(provider, iso_ticks, "moon", "sun") == detect_aspects(
+        provider, jd, "moon", "sun"
+    )
+    assert detect_decl_contacts(
+        provider, iso_ticks, "moon", "sun", 0.5, 0.5
+    ) == detect_decl_contacts(provider, jd, "moon", "sun", 0.5, 0.5)
+    assert detect_antiscia_contacts(
+        provider, iso_ticks, "moon", "sun", 1.0, 1.0
+    ) == detect_antiscia_contacts(provider, jd, "moon", "sun", 1.0, 1.0)
+
+
+def test_positions_at_falls_back_to_iso_api() -> None:
+    provider = IsoOnlyProvider()
+    jd = jd_from_utc_datetime(_BASE + dt.timedelta(days=2))
+    result = positions_at(provider, jd, ["sun"])
+    assert provider.iso_calls == 1
+    assert result["sun"]["lon"] == 282.0
+
+
+def test_tick_caching_provider_caches_jd_queries() -> None:
+    provider = JdProvider()
+    cached = TickCachingProvider(provider)
+    jd = jd_from_utc_datetime(_BASE)
+    first = cached.positions_ecliptic_jd(jd, ["Sun", "moon"])
+    second = cached.positions_ecliptic_jd(jd, ["moon", "sun"])
+    assert provider.jd_calls == 1
+    assert provider.iso_calls == 0
+    assert first["Sun"] == second["sun"]
+
+
+def test_scan_contacts_uses_jd_api_and_emits_iso_timestamps() -> None:
+    provider = JdProvider()
+    events = scan_contacts(
+        "2024-01-01T00:00:00Z",
+        "2024-01-20T00:00:00Z",
+        "moon",
+        "sun",
+        provider=provider,
+        step_minutes=360,
+    )
+    assert events
+    assert provider.iso_calls == 0
+    for event in events:
+        assert event.timestamp.endswith("Z")
+        dt.datetime.fromisoformat(event.timestamp.replace("Z", "+00:00"))
+
+
+def test_iso_tick_view_formats_lazily() -> None:
+    ticks = tuple(jd_ticks(_BASE, _BASE + dt.timedelta(days=2), dt.timedelta(days=1)))
+    view = IsoTickView(ticks)
+    assert len(view) == 3
+    assert list(view) == _iso_grid(dt.timedelta(days=1), 3)
+    assert view[-1] == "2024-01-03T00:00:00Z"
+    assert view.jd is ticks
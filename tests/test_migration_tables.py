@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import JSON, MetaData, Table, create_engine, inspect, select
 
 EXPECTED_TABLES = {
     "orb_policies",
     "severity_profiles",
     "charts",
     "notes",
+    "chart_positions",
+    "chart_tags",
     "ruleset_versions",
     "events",
     "asteroid_meta",
@@ -49,3 +52,51 @@ def test_tables_exist_after_upgrade(tmp_path) -> None:
     command.downgrade(cfg, "base")
     tables_after_downgrade = _introspect_tables(database_url)
     assert EXPECTED_TABLES.isdisjoint(tables_after_downgrade)
+
+
+def _required_value(column, index: int):
+    if isinstance(column.type, JSON):
+        return {}
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime(2020, 1, 1, tzinfo=UTC)
+    if python_type is str:
+        return f"{column.name}-{index}"
+    return python_type()
+
+
+def test_chart_index_upgrade_backfills_existing_charts(tmp_path) -> None:
+    database_url = f"sqlite:///{tmp_path / 'backfill.db'}"
+    cfg = _make_config(database_url)
+    command.upgrade(cfg, "20241202_0006_chart_soft_delete")
+
+    engine = create_engine(database_url)
+    try:
+        charts = Table("charts", MetaData(), autoload_with=engine)
+        records = [
+            {"bodies": {"Mars": {"longitude": 136.5}}, "houses": {}, "tags": ["Client"]},
+            {"bodies": {"Sun": {"longitude": 1.5}}, "houses": {}, "tags": []},
+        ]
+        with engine.begin() as connection:
+            for index, record in enumerate(records):
+                row = {
+                    column.name: _required_value(column, index)
+                    for column in charts.columns
+                    if not column.nullable
+                    and column.server_default is None
+                    and not column.primary_key
+                }
+                row.update(record)
+                connection.execute(charts.insert().values(**row))
+
+        command.upgrade(cfg, "head")
+        metadata = MetaData()
+        positions = Table("chart_positions", metadata, autoload_with=engine)
+        tags = Table("chart_tags", metadata, autoload_with=engine)
+        with engine.connect() as connection:
+            bodies = connection.execute(select(positions.c.body, positions.c.sign)).all()
+            tag_rows = connection.execute(select(tags.c.tag)).scalars().all()
+        assert sorted(bodies) == [("mars", 4), ("sun", 0)]
+        assert tag_rows == ["client"]
+    finally:
+        engine.dispose()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+
+import numpy as np
+import pytest
+
+from astroengine.cache import positions_cache
+from astroengine.cache.positions_store import PositionsStore, write_positions_store
+
+
+@pytest.fixture
+def isolated_cache(tmp_path, monkeypatch):
+    con = sqlite3.connect(":memory:")
+    con.executescript(positions_cache._SQL["init"])
+    computed: list[tuple[int, str]] = []
+
+    def fake_compute(day: int, body: str) -> tuple[float, float, float]:
+        computed.append((day, body))
+        return float(day % 360), 0.5, 1.0
+
+    monkeypatch.setattr(positions_cache, "STORE", tmp_path / "positions.f64")
+    monkeypatch.setattr(positions_cache, "_STORE", None)
+    monkeypatch.setattr(positions_cache, "_STORE_CHECKED_AT", None)
+    monkeypatch.setattr(positions_cache, "_get_connection", lambda: con)
+    monkeypatch.setattr(positions_cache, "_compute_daily", fake_compute)
+    yield con, computed
+    con.close()
+
+
+def test_store_round_trip(tmp_path) -> None:
+    data = np.full((3, 2, 3), np.nan)
+    data[0, 0] = (10.0, 1.0, 0.9)
+    data[2, 1] = (200.0, -2.0, 13.1)
+    path = write_positions_store(tmp_path / "store.f64", 2460000, ["sun", "moon"], data)
+
+    store = PositionsStore.open(path)
+    assert (store.start_day, store.end_day, store.bodies) == (2460000, 2460002, ("sun", "moon"))
+    assert store.entry(2460000, "sun") == (10.0, 1.0, 0.9)
+    assert store.entry(2460002, "moon") == (200.0, -2.0, 13.1)
+    assert store.entry(2460001, "sun") is None
+    assert store.entry(2460003, "sun") is None
+    assert store.entry(2460000, "mars") is None
+
+
+def test_store_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "junk.f64"
+    path.write_bytes(b"x" * 128)
+    with pytest.raises(ValueError):
+        PositionsStore.open(path)
+
+
+def test_backfill_merges_sqlite_rows_and_serves_lookups(isolated_cache, monkeypatch) -> None:
+    con, computed = isolated_cache
+    con.execute(
+        positions_cache._SQL["upsert"], (2460001, "moon", 123.0, 4.5, 12.0)
+    )
+
+    filled = positions_cache.backfill_store(["Sun", "moon"], 2460000.5, 2460002.5)
+    assert filled == 5
+    assert (2460001, "moon") not in computed
+
+    def fail_connection():
+        raise AssertionError("store hits must not touch sqlite")
+
+    monkeypatch.setattr(positions_cache, "_get_connection", fail_connection)
+    assert positions_cache.get_daily_entry(2460001.7, "Moon") == (123.0, 4.5, 12.0)
+    lon, lat, speed = positions_cache.get_daily_entry(2460002.0, "sun")
+    assert (lon, lat, speed) == (float(2460002 % 360), 0.5, 1.0)
+
+
+def test_backfill_extends_existing_store(isolated_cache) -> None:
+    _, computed = isolated_cache
+    positions_cache.backfill_store(["sun"], 2460000, 2460001)
+    computed.clear()
+
+    filled = positions_cache.backfill_store(["sun", "mars"], 2460001, 2460003)
+    assert filled == 5
+    assert (2460001, "sun") not in computed
+
+    store = PositionsStore.open(positions_cache.STORE)
+    assert (store.start_day, store.end_day) == (2460000, 2460003)
+    assert store.bodies == ("sun", "mars")
+    assert store.entry(2460000, "sun") is not None
+    assert store.entry(2460000, "mars") is None
+    # The reader picks up the replaced file on its next miss.
+    assert positions_cache.get_daily_entry(2460003, "mars")[0] == float(2460003 % 360)
+    assert not math.isnan(positions_cache.get_daily_entry(2460000, "sun")[0])
+
+
+def test_backfill_rejects_unsupported_bodies(isolated_cache) -> None:
+    with pytest.raises(ValueError):
+        positions_cache.backfill_store(["chiron"], 2460000, 2460001)
+
+
+def test_missing_store_is_rechecked_at_most_once_per_interval(isolated_cache, monkeypatch) -> None:
+    from astroengine.cache import positions_store
+
+    opens: list[object] = []
+    real_open = positions_store.PositionsStore.open.__func__
+
+    def counting_open(cls, path):
+        opens.append(path)
+        return real_open(cls, path)
+
+    monkeypatch.setattr(PositionsStore, "open", classmethod(counting_open))
+    for day in range(2460000, 2460005):
+        positions_cache.get_daily_entry(day, "sun")
+    assert len(opens) == 1
+
+    monkeypatch.setattr(positions_cache, "_STORE_RECHECK_SEC", 0.0)
+    positions_cache.get_daily_entry(2460010, "sun")
+    assert len(opens) == 2
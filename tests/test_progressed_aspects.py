@@ -4,6 +4,7 @@ import os
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 from astroengine.detectors.progressed_aspects import progressed_natal_aspects
@@ -13,74 +14,105 @@ def _iso(moment: datetime) -> str:
     return moment.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
-def test_progressed_aspects_unit(monkeypatch: pytest.MonkeyPatch) -> None:
-    import astroengine.detectors.progressed_aspects as module
+_BASE = {"Sun": 10.0, "Moon": 70.0, "Mars": 200.0}
+_RATES = {"Sun": 0.9856, "Moon": 13.1, "Mars": -0.4}
+_NATAL = datetime(2000, 1, 1, tzinfo=UTC)
+_NATAL_JD = 2451544.5
+
+
+class LinearAdapter:
+    """Adapter stub with linear ephemeris motion that counts batch calls."""
+
+    batches = 0
+
+    @staticmethod
+    def from_chart_config(_config):  # type: ignore[no-untyped-def]
+        return LinearAdapter()
+
+    def julian_day(self, moment: datetime) -> float:
+        return _NATAL_JD + (moment - _NATAL).total_seconds() / 86400.0
+
+    def compute_bodies_array(self, jds, bodies):  # type: ignore[no-untyped-def]
+        LinearAdapter.batches += 1
+        jds = np.asarray(jds, dtype=float)
+        names = tuple(bodies)
+        lon = np.stack([(_BASE[n] + _RATES[n] * (jds - _NATAL_JD)) % 360.0 for n in names], axis=1)
+        speed = np.stack([np.full(jds.shape, _RATES[n]) for n in names], axis=1)
+        return SimpleNamespace(bodies=names, longitude=lon, speed_longitude=speed)
+
+
+@pytest.fixture
+def linear_ephemeris(monkeypatch: pytest.MonkeyPatch):
+    import astroengine.detectors.directed_aspects as directed
+    import astroengine.detectors.progressed_aspects as progressed
 
     class DummyPos:
-        def __init__(self, longitude: float, speed: float = 0.0) -> None:
+        def __init__(self, longitude: float) -> None:
             self.longitude = longitude
-            self.speed_longitude = speed
-
-    natal_positions = {
-        "Sun": DummyPos(10.0),
-        "Moon": DummyPos(70.0),
-        "Mars": DummyPos(200.0),
-    }
 
     def fake_compute_natal_chart(moment, location, *, bodies=None, **_kwargs):  # type: ignore[no-untyped-def]
-        if bodies is not None:
-            positions = {name: DummyPos(natal_positions[name].longitude) for name in bodies}
-        else:
-            positions = dict(natal_positions)
+        positions = {name: DummyPos(_BASE[name]) for name in bodies}
         return SimpleNamespace(positions=positions, location=location, moment=moment)
 
-    start = datetime(2000, 1, 1, tzinfo=UTC)
-    second = start + timedelta(days=1)
-    timeline = {
-        _iso(start): {
-            "Sun": DummyPos(10.0, 0.9),
-            "Moon": DummyPos(69.0, 13.0),
-            "Mars": DummyPos(190.0, 0.6),
-        },
-        _iso(second): {
-            "Sun": DummyPos(10.9, 0.9),
-            "Moon": DummyPos(71.2, 13.0),
-            "Mars": DummyPos(189.0, -0.5),
-        },
-    }
-
-    def fake_progressed(natal_chart, target_moment, *, bodies=None, **_kwargs):  # type: ignore[no-untyped-def]
-        iso = _iso(target_moment)
-        positions = timeline[iso]
-        if bodies is not None:
-            positions = {name: positions[name] for name in bodies}
-        return SimpleNamespace(chart=SimpleNamespace(positions=positions))
-
-    class DummyAdapter:
-        @staticmethod
-        def from_chart_config(_config):
-            return SimpleNamespace()
-
-    monkeypatch.setattr(module, "compute_natal_chart", fake_compute_natal_chart)
-    monkeypatch.setattr(module, "compute_secondary_progressed_chart", fake_progressed)
-    monkeypatch.setattr(module, "SwissEphemerisAdapter", DummyAdapter)
+    LinearAdapter.batches = 0
+    monkeypatch.setattr(progressed, "compute_natal_chart", fake_compute_natal_chart)
+    monkeypatch.setattr(progressed, "SwissEphemerisAdapter", LinearAdapter)
+    monkeypatch.setattr(directed, "_compute_natal_chart", lambda: fake_compute_natal_chart)
+    monkeypatch.setattr(directed, "SwissEphemerisAdapter", LinearAdapter)
+    return SimpleNamespace(adapter=LinearAdapter, progressed=progressed, directed=directed)
 
-    hits = progressed_natal_aspects(
-        natal_ts=_iso(start),
-        start_ts=_iso(start),
-        end_ts=_iso(second),
+
+def test_progressed_aspects_unit(linear_ephemeris) -> None:
+    end = _NATAL + timedelta(days=365.2422 * 4)
+    hits = linear_ephemeris.progressed.progressed_natal_aspects(
+        natal_ts=_iso(_NATAL),
+        start_ts=_iso(_NATAL),
+        end_ts=_iso(end),
         aspects=(0, 60, 90, 120, 180),
         orb_deg=2.0,
         bodies=("Sun", "Moon", "Mars"),
         step_days=1.0,
     )
 
+    assert linear_ephemeris.adapter.batches == 1
     assert isinstance(hits, list)
     assert hits == sorted(hits, key=lambda hit: (hit.when_iso, hit.moving, hit.target, hit.angle_deg))
     for hit in hits:
         assert hit.orb_abs <= hit.orb_allow + 1e-9
         assert hit.speed_deg_per_day is not None
 
+    # Progressed Moon reaches the natal Sun square after 30 / 13.1 years.
+    squares = [hit for hit in hits if (hit.moving, hit.target, hit.angle_deg) == ("Moon", "Sun", 90.0)]
+    assert squares
+    closest = min(squares, key=lambda hit: hit.orb_abs)
+    moment = datetime.fromisoformat(closest.when_iso.replace("Z", "+00:00"))
+    years = (moment - _NATAL).total_seconds() / 86400.0 / 365.2422
+    assert years == pytest.approx(30.0 / 13.1, abs=1.0 / 365.0)
+    assert closest.lon_moving == pytest.approx((70.0 + 13.1 * years) % 360.0, abs=1e-9)
+    assert closest.speed_deg_per_day == pytest.approx(13.1 / 365.2422, rel=1e-6)
+    assert closest.applying_or_separating in {"applying", "separating", "exact"}
+
+
+def test_solar_arc_aspects_interpolate_progressed_sun(linear_ephemeris) -> None:
+    end = _NATAL + timedelta(days=365.2422 * 80)
+    hits = linear_ephemeris.directed.solar_arc_natal_aspects(
+        natal_ts=_iso(_NATAL),
+        start_ts=_iso(_NATAL + timedelta(days=1)),
+        end_ts=_iso(end),
+        aspects=(0, 90, 120),
+        orb_deg=0.5,
+        bodies=("Moon", "Mars"),
+        step_days=7.0,
+    )
+
+    assert linear_ephemeris.adapter.batches == 1
+    assert {hit.moving for hit in hits} == {"Moon", "Mars"}
+    for hit in hits:
+        moment = datetime.fromisoformat(hit.when_iso.replace("Z", "+00:00"))
+        arc = 0.9856 * (moment - _NATAL).total_seconds() / 86400.0 / 365.2422
+        assert hit.lon_moving == pytest.approx((_BASE[hit.moving] + arc) % 360.0, abs=1e-9)
+        assert hit.family == "directed-natal"
+
 
 @pytest.mark.skipif(
     not any(os.environ.get(var) for var in ("SWE_EPH_PATH", "SE_EPHE_PATH")),
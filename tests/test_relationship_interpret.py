@@ -1,4 +1,4 @@
-from core.interpret_plus.engine import interpret
+from core.interpret_plus.engine import compile_pack, interpret, pack_etag
 
 PACK = {
     "rulepack": "test-pack",
@@ -93,3 +93,34 @@ def test_composite_house_overlay():
     out = interpret(req, PACK)
     assert len(out) == 1
     assert out[0].id == "comp_venus_house7"
+
+
+def test_compiled_pack_is_cached_by_etag_and_matches_body_forms():
+    rules = [
+        {"id": "pair", "scope": "synastry", "when": {"bodies": ["Venus", "Mars"], "aspects": [0]}},
+        {"id": "single", "scope": "synastry", "when": {"bodies": ["Venus"], "family": ["harmonious"]}},
+        {"id": "directed", "scope": "synastry", "when": {"bodiesA": ["*"], "bodiesB": ["Mars"]}},
+        {"id": "unknown", "scope": "synastry", "when": {"aspects": ["novile"]}},
+    ]
+    compiled = compile_pack(rules)
+    assert compile_pack(list(rules)) is compiled
+    assert compiled.etag == pack_etag(rules)
+    assert compile_pack(rules, etag="pinned") is not compiled
+
+    hits = [
+        {"a": "Mars", "b": "Venus", "aspect": 0, "severity": 0.9},
+        {"a": "Venus", "b": "Moon", "aspect": "trine", "severity": 0.5},
+        {"a": "Sun", "b": "Mars", "aspect": "square", "severity": 0.4},
+        {"a": "Moon", "b": "Pluto", "aspect": "novile", "severity": 0.3},
+    ]
+    out = interpret({"scope": "synastry", "hits": hits}, compiled)
+    found = {(finding.id, finding.meta["context"]["a"], finding.meta["context"]["b"]) for finding in out}
+    assert found == {
+        ("pair", "Mars", "Venus"),
+        ("single", "Venus", "Moon"),
+        ("directed", "Sun", "Mars"),
+        ("unknown", "Moon", "Pluto"),
+    }
+    assert [finding.id for finding in interpret({"scope": "synastry", "hits": hits}, rules)] == [
+        finding.id for finding in out
+    ]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import datetime as dt
+import math
+
+import pytest
+
+from astroengine.engine import scan_contacts, scan_contacts_batch
+from astroengine.engine.frames import TargetFrameResolver
+
+_BASE = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+
+# (longitude at epoch, speed deg/day)
+_MOTION = {
+    "sun": (280.0, 1.0),
+    "moon": (10.0, 13.2),
+    "mercury": (265.0, -0.6),
+    "venus": (300.0, 1.2),
+    "mars": (250.0, 0.7),
+}
+
+
+class LinearProvider:
+    """Deterministic multi-body provider with linear ecliptic motion."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def positions_ecliptic(self, iso: str, bodies):
+        self.calls += 1
+        moment = dt.datetime.fromisoformat(iso.replace("Z", "+00:00"))
+        days = (moment - _BASE).total_seconds() / 86400.0
+        out: dict[str, dict[str, float]] = {}
+        for body in bodies:
+            spec = _MOTION.get(str(body).lower())
+            if spec is None:
+                continue
+            lon = (spec[0] + spec[1] * days) % 360.0
+            decl = math.degrees(math.asin(math.sin(math.radians(lon)) * 0.3978))
+            out[body] = {"lon": lon, "decl": decl, "speed_lon": spec[1]}
+        return out
+
+
+def _key(event):
+    return (
+        event.timestamp,
+        event.kind,
+        event.moving,
+        event.target,
+        round(event.orb_abs, 9),
+        event.applying_or_separating,
+        round(event.score, 9),
+        tuple(sorted((k, repr(v)) for k, v in event.metadata.items())),
+    )
+
+
+@pytest.mark.parametrize("step_minutes", [360, 1440])
+def test_batch_matches_per_pair_scan_contacts(step_minutes: int) -> None:
+    provider = LinearProvider()
+    moving = ["Sun", "moon", "mercury"]
+    targets = ["venus", "mars", "sun"]
+    kwargs = dict(provider=provider, step_minutes=step_minutes)
+
+    expected = []
+    for m in moving:
+        for t in targets:
+            if m.lower() == t:
+                continue
+            expected.extend(
+                scan_contacts(
+                    "2024-01-01T00:00:00Z", "2024-02-15T00:00:00Z", m, t, **kwargs
+                )
+            )
+    expected.sort(key=lambda event: (event.timestamp, -event.score))
+
+    batch = scan_contacts_batch(
+        "2024-01-01T00:00:00Z", "2024-02-15T00:00:00Z", moving, targets, **kwargs
+    )
+
+    assert expected, "fixture should produce contacts"
+    assert [_key(e) for e in batch] == [_key(e) for e in expected]
+
+
+def test_batch_samples_each_tick_once_per_gating_group() -> None:
+    provider = LinearProvider()
+    scan_contacts_batch(
+        "2024-01-01T00:00:00Z",
+        "2024-01-11T00:00:00Z",
+        ["sun", "mercury", "venus"],
+        ["mars", "moon"],
+        provider=provider,
+        step_minutes=1440,
+        include_declination=False,
+        include_mirrors=False,
+    )
+    assert provider.calls == 11
+
+
+def test_batch_static_natal_frame_allows_self_pairs() -> None:
+    provider = LinearProvider()
+    resolver = TargetFrameResolver("natal", static_positions={"mars": 255.0})
+    events = scan_contacts_batch(
+        "2024-01-01T00:00:00Z",
+        "2024-01-31T00:00:00Z",
+        ["mars"],
+        ["mars"],
+        provider=provider,
+        step_minutes=1440,
+        target_frame="natal",
+        target_resolver=resolver,
+        include_declination=False,
+        include_mirrors=False,
+    )
+    assert events
+    assert all(event.lon_target == pytest.approx(255.0) for event in events)
+    # Moving samples still come from the transit provider.
+    assert {round(event.lon_moving, 6) for event in events} != {255.0}
+
+
+def test_batch_chunking_preserves_delta_lambda_continuity() -> None:
+    provider = LinearProvider()
+    args = ("2024-01-01T00:00:00Z", "2024-03-01T00:00:00Z", ["moon"], ["sun"])
+    whole = scan_contacts_batch(*args, provider=provider, step_minutes=360)
+    chunked = scan_contacts_batch(
+        *args, provider=provider, step_minutes=360, chunk_ticks=7
+    )
+    assert [_key(e) for e in chunked] == [_key(e) for e in whole]
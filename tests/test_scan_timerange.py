@@ -115,3 +115,65 @@ def test_scan_time_range_includes_antiscia_hits():
     ]
     assert mirror_hits, "expected antiscia hits when feature enabled"
     assert all((hit.meta or {}).get("kind") == "mirror" for hit in mirror_hits)
+
+
+class CountingEphemeris(LinearEphemeris):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def __call__(self, ts: datetime):
+        self.calls += 1
+        return super().__call__(ts)
+
+
+def _harmonic_scan(eph, **kwargs):
+    # Resolve at call time: worker tasks are pickled by reference to the
+    # module currently registered in ``sys.modules``.
+    from astroengine.core.aspects_plus import scan
+
+    t0 = datetime(2025, 1, 1, tzinfo=UTC)
+    return scan.scan_time_range(
+        objects=["Sun", "Moon", "Mars", "Venus"],
+        window=scan.TimeWindow(start=t0, end=t0 + timedelta(days=20)),
+        position_provider=eph,
+        aspects=["conjunction", "sextile", "square"],
+        harmonics=[5, 7],
+        orb_policy=POLICY,
+        step_minutes=180,
+        include_antiscia=True,
+        antiscia_orb=1.0,
+        **kwargs,
+    )
+
+
+def _eph(cls=LinearEphemeris):
+    return cls(
+        datetime(2025, 1, 1, tzinfo=UTC),
+        base={"Sun": 280.0, "Moon": 15.0, "Mars": 10.0, "Venus": 300.0},
+        rates_deg_per_day={"Sun": 1.0, "Moon": 13.2, "Mars": 0.6, "Venus": 1.2},
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_shared_grid_mode_matches_serial_scan(workers):
+    serial = _harmonic_scan(_eph())
+    shared = _harmonic_scan(_eph(), workers=workers)
+
+    assert serial
+    assert any((hit.meta or {}).get("kind") == "mirror" for hit in serial)
+    assert [hit.as_mapping() for hit in shared] == [hit.as_mapping() for hit in serial]
+
+
+def test_shared_grid_samples_each_step_once():
+    serial_eph = _eph(CountingEphemeris)
+    shared_eph = _eph(CountingEphemeris)
+    _harmonic_scan(serial_eph)
+    _harmonic_scan(shared_eph, workers=1)
+
+    assert shared_eph.calls < serial_eph.calls / 10
+
+
+def test_shared_grid_rejects_non_positive_workers():
+    with pytest.raises(ValueError, match="workers"):
+        _harmonic_scan(_eph(), workers=0)
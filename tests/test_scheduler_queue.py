@@ -87,3 +87,33 @@ def test_fail_backoff_and_max_attempts(monkeypatch):
     assert failed is not None
     assert failed["state"] == "failed"
     assert "second error" in failed["last_error"]
+
+
+def test_claim_batch_claims_in_priority_order_once():
+    from astroengine.scheduler import queue
+
+    low = queue.enqueue("scan:test", {"n": 1}, priority=200)
+    high = queue.enqueue("scan:test", {"n": 2}, priority=10)
+    mid = queue.enqueue("scan:test", {"n": 3}, priority=100)
+
+    batch = queue.claim_batch(2)
+    assert [job["id"] for job in batch] == [high, mid]
+    assert all(job["state"] == "running" and job["attempts"] == 1 for job in batch)
+
+    rest = queue.claim_batch(5)
+    assert [job["id"] for job in rest] == [low]
+    assert queue.claim_batch(5) == []
+
+
+def test_requeue_returns_jobs_without_counting_attempt():
+    from astroengine.scheduler import queue
+
+    jid = queue.enqueue("scan:test", {"payload": 4})
+    assert queue.claim_one() is not None
+    queue.requeue([jid])
+
+    job = queue.get(jid)
+    assert job is not None
+    assert job["state"] == "queued"
+    assert job["attempts"] == 0
+    assert job["heartbeat_at"] is None
@@ -42,3 +42,171 @@ def test_worker_processes_progressions(monkeypatch):
     summary = json.loads(job["result"])
     assert summary == {"summary": {"count": 3}}
     assert captured and captured[0]["payload"] == "data"
+
+
+def test_worker_pool_runs_jobs_concurrently(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+
+    from astroengine.scheduler import queue, worker
+
+    barrier = Barrier(3, timeout=5)
+
+    def blocking_handler(payload: dict[str, object]) -> list[int]:
+        barrier.wait()  # only passes if three jobs run at the same time
+        return [payload["n"]]
+
+    def broken_handler(payload: dict[str, object]) -> None:
+        raise ValueError("boom")
+
+    monkeypatch.setitem(worker.HANDLERS, "scan:progressions", blocking_handler)
+    monkeypatch.setitem(worker.HANDLERS, "scan:broken", broken_handler)
+
+    ids = [queue.enqueue("scan:progressions", {"n": n}) for n in range(3)]
+    broken = queue.enqueue("scan:broken", {}, max_attempts=1, priority=200)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        worker.run_worker_pool(
+            3,
+            sleep_sec=0.01,
+            heartbeat_sec=0.0,
+            max_iterations=6,
+            executor=pool,
+        )
+
+    for jid in ids:
+        job = queue.get(jid)
+        assert job is not None
+        assert job["state"] == "done"
+        assert json.loads(job["result"]) == {"summary": {"count": 1}}
+    failed = queue.get(broken)
+    assert failed is not None
+    assert failed["state"] == "failed"
+    assert "ValueError: boom" in failed["last_error"]
+
+
+def test_worker_pool_process_mode(monkeypatch):
+    from astroengine.scheduler import queue, worker
+
+    monkeypatch.setitem(worker.HANDLERS, "scan:progressions", lambda payload: [0] * 2)
+    ids = [queue.enqueue("scan:progressions", {"n": n}) for n in range(4)]
+
+    worker.run_worker_pool(2, sleep_sec=0.01, heartbeat_sec=0.0, max_iterations=8)
+
+    for jid in ids:
+        job = queue.get(jid)
+        assert job is not None
+        assert job["state"] == "done"
+
+
+def test_worker_pool_heartbeats_and_requeues_unstarted_jobs_on_stop(monkeypatch):
+    import itertools
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from astroengine.scheduler import db, queue, worker
+
+    started: list[int] = []
+    release = threading.Event()
+    stop = threading.Event()
+    clock = itertools.count(1_000_000)
+    monkeypatch.setattr(queue, "now", lambda: next(clock))
+
+    def slow_handler(payload: dict[str, object]) -> None:
+        started.append(int(payload["n"]))
+        release.wait(5)
+
+    monkeypatch.setitem(worker.HANDLERS, "scan:progressions", slow_handler)
+    ids = [queue.enqueue("scan:progressions", {"n": n}) for n in range(2)]
+    heartbeats: list[int] = []
+
+    def _stop_after_heartbeat() -> None:
+        con = db.open_connection()
+        try:
+            deadline = time.monotonic() + 5
+            while not started and time.monotonic() < deadline:
+                time.sleep(0.01)
+            running = ids[started[0]]
+            waiting = ids[1 - started[0]]
+            query = "SELECT heartbeat_at FROM jobs WHERE id=?"
+            claimed = con.execute(query, (running,)).fetchone()[0]
+            while time.monotonic() < deadline:
+                current = con.execute(query, (running,)).fetchone()[0]
+                if current > claimed:
+                    heartbeats.append(current)
+                    break
+                time.sleep(0.01)
+            stop.set()
+            # The running job is only released once the unstarted one is back
+            # in the queue, so it cannot be picked up by the executor.
+            while time.monotonic() < deadline:
+                row = con.execute("SELECT state FROM jobs WHERE id=?", (waiting,)).fetchone()
+                if row[0] == "queued":
+                    break
+                time.sleep(0.01)
+        finally:
+            con.close()
+            stop.set()
+            release.set()
+
+    watcher = threading.Thread(target=_stop_after_heartbeat)
+    watcher.start()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worker.run_worker_pool(
+            2,
+            sleep_sec=0.01,
+            heartbeat_sec=0.02,
+            grace_sec=0.0,
+            stop_event=stop,
+            executor=pool,
+        )
+    watcher.join()
+
+    assert heartbeats, "lease should be refreshed while the handler runs"
+    assert len(started) == 1, "the unstarted job must not run"
+    running = queue.get(ids[started[0]])
+    assert running is not None
+    assert running["state"] == "done"
+    waiting = queue.get(ids[1 - started[0]])
+    assert waiting is not None
+    assert waiting["state"] == "queued"
+    assert waiting["attempts"] == 0
+
+
+def test_worker_pool_terminates_jobs_outliving_grace(monkeypatch, tmp_path):
+    import threading
+    import time
+
+    from astroengine.scheduler import queue, worker
+
+    marker = tmp_path / "ran"
+
+    def slow_handler(payload: dict[str, object]) -> None:
+        time.sleep(float(payload["sleep"]))
+        marker.write_text("ran")
+
+    monkeypatch.setitem(worker.HANDLERS, "scan:progressions", slow_handler)
+    jid = queue.enqueue("scan:progressions", {"sleep": 1.0})
+    stop = threading.Event()
+    timer = threading.Timer(0.5, stop.set)
+    timer.start()
+    try:
+        worker.run_worker_pool(
+            1,
+            sleep_sec=0.01,
+            heartbeat_sec=0.0,
+            grace_sec=0.1,
+            stop_event=stop,
+        )
+    finally:
+        timer.cancel()
+
+    job = queue.get(jid)
+    assert job is not None
+    assert job["state"] == "queued"
+    assert job["attempts"] == 0
+    # The worker process was stopped before the job was requeued, so the
+    # handler never gets to finish behind the queue's back.
+    time.sleep(1.5)
+    assert not marker.exists()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import pytest
+
+from astroengine.core.ticks import jd_from_tick
+from astroengine.observability.metrics import POSITION_CACHE_HITS
+from astroengine.transits.engine import SharedPositionCache, TickCachingProvider
+
+
+class FingerprintedProvider:
+    """Records every body requested; output depends on ``offset``."""
+
+    def __init__(self, offset: float = 0.0) -> None:
+        self.offset = offset
+        self.requested: list[tuple[float, tuple[str, ...]]] = []
+
+    def cache_fingerprint(self):
+        return ("offset", self.offset)
+
+    def positions_ecliptic_jd(self, jd_utc: float, bodies):
+        names = tuple(bodies)
+        self.requested.append((jd_utc, names))
+        return {
+            name: {"lon": (jd_utc + self.offset + index) % 360.0, "speed_lon": 1.0}
+            for index, name in enumerate(names)
+        }
+
+    def positions_ecliptic(self, iso: str, bodies):
+        return self.positions_ecliptic_jd(jd_from_tick(iso), bodies)
+
+
+class AnonymousProvider(FingerprintedProvider):
+    cache_fingerprint = None
+
+
+_JD = 2460400.5
+
+
+def test_sessions_share_positions_across_requests() -> None:
+    shared = SharedPositionCache(64)
+    provider = FingerprintedProvider()
+    first = TickCachingProvider(provider, shared_cache=shared).positions_ecliptic_jd(
+        _JD, ["Sun", "Moon"]
+    )
+    before = POSITION_CACHE_HITS._value.get()
+
+    second_session = TickCachingProvider(FingerprintedProvider(), shared_cache=shared)
+    second = second_session.positions_ecliptic_jd(_JD, ["moon", "sun"])
+
+    assert first["Sun"] == second["sun"]
+    assert first["Moon"] == second["moon"]
+    assert len(provider.requested) == 1
+    assert shared.hits == 2
+    assert POSITION_CACHE_HITS._value.get() - before == 2
+
+
+def test_only_missing_bodies_reach_the_provider() -> None:
+    shared = SharedPositionCache(64)
+    provider = FingerprintedProvider()
+    TickCachingProvider(provider, shared_cache=shared).positions_ecliptic_jd(_JD, ["Sun"])
+    TickCachingProvider(provider, shared_cache=shared).positions_ecliptic_jd(
+        _JD, ["Sun", "Mars"]
+    )
+    assert [names for _, names in provider.requested] == [("Sun",), ("Mars",)]
+
+
+def test_iso_and_jd_ticks_share_a_quantized_bin() -> None:
+    shared = SharedPositionCache(64)
+    provider = FingerprintedProvider()
+    TickCachingProvider(provider, shared_cache=shared).positions_ecliptic(
+        "2024-04-04T12:00:00Z", ["Sun"]
+    )
+    jd = jd_from_tick("2024-04-04T12:00:00Z")
+    TickCachingProvider(provider, shared_cache=shared).positions_ecliptic_jd(
+        jd + 1e-9, ["Sun"]
+    )
+    assert len(provider.requested) == 1
+    assert shared.bin(jd) != shared.bin(jd + 1.0 / 86400.0)
+
+
+def test_fingerprints_and_anonymous_providers_are_isolated() -> None:
+    shared = SharedPositionCache(64)
+    a = FingerprintedProvider(0.0)
+    b = FingerprintedProvider(10.0)
+    assert TickCachingProvider(a, shared_cache=shared).positions_ecliptic_jd(_JD, ["Sun"]) != (
+        TickCachingProvider(b, shared_cache=shared).positions_ecliptic_jd(_JD, ["Sun"])
+    )
+
+    anonymous = AnonymousProvider()
+    for _ in range(2):
+        TickCachingProvider(anonymous, shared_cache=shared).positions_ecliptic_jd(_JD, ["Sun"])
+    assert len(anonymous.requested) == 2
+    assert len(shared) == 2
+
+
+def test_lru_bound_evicts_oldest_entries() -> None:
+    shared = SharedPositionCache(2)
+    provider = FingerprintedProvider()
+    for offset in range(3):
+        TickCachingProvider(provider, shared_cache=shared).positions_ecliptic_jd(
+            _JD + offset, ["Sun"]
+        )
+    assert len(shared) == 2
+    assert shared.evictions == 1
+
+    TickCachingProvider(provider, shared_cache=shared).positions_ecliptic_jd(_JD, ["Sun"])
+    assert len(provider.requested) == 4
+
+
+def test_shared_entries_are_read_only_copies() -> None:
+    shared = SharedPositionCache(64)
+    provider = FingerprintedProvider()
+    produced: list[dict[str, float]] = []
+    original = provider.positions_ecliptic_jd
+
+    def recording(jd_utc, bodies):
+        result = original(jd_utc, bodies)
+        produced.extend(result.values())
+        return result
+
+    provider.positions_ecliptic_jd = recording
+    session = TickCachingProvider(provider, shared_cache=shared)
+    first = session.positions_ecliptic_jd(_JD, ["Sun"])
+    with pytest.raises(TypeError):
+        first["Sun"]["lon"] = 0.0  # type: ignore[index]
+
+    expected = dict(first["Sun"])
+    produced[0]["lon"] = -1.0
+    other = TickCachingProvider(FingerprintedProvider(), shared_cache=shared)
+    second = other.positions_ecliptic_jd(_JD, ["Sun"])
+    assert dict(second["Sun"]) == expected
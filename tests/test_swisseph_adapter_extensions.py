@@ -117,3 +117,27 @@ def test_ayanamsa_variants(swiss_ephemeris) -> None:
 def test_planet_name_resolution(swiss_ephemeris) -> None:
     name = SwissEphemerisAdapter.planet_name(int(swiss_ephemeris.MARS))
     assert "mars" in name.lower()
+
+
+def test_compute_bodies_array_rotates_ecliptic_to_equatorial(swiss_ephemeris) -> None:
+    adapter = SwissEphemerisAdapter()
+    adapter.use_segment_cache = False
+    init_ephe()
+    bodies = {
+        "Sun": int(swiss_ephemeris.SUN),
+        "Moon": int(swiss_ephemeris.MOON),
+        "Pluto": int(swiss_ephemeris.PLUTO),
+    }
+    jds = [swiss_ephemeris.julday(2024, 1, 1, 0.0) + 37.25 * step for step in range(8)]
+    arrays = adapter.compute_bodies_array(jds, bodies)
+    assert arrays.bodies == tuple(bodies)
+    assert arrays.declination.shape == (len(jds), len(bodies))
+    flags = int(swiss_ephemeris.FLG_SWIEPH | swiss_ephemeris.FLG_SPEED)
+    for row, jd in enumerate(jds):
+        for col, code in enumerate(bodies.values()):
+            eq, _ = swiss_ephemeris.calc_ut(jd, code, flags | swiss_ephemeris.FLG_EQUATORIAL)
+            assert arrays.right_ascension[row, col] == pytest.approx(eq[0], abs=1e-9)
+            assert arrays.declination[row, col] == pytest.approx(eq[1], abs=1e-9)
+            assert arrays.speed_declination[row, col] == pytest.approx(eq[4], abs=1e-3)
+        position = arrays.position(row, "Moon")
+        assert position == adapter.compute_bodies_many(jd, bodies)["Moon"]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from astroengine.ephemeris.swisseph_adapter import VariantConfig
+from astroengine.transits import engine
+
+_EPOCH = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+_RATES = {0: 0.9856, 1: 13.18, 4: 0.52}  # Sun, Moon, Mars (deg/day)
+
+
+def _lon(code: int, moment: dt.datetime) -> float:
+    days = (moment - _EPOCH).total_seconds() / 86400.0
+    return (17.0 * code + _RATES[code] * days) % 360.0
+
+
+class _FakeAdapter:
+    _variant_config = VariantConfig()
+
+    def julian_day(self, moment: dt.datetime) -> dt.datetime:
+        return moment
+
+    def body_position(self, moment, code: int, body_name: str | None = None):
+        return SimpleNamespace(longitude=_lon(code, moment))
+
+
+class _FakeService:
+    """Analytic crossings for linear motion over ``[start, end)``."""
+
+    def __init__(self) -> None:
+        self.adapter = _FakeAdapter()
+        self.calls = 0
+
+    def iter_longitude_crossings(
+        self, body, reference_longitude, aspect_angle_deg, start, end, **_
+    ):
+        self.calls += 1
+        rate = _RATES[body]
+        target = (reference_longitude + aspect_angle_deg) % 360.0
+        lag = ((target - _lon(body, start)) % 360.0) / rate
+        moment = start + dt.timedelta(days=lag)
+        while moment < end:
+            yield SimpleNamespace(
+                timestamp=moment,
+                metadata={"sample": {"longitude": target, "speed_longitude": rate}},
+            )
+            moment += dt.timedelta(days=360.0 / rate)
+
+
+@pytest.fixture
+def fake_service(monkeypatch):
+    service = _FakeService()
+    monkeypatch.setattr(
+        engine.SwissEphemerisAdapter,
+        "get_default_adapter",
+        classmethod(lambda cls: service.adapter),
+    )
+    monkeypatch.setattr(
+        engine.TransitScanService,
+        "with_default_adapter",
+        classmethod(lambda cls, *args, **kwargs: service),
+    )
+    return service
+
+
+_ARGS = ("1990-05-01T00:00:00Z", "2024-01-01T00:00:00Z", "2026-01-01T00:00:00Z")
+_KWARGS = {
+    "bodies": ["Sun", "Moon", "Mars"],
+    "aspects": ["conjunction", "square", "trine"],
+    "step_days": 1.0,
+}
+
+
+def test_streamed_hits_match_the_sorted_list(fake_service) -> None:
+    streamed = list(engine.iter_scan_transits(*_ARGS, **_KWARGS))
+    listed = engine.scan_transits(*_ARGS, **_KWARGS)
+
+    assert len(streamed) > 50
+    assert streamed == listed
+    moments = [hit.when_iso for hit in streamed]
+    assert moments == sorted(moments)
+
+
+def test_first_hits_arrive_before_the_window_is_scanned(fake_service) -> None:
+    stream = engine.iter_scan_transits(*_ARGS, **_KWARGS)
+    first = list(itertools.islice(stream, 3))
+    early_calls = fake_service.calls
+
+    assert first[0].when_iso < "2024-01-10"
+    list(stream)
+    assert early_calls * 20 < fake_service.calls
+
+
+def test_empty_window_yields_nothing(fake_service) -> None:
+    assert list(engine.iter_scan_transits(_ARGS[0], _ARGS[1], _ARGS[1], **_KWARGS)) == []
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from astroengine.chart import ChartLocation
+from astroengine.timelords import active as active_module
+from astroengine.timelords.active import TimelordCalculator
+from astroengine.timelords.context import TimelordContext
+
+
+class DummyAdapter:
+    def __init__(self, base_moment: datetime, base_jd: float) -> None:
+        self.base_moment = base_moment
+        self.base_jd = base_jd
+
+    def ayanamsa(self, _jd: float) -> float:
+        return 0.0
+
+    def julian_day(self, moment: datetime) -> float:
+        return self.base_jd + (moment - self.base_moment).total_seconds() / 86400.0
+
+
+@pytest.fixture
+def context() -> TimelordContext:
+    base_moment = datetime(2000, 1, 1, 12, tzinfo=UTC)
+    chart = SimpleNamespace(
+        julian_day=2451545.0,
+        houses=SimpleNamespace(ascendant=15.0),
+        positions={
+            "Sun": SimpleNamespace(longitude=20.0),
+            "Moon": SimpleNamespace(longitude=80.0),
+        },
+    )
+    return TimelordContext(
+        moment=base_moment,
+        location=ChartLocation(latitude=0.0, longitude=0.0),
+        chart=chart,
+        adapter=DummyAdapter(base_moment, 2451545.0),
+    )
+
+
+def _brute_force(calculator: TimelordCalculator, moment: datetime) -> list:
+    active = [period for period in calculator.iter_periods() if period.contains(moment)]
+    active.sort(key=active_module._period_sort_key)
+    return active
+
+
+def test_active_stack_matches_linear_scan(context: TimelordContext) -> None:
+    until = context.moment + timedelta(days=3 * 365)
+    calculator = TimelordCalculator(context=context, until=until, include_fortune=True)
+    moment = context.moment
+    while moment < until:
+        stack = calculator.active_stack(moment)
+        assert list(stack.periods) == _brute_force(calculator, moment)
+        moment += timedelta(days=13, hours=7)
+
+
+def test_periods_between_returns_overlapping_periods(context: TimelordContext) -> None:
+    until = context.moment + timedelta(days=2 * 365)
+    calculator = TimelordCalculator(context=context, until=until)
+    start = context.moment + timedelta(days=100)
+    end = start + timedelta(days=45)
+
+    found = calculator.periods_between(start, end)
+    expected = [
+        period
+        for period in calculator.iter_periods()
+        if period.start <= end and period.end > start
+    ]
+    assert sorted(map(id, found)) == sorted(map(id, expected))
+    assert [p.start for p in found] == sorted(p.start for p in found)
+
+    shallow = calculator.periods_between(start, end, depth=1)
+    assert {p.level for p in shallow} <= {"annual", "maha", "l1"}
+    with pytest.raises(ValueError):
+        calculator.periods_between(end, start)
+
+
+def test_generation_is_lazy_and_deepens_on_demand(
+    context: TimelordContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requested: list[int] = []
+    original = active_module.generate_vimshottari_periods
+
+    def tracking(ctx, until, *, levels=5):  # type: ignore[no-untyped-def]
+        requested.append(levels)
+        return original(ctx, until, levels=levels)
+
+    monkeypatch.setattr(active_module, "generate_vimshottari_periods", tracking)
+    calculator = TimelordCalculator(
+        context=context,
+        until=context.moment + timedelta(days=365),
+        systems=("vimshottari",),
+    )
+    assert requested == []
+
+    moment = context.moment + timedelta(days=40)
+    shallow = calculator.active_stack(moment, depth=2)
+    assert [p.level for p in shallow.periods] == ["maha", "antar"]
+    calculator.active_stack(moment + timedelta(days=1), depth=1)
+    assert requested == [2]
+
+    full = calculator.active_stack(moment)
+    assert requested == [2, 5]
+    assert [p.level for p in full.periods] == [
+        "maha",
+        "antar",
+        "pratyantar",
+        "sookshma",
+        "praan",
+    ]
+    assert list(full.periods[:2]) == list(shallow.periods)